@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmark
+Times each pipeline stage, records simulator throughput and peak RSS into a
+local history file, and flags statistically significant slowdowns
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import time
+import xml.etree.ElementTree as ET
+
+HISTORY_FILE = os.environ.get('BENCH_HISTORY', 'benchmark_history.jsonl')
+
+# Clock period of the cocotb testbenches
+CLOCK_PERIOD_NS = 10
+
+# Make targets in pipeline order; 'metrics' names the output each stage is read from
+STAGES = {
+    'train-model': {'metrics': None},
+    'convert-params': {'metrics': None},
+    'test-configurable': {'metrics': 'cocotb'},
+    'verify': {'metrics': 'verify'},
+    'test-consistency': {'metrics': 'consistency'},
+    'synth': {'metrics': None},
+    'synth-dnn': {'metrics': None},
+    'synth-configurable': {'metrics': None},
+}
+
+# A slowdown is reported when it is both significant and at least this large
+ALPHA = 0.05
+MIN_SLOWDOWN = 0.05
+
+def run_stage(target):
+    """Run one make target; wall and CPU seconds and peak RSS of the process tree
+
+    wait4 reports the largest resident set of the make process and all of
+    its waited-for descendants, i.e. the Python or simulator it ran.
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(['make', target], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    stderr = process.stderr.read()
+    _, status, usage = os.wait4(process.pid, 0)
+    wall = time.perf_counter() - start
+    process.returncode = os.waitstatus_to_exitcode(status)
+    if process.returncode != 0:
+        raise RuntimeError(f"make {target} failed:\n{stderr.decode(errors='replace')[-2000:]}")
+    return {
+        'wall_s': wall,
+        'cpu_s': usage.ru_utime + usage.ru_stime,
+        'max_rss_mb': usage.ru_maxrss / 1024,
+    }
+
+def cocotb_throughput(results_file='results.xml'):
+    """Simulated cycles per wall-clock second over a cocotb results file"""
+    root = ET.parse(results_file).getroot()
+    sim_ns = real_s = 0.0
+    for testcase in root.iter('testcase'):
+        sim_ns += float(testcase.get('sim_time_ns', 0))
+        real_s += float(testcase.get('time', 0))
+    return {'cycles_per_second': sim_ns / CLOCK_PERIOD_NS / real_s if real_s else None}
+
+def stage_metrics(kind, wall):
+    """Throughput figures a stage leaves behind in its output files"""
+    if kind == 'cocotb':
+        return cocotb_throughput()
+    if kind == 'verify':
+        with open('consistency_verification_results.json', 'r') as f:
+            return {'vectors_per_second': json.load(f)['vectors_per_second']}
+    if kind == 'consistency':
+        with open('consistency_test_results.json', 'r') as f:
+            return {'vectors_per_second': json.load(f)['num_vectors'] / wall}
+    return {}
+
+def git_commit():
+    """Short hash of HEAD ('unknown' outside a git checkout)"""
+    result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True)
+    return result.stdout.strip() or 'unknown'
+
+def run_benchmark(stages, repeat):
+    """Run each stage repeat times and collect its samples"""
+    record = {'timestamp': time.time(), 'commit': git_commit(), 'host': platform.node(),
+              'repeat': repeat, 'stages': {}}
+    for target in stages:
+        samples = {'wall_s': [], 'cpu_s': [], 'max_rss_mb': []}
+        metrics = {}
+        for i in range(repeat):
+            print(f"[{target}] run {i + 1}/{repeat}...", flush=True)
+            result = run_stage(target)
+            for key in samples:
+                samples[key].append(result[key])
+            for key, value in stage_metrics(STAGES[target]['metrics'], result['wall_s']).items():
+                metrics.setdefault(key, []).append(value)
+        record['stages'][target] = {**samples, **metrics}
+    return record
+
+def load_history(history_file=HISTORY_FILE):
+    """Every recorded benchmark run, oldest first"""
+    if not os.path.exists(history_file):
+        return []
+    with open(history_file, 'r') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def append_history(record, history_file=HISTORY_FILE):
+    """Add one benchmark run to the history file"""
+    with open(history_file, 'a') as f:
+        f.write(json.dumps(record) + '\n')
+
+def betainc(a, b, x):
+    """Regularized incomplete beta function I_x(a, b) (continued fraction)"""
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+    if x > (a + 1) / (a + b + 2):
+        return 1.0 - betainc(b, a, 1.0 - x)
+
+    front = math.exp(math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                     + a * math.log(x) + b * math.log(1.0 - x)) / a
+    tiny = 1e-300
+    c, d = 1.0, 1.0 - (a + b) * x / (a + 1)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    result = d
+    for m in range(1, 200):
+        for numerator in (m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+                          -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1))):
+            d = 1.0 + numerator * d
+            d = 1.0 / (d if abs(d) > tiny else tiny)
+            c = 1.0 + numerator / c
+            c = c if abs(c) > tiny else tiny
+            result *= c * d
+        if abs(c * d - 1.0) < 1e-12:
+            break
+    return front * result
+
+def welch_slower(baseline, current):
+    """One-sided Welch t-test that current samples are slower than baseline
+
+    Returns (t, p); p is None when either side has fewer than two samples.
+    """
+    n1, n2 = len(baseline), len(current)
+    if n1 < 2 or n2 < 2:
+        return None, None
+    m1, m2 = sum(baseline) / n1, sum(current) / n2
+    v1 = sum((x - m1) ** 2 for x in baseline) / (n1 - 1)
+    v2 = sum((x - m2) ** 2 for x in current) / (n2 - 1)
+    se2 = v1 / n1 + v2 / n2
+    if se2 == 0:
+        return (math.inf, 0.0) if m2 > m1 else (0.0, 1.0)
+
+    t = (m2 - m1) / math.sqrt(se2)
+    df = se2 ** 2 / ((v1 / n1) ** 2 / (n1 - 1) + (v2 / n2) ** 2 / (n2 - 1))
+    tail = 0.5 * betainc(df / 2, 0.5, df / (df + t * t))
+    return t, tail if t > 0 else 1.0 - tail
+
+def compare(baseline, current, alpha=ALPHA, min_slowdown=MIN_SLOWDOWN):
+    """Per-stage wall-time comparison; flags significant slowdowns"""
+    rows = []
+    for target, samples in current['stages'].items():
+        if target not in baseline['stages']:
+            continue
+        before, after = baseline['stages'][target]['wall_s'], samples['wall_s']
+        mean_before, mean_after = sum(before) / len(before), sum(after) / len(after)
+        change = mean_after / mean_before - 1 if mean_before else 0.0
+        t, p = welch_slower(before, after)
+        rows.append({
+            'stage': target,
+            'baseline_s': mean_before,
+            'current_s': mean_after,
+            'change': change,
+            't': t,
+            'p': p,
+            'regression': p is not None and p < alpha and change >= min_slowdown,
+        })
+    return rows
+
+def find_baseline(history, ref):
+    """History record for ref: a commit hash, a negative index, or None for the previous run"""
+    if ref is None:
+        return history[-1] if history else None
+    if ref.lstrip('-').isdigit():
+        return history[int(ref)]
+    matches = [record for record in history if record['commit'].startswith(ref)]
+    if not matches:
+        raise ValueError(f"No benchmark run for commit {ref} in {HISTORY_FILE}")
+    return matches[-1]
+
+def print_record(record):
+    """Per-stage means of one benchmark run"""
+    print(f"\n{'stage':<20} {'wall (s)':>9} {'cpu (s)':>9} {'peak RSS (MB)':>14}  throughput")
+    for target, samples in record['stages'].items():
+        mean = {key: sum(samples[key]) / len(samples[key]) for key in ('wall_s', 'cpu_s')}
+        throughput = ', '.join(f"{sum(samples[key]) / len(samples[key]):.0f} {key.replace('_', ' ')}"
+                               for key in ('cycles_per_second', 'vectors_per_second') if key in samples)
+        print(f"{target:<20} {mean['wall_s']:>9.2f} {mean['cpu_s']:>9.2f} "
+              f"{max(samples['max_rss_mb']):>14.1f}  {throughput}")
+
+def print_comparison(rows, baseline):
+    """Comparison table against the baseline run"""
+    print(f"\nAgainst {baseline['commit']} ({time.strftime('%Y-%m-%d %H:%M', time.localtime(baseline['timestamp']))}):")
+    print(f"{'stage':<20} {'baseline (s)':>12} {'current (s)':>12} {'change':>8} {'p':>8}")
+    for row in rows:
+        p = f"{row['p']:.3f}" if row['p'] is not None else '-'
+        flag = '  SLOWER' if row['regression'] else ''
+        print(f"{row['stage']:<20} {row['baseline_s']:>12.2f} {row['current_s']:>12.2f} "
+              f"{row['change']:>+7.1%} {p:>8}{flag}")
+
+def main():
+    """Benchmark the pipeline and compare with a stored baseline"""
+    parser = argparse.ArgumentParser(description="Benchmark the DNN pipeline stages")
+    parser.add_argument('stages', nargs='*', default=list(STAGES),
+                        help=f"make targets to time (default: {' '.join(STAGES)})")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per stage")
+    parser.add_argument('--baseline', default=None,
+                        help="commit or history index to compare with (default: the previous run)")
+    parser.add_argument('--alpha', type=float, default=ALPHA, help="significance level")
+    parser.add_argument('--no-save', action='store_true', help="do not append this run to the history")
+    args = parser.parse_args()
+
+    print("=== Pipeline Benchmark ===")
+    unknown = [target for target in args.stages if target not in STAGES]
+    if unknown:
+        parser.error(f"unknown stage(s) {', '.join(unknown)}; choose from {', '.join(STAGES)}")
+
+    history = load_history()
+    baseline = find_baseline(history, args.baseline)
+
+    record = run_benchmark(args.stages, args.repeat)
+    print_record(record)
+
+    regressions = []
+    if baseline is not None:
+        rows = compare(baseline, record, args.alpha)
+        print_comparison(rows, baseline)
+        regressions = [row['stage'] for row in rows if row['regression']]
+
+    if not args.no_save:
+        append_history(record)
+        print(f"\nRun saved to {HISTORY_FILE}")
+
+    if regressions:
+        print(f"Significant slowdown in: {', '.join(regressions)}")
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -2,16 +2,42 @@
 // This module implements a 2-layer neural network accelerator with configurable parameters
 // Layer 1: 4 inputs -> 3 hidden neurons
 // Layer 2: 3 hidden neurons -> 2 outputs
-// Parameters can be loaded from external source
+// Layer 2 reads the hidden activations: requant_unit turns each finished
+// layer 1 accumulator into an 8-bit value (the requant word loaded with the
+// parameters, so it follows each model).
+// mac_unit reads weights and biases as two's complement (MAC_SIGNED) at
+// MAC_WEIGHT_W / MAC_ACC_W bits; mac_sizing.py picks the narrowest exact
+// widths for a model. The defaults take any int8 weight and int16 bias.
+// Parameters can be loaded from external source, one byte per beat or in
+// 16-bit bursts (see dnn_param_memory.v for the load formats)
+//
+// With SHADOW_PARAMS = 1 loads go to a shadow parameter bank while inference
+// keeps running on the active one: load_params is accepted in any state and
+// shadow_loaded rises after the last beat. swap_params requests a swap, which
+// takes effect at the next inference boundary (IDLE without a launch, or
+// DONE_STATE) once the shadow bank is loaded; params_loaded then rises.
+// Every inference runs entirely on one bank.
+//
+// With MAC_MUL_STAGE / MAC_ACC_STAGE the mac_unit is pipelined: every MAC
+// step then waits MAC_MUL_STAGE + MAC_ACC_STAGE extra cycles for its result.
 
-module configurable_dnn_accelerator (
+module configurable_dnn_accelerator #(
+    parameter SHADOW_PARAMS = 0,  // 1 = load into a shadow bank, swap at boundaries
+    parameter MAC_SIGNED = 1,     // 1 = two's complement weights and biases
+    parameter MAC_WEIGHT_W = 8,   // mac_unit weight width (up to 8)
+    parameter MAC_ACC_W = 16,     // mac_unit accumulator width (up to 16)
+    parameter MAC_MUL_STAGE = 0,  // mac_unit register stage after the multiply
+    parameter MAC_ACC_STAGE = 0   // mac_unit register stage after the accumulate
+) (
     input clk,                    // Clock signal
     input rst_n,                  // Reset signal (active low)
     input start,                  // Start computation signal
     input load_params,            // Load parameters signal
-    input [7:0] param_data,      // Parameter data input
-    input [3:0] param_addr,      // Parameter address
+    input param_burst,            // Load mode: 0 = bytes, 1 = 16-bit burst
+    input [15:0] param_data,      // Parameter data input (bytes use [7:0])
+    input [3:0] param_addr,       // Parameter address (unused, loads auto-increment)
     input param_valid,            // Parameter data valid
+    input swap_params,            // Swap in the shadow bank (SHADOW_PARAMS = 1)
     input [7:0] input_data_0,    // Input data 0
     input [7:0] input_data_1,    // Input data 1
     input [7:0] input_data_2,    // Input data 2
@@ -20,23 +46,33 @@ module configurable_dnn_accelerator (
     output reg [15:0] output_data_1, // Output data 1
     output reg done,              // Computation done signal
     output reg valid,             // Output valid signal
-    output reg params_loaded      // Parameters loaded signal
+    output reg params_loaded,     // Parameters loaded signal
+    output reg shadow_loaded      // Shadow bank holds a complete model (SHADOW_PARAMS = 1)
 );
 
-    // Internal signals
-    reg [7:0] weights_layer1 [0:11];  // Layer 1 weights (4 inputs × 3 neurons)
-    reg [7:0] weights_layer2 [0:5];   // Layer 2 weights (3 neurons × 2 outputs)
-    reg [15:0] bias_layer1 [0:2];     // Layer 1 biases (3 neurons)
-    reg [15:0] bias_layer2 [0:1];     // Layer 2 biases (2 outputs)
+    // Parameter memory read ports
+    wire [12*8-1:0] weights_layer1;   // Layer 1 weights (4 inputs × 3 neurons)
+    wire [6*8-1:0] weights_layer2;    // Layer 2 weights (3 neurons × 2 outputs)
+    wire [3*16-1:0] bias_layer1;      // Layer 1 biases (3 neurons)
+    wire [2*16-1:0] bias_layer2;      // Layer 2 biases (2 outputs)
+    wire [7:0] requant_mult;          // Hidden requantization (loaded with the parameters)
+    wire [4:0] requant_shift;
+    wire requant_round;
+    wire requant_relu;
+    wire load_done;                   // Last parameter beat being written
     
-    reg [15:0] hidden_layer [0:2];    // Hidden layer activations
+    reg [7:0] hidden_layer [0:2];     // Hidden layer activations (requantized)
     reg [15:0] mac_result;            // MAC computation result
     
     // Control signals
     reg [2:0] state;                  // State machine
     reg [1:0] neuron_idx;              // Current neuron index
     reg [1:0] input_idx;               // Current input index
-    reg [4:0] param_load_addr;         // Parameter loading address (5 bits for values up to 23)
+    
+    // Pipelined mac_unit: cycles to wait for mac_out after the operands change
+    localparam MAC_LATENCY = MAC_MUL_STAGE + MAC_ACC_STAGE;
+    reg [1:0] mac_wait;
+    wire mac_ready = (MAC_LATENCY == 0) || (mac_wait == MAC_LATENCY);
     
     // State machine states
     localparam IDLE = 3'b000;
@@ -45,28 +81,100 @@ module configurable_dnn_accelerator (
     localparam LAYER2_COMPUTE = 3'b011;
     localparam DONE_STATE = 3'b100;
     
+    // Shadow bank loading and swapping (SHADOW_PARAMS = 1)
+    reg shadow_loading;               // Shadow bank load in progress
+    reg swap_pending;                 // Swap requested, waiting for a boundary
+    wire launch = (state == IDLE) && start && params_loaded;
+    wire boundary = (state == IDLE && !launch) || (state == DONE_STATE);
+    wire bank_swap = SHADOW_PARAMS && (swap_params || swap_pending) && shadow_loaded && boundary;
+    
+    dnn_param_memory #(.SHADOW(SHADOW_PARAMS)) param_mem (
+        .clk(clk),
+        .rst_n(rst_n),
+        .load_start(SHADOW_PARAMS ? load_params : (state == IDLE && load_params)),
+        .bank_swap(bank_swap),
+        .param_burst(param_burst),
+        .param_write(SHADOW_PARAMS ? (shadow_loading && param_valid) : (state == LOAD_PARAMS && param_valid)),
+        .param_data(param_data),
+        .load_done(load_done),
+        .weights_layer1_flat(weights_layer1),
+        .weights_layer2_flat(weights_layer2),
+        .bias_layer1_flat(bias_layer1),
+        .bias_layer2_flat(bias_layer2),
+        .requant_mult(requant_mult),
+        .requant_shift(requant_shift),
+        .requant_round(requant_round),
+        .requant_relu(requant_relu)
+    );
+    
     // MAC unit instantiation
     wire [7:0] current_input;
     wire [7:0] current_weight;
     wire [15:0] mac_out;
     
-    // Multiplexer for input data
-    assign current_input = (input_idx == 2'b00) ? input_data_0 :
+    // Multiplexer for input data: network inputs, then hidden activations
+    assign current_input = (state != LAYER1_COMPUTE) ? hidden_layer[input_idx] :
+                          (input_idx == 2'b00) ? input_data_0 :
                           (input_idx == 2'b01) ? input_data_1 :
                           (input_idx == 2'b10) ? input_data_2 : input_data_3;
     
     // Multiplexer for weights
     assign current_weight = (state == LAYER1_COMPUTE) ? 
-                           weights_layer1[neuron_idx * 4 + input_idx] :
-                           weights_layer2[neuron_idx * 3 + input_idx];
+                           weights_layer1[(neuron_idx * 4 + input_idx) * 8 +: 8] :
+                           weights_layer2[(neuron_idx * 3 + input_idx) * 8 +: 8];
     
-    mac_unit mac_inst (
+    // C extended back to the 16-bit accumulator registers
+    wire [MAC_ACC_W-1:0] mac_c;
+    wire signed [15:0] mac_c_signed = $signed(mac_c);
+    wire [15:0] mac_c_unsigned = mac_c;
+    assign mac_out = MAC_SIGNED ? mac_c_signed : mac_c_unsigned;
+
+    mac_unit #(.WEIGHT_W(MAC_WEIGHT_W), .ACC_W(MAC_ACC_W), .SIGNED(MAC_SIGNED),
+               .MUL_STAGE(MAC_MUL_STAGE), .ACC_STAGE(MAC_ACC_STAGE)) mac_inst (
+        .clk(clk),
         .A(current_input),
-        .W(current_weight),
-        .B(mac_result),
-        .C(mac_out)
+        .W(current_weight[MAC_WEIGHT_W-1:0]),
+        .B(mac_result[MAC_ACC_W-1:0]),
+        .C(mac_c)
     );
     
+    // Requantize each finished hidden neuron to the 8-bit layer 2 input
+    wire [7:0] hidden_act;
+    
+    requant_unit #(.ACC_SIGNED(MAC_SIGNED)) requant_inst (
+        .acc(mac_out),
+        .multiplier(requant_mult),
+        .shift(requant_shift),
+        .round(requant_round),
+        .relu(requant_relu),
+        .q(hidden_act)
+    );
+    
+    // Shadow bank control
+    always @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            shadow_loading <= 0;
+            shadow_loaded <= 0;
+            swap_pending <= 0;
+        end else if (SHADOW_PARAMS) begin
+            if (load_params) begin
+                shadow_loading <= 1;
+                shadow_loaded <= 0;
+            end else if (shadow_loading && param_valid && load_done) begin
+                shadow_loading <= 0;
+                shadow_loaded <= 1;
+            end else if (bank_swap) begin
+                shadow_loaded <= 0;
+            end
+            
+            if (bank_swap) begin
+                swap_pending <= 0;
+            end else if (swap_params) begin
+                swap_pending <= 1;
+            end
+        end
+    end
+    
     // Parameter loading and computation control
     always @(posedge clk or negedge rst_n) begin
         if (!rst_n) begin
@@ -75,86 +183,73 @@ module configurable_dnn_accelerator (
             neuron_idx <= 0;
             input_idx <= 0;
             mac_result <= 0;
+            mac_wait <= 0;
             done <= 0;
             valid <= 0;
             params_loaded <= 0;
-            param_load_addr <= 0;
         end else begin
+            if (bank_swap) begin
+                params_loaded <= 1;
+            end
+            
+            // Count the wait for each MAC step's result
+            if (mac_ready) begin
+                mac_wait <= 0;
+            end else if (state == LAYER1_COMPUTE || state == LAYER2_COMPUTE) begin
+                mac_wait <= mac_wait + 1;
+            end
+            
             case (state)
                 IDLE: begin
-                    if (load_params) begin
+                    if (load_params && !SHADOW_PARAMS) begin
                         state <= LOAD_PARAMS;
-                        param_load_addr <= 0;
                         params_loaded <= 0;
-                    end else if (start && params_loaded) begin
+                    end else if (launch) begin
                         state <= LAYER1_COMPUTE;
                         neuron_idx <= 0;
                         input_idx <= 0;
-                        mac_result <= bias_layer1[0];
+                        mac_result <= bias_layer1[15:0];
                         done <= 0;
                         valid <= 0;
                     end
                 end
                 
                 LOAD_PARAMS: begin
-                    if (param_valid) begin
-                        // Load parameters based on address
-                        if (param_load_addr < 12) begin
-                            // Layer 1 weights
-                            weights_layer1[param_load_addr[3:0]] <= param_data;
-                        end else if (param_load_addr < 18) begin
-                            // Layer 2 weights
-                            weights_layer2[param_load_addr[3:0] - 12] <= param_data;
-                        end else if (param_load_addr < 21) begin
-                            // Layer 1 bias (16-bit, need 2 cycles)
-                            if (param_load_addr[0] == 0) begin
-                                bias_layer1[param_load_addr[3:1] - 9][7:0] <= param_data;
-                            end else begin
-                                bias_layer1[param_load_addr[3:1] - 9][15:8] <= param_data;
-                            end
-                        end else if (param_load_addr < 23) begin
-                            // Layer 2 bias (16-bit, need 2 cycles)
-                            if (param_load_addr[0] == 0) begin
-                                bias_layer2[param_load_addr[3:1] - 10][7:0] <= param_data;
-                            end else begin
-                                bias_layer2[param_load_addr[3:1] - 10][15:8] <= param_data;
-                            end
-                        end
-                        
-                        param_load_addr <= param_load_addr + 1;
-                        
-                        // Check if all parameters loaded
-                        if (param_load_addr >= 22) begin
-                            state <= IDLE;
-                            params_loaded <= 1;
-                        end
+                    // Beats are written by param_mem; finish on the last one
+                    if (param_valid && load_done) begin
+                        state <= IDLE;
+                        params_loaded <= 1;
                     end
                 end
                 
                 LAYER1_COMPUTE: begin
-                    if (input_idx < 3) begin
+                    if (!mac_ready) begin
+                        // mac_out not valid yet
+                    end else if (input_idx < 3) begin
                         mac_result <= mac_out;
                         input_idx <= input_idx + 1;
                     end else begin
-                        // Store hidden layer result
-                        hidden_layer[neuron_idx] <= mac_out;
+                        // Store hidden layer activation
+                        hidden_layer[neuron_idx] <= hidden_act;
                         input_idx <= 0;
                         
                         if (neuron_idx < 2) begin
                             neuron_idx <= neuron_idx + 1;
-                            mac_result <= bias_layer1[neuron_idx + 1];
+                            mac_result <= bias_layer1[(neuron_idx + 1) * 16 +: 16];
                         end else begin
                             // Layer 1 complete, move to layer 2
                             state <= LAYER2_COMPUTE;
                             neuron_idx <= 0;
                             input_idx <= 0;
-                            mac_result <= bias_layer2[0];
+                            mac_result <= bias_layer2[15:0];
                         end
                     end
                 end
                 
                 LAYER2_COMPUTE: begin
-                    if (input_idx < 2) begin
+                    if (!mac_ready) begin
+                        // mac_out not valid yet
+                    end else if (input_idx < 2) begin
                         mac_result <= mac_out;
                         input_idx <= input_idx + 1;
                     end else begin
@@ -169,7 +264,7 @@ module configurable_dnn_accelerator (
                         
                         if (neuron_idx < 1) begin
                             neuron_idx <= neuron_idx + 1;
-                            mac_result <= bias_layer2[neuron_idx + 1];
+                            mac_result <= bias_layer2[(neuron_idx + 1) * 16 +: 16];
                         end else begin
                             // Computation complete
                             state <= DONE_STATE;
@@ -4,146 +4,106 @@ Parameter Conversion Tool
 Converts software DNN parameters to hardware-compatible format
 """
 
-import json
 import numpy as np
 
-def convert_parameters_to_hardware(params_file='model_parameters.json'):
+from hardware_model import network_layers
+from param_file import load_model_parameters
+
+def convert_parameters_to_hardware(params_file='model_parameters.bin'):
     """Convert software parameters to hardware format"""
     
-    with open(params_file, 'r') as f:
-        params = json.load(f)
+    params = load_model_parameters(params_file)
     
     print("=== Parameter Conversion ===")
     
-    # Convert layer 1 weights (4x3)
-    layer1_weights = np.array(params['layer1_weights'])
-    layer1_bias = np.array(params['layer1_bias'])
-    
-    # Convert layer 2 weights (3x2)
-    layer2_weights = np.array(params['layer2_weights'])
-    layer2_bias = np.array(params['layer2_bias'])
-    
-    print("Layer 1 weights (4x3):")
-    print(layer1_weights)
-    print("Layer 1 bias:")
-    print(layer1_bias)
+    # Any stack of nn.Linear/ReLU layers (older files: the 4-3-2 network)
+    layers = network_layers(params)
+    signed_layers = signed_layer_values(params)
     
-    print("\nLayer 2 weights (3x2):")
-    print(layer2_weights)
-    print("Layer 2 bias:")
-    print(layer2_bias)
+    for i, (weights, bias) in enumerate(signed_layers, start=1):
+        fan_out, fan_in = weights.shape
+        if i > 1:
+            print()
+        print(f"Layer {i} weights ({fan_out} neurons x {fan_in} inputs):")
+        print(weights)
+        print(f"Layer {i} bias:")
+        print(bias)
     
-    # Generate Verilog initialization code
-    verilog_code = generate_verilog_init(layer1_weights, layer1_bias, 
-                                       layer2_weights, layer2_bias)
+    # Memory images and the Verilog module that loads them
+    images = write_memory_images(layers)
+    verilog_code = generate_verilog_init(layers, images)
     
     # Save Verilog code
     with open('hardware_parameters.v', 'w') as f:
         f.write(verilog_code)
     
     print("\nVerilog initialization code saved to hardware_parameters.v")
+    print("Memory images: " + ", ".join(name for pair in images for name in pair))
     
     # Generate testbench data
     generate_testbench_data(params)
     
-    return layer1_weights, layer1_bias, layer2_weights, layer2_bias
+    return layers
 
-def generate_verilog_init(layer1_weights, layer1_bias, layer2_weights, layer2_bias):
-    """Generate Verilog initialization code"""
+def signed_layer_values(params):
+    """Signed integer weights and biases of each layer, as exported by training"""
+    if 'layers' in params:
+        return [(np.array(layer['weights']), np.array(layer['bias'])) for layer in params['layers']]
+    return [(np.array(params['layer1_weights']), np.array(params['layer1_bias'])),
+            (np.array(params['layer2_weights']), np.array(params['layer2_bias']))]
+
+def write_memory_images(layers, prefix='hardware_parameters'):
+    """Write each layer's weights and biases as $readmemh images
+    
+    One hex word per line, weights neuron-major (weight of input i of
+    neuron n at n * fan_in + i), the order the accelerators read them in.
+    Returns the image file names per layer as (weights, bias) pairs.
+    """
+    images = []
+    for l, layer in enumerate(layers, start=1):
+        weights = np.asarray(layer['weights'], dtype=np.int64)
+        fan_out, fan_in = weights.shape
+        weight_file = f"{prefix}_weights_layer{l}.hex"
+        bias_file = f"{prefix}_bias_layer{l}.hex"
+        np.savetxt(weight_file, (weights & 0xFF).reshape(-1, 1), fmt='%02x',
+                   header=f"// weights_layer{l}: {fan_out} neurons x {fan_in} inputs, neuron-major",
+                   comments='')
+        np.savetxt(bias_file, (np.asarray(layer['bias'], dtype=np.int64) & 0xFFFF).reshape(-1, 1),
+                   fmt='%04x', header=f"// bias_layer{l}: {fan_out} neurons", comments='')
+        images.append((weight_file, bias_file))
+    return images
+
+def generate_verilog_init(layers, images):
+    """Generate Verilog initialization code
+    
+    layers is the stack from hardware_model.network_layers() and images
+    the files from write_memory_images(); the memories are filled with
+    $readmemh, so the module stays the same size whatever the model size.
+    """
     
     verilog = """// Hardware DNN Parameter Initialization
 // Generated from software model parameters
-
-// Layer 1 weights (4 inputs × 3 neurons)
+// Memories are loaded with $readmemh from the .hex images next to this file
 """
+    for l, (layer, (weight_file, bias_file)) in enumerate(zip(layers, images), start=1):
+        fan_out, fan_in = np.shape(layer['weights'])
+        relu = ", ReLU" if layer['relu'] else ""
+        verilog += f"//   Layer {l}: {fan_in} inputs × {fan_out} neurons{relu} ({weight_file}, {bias_file})\n"
     
-    # Layer 1 weights (transpose to get 4x3 format)
-    layer1_weights_t = layer1_weights.T  # Transpose to get 4x3
-    
-    verilog += "// weights_layer1[0] = ["
-    for i in range(4):
-        verilog += f"{layer1_weights_t[i, 0]:4d}"
-        if i < 3:
-            verilog += ", "
-    verilog += "]\n"
-    
-    verilog += "// weights_layer1[1] = ["
-    for i in range(4):
-        verilog += f"{layer1_weights_t[i, 1]:4d}"
-        if i < 3:
-            verilog += ", "
-    verilog += "]\n"
-    
-    verilog += "// weights_layer1[2] = ["
-    for i in range(4):
-        verilog += f"{layer1_weights_t[i, 2]:4d}"
-        if i < 3:
-            verilog += ", "
-    verilog += "]\n"
-    
-    # Layer 1 bias
-    verilog += "\n// Layer 1 bias\n"
-    verilog += f"// bias_layer1[0] = {layer1_bias[0]:5d}\n"
-    verilog += f"// bias_layer1[1] = {layer1_bias[1]:5d}\n"
-    verilog += f"// bias_layer1[2] = {layer1_bias[2]:5d}\n"
-    
-    # Layer 2 weights (transpose to get 3x2 format)
-    layer2_weights_t = layer2_weights.T  # Transpose to get 3x2
-    
-    verilog += "\n// Layer 2 weights (3 neurons × 2 outputs)\n"
-    verilog += "// weights_layer2[0] = ["
-    for i in range(3):
-        verilog += f"{layer2_weights_t[i, 0]:4d}"
-        if i < 2:
-            verilog += ", "
-    verilog += "]\n"
-    
-    verilog += "// weights_layer2[1] = ["
-    for i in range(3):
-        verilog += f"{layer2_weights_t[i, 1]:4d}"
-        if i < 2:
-            verilog += ", "
-    verilog += "]\n"
-    
-    # Layer 2 bias
-    verilog += "\n// Layer 2 bias\n"
-    verilog += f"// bias_layer2[0] = {layer2_bias[0]:5d}\n"
-    verilog += f"// bias_layer2[1] = {layer2_bias[1]:5d}\n"
-    
-    # Generate actual Verilog initialization
     verilog += """
-// Actual Verilog initialization code
 module hardware_parameter_init (
-    output reg [7:0] weights_layer1 [0:11],
-    output reg [7:0] weights_layer2 [0:5],
-    output reg [15:0] bias_layer1 [0:2],
-    output reg [15:0] bias_layer2 [0:1]
-);
-
-always @(*) begin
-    // Layer 1 weights initialization
 """
-    
-    # Layer 1 weights
-    for i in range(4):
-        for j in range(3):
-            idx = i * 3 + j
-            verilog += f"    weights_layer1[{idx}] = 8'd{layer1_weights_t[i, j] & 0xFF};\n"
-    
-    verilog += "\n    // Layer 2 weights initialization\n"
-    # Layer 2 weights
-    for i in range(3):
-        for j in range(2):
-            idx = i * 2 + j
-            verilog += f"    weights_layer2[{idx}] = 8'd{layer2_weights_t[i, j] & 0xFF};\n"
-    
-    verilog += "\n    // Layer 1 bias initialization\n"
-    for i in range(3):
-        verilog += f"    bias_layer1[{i}] = 16'd{layer1_bias[i] & 0xFFFF};\n"
-    
-    verilog += "\n    // Layer 2 bias initialization\n"
-    for i in range(2):
-        verilog += f"    bias_layer2[{i}] = 16'd{layer2_bias[i] & 0xFFFF};\n"
+    ports = []
+    for l, layer in enumerate(layers, start=1):
+        fan_out, fan_in = np.shape(layer['weights'])
+        ports.append(f"    output reg [7:0] weights_layer{l} [0:{fan_out * fan_in - 1}]")
+    for l, layer in enumerate(layers, start=1):
+        ports.append(f"    output reg [15:0] bias_layer{l} [0:{len(layer['bias']) - 1}]")
+    verilog += ",\n".join(ports) + "\n);\n\ninitial begin\n"
+    
+    for l, (weight_file, bias_file) in enumerate(images, start=1):
+        verilog += f'    $readmemh("{weight_file}", weights_layer{l});\n'
+        verilog += f'    $readmemh("{bias_file}", bias_layer{l});\n'
     
     verilog += "end\n\nendmodule\n"
     
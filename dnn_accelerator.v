@@ -2,9 +2,26 @@
 // This module implements a simple 2-layer neural network accelerator
 // Layer 1: 4 inputs -> 3 hidden neurons
 // Layer 2: 3 hidden neurons -> 2 outputs
+// Layer 2 reads the hidden activations: requant_unit turns each finished
+// layer 1 accumulator into an 8-bit value (REQUANT_* parameters).
+// mac_unit reads weights and biases as two's complement (MAC_SIGNED) at
+// MAC_WEIGHT_W / MAC_ACC_W bits; mac_sizing.py picks the narrowest exact
+// widths for a model. The defaults take any int8 weight and int16 bias.
 // Uses MAC units for computation and includes control logic
+// With MAC_MUL_STAGE / MAC_ACC_STAGE the mac_unit is pipelined: every MAC
+// step then waits MAC_MUL_STAGE + MAC_ACC_STAGE extra cycles for its result.
 
-module dnn_accelerator (
+module dnn_accelerator #(
+    parameter MAC_SIGNED = 1,     // 1 = two's complement weights and biases
+    parameter MAC_WEIGHT_W = 8,   // mac_unit weight width (up to 8)
+    parameter MAC_ACC_W = 16,     // mac_unit accumulator width (up to 16)
+    parameter REQUANT_MULT = 1,   // Hidden activation multiplier (requant_unit)
+    parameter REQUANT_SHIFT = 7,  // Hidden activation right shift
+    parameter REQUANT_ROUND = 1,  // 1 = round the shift half up
+    parameter REQUANT_RELU = 1,   // 1 = ReLU on hidden activations
+    parameter MAC_MUL_STAGE = 0,  // mac_unit register stage after the multiply
+    parameter MAC_ACC_STAGE = 0   // mac_unit register stage after the accumulate
+) (
     input clk,                    // Clock signal
     input rst_n,                  // Reset signal (active low)
     input start,                  // Start computation signal
@@ -24,7 +41,7 @@ module dnn_accelerator (
     reg [15:0] bias_layer1 [0:2];     // Layer 1 biases (3 neurons)
     reg [15:0] bias_layer2 [0:1];     // Layer 2 biases (2 outputs)
     
-    reg [15:0] hidden_layer [0:2];    // Hidden layer activations
+    reg [7:0] hidden_layer [0:2];     // Hidden layer activations (requantized)
     reg [15:0] mac_result;            // MAC computation result
     
     // Control signals
@@ -32,6 +49,11 @@ module dnn_accelerator (
     reg [1:0] neuron_idx;              // Current neuron index
     reg [1:0] input_idx;               // Current input index
     
+    // Pipelined mac_unit: cycles to wait for mac_out after the operands change
+    localparam MAC_LATENCY = MAC_MUL_STAGE + MAC_ACC_STAGE;
+    reg [1:0] mac_wait;
+    wire mac_ready = (MAC_LATENCY == 0) || (mac_wait == MAC_LATENCY);
+    
     // State machine states
     localparam IDLE = 3'b000;
     localparam LAYER1_COMPUTE = 3'b001;
@@ -43,8 +65,9 @@ module dnn_accelerator (
     wire [7:0] current_weight;
     wire [15:0] mac_out;
     
-    // Multiplexer for input data
-    assign current_input = (input_idx == 2'b00) ? input_data_0 :
+    // Multiplexer for input data: network inputs, then hidden activations
+    assign current_input = (state != LAYER1_COMPUTE) ? hidden_layer[input_idx] :
+                          (input_idx == 2'b00) ? input_data_0 :
                           (input_idx == 2'b01) ? input_data_1 :
                           (input_idx == 2'b10) ? input_data_2 : input_data_3;
     
@@ -53,11 +76,31 @@ module dnn_accelerator (
                            weights_layer1[neuron_idx * 4 + input_idx] :
                            weights_layer2[neuron_idx * 3 + input_idx];
     
-    mac_unit mac_inst (
+    // C extended back to the 16-bit accumulator registers
+    wire [MAC_ACC_W-1:0] mac_c;
+    wire signed [15:0] mac_c_signed = $signed(mac_c);
+    wire [15:0] mac_c_unsigned = mac_c;
+    assign mac_out = MAC_SIGNED ? mac_c_signed : mac_c_unsigned;
+
+    mac_unit #(.WEIGHT_W(MAC_WEIGHT_W), .ACC_W(MAC_ACC_W), .SIGNED(MAC_SIGNED),
+               .MUL_STAGE(MAC_MUL_STAGE), .ACC_STAGE(MAC_ACC_STAGE)) mac_inst (
+        .clk(clk),
         .A(current_input),
-        .W(current_weight),
-        .B(mac_result),
-        .C(mac_out)
+        .W(current_weight[MAC_WEIGHT_W-1:0]),
+        .B(mac_result[MAC_ACC_W-1:0]),
+        .C(mac_c)
+    );
+    
+    // Requantize each finished hidden neuron to the 8-bit layer 2 input
+    wire [7:0] hidden_act;
+    
+    requant_unit #(.ACC_SIGNED(MAC_SIGNED)) requant_inst (
+        .acc(mac_out),
+        .multiplier(REQUANT_MULT[7:0]),
+        .shift(REQUANT_SHIFT[4:0]),
+        .round(REQUANT_ROUND[0]),
+        .relu(REQUANT_RELU[0]),
+        .q(hidden_act)
     );
     
     // Initialize weights and biases
@@ -80,9 +123,17 @@ module dnn_accelerator (
             neuron_idx <= 0;
             input_idx <= 0;
             mac_result <= 0;
+            mac_wait <= 0;
             done <= 0;
             valid <= 0;
         end else begin
+            // Count the wait for each MAC step's result
+            if (mac_ready) begin
+                mac_wait <= 0;
+            end else if (state == LAYER1_COMPUTE || state == LAYER2_COMPUTE) begin
+                mac_wait <= mac_wait + 1;
+            end
+            
             case (state)
                 IDLE: begin
                     if (start) begin
@@ -96,12 +147,14 @@ module dnn_accelerator (
                 end
                 
                 LAYER1_COMPUTE: begin
-                    if (input_idx < 3) begin
+                    if (!mac_ready) begin
+                        // mac_out not valid yet
+                    end else if (input_idx < 3) begin
                         mac_result <= mac_out;
                         input_idx <= input_idx + 1;
                     end else begin
-                        // Store hidden layer result
-                        hidden_layer[neuron_idx] <= mac_out;
+                        // Store hidden layer activation
+                        hidden_layer[neuron_idx] <= hidden_act;
                         input_idx <= 0;
                         
                         if (neuron_idx < 2) begin
@@ -118,7 +171,9 @@ module dnn_accelerator (
                 end
                 
                 LAYER2_COMPUTE: begin
-                    if (input_idx < 2) begin
+                    if (!mac_ready) begin
+                        // mac_out not valid yet
+                    end else if (input_idx < 2) begin
                         mac_result <= mac_out;
                         input_idx <= input_idx + 1;
                     end else begin
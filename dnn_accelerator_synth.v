@@ -1,1248 +1,23 @@
-/* Generated by Yosys 0.58 (git sha1 157aabb5831cc77d08346001c4a085f188d7c736, clang++ 17.0.0 -fPIC -O3) */
+/* Generated by Yosys 0.69 (git sha1 9f75ca1f9, Release, Clang /workspace/YoWASP/yosys/wasi-sdk-33.0-x86_64-linux/share/cmake/../..//bin/clang++ 22.1.0) */
 
-(* top =  1  *)
-(* src = "dnn_accelerator.v:7.1-159.10" *)
-module dnn_accelerator(clk, rst_n, start, input_data_0, input_data_1, input_data_2, input_data_3, output_data_0, output_data_1, done, valid);
-  (* src = "dnn_accelerator.v:8.11-8.14" *)
+(* keep_hierarchy =  1  *)
+(* dynports =  1  *)
+(* hdlname = "mac_unit" *)
+(* src = "mac_unit.v:18.1-92.10" *)
+module \$paramod$079cb365e8d4f2bc00a2147bd2bf67296f31546b\mac_unit (clk, A, W, B, C);
+  (* src = "mac_unit.v:28.11-28.14" *)
   input clk;
   wire clk;
-  (* src = "dnn_accelerator.v:9.11-9.16" *)
-  input rst_n;
-  wire rst_n;
-  (* src = "dnn_accelerator.v:10.11-10.16" *)
-  input start;
-  wire start;
-  (* src = "dnn_accelerator.v:11.17-11.29" *)
-  input [7:0] input_data_0;
-  wire [7:0] input_data_0;
-  (* src = "dnn_accelerator.v:12.17-12.29" *)
-  input [7:0] input_data_1;
-  wire [7:0] input_data_1;
-  (* src = "dnn_accelerator.v:13.17-13.29" *)
-  input [7:0] input_data_2;
-  wire [7:0] input_data_2;
-  (* src = "dnn_accelerator.v:14.17-14.29" *)
-  input [7:0] input_data_3;
-  wire [7:0] input_data_3;
-  (* src = "dnn_accelerator.v:15.23-15.36" *)
-  output [15:0] output_data_0;
-  reg [15:0] output_data_0;
-  (* src = "dnn_accelerator.v:16.23-16.36" *)
-  output [15:0] output_data_1;
-  reg [15:0] output_data_1;
-  (* src = "dnn_accelerator.v:17.16-17.20" *)
-  output done;
-  wire done;
-  (* src = "dnn_accelerator.v:18.16-18.21" *)
-  output valid;
-  reg valid;
-  wire _000_;
-  wire _001_;
-  wire _002_;
-  wire _003_;
-  wire _004_;
-  wire _005_;
-  wire _006_;
-  wire _007_;
-  wire _008_;
-  wire _009_;
-  wire _010_;
-  wire _011_;
-  wire _012_;
-  wire _013_;
-  wire _014_;
-  wire _015_;
-  wire _016_;
-  wire _017_;
-  wire _018_;
-  wire _019_;
-  wire _020_;
-  wire _021_;
-  wire _022_;
-  wire _023_;
-  wire _024_;
-  wire _025_;
-  wire _026_;
-  wire _027_;
-  wire _028_;
-  wire _029_;
-  wire _030_;
-  wire _031_;
-  wire _032_;
-  wire _033_;
-  wire _034_;
-  wire _035_;
-  wire _036_;
-  wire _037_;
-  wire _038_;
-  wire _039_;
-  wire _040_;
-  wire _041_;
-  wire _042_;
-  wire _043_;
-  wire _044_;
-  wire _045_;
-  wire _046_;
-  wire _047_;
-  wire _048_;
-  wire _049_;
-  wire _050_;
-  wire _051_;
-  wire _052_;
-  wire _053_;
-  wire _054_;
-  wire _055_;
-  wire _056_;
-  wire _057_;
-  wire _058_;
-  wire _059_;
-  wire _060_;
-  wire _061_;
-  wire _062_;
-  wire _063_;
-  wire _064_;
-  wire _065_;
-  wire _066_;
-  wire _067_;
-  wire _068_;
-  wire _069_;
-  wire _070_;
-  wire _071_;
-  wire _072_;
-  wire _073_;
-  wire _074_;
-  wire _075_;
-  wire _076_;
-  wire _077_;
-  wire _078_;
-  wire _079_;
-  wire _080_;
-  wire _081_;
-  wire _082_;
-  wire _083_;
-  wire _084_;
-  wire _085_;
-  wire _086_;
-  wire _087_;
-  wire _088_;
-  wire _089_;
-  wire _090_;
-  wire _091_;
-  wire _092_;
-  wire _093_;
-  wire _094_;
-  wire _095_;
-  wire _096_;
-  wire _097_;
-  wire _098_;
-  wire _099_;
-  wire _100_;
-  wire _101_;
-  wire _102_;
-  wire _103_;
-  wire _104_;
-  wire _105_;
-  wire _106_;
-  wire _107_;
-  wire _108_;
-  wire _109_;
-  wire _110_;
-  wire _111_;
-  wire _112_;
-  wire _113_;
-  wire _114_;
-  wire _115_;
-  wire _116_;
-  wire _117_;
-  wire _118_;
-  wire _119_;
-  wire _120_;
-  wire _121_;
-  wire _122_;
-  wire _123_;
-  wire _124_;
-  wire _125_;
-  wire _126_;
-  wire _127_;
-  wire _128_;
-  wire _129_;
-  wire _130_;
-  wire _131_;
-  wire _132_;
-  wire _133_;
-  wire _134_;
-  wire _135_;
-  wire _136_;
-  wire _137_;
-  wire _138_;
-  wire _139_;
-  wire _140_;
-  wire _141_;
-  wire _142_;
-  wire _143_;
-  wire _144_;
-  wire _145_;
-  wire _146_;
-  wire _147_;
-  wire _148_;
-  wire _149_;
-  wire _150_;
-  wire _151_;
-  wire _152_;
-  wire _153_;
-  wire _154_;
-  wire _155_;
-  wire _156_;
-  wire _157_;
-  wire _158_;
-  wire _159_;
-  wire _160_;
-  wire _161_;
-  wire _162_;
-  wire _163_;
-  wire _164_;
-  wire _165_;
-  wire _166_;
-  wire _167_;
-  wire _168_;
-  wire _169_;
-  wire _170_;
-  wire _171_;
-  wire _172_;
-  wire _173_;
-  wire _174_;
-  wire _175_;
-  wire _176_;
-  wire _177_;
-  wire _178_;
-  wire _179_;
-  wire _180_;
-  wire _181_;
-  wire _182_;
-  wire _183_;
-  wire _184_;
-  wire _185_;
-  wire _186_;
-  wire _187_;
-  wire _188_;
-  wire _189_;
-  wire _190_;
-  wire _191_;
-  wire _192_;
-  wire _193_;
-  wire _194_;
-  wire _195_;
-  wire _196_;
-  wire _197_;
-  wire _198_;
-  wire _199_;
-  wire _200_;
-  wire _201_;
-  wire _202_;
-  wire _203_;
-  wire _204_;
-  wire _205_;
-  wire _206_;
-  wire _207_;
-  wire _208_;
-  wire _209_;
-  wire _210_;
-  wire _211_;
-  wire _212_;
-  wire _213_;
-  wire _214_;
-  wire _215_;
-  wire _216_;
-  wire _217_;
-  wire _218_;
-  wire _219_;
-  wire _220_;
-  wire _221_;
-  wire _222_;
-  wire _223_;
-  wire _224_;
-  wire _225_;
-  wire _226_;
-  wire _227_;
-  wire _228_;
-  wire _229_;
-  wire _230_;
-  wire _231_;
-  wire _232_;
-  wire _233_;
-  wire _234_;
-  wire _235_;
-  wire _236_;
-  wire _237_;
-  wire _238_;
-  wire _239_;
-  wire _240_;
-  wire _241_;
-  wire _242_;
-  wire _243_;
-  (* src = "dnn_accelerator.v:42.16-42.29" *)
-  wire _244_;
-  (* src = "dnn_accelerator.v:42.16-42.29" *)
-  wire _245_;
-  (* src = "dnn_accelerator.v:42.16-42.29" *)
-  wire _246_;
-  (* src = "dnn_accelerator.v:42.16-42.29" *)
-  wire _247_;
-  (* src = "dnn_accelerator.v:42.16-42.29" *)
-  wire _248_;
-  (* src = "dnn_accelerator.v:42.16-42.29" *)
-  wire _249_;
-  (* src = "dnn_accelerator.v:42.16-42.29" *)
-  wire _250_;
-  (* src = "dnn_accelerator.v:42.16-42.29" *)
-  wire _251_;
-  (* src = "dnn_accelerator.v:43.16-43.30" *)
-  wire _252_;
-  (* src = "dnn_accelerator.v:43.16-43.30" *)
-  wire _253_;
-  (* src = "dnn_accelerator.v:43.16-43.30" *)
-  wire _254_;
-  (* src = "dnn_accelerator.v:43.16-43.30" *)
-  wire _255_;
-  (* src = "dnn_accelerator.v:43.16-43.30" *)
-  wire _256_;
-  (* src = "dnn_accelerator.v:43.16-43.30" *)
-  wire _257_;
-  (* src = "dnn_accelerator.v:43.16-43.30" *)
-  wire _258_;
-  (* src = "dnn_accelerator.v:11.17-11.29" *)
-  wire _259_;
-  (* src = "dnn_accelerator.v:11.17-11.29" *)
-  wire _260_;
-  (* src = "dnn_accelerator.v:11.17-11.29" *)
-  wire _261_;
-  (* src = "dnn_accelerator.v:11.17-11.29" *)
-  wire _262_;
-  (* src = "dnn_accelerator.v:11.17-11.29" *)
-  wire _263_;
-  (* src = "dnn_accelerator.v:11.17-11.29" *)
-  wire _264_;
-  (* src = "dnn_accelerator.v:11.17-11.29" *)
-  wire _265_;
-  (* src = "dnn_accelerator.v:11.17-11.29" *)
-  wire _266_;
-  (* src = "dnn_accelerator.v:12.17-12.29" *)
-  wire _267_;
-  (* src = "dnn_accelerator.v:12.17-12.29" *)
-  wire _268_;
-  (* src = "dnn_accelerator.v:12.17-12.29" *)
-  wire _269_;
-  (* src = "dnn_accelerator.v:12.17-12.29" *)
-  wire _270_;
-  (* src = "dnn_accelerator.v:12.17-12.29" *)
-  wire _271_;
-  (* src = "dnn_accelerator.v:12.17-12.29" *)
-  wire _272_;
-  (* src = "dnn_accelerator.v:12.17-12.29" *)
-  wire _273_;
-  (* src = "dnn_accelerator.v:12.17-12.29" *)
-  wire _274_;
-  (* src = "dnn_accelerator.v:13.17-13.29" *)
-  wire _275_;
-  (* src = "dnn_accelerator.v:13.17-13.29" *)
-  wire _276_;
-  (* src = "dnn_accelerator.v:13.17-13.29" *)
-  wire _277_;
-  (* src = "dnn_accelerator.v:13.17-13.29" *)
-  wire _278_;
-  (* src = "dnn_accelerator.v:13.17-13.29" *)
-  wire _279_;
-  (* src = "dnn_accelerator.v:13.17-13.29" *)
-  wire _280_;
-  (* src = "dnn_accelerator.v:13.17-13.29" *)
-  wire _281_;
-  (* src = "dnn_accelerator.v:13.17-13.29" *)
-  wire _282_;
-  (* src = "dnn_accelerator.v:14.17-14.29" *)
-  wire _283_;
-  (* src = "dnn_accelerator.v:14.17-14.29" *)
-  wire _284_;
-  (* src = "dnn_accelerator.v:14.17-14.29" *)
-  wire _285_;
-  (* src = "dnn_accelerator.v:14.17-14.29" *)
-  wire _286_;
-  (* src = "dnn_accelerator.v:14.17-14.29" *)
-  wire _287_;
-  (* src = "dnn_accelerator.v:14.17-14.29" *)
-  wire _288_;
-  (* src = "dnn_accelerator.v:14.17-14.29" *)
-  wire _289_;
-  (* src = "dnn_accelerator.v:14.17-14.29" *)
-  wire _290_;
-  (* src = "dnn_accelerator.v:33.15-33.24" *)
-  wire _291_;
-  (* src = "dnn_accelerator.v:33.15-33.24" *)
-  wire _292_;
-  (* src = "dnn_accelerator.v:44.17-44.24" *)
-  wire _293_;
-  (* src = "dnn_accelerator.v:44.17-44.24" *)
-  wire _294_;
-  (* src = "dnn_accelerator.v:44.17-44.24" *)
-  wire _295_;
-  (* src = "dnn_accelerator.v:44.17-44.24" *)
-  wire _296_;
-  (* src = "dnn_accelerator.v:44.17-44.24" *)
-  wire _297_;
-  (* src = "dnn_accelerator.v:44.17-44.24" *)
-  wire _298_;
-  (* src = "dnn_accelerator.v:44.17-44.24" *)
-  wire _299_;
-  (* src = "dnn_accelerator.v:44.17-44.24" *)
-  wire _300_;
-  (* src = "dnn_accelerator.v:44.17-44.24" *)
-  wire _301_;
-  (* src = "dnn_accelerator.v:44.17-44.24" *)
-  wire _302_;
-  (* src = "dnn_accelerator.v:44.17-44.24" *)
-  wire _303_;
-  (* src = "dnn_accelerator.v:44.17-44.24" *)
-  wire _304_;
-  (* src = "dnn_accelerator.v:44.17-44.24" *)
-  wire _305_;
-  (* src = "dnn_accelerator.v:44.17-44.24" *)
-  wire _306_;
-  (* src = "dnn_accelerator.v:44.17-44.24" *)
-  wire _307_;
-  (* src = "dnn_accelerator.v:44.17-44.24" *)
-  wire _308_;
-  (* src = "dnn_accelerator.v:32.15-32.25" *)
-  wire _309_;
-  (* src = "dnn_accelerator.v:32.15-32.25" *)
-  wire _310_;
-  wire _311_;
-  wire _312_;
-  wire _313_;
-  wire _314_;
-  wire _315_;
-  wire _316_;
-  wire _317_;
-  wire _318_;
-  wire _319_;
-  wire _320_;
-  wire _321_;
-  wire _322_;
-  wire _323_;
-  wire _324_;
-  wire _325_;
-  wire _326_;
-  wire _327_;
-  wire _328_;
-  wire _329_;
-  wire _330_;
-  wire _331_;
-  wire _332_;
-  wire _333_;
-  wire _334_;
-  wire _335_;
-  wire _336_;
-  wire _337_;
-  wire _338_;
-  wire _339_;
-  wire _340_;
-  wire _341_;
-  wire _342_;
-  wire _343_;
-  wire _344_;
-  wire _345_;
-  wire _346_;
-  wire _347_;
-  wire _348_;
-  wire _349_;
-  wire _350_;
-  wire _351_;
-  wire _352_;
-  wire _353_;
-  wire _354_;
-  wire _355_;
-  wire _356_;
-  wire _357_;
-  wire _358_;
-  wire _359_;
-  wire _360_;
-  wire _361_;
-  wire _362_;
-  wire _363_;
-  wire _364_;
-  wire _365_;
-  wire _366_;
-  wire _367_;
-  wire _368_;
-  wire _369_;
-  wire _370_;
-  wire _371_;
-  wire _372_;
-  wire _373_;
-  wire _374_;
-  wire _375_;
-  wire _376_;
-  wire _377_;
-  wire _378_;
-  wire _379_;
-  wire _380_;
-  wire _381_;
-  wire _382_;
-  wire _383_;
-  wire _384_;
-  wire _385_;
-  wire _386_;
-  wire _387_;
-  wire _388_;
-  wire _389_;
-  wire _390_;
-  wire _391_;
-  wire _392_;
-  wire _393_;
-  wire _394_;
-  wire _395_;
-  wire _396_;
-  wire _397_;
-  wire _398_;
-  wire _399_;
-  wire _400_;
-  wire _401_;
-  wire _402_;
-  wire _403_;
-  wire _404_;
-  wire _405_;
-  wire _406_;
-  wire _407_;
-  wire _408_;
-  wire _409_;
-  wire _410_;
-  wire _411_;
-  wire _412_;
-  wire _413_;
-  wire _414_;
-  wire _415_;
-  wire _416_;
-  wire _417_;
-  wire _418_;
-  wire _419_;
-  wire _420_;
-  wire _421_;
-  wire _422_;
-  wire _423_;
-  wire _424_;
-  wire _425_;
-  wire _426_;
-  wire _427_;
-  wire _428_;
-  wire _429_;
-  wire _430_;
-  wire _431_;
-  wire _432_;
-  wire _433_;
-  wire _434_;
-  wire _435_;
-  wire _436_;
-  wire _437_;
-  wire _438_;
-  wire _439_;
-  wire _440_;
-  wire _441_;
-  wire _442_;
-  wire _443_;
-  wire _444_;
-  wire _445_;
-  wire _446_;
-  wire _447_;
-  wire _448_;
-  wire _449_;
-  wire _450_;
-  wire _451_;
-  wire _452_;
-  wire _453_;
-  wire _454_;
-  wire _455_;
-  wire _456_;
-  wire _457_;
-  wire _458_;
-  wire _459_;
-  wire _460_;
-  wire _461_;
-  wire _462_;
-  wire _463_;
-  wire _464_;
-  wire _465_;
-  (* src = "dnn_accelerator.v:118.20-118.20|dnn_accelerator.v:86.13-155.20|/opt/homebrew/bin/../share/yosys/techmap.v:581.22-581.23" *)
-  wire _466_;
-  (* src = "dnn_accelerator.v:118.20-118.20|dnn_accelerator.v:86.13-155.20|/opt/homebrew/bin/../share/yosys/techmap.v:583.21-583.22" *)
-  wire _467_;
-  (* src = "dnn_accelerator.v:118.20-118.20|dnn_accelerator.v:86.13-155.20|/opt/homebrew/bin/../share/yosys/techmap.v:583.21-583.22" *)
-  wire _468_;
-  (* src = "dnn_accelerator.v:118.20-118.20|dnn_accelerator.v:86.13-155.20|/opt/homebrew/bin/../share/yosys/techmap.v:583.21-583.22" *)
-  wire _469_;
-  (* src = "dnn_accelerator.v:118.20-118.20|dnn_accelerator.v:86.13-155.20|/opt/homebrew/bin/../share/yosys/techmap.v:583.21-583.22" *)
-  wire _470_;
-  (* src = "dnn_accelerator.v:144.20-144.20|dnn_accelerator.v:86.13-155.20|/opt/homebrew/bin/../share/yosys/techmap.v:583.21-583.22" *)
-  wire _471_;
-  (* src = "dnn_accelerator.v:144.20-144.20|dnn_accelerator.v:86.13-155.20|/opt/homebrew/bin/../share/yosys/techmap.v:583.21-583.22" *)
-  wire _472_;
-  (* src = "dnn_accelerator.v:118.20-118.20|dnn_accelerator.v:86.13-155.20|/opt/homebrew/bin/../share/yosys/techmap.v:583.21-583.22" *)
-  wire _473_;
-  (* src = "dnn_accelerator.v:118.20-118.20|dnn_accelerator.v:86.13-155.20|/opt/homebrew/bin/../share/yosys/techmap.v:583.21-583.22" *)
-  wire _474_;
-  (* src = "dnn_accelerator.v:118.20-118.20|dnn_accelerator.v:86.13-155.20|/opt/homebrew/bin/../share/yosys/techmap.v:583.21-583.22" *)
-  wire _475_;
-  (* src = "dnn_accelerator.v:118.20-118.20|dnn_accelerator.v:86.13-155.20|/opt/homebrew/bin/../share/yosys/techmap.v:583.21-583.22" *)
-  wire _476_;
-  (* src = "dnn_accelerator.v:118.20-118.20|dnn_accelerator.v:86.13-155.20|/opt/homebrew/bin/../share/yosys/techmap.v:583.21-583.22" *)
-  wire _477_;
-  (* src = "dnn_accelerator.v:118.20-118.20|dnn_accelerator.v:86.13-155.20|/opt/homebrew/bin/../share/yosys/techmap.v:583.21-583.22" *)
-  wire _478_;
-  (* src = "dnn_accelerator.v:118.20-118.20|dnn_accelerator.v:86.13-155.20|/opt/homebrew/bin/../share/yosys/techmap.v:583.21-583.22" *)
-  wire _479_;
-  (* src = "dnn_accelerator.v:118.20-118.20|dnn_accelerator.v:86.13-155.20|/opt/homebrew/bin/../share/yosys/techmap.v:583.21-583.22" *)
-  wire _480_;
-  (* src = "dnn_accelerator.v:118.20-118.20|dnn_accelerator.v:86.13-155.20|/opt/homebrew/bin/../share/yosys/techmap.v:583.21-583.22" *)
-  wire _481_;
-  (* src = "dnn_accelerator.v:118.20-118.20|dnn_accelerator.v:86.13-155.20|/opt/homebrew/bin/../share/yosys/techmap.v:583.21-583.22" *)
-  wire _482_;
-  (* src = "dnn_accelerator.v:118.20-118.20|dnn_accelerator.v:86.13-155.20|/opt/homebrew/bin/../share/yosys/techmap.v:583.21-583.22" *)
-  wire _483_;
-  (* src = "dnn_accelerator.v:118.20-118.20|dnn_accelerator.v:86.13-155.20|/opt/homebrew/bin/../share/yosys/techmap.v:583.21-583.22" *)
-  wire _484_;
-  (* src = "dnn_accelerator.v:118.20-118.20|dnn_accelerator.v:86.13-155.20|/opt/homebrew/bin/../share/yosys/techmap.v:583.21-583.22" *)
-  wire _485_;
-  (* src = "dnn_accelerator.v:118.20-118.20|dnn_accelerator.v:86.13-155.20|/opt/homebrew/bin/../share/yosys/techmap.v:583.21-583.22" *)
-  wire _486_;
-  (* src = "dnn_accelerator.v:118.20-118.20|dnn_accelerator.v:86.13-155.20|/opt/homebrew/bin/../share/yosys/techmap.v:583.21-583.22" *)
-  wire _487_;
-  (* src = "dnn_accelerator.v:118.20-118.20|dnn_accelerator.v:86.13-155.20|/opt/homebrew/bin/../share/yosys/techmap.v:583.21-583.22" *)
-  wire _488_;
-  (* src = "dnn_accelerator.v:9.11-9.16" *)
-  wire _489_;
-  (* src = "dnn_accelerator.v:10.11-10.16" *)
-  wire _490_;
-  (* src = "dnn_accelerator.v:31.15-31.20" *)
-  wire _491_;
-  (* src = "dnn_accelerator.v:31.15-31.20" *)
-  wire _492_;
-  (* src = "dnn_accelerator.v:31.15-31.20" *)
-  wire _493_;
-  (* force_downto = 32'd1 *)
-  (* src = "dnn_accelerator.v:118.20-118.20|dnn_accelerator.v:86.13-155.20|/opt/homebrew/bin/../share/yosys/techmap.v:581.22-581.23" *)
-  (* unused_bits = "1" *)
-  wire [1:0] _494_;
-  (* force_downto = 32'd1 *)
-  (* src = "dnn_accelerator.v:118.20-118.20|dnn_accelerator.v:86.13-155.20|/opt/homebrew/bin/../share/yosys/techmap.v:583.21-583.22" *)
-  wire [1:0] _495_;
-  (* force_downto = 32'd1 *)
-  (* src = "dnn_accelerator.v:118.20-118.20|dnn_accelerator.v:86.13-155.20|/opt/homebrew/bin/../share/yosys/techmap.v:583.21-583.22" *)
-  wire [1:0] _496_;
-  (* force_downto = 32'd1 *)
-  (* src = "dnn_accelerator.v:144.20-144.20|dnn_accelerator.v:86.13-155.20|/opt/homebrew/bin/../share/yosys/techmap.v:583.21-583.22" *)
-  wire [2:0] _497_;
-  (* force_downto = 32'd1 *)
-  (* src = "dnn_accelerator.v:118.20-118.20|dnn_accelerator.v:86.13-155.20|/opt/homebrew/bin/../share/yosys/techmap.v:583.21-583.22" *)
-  wire [15:0] _498_;
-  (* src = "dnn_accelerator.v:24.16-24.27" *)
-  wire [15:0] \bias_layer1[0] ;
-  (* src = "dnn_accelerator.v:24.16-24.27" *)
-  wire [15:0] \bias_layer1[1] ;
-  (* src = "dnn_accelerator.v:24.16-24.27" *)
-  wire [15:0] \bias_layer1[2] ;
-  (* src = "dnn_accelerator.v:25.16-25.27" *)
-  wire [15:0] \bias_layer2[0] ;
-  (* src = "dnn_accelerator.v:25.16-25.27" *)
-  wire [15:0] \bias_layer2[1] ;
-  (* src = "dnn_accelerator.v:42.16-42.29" *)
-  wire [7:0] current_input;
-  (* src = "dnn_accelerator.v:43.16-43.30" *)
-  wire [7:0] current_weight;
-  (* src = "dnn_accelerator.v:33.15-33.24" *)
-  reg [1:0] input_idx;
-  (* src = "dnn_accelerator.v:44.17-44.24" *)
-  wire [15:0] mac_out;
-  (* src = "dnn_accelerator.v:28.16-28.26" *)
-  reg [15:0] mac_result;
-  (* src = "dnn_accelerator.v:32.15-32.25" *)
-  reg [1:0] neuron_idx;
-  (* src = "dnn_accelerator.v:31.15-31.20" *)
-  reg [2:0] state;
-  (* src = "dnn_accelerator.v:22.15-22.29" *)
-  wire [7:0] \weights_layer1[0] ;
-  (* src = "dnn_accelerator.v:22.15-22.29" *)
-  wire [7:0] \weights_layer1[10] ;
-  (* src = "dnn_accelerator.v:22.15-22.29" *)
-  wire [7:0] \weights_layer1[11] ;
-  (* src = "dnn_accelerator.v:22.15-22.29" *)
-  wire [7:0] \weights_layer1[1] ;
-  (* src = "dnn_accelerator.v:22.15-22.29" *)
-  wire [7:0] \weights_layer1[2] ;
-  (* src = "dnn_accelerator.v:22.15-22.29" *)
-  wire [7:0] \weights_layer1[3] ;
-  (* src = "dnn_accelerator.v:22.15-22.29" *)
-  wire [7:0] \weights_layer1[4] ;
-  (* src = "dnn_accelerator.v:22.15-22.29" *)
-  wire [7:0] \weights_layer1[5] ;
-  (* src = "dnn_accelerator.v:22.15-22.29" *)
-  wire [7:0] \weights_layer1[6] ;
-  (* src = "dnn_accelerator.v:22.15-22.29" *)
-  wire [7:0] \weights_layer1[7] ;
-  (* src = "dnn_accelerator.v:22.15-22.29" *)
-  wire [7:0] \weights_layer1[8] ;
-  (* src = "dnn_accelerator.v:22.15-22.29" *)
-  wire [7:0] \weights_layer1[9] ;
-  (* src = "dnn_accelerator.v:23.15-23.29" *)
-  wire [7:0] \weights_layer2[0] ;
-  (* src = "dnn_accelerator.v:23.15-23.29" *)
-  wire [7:0] \weights_layer2[1] ;
-  (* src = "dnn_accelerator.v:23.15-23.29" *)
-  wire [7:0] \weights_layer2[2] ;
-  (* src = "dnn_accelerator.v:23.15-23.29" *)
-  wire [7:0] \weights_layer2[3] ;
-  (* src = "dnn_accelerator.v:23.15-23.29" *)
-  wire [7:0] \weights_layer2[4] ;
-  (* src = "dnn_accelerator.v:23.15-23.29" *)
-  wire [7:0] \weights_layer2[5] ;
-  assign _311_ = ~_309_;
-  assign _312_ = ~_291_;
-  assign _313_ = ~_304_;
-  assign _314_ = ~(_493_ | _491_);
-  assign _466_ = _492_ & _314_;
-  assign _315_ = ~_466_;
-  assign _316_ = ~(_309_ | _310_);
-  assign _317_ = _466_ & _316_;
-  assign _318_ = _489_ & _292_;
-  assign _243_ = _317_ & _318_;
-  assign _319_ = _466_ & ~(_316_);
-  assign _320_ = ~(_292_ & _319_);
-  assign _242_ = _318_ & _319_;
-  assign _321_ = ~(_491_ | _492_);
-  assign _322_ = _493_ | ~(_321_);
-  assign _471_ = ~_322_;
-  assign _323_ = _491_ & ~(_493_);
-  assign _472_ = _323_ & ~(_492_);
-  assign _324_ = _492_ ? _314_ : _323_;
-  assign _325_ = ~(_490_ | _322_);
-  assign _237_ = _322_ ? _324_ : _490_;
-  assign _326_ = _292_ & _291_;
-  assign _327_ = ~_326_;
-  assign _328_ = _292_ | ~(_466_);
-  assign _329_ = _472_ | ~(_328_);
-  assign _330_ = _327_ & _329_;
-  assign _331_ = _237_ & ~(_319_);
-  assign _238_ = _331_ & ~(_330_);
-  assign _332_ = _493_ & _490_;
-  assign _333_ = ~(_321_ & _332_);
-  assign _334_ = ~(_317_ | _325_);
-  assign _335_ = _333_ & _334_;
-  assign _336_ = _310_ | ~(_472_);
-  assign _337_ = _335_ & _336_;
-  assign _239_ = _337_ & ~(_330_);
-  assign _338_ = _466_ ? _292_ : _321_;
-  assign _241_ = _335_ & _338_;
-  assign _240_ = _320_ & _237_;
-  assign _339_ = _292_ | _291_;
-  assign _340_ = _291_ & ~(_292_);
-  assign _341_ = ~(_267_ & _340_);
-  assign _342_ = ~(_283_ & _326_);
-  assign _343_ = _291_ | ~(_275_);
-  assign _344_ = _342_ & _343_;
-  assign _345_ = ~(_341_ & _344_);
-  assign _346_ = _292_ & ~(_291_);
-  assign _244_ = _339_ ? _345_ : _259_;
-  assign _347_ = ~(_268_ & _340_);
-  assign _348_ = ~(_284_ & _326_);
-  assign _349_ = _291_ | ~(_276_);
-  assign _350_ = _348_ & _349_;
-  assign _351_ = ~(_347_ & _350_);
-  assign _245_ = _339_ ? _351_ : _260_;
-  assign _352_ = ~(_269_ & _340_);
-  assign _353_ = ~(_285_ & _326_);
-  assign _354_ = _291_ | ~(_277_);
-  assign _355_ = _353_ & _354_;
-  assign _356_ = ~(_352_ & _355_);
-  assign _246_ = _339_ ? _356_ : _261_;
-  assign _357_ = ~(_286_ & _326_);
-  assign _358_ = ~(_270_ & _340_);
-  assign _359_ = _291_ | ~(_278_);
-  assign _360_ = _358_ & _359_;
-  assign _361_ = ~(_357_ & _360_);
-  assign _247_ = _339_ ? _361_ : _262_;
-  assign _362_ = ~(_271_ & _340_);
-  assign _363_ = ~(_287_ & _326_);
-  assign _364_ = _291_ | ~(_279_);
-  assign _365_ = _363_ & _364_;
-  assign _366_ = ~(_362_ & _365_);
-  assign _248_ = _339_ ? _366_ : _263_;
-  assign _367_ = ~(_272_ & _340_);
-  assign _368_ = ~(_288_ & _326_);
-  assign _369_ = _291_ | ~(_280_);
-  assign _370_ = _368_ & _369_;
-  assign _371_ = ~(_367_ & _370_);
-  assign _249_ = _339_ ? _371_ : _264_;
-  assign _372_ = ~(_289_ & _326_);
-  assign _373_ = ~(_273_ & _340_);
-  assign _374_ = _291_ | ~(_281_);
-  assign _375_ = _373_ & _374_;
-  assign _376_ = ~(_372_ & _375_);
-  assign _250_ = _339_ ? _376_ : _265_;
-  assign _377_ = ~(_290_ & _326_);
-  assign _378_ = ~(_274_ & _340_);
-  assign _379_ = _291_ | ~(_282_);
-  assign _380_ = _378_ & _379_;
-  assign _381_ = ~(_377_ & _380_);
-  assign _251_ = _339_ ? _381_ : _266_;
-  assign _382_ = _309_ ^ _310_;
-  assign _383_ = ~(_292_ & _382_);
-  assign _384_ = ~(_292_ ^ _382_);
-  assign _385_ = ~(_309_ & _291_);
-  assign _386_ = ~(_309_ | _291_);
-  assign _387_ = _385_ & ~(_386_);
-  assign _388_ = _309_ | ~(_310_);
-  assign _389_ = _292_ | _388_;
-  assign _390_ = _309_ & ~(_310_);
-  assign _391_ = _310_ | ~(_309_);
-  assign _392_ = ~(_309_ & _292_);
-  assign _393_ = _292_ ? _391_ : _388_;
-  assign _394_ = _387_ & _393_;
-  assign _395_ = _384_ | _385_;
-  assign _396_ = _384_ ^ _385_;
-  assign _397_ = ~(_393_ & _396_);
-  assign _398_ = _384_ | ~(_394_);
-  assign _399_ = ~(_346_ & _390_);
-  assign _400_ = _395_ & _399_;
-  assign _401_ = ~(_398_ & _400_);
-  assign _402_ = _472_ & _390_;
-  assign _252_ = _472_ ? _390_ : _401_;
-  assign _403_ = ~(_384_ & _394_);
-  assign _404_ = _397_ & _403_;
-  assign _405_ = ~(_397_ & _403_);
-  assign _406_ = ~(_400_ & _404_);
-  assign _407_ = _472_ | ~(_399_);
-  assign _408_ = _397_ & ~(_407_);
-  assign _409_ = ~(_406_ & _408_);
-  assign _410_ = _310_ ? _386_ : _291_;
-  assign _411_ = ~(_472_ & _410_);
-  assign _253_ = _409_ & _411_;
-  assign _412_ = _326_ | ~(_339_);
-  assign _413_ = ~_412_;
-  assign _414_ = ~(_390_ & _412_);
-  assign _415_ = _389_ & _414_;
-  assign _416_ = ~(_316_ & _413_);
-  assign _417_ = ~(_415_ & _416_);
-  assign _254_ = _472_ ? _417_ : _405_;
-  assign _418_ = _310_ ? _311_ : _387_;
-  assign _419_ = ~(_413_ & _418_);
-  assign _420_ = _384_ & _387_;
-  assign _255_ = _472_ ? _419_ : _420_;
-  assign _421_ = ~(_472_ | _394_);
-  assign _422_ = ~(_406_ & _421_);
-  assign _258_ = ~_422_;
-  assign _423_ = ~(_340_ & _382_);
-  assign _424_ = _472_ & _423_;
-  assign _425_ = ~(_416_ & _424_);
-  assign _256_ = _422_ & _425_;
-  assign _426_ = ~(_316_ & _326_);
-  assign _427_ = _472_ & _426_;
-  assign _428_ = ~(_383_ & _427_);
-  assign _257_ = _422_ & _428_;
-  assign _467_ = _312_ & _329_;
-  assign _468_ = _329_ & _413_;
-  assign _429_ = _315_ & _336_;
-  assign _469_ = _311_ & ~(_429_);
-  assign _470_ = _382_ & ~(_429_);
-  assign _473_ = _293_ & _330_;
-  assign _430_ = _292_ | _300_;
-  assign _431_ = ~(_466_ & _430_);
-  assign _432_ = ~(_310_ & _326_);
-  assign _433_ = _326_ ? _310_ : _300_;
-  assign _434_ = ~(_472_ & _433_);
-  assign _480_ = ~(_431_ & _434_);
-  assign _435_ = _301_ | _326_;
-  assign _436_ = ~(_427_ & _435_);
-  assign _437_ = _292_ ? _309_ : _301_;
-  assign _438_ = ~_437_;
-  assign _439_ = _466_ ? _438_ : _472_;
-  assign _481_ = ~(_436_ & _439_);
-  assign _440_ = _292_ ? _311_ : _302_;
-  assign _441_ = ~(_466_ & _440_);
-  assign _442_ = _302_ | _326_;
-  assign _443_ = _472_ & _442_;
-  assign _444_ = ~(_432_ & _443_);
-  assign _482_ = ~(_441_ & _444_);
-  assign _445_ = _292_ | _303_;
-  assign _446_ = ~(_466_ & _445_);
-  assign _447_ = _326_ ? _310_ : _303_;
-  assign _448_ = ~(_472_ & _447_);
-  assign _483_ = ~(_446_ & _448_);
-  assign _449_ = _304_ | _326_;
-  assign _450_ = ~(_326_ & _391_);
-  assign _451_ = _472_ & _449_;
-  assign _452_ = ~(_450_ & _451_);
-  assign _453_ = _466_ & _392_;
-  assign _454_ = _292_ ? _309_ : _313_;
-  assign _455_ = _466_ ? _454_ : _472_;
-  assign _484_ = ~(_452_ & _455_);
-  assign _456_ = _292_ | _305_;
-  assign _457_ = _453_ & _456_;
-  assign _458_ = _326_ ? _316_ : _305_;
-  assign _459_ = _472_ ? _458_ : _315_;
-  assign _485_ = _457_ | _459_;
-  assign _460_ = _292_ | _306_;
-  assign _461_ = ~(_466_ & _460_);
-  assign _462_ = _326_ ? _391_ : _306_;
-  assign _463_ = ~(_472_ & _462_);
-  assign _486_ = ~(_461_ & _463_);
-  assign _464_ = ~(_307_ & _330_);
-  assign _465_ = ~(_326_ & _402_);
-  assign _487_ = ~(_464_ & _465_);
-  assign _488_ = _308_ & _330_;
-  assign _474_ = _294_ & _330_;
-  assign _475_ = _295_ & _330_;
-  assign _476_ = _296_ & _330_;
-  assign _477_ = _297_ & _330_;
-  assign _478_ = _298_ & _330_;
-  assign _479_ = _299_ & _330_;
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk, negedge rst_n)
-    if (!rst_n) input_idx[0] <= 1'h0;
-    else if (_000_) input_idx[0] <= _495_[0];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk, negedge rst_n)
-    if (!rst_n) input_idx[1] <= 1'h0;
-    else if (_000_) input_idx[1] <= _495_[1];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_006_) output_data_0[0] <= mac_out[0];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_006_) output_data_0[1] <= mac_out[1];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_006_) output_data_0[2] <= mac_out[2];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_006_) output_data_0[3] <= mac_out[3];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_006_) output_data_0[4] <= mac_out[4];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_006_) output_data_0[5] <= mac_out[5];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_006_) output_data_0[6] <= mac_out[6];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_006_) output_data_0[7] <= mac_out[7];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_006_) output_data_0[8] <= mac_out[8];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_006_) output_data_0[9] <= mac_out[9];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_006_) output_data_0[10] <= mac_out[10];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_006_) output_data_0[11] <= mac_out[11];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_006_) output_data_0[12] <= mac_out[12];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_006_) output_data_0[13] <= mac_out[13];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_006_) output_data_0[14] <= mac_out[14];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_006_) output_data_0[15] <= mac_out[15];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_005_) output_data_1[0] <= mac_out[0];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_005_) output_data_1[1] <= mac_out[1];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_005_) output_data_1[2] <= mac_out[2];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_005_) output_data_1[3] <= mac_out[3];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_005_) output_data_1[4] <= mac_out[4];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_005_) output_data_1[5] <= mac_out[5];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_005_) output_data_1[6] <= mac_out[6];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_005_) output_data_1[7] <= mac_out[7];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_005_) output_data_1[8] <= mac_out[8];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_005_) output_data_1[9] <= mac_out[9];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_005_) output_data_1[10] <= mac_out[10];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_005_) output_data_1[11] <= mac_out[11];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_005_) output_data_1[12] <= mac_out[12];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_005_) output_data_1[13] <= mac_out[13];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_005_) output_data_1[14] <= mac_out[14];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk)
-    if (_005_) output_data_1[15] <= mac_out[15];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk, negedge rst_n)
-    if (!rst_n) valid <= 1'h0;
-    else if (_004_) valid <= _494_[0];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk, negedge rst_n)
-    if (!rst_n) mac_result[0] <= 1'h0;
-    else if (_003_) mac_result[0] <= _498_[0];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk, negedge rst_n)
-    if (!rst_n) mac_result[1] <= 1'h0;
-    else if (_003_) mac_result[1] <= _498_[1];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk, negedge rst_n)
-    if (!rst_n) mac_result[2] <= 1'h0;
-    else if (_003_) mac_result[2] <= _498_[2];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk, negedge rst_n)
-    if (!rst_n) mac_result[3] <= 1'h0;
-    else if (_003_) mac_result[3] <= _498_[3];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk, negedge rst_n)
-    if (!rst_n) mac_result[4] <= 1'h0;
-    else if (_003_) mac_result[4] <= _498_[4];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk, negedge rst_n)
-    if (!rst_n) mac_result[5] <= 1'h0;
-    else if (_003_) mac_result[5] <= _498_[5];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk, negedge rst_n)
-    if (!rst_n) mac_result[6] <= 1'h0;
-    else if (_003_) mac_result[6] <= _498_[6];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk, negedge rst_n)
-    if (!rst_n) mac_result[7] <= 1'h0;
-    else if (_003_) mac_result[7] <= _498_[7];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk, negedge rst_n)
-    if (!rst_n) mac_result[8] <= 1'h0;
-    else if (_003_) mac_result[8] <= _498_[8];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk, negedge rst_n)
-    if (!rst_n) mac_result[9] <= 1'h0;
-    else if (_003_) mac_result[9] <= _498_[9];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk, negedge rst_n)
-    if (!rst_n) mac_result[10] <= 1'h0;
-    else if (_003_) mac_result[10] <= _498_[10];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk, negedge rst_n)
-    if (!rst_n) mac_result[11] <= 1'h0;
-    else if (_003_) mac_result[11] <= _498_[11];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk, negedge rst_n)
-    if (!rst_n) mac_result[12] <= 1'h0;
-    else if (_003_) mac_result[12] <= _498_[12];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk, negedge rst_n)
-    if (!rst_n) mac_result[13] <= 1'h0;
-    else if (_003_) mac_result[13] <= _498_[13];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk, negedge rst_n)
-    if (!rst_n) mac_result[14] <= 1'h0;
-    else if (_003_) mac_result[14] <= _498_[14];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk, negedge rst_n)
-    if (!rst_n) mac_result[15] <= 1'h0;
-    else if (_003_) mac_result[15] <= _498_[15];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk, negedge rst_n)
-    if (!rst_n) state[0] <= 1'h0;
-    else if (_002_) state[0] <= _497_[0];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk, negedge rst_n)
-    if (!rst_n) state[1] <= 1'h0;
-    else if (_002_) state[1] <= _497_[1];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk, negedge rst_n)
-    if (!rst_n) state[2] <= 1'h0;
-    else if (_002_) state[2] <= _494_[0];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk, negedge rst_n)
-    if (!rst_n) neuron_idx[0] <= 1'h0;
-    else if (_001_) neuron_idx[0] <= _496_[0];
-  (* src = "dnn_accelerator.v:64.5-157.8" *)
-  always @(posedge clk, negedge rst_n)
-    if (!rst_n) neuron_idx[1] <= 1'h0;
-    else if (_001_) neuron_idx[1] <= _496_[1];
-  (* module_not_derived = 32'd1 *)
-  (* src = "dnn_accelerator.v:56.14-61.6" *)
-  mac_unit mac_inst (
-    .A(current_input),
-    .B(mac_result),
-    .C(mac_out),
-    .W({ 1'h0, current_weight[6:0] })
-  );
-  assign _497_[2] = _494_[0];
-  assign \bias_layer1[0]  = 16'h0064;
-  assign \bias_layer1[1]  = 16'h00c8;
-  assign \bias_layer1[2]  = 16'h012c;
-  assign \bias_layer2[0]  = 16'h0096;
-  assign \bias_layer2[1]  = 16'h00fa;
-  assign current_weight[7] = 1'h0;
-  assign done = valid;
-  assign \weights_layer1[0]  = 8'h0a;
-  assign \weights_layer1[10]  = 8'h20;
-  assign \weights_layer1[11]  = 8'h2a;
-  assign \weights_layer1[1]  = 8'h14;
-  assign \weights_layer1[2]  = 8'h1e;
-  assign \weights_layer1[3]  = 8'h28;
-  assign \weights_layer1[4]  = 8'h0f;
-  assign \weights_layer1[5]  = 8'h19;
-  assign \weights_layer1[6]  = 8'h23;
-  assign \weights_layer1[7]  = 8'h2d;
-  assign \weights_layer1[8]  = 8'h0c;
-  assign \weights_layer1[9]  = 8'h16;
-  assign \weights_layer2[0]  = 8'h32;
-  assign \weights_layer2[1]  = 8'h3c;
-  assign \weights_layer2[2]  = 8'h46;
-  assign \weights_layer2[3]  = 8'h37;
-  assign \weights_layer2[4]  = 8'h41;
-  assign \weights_layer2[5]  = 8'h4b;
-  assign _493_ = state[2];
-  assign _491_ = state[0];
-  assign _492_ = state[1];
-  assign _494_[0] = _466_;
-  assign _489_ = rst_n;
-  assign _309_ = neuron_idx[0];
-  assign _310_ = neuron_idx[1];
-  assign _292_ = input_idx[1];
-  assign _006_ = _243_;
-  assign _005_ = _242_;
-  assign _497_[0] = _471_;
-  assign _490_ = start;
-  assign _000_ = _237_;
-  assign _291_ = input_idx[0];
-  assign _001_ = _238_;
-  assign _002_ = _239_;
-  assign _004_ = _241_;
-  assign _003_ = _240_;
-  assign _275_ = input_data_2[0];
-  assign _283_ = input_data_3[0];
-  assign _267_ = input_data_1[0];
-  assign _259_ = input_data_0[0];
-  assign current_input[0] = _244_;
-  assign _276_ = input_data_2[1];
-  assign _284_ = input_data_3[1];
-  assign _268_ = input_data_1[1];
-  assign _260_ = input_data_0[1];
-  assign current_input[1] = _245_;
-  assign _277_ = input_data_2[2];
-  assign _285_ = input_data_3[2];
-  assign _269_ = input_data_1[2];
-  assign _261_ = input_data_0[2];
-  assign current_input[2] = _246_;
-  assign _278_ = input_data_2[3];
-  assign _286_ = input_data_3[3];
-  assign _270_ = input_data_1[3];
-  assign _262_ = input_data_0[3];
-  assign current_input[3] = _247_;
-  assign _279_ = input_data_2[4];
-  assign _287_ = input_data_3[4];
-  assign _271_ = input_data_1[4];
-  assign _263_ = input_data_0[4];
-  assign current_input[4] = _248_;
-  assign _280_ = input_data_2[5];
-  assign _288_ = input_data_3[5];
-  assign _272_ = input_data_1[5];
-  assign _264_ = input_data_0[5];
-  assign current_input[5] = _249_;
-  assign _281_ = input_data_2[6];
-  assign _289_ = input_data_3[6];
-  assign _273_ = input_data_1[6];
-  assign _265_ = input_data_0[6];
-  assign current_input[6] = _250_;
-  assign _282_ = input_data_2[7];
-  assign _290_ = input_data_3[7];
-  assign _274_ = input_data_1[7];
-  assign _266_ = input_data_0[7];
-  assign current_input[7] = _251_;
-  assign current_weight[0] = _252_;
-  assign current_weight[1] = _253_;
-  assign current_weight[2] = _254_;
-  assign current_weight[3] = _255_;
-  assign current_weight[4] = _256_;
-  assign current_weight[5] = _257_;
-  assign current_weight[6] = _258_;
-  assign _495_[0] = _467_;
-  assign _495_[1] = _468_;
-  assign _496_[0] = _469_;
-  assign _496_[1] = _470_;
-  assign _497_[1] = _472_;
-  assign _293_ = mac_out[0];
-  assign _498_[0] = _473_;
-  assign _300_ = mac_out[1];
-  assign _498_[1] = _480_;
-  assign _301_ = mac_out[2];
-  assign _498_[2] = _481_;
-  assign _302_ = mac_out[3];
-  assign _498_[3] = _482_;
-  assign _303_ = mac_out[4];
-  assign _498_[4] = _483_;
-  assign _304_ = mac_out[5];
-  assign _498_[5] = _484_;
-  assign _305_ = mac_out[6];
-  assign _498_[6] = _485_;
-  assign _306_ = mac_out[7];
-  assign _498_[7] = _486_;
-  assign _307_ = mac_out[8];
-  assign _498_[8] = _487_;
-  assign _308_ = mac_out[9];
-  assign _498_[9] = _488_;
-  assign _294_ = mac_out[10];
-  assign _498_[10] = _474_;
-  assign _295_ = mac_out[11];
-  assign _498_[11] = _475_;
-  assign _296_ = mac_out[12];
-  assign _498_[12] = _476_;
-  assign _297_ = mac_out[13];
-  assign _498_[13] = _477_;
-  assign _298_ = mac_out[14];
-  assign _498_[14] = _478_;
-  assign _299_ = mac_out[15];
-  assign _498_[15] = _479_;
-endmodule
-
-(* src = "mac_unit.v:5.1-21.10" *)
-module mac_unit(A, W, B, C);
-  (* src = "mac_unit.v:6.17-6.18" *)
+  (* src = "mac_unit.v:29.24-29.25" *)
   input [7:0] A;
   wire [7:0] A;
-  (* src = "mac_unit.v:7.17-7.18" *)
+  (* src = "mac_unit.v:30.26-30.27" *)
   input [7:0] W;
   wire [7:0] W;
-  (* src = "mac_unit.v:8.18-8.19" *)
+  (* src = "mac_unit.v:31.23-31.24" *)
   input [15:0] B;
   wire [15:0] B;
-  (* src = "mac_unit.v:9.19-9.20" *)
+  (* src = "mac_unit.v:32.24-32.25" *)
   output [15:0] C;
   wire [15:0] C;
   wire _0000_;
@@ -1660,120 +435,120 @@ module mac_unit(A, W, B, C);
   wire _0412_;
   wire _0413_;
   wire _0414_;
+  (* src = "mac_unit.v:29.24-29.25" *)
   wire _0415_;
+  (* src = "mac_unit.v:29.24-29.25" *)
   wire _0416_;
+  (* src = "mac_unit.v:29.24-29.25" *)
   wire _0417_;
+  (* src = "mac_unit.v:29.24-29.25" *)
   wire _0418_;
+  (* src = "mac_unit.v:29.24-29.25" *)
   wire _0419_;
+  (* src = "mac_unit.v:29.24-29.25" *)
   wire _0420_;
+  (* src = "mac_unit.v:29.24-29.25" *)
   wire _0421_;
+  (* src = "mac_unit.v:29.24-29.25" *)
   wire _0422_;
+  (* src = "mac_unit.v:31.23-31.24" *)
   wire _0423_;
+  (* src = "mac_unit.v:31.23-31.24" *)
   wire _0424_;
+  (* src = "mac_unit.v:31.23-31.24" *)
   wire _0425_;
+  (* src = "mac_unit.v:31.23-31.24" *)
   wire _0426_;
+  (* src = "mac_unit.v:31.23-31.24" *)
   wire _0427_;
+  (* src = "mac_unit.v:31.23-31.24" *)
   wire _0428_;
+  (* src = "mac_unit.v:31.23-31.24" *)
   wire _0429_;
+  (* src = "mac_unit.v:31.23-31.24" *)
   wire _0430_;
+  (* src = "mac_unit.v:31.23-31.24" *)
   wire _0431_;
+  (* src = "mac_unit.v:31.23-31.24" *)
   wire _0432_;
+  (* src = "mac_unit.v:31.23-31.24" *)
   wire _0433_;
-  (* src = "mac_unit.v:6.17-6.18" *)
+  (* src = "mac_unit.v:31.23-31.24" *)
   wire _0434_;
-  (* src = "mac_unit.v:6.17-6.18" *)
+  (* src = "mac_unit.v:31.23-31.24" *)
   wire _0435_;
-  (* src = "mac_unit.v:6.17-6.18" *)
+  (* src = "mac_unit.v:31.23-31.24" *)
   wire _0436_;
-  (* src = "mac_unit.v:6.17-6.18" *)
+  (* src = "mac_unit.v:31.23-31.24" *)
   wire _0437_;
-  (* src = "mac_unit.v:6.17-6.18" *)
+  (* src = "mac_unit.v:31.23-31.24" *)
   wire _0438_;
-  (* src = "mac_unit.v:6.17-6.18" *)
+  (* src = "mac_unit.v:32.24-32.25" *)
   wire _0439_;
-  (* src = "mac_unit.v:6.17-6.18" *)
+  (* src = "mac_unit.v:32.24-32.25" *)
   wire _0440_;
-  (* src = "mac_unit.v:6.17-6.18" *)
+  (* src = "mac_unit.v:32.24-32.25" *)
   wire _0441_;
-  (* src = "mac_unit.v:8.18-8.19" *)
+  (* src = "mac_unit.v:32.24-32.25" *)
   wire _0442_;
-  (* src = "mac_unit.v:8.18-8.19" *)
+  (* src = "mac_unit.v:32.24-32.25" *)
   wire _0443_;
-  (* src = "mac_unit.v:8.18-8.19" *)
+  (* src = "mac_unit.v:32.24-32.25" *)
   wire _0444_;
-  (* src = "mac_unit.v:8.18-8.19" *)
+  (* src = "mac_unit.v:32.24-32.25" *)
   wire _0445_;
-  (* src = "mac_unit.v:8.18-8.19" *)
+  (* src = "mac_unit.v:32.24-32.25" *)
   wire _0446_;
-  (* src = "mac_unit.v:8.18-8.19" *)
+  (* src = "mac_unit.v:32.24-32.25" *)
   wire _0447_;
-  (* src = "mac_unit.v:8.18-8.19" *)
+  (* src = "mac_unit.v:32.24-32.25" *)
   wire _0448_;
-  (* src = "mac_unit.v:8.18-8.19" *)
+  (* src = "mac_unit.v:32.24-32.25" *)
   wire _0449_;
-  (* src = "mac_unit.v:8.18-8.19" *)
+  (* src = "mac_unit.v:32.24-32.25" *)
   wire _0450_;
-  (* src = "mac_unit.v:8.18-8.19" *)
+  (* src = "mac_unit.v:32.24-32.25" *)
   wire _0451_;
-  (* src = "mac_unit.v:8.18-8.19" *)
+  (* src = "mac_unit.v:32.24-32.25" *)
   wire _0452_;
-  (* src = "mac_unit.v:8.18-8.19" *)
+  (* src = "mac_unit.v:32.24-32.25" *)
   wire _0453_;
-  (* src = "mac_unit.v:8.18-8.19" *)
+  (* src = "mac_unit.v:32.24-32.25" *)
   wire _0454_;
-  (* src = "mac_unit.v:8.18-8.19" *)
+  (* src = "mac_unit.v:30.26-30.27" *)
   wire _0455_;
-  (* src = "mac_unit.v:8.18-8.19" *)
+  (* src = "mac_unit.v:30.26-30.27" *)
   wire _0456_;
-  (* src = "mac_unit.v:8.18-8.19" *)
+  (* src = "mac_unit.v:30.26-30.27" *)
   wire _0457_;
-  (* src = "mac_unit.v:9.19-9.20" *)
+  (* src = "mac_unit.v:30.26-30.27" *)
   wire _0458_;
-  (* src = "mac_unit.v:9.19-9.20" *)
+  (* src = "mac_unit.v:30.26-30.27" *)
   wire _0459_;
-  (* src = "mac_unit.v:9.19-9.20" *)
+  (* src = "mac_unit.v:30.26-30.27" *)
   wire _0460_;
-  (* src = "mac_unit.v:9.19-9.20" *)
+  (* src = "mac_unit.v:30.26-30.27" *)
   wire _0461_;
-  (* src = "mac_unit.v:9.19-9.20" *)
+  (* src = "mac_unit.v:30.26-30.27" *)
   wire _0462_;
-  (* src = "mac_unit.v:9.19-9.20" *)
   wire _0463_;
-  (* src = "mac_unit.v:9.19-9.20" *)
   wire _0464_;
-  (* src = "mac_unit.v:9.19-9.20" *)
   wire _0465_;
-  (* src = "mac_unit.v:9.19-9.20" *)
   wire _0466_;
-  (* src = "mac_unit.v:9.19-9.20" *)
   wire _0467_;
-  (* src = "mac_unit.v:9.19-9.20" *)
   wire _0468_;
-  (* src = "mac_unit.v:9.19-9.20" *)
   wire _0469_;
-  (* src = "mac_unit.v:9.19-9.20" *)
   wire _0470_;
-  (* src = "mac_unit.v:9.19-9.20" *)
   wire _0471_;
-  (* src = "mac_unit.v:9.19-9.20" *)
   wire _0472_;
-  (* src = "mac_unit.v:9.19-9.20" *)
   wire _0473_;
-  (* src = "mac_unit.v:7.17-7.18" *)
   wire _0474_;
-  (* src = "mac_unit.v:7.17-7.18" *)
   wire _0475_;
-  (* src = "mac_unit.v:7.17-7.18" *)
   wire _0476_;
-  (* src = "mac_unit.v:7.17-7.18" *)
   wire _0477_;
-  (* src = "mac_unit.v:7.17-7.18" *)
   wire _0478_;
-  (* src = "mac_unit.v:7.17-7.18" *)
   wire _0479_;
-  (* src = "mac_unit.v:7.17-7.18" *)
   wire _0480_;
-  (* src = "mac_unit.v:7.17-7.18" *)
   wire _0481_;
   wire _0482_;
   wire _0483_;
@@ -2169,472 +944,2195 @@ module mac_unit(A, W, B, C);
   wire _0873_;
   wire _0874_;
   wire _0875_;
-  wire _0876_;
-  wire _0877_;
-  wire _0878_;
-  wire _0879_;
-  wire _0880_;
-  assign _0832_ = _0474_ & _0434_;
-  assign _0833_ = ~(_0442_ & _0832_);
-  assign _0458_ = _0442_ ^ _0832_;
-  assign _0834_ = _0435_ & _0475_;
-  assign _0835_ = ~(_0434_ & _0476_);
-  assign _0836_ = ~(_0476_ & _0435_);
-  assign _0837_ = ~(_0434_ & _0475_);
-  assign _0838_ = _0836_ | _0837_;
-  assign _0839_ = ~(_0834_ ^ _0835_);
-  assign _0840_ = _0474_ & _0436_;
-  assign _0841_ = ~(_0839_ & _0840_);
-  assign _0842_ = ~(_0838_ & _0841_);
-  assign _0843_ = _0474_ & _0437_;
-  assign _0844_ = _0475_ & _0436_;
-  assign _0845_ = _0476_ & _0436_;
-  assign _0846_ = ~(_0834_ & _0845_);
-  assign _0847_ = ~(_0836_ ^ _0844_);
-  assign _0848_ = ~(_0843_ & _0847_);
-  assign _0849_ = _0843_ ^ _0847_;
-  assign _0850_ = _0842_ & _0849_;
-  assign _0851_ = _0842_ ^ _0849_;
-  assign _0852_ = _0434_ & _0477_;
-  assign _0853_ = _0451_ & _0852_;
-  assign _0854_ = ~(_0451_ ^ _0852_);
-  assign _0855_ = _0851_ & ~(_0854_);
-  assign _0856_ = ~(_0851_ ^ _0854_);
-  assign _0857_ = _0474_ & _0435_;
-  assign _0858_ = _0832_ & _0834_;
-  assign _0859_ = _0839_ ^ _0840_;
-  assign _0860_ = ~(_0858_ & _0859_);
-  assign _0861_ = _0858_ ^ _0859_;
-  assign _0862_ = ~(_0450_ & _0861_);
-  assign _0863_ = ~(_0860_ & _0862_);
-  assign _0864_ = _0856_ & _0863_;
-  assign _0865_ = _0856_ ^ _0863_;
-  assign _0866_ = ~(_0450_ ^ _0861_);
-  assign _0867_ = ~(_0837_ ^ _0857_);
-  assign _0868_ = ~(_0449_ & _0867_);
-  assign _0869_ = ~(_0449_ ^ _0867_);
-  assign _0870_ = _0833_ | _0869_;
-  assign _0871_ = ~(_0868_ & _0870_);
-  assign _0872_ = _0871_ & ~(_0866_);
-  assign _0873_ = _0865_ & _0872_;
-  assign _0467_ = _0865_ ^ _0872_;
-  assign _0874_ = ~(_0846_ & _0848_);
-  assign _0875_ = _0474_ & _0438_;
-  assign _0876_ = _0475_ & _0437_;
-  assign _0877_ = _0476_ & _0437_;
-  assign _0878_ = ~(_0845_ & _0876_);
-  assign _0879_ = _0845_ ^ _0876_;
-  assign _0880_ = ~(_0875_ & _0879_);
-  assign _0482_ = _0875_ ^ _0879_;
-  assign _0483_ = _0874_ & _0482_;
-  assign _0484_ = _0874_ ^ _0482_;
-  assign _0485_ = ~(_0477_ & _0435_);
-  assign _0486_ = _0434_ & _0478_;
-  assign _0487_ = _0435_ & _0478_;
-  assign _0488_ = _0852_ & _0487_;
-  assign _0489_ = ~(_0485_ ^ _0486_);
-  assign _0490_ = _0452_ & _0489_;
-  assign _0491_ = ~(_0452_ ^ _0489_);
-  assign _0492_ = _0853_ & ~(_0491_);
-  assign _0493_ = ~(_0853_ ^ _0491_);
-  assign _0494_ = _0484_ & _0493_;
-  assign _0495_ = _0484_ ^ _0493_;
-  assign _0496_ = ~(_0855_ & _0495_);
-  assign _0497_ = _0855_ ^ _0495_;
-  assign _0498_ = ~(_0850_ & _0497_);
-  assign _0499_ = _0850_ ^ _0497_;
-  assign _0500_ = ~(_0864_ & _0499_);
-  assign _0501_ = _0864_ ^ _0499_;
-  assign _0502_ = ~(_0873_ & _0501_);
-  assign _0468_ = _0873_ ^ _0501_;
-  assign _0503_ = ~(_0500_ & _0502_);
-  assign _0504_ = ~(_0496_ & _0498_);
-  assign _0505_ = _0492_ | _0494_;
-  assign _0506_ = ~(_0878_ & _0880_);
-  assign _0507_ = _0474_ & _0439_;
-  assign _0508_ = _0475_ & _0438_;
-  assign _0509_ = _0476_ & _0438_;
-  assign _0510_ = ~(_0877_ & _0508_);
-  assign _0511_ = _0877_ ^ _0508_;
-  assign _0512_ = ~(_0507_ & _0511_);
-  assign _0513_ = _0507_ ^ _0511_;
-  assign _0514_ = ~(_0488_ & _0513_);
-  assign _0515_ = _0488_ ^ _0513_;
-  assign _0516_ = ~(_0506_ & _0515_);
-  assign _0517_ = _0506_ ^ _0515_;
-  assign _0518_ = _0477_ & _0436_;
-  assign _0519_ = _0434_ & _0479_;
-  assign _0520_ = ~(_0435_ & _0479_);
-  assign _0521_ = ~(_0487_ & _0519_);
-  assign _0522_ = _0487_ ^ _0519_;
-  assign _0523_ = ~(_0518_ & _0522_);
-  assign _0524_ = _0518_ ^ _0522_;
-  assign _0525_ = _0453_ & _0524_;
-  assign _0526_ = ~(_0453_ ^ _0524_);
-  assign _0527_ = _0490_ & ~(_0526_);
-  assign _0528_ = ~(_0490_ ^ _0526_);
-  assign _0529_ = _0517_ & _0528_;
-  assign _0530_ = _0517_ ^ _0528_;
-  assign _0531_ = ~(_0505_ & _0530_);
-  assign _0532_ = _0505_ ^ _0530_;
-  assign _0533_ = ~(_0483_ & _0532_);
-  assign _0534_ = _0483_ ^ _0532_;
-  assign _0535_ = ~(_0504_ & _0534_);
-  assign _0536_ = _0504_ ^ _0534_;
-  assign _0537_ = ~(_0503_ & _0536_);
-  assign _0469_ = _0503_ ^ _0536_;
-  assign _0538_ = ~(_0535_ & _0537_);
-  assign _0539_ = ~(_0531_ & _0533_);
-  assign _0540_ = ~(_0514_ & _0516_);
-  assign _0541_ = _0527_ | _0529_;
-  assign _0542_ = ~(_0510_ & _0512_);
-  assign _0543_ = _0474_ & _0440_;
-  assign _0544_ = _0475_ & _0439_;
-  assign _0545_ = _0476_ & _0439_;
-  assign _0546_ = ~(_0509_ & _0544_);
-  assign _0547_ = _0509_ ^ _0544_;
-  assign _0548_ = ~(_0543_ & _0547_);
-  assign _0549_ = _0543_ ^ _0547_;
-  assign _0550_ = ~(_0521_ & _0523_);
+  (* src = "mac_unit.v:39.28-39.33" *)
+  wire signed [8:0] a_ext;
+  (* src = "mac_unit.v:66.27-66.32" *)
+  wire signed [16:0] b_ext;
+  (* src = "mac_unit.v:71.29-71.34" *)
+  wire signed [18:0] c_max;
+  (* src = "mac_unit.v:73.29-73.34" *)
+  wire signed [18:0] c_min;
+  (* src = "mac_unit.v:75.22-75.28" *)
+  wire [15:0] result;
+  (* src = "mac_unit.v:67.29-67.32" *)
+  wire signed [18:0] sum;
+  (* src = "mac_unit.v:48.22-48.27" *)
+  wire [15:0] sum_B;
+  (* src = "mac_unit.v:40.30-40.35" *)
+  wire signed [8:0] w_ext;
+  assign _0825_ = ~(_0455_ & _0417_);
+  assign _0826_ = _0416_ & _0456_;
+  assign _0827_ = _0456_ & _0417_;
+  assign _0828_ = _0416_ & _0455_;
+  assign _0829_ = ~(_0827_ & _0828_);
+  assign _0830_ = ~(_0825_ ^ _0826_);
+  assign _0831_ = ~(_0431_ & _0830_);
+  assign _0832_ = _0829_ & _0831_;
+  assign _0833_ = _0418_ & _0455_;
+  assign _0834_ = _0418_ & _0456_;
+  assign _0835_ = ~(_0827_ & _0833_);
+  assign _0836_ = _0827_ ^ _0833_;
+  assign _0837_ = ~(_0432_ & _0836_);
+  assign _0838_ = ~(_0432_ ^ _0836_);
+  assign _0839_ = _0832_ | _0838_;
+  assign _0840_ = _0832_ ^ _0838_;
+  assign _0841_ = ~(_0415_ & _0458_);
+  assign _0842_ = _0416_ & _0457_;
+  assign _0843_ = _0458_ & _0416_;
+  assign _0844_ = _0415_ & _0457_;
+  assign _0845_ = _0843_ & _0844_;
+  assign _0846_ = ~(_0841_ ^ _0842_);
+  assign _0847_ = ~(_0840_ & _0846_);
+  assign _0848_ = ~(_0839_ & _0847_);
+  assign _0849_ = ~(_0835_ & _0837_);
+  assign _0850_ = _0455_ & _0419_;
+  assign _0851_ = _0456_ & _0419_;
+  assign _0852_ = ~(_0834_ & _0850_);
+  assign _0853_ = _0834_ ^ _0850_;
+  assign _0854_ = ~(_0433_ & _0853_);
+  assign _0855_ = ~(_0433_ ^ _0853_);
+  assign _0856_ = _0845_ & ~(_0855_);
+  assign _0857_ = ~(_0845_ ^ _0855_);
+  assign _0858_ = _0849_ & _0857_;
+  assign _0859_ = _0849_ ^ _0857_;
+  assign _0860_ = _0457_ & _0417_;
+  assign _0861_ = ~(_0415_ & _0459_);
+  assign _0862_ = _0416_ & _0459_;
+  assign _0863_ = _0841_ | ~(_0862_);
+  assign _0864_ = ~(_0843_ ^ _0861_);
+  assign _0865_ = ~(_0860_ & _0864_);
+  assign _0866_ = _0860_ ^ _0864_;
+  assign _0867_ = _0859_ & _0866_;
+  assign _0868_ = _0859_ ^ _0866_;
+  assign _0869_ = _0848_ & _0868_;
+  assign _0870_ = _0856_ | _0858_;
+  assign _0871_ = ~(_0852_ & _0854_);
+  assign _0872_ = _0863_ & _0865_;
+  assign _0873_ = _0455_ & _0420_;
+  assign _0874_ = ~(_0456_ & _0420_);
+  assign _0875_ = ~(_0851_ & _0873_);
+  assign _0463_ = _0851_ ^ _0873_;
+  assign _0464_ = ~(_0434_ & _0463_);
+  assign _0465_ = ~(_0434_ ^ _0463_);
+  assign _0466_ = _0872_ | _0465_;
+  assign _0467_ = _0872_ ^ _0465_;
+  assign _0468_ = ~(_0871_ & _0467_);
+  assign _0469_ = _0871_ ^ _0467_;
+  assign _0470_ = _0415_ & _0460_;
+  assign _0471_ = _0457_ & _0418_;
+  assign _0472_ = _0458_ & _0417_;
+  assign _0473_ = ~(_0417_ & _0459_);
+  assign _0474_ = ~(_0862_ & _0472_);
+  assign _0475_ = _0862_ ^ _0472_;
+  assign _0476_ = ~(_0471_ & _0475_);
+  assign _0477_ = _0471_ ^ _0475_;
+  assign _0478_ = _0470_ & _0477_;
+  assign _0479_ = _0470_ ^ _0477_;
+  assign _0480_ = _0469_ & _0479_;
+  assign _0481_ = _0469_ ^ _0479_;
+  assign _0482_ = ~(_0867_ & _0481_);
+  assign _0483_ = _0867_ ^ _0481_;
+  assign _0484_ = ~(_0870_ & _0483_);
+  assign _0485_ = _0870_ ^ _0483_;
+  assign _0486_ = _0869_ & _0485_;
+  assign _0487_ = ~(_0482_ & _0484_);
+  assign _0488_ = ~(_0466_ & _0468_);
+  assign _0489_ = ~(_0875_ & _0464_);
+  assign _0490_ = _0474_ & _0476_;
+  assign _0491_ = _0455_ & _0421_;
+  assign _0492_ = _0456_ & _0421_;
+  assign _0493_ = ~(_0873_ & _0492_);
+  assign _0494_ = ~(_0874_ ^ _0491_);
+  assign _0495_ = ~(_0435_ & _0494_);
+  assign _0496_ = ~(_0435_ ^ _0494_);
+  assign _0497_ = _0490_ | _0496_;
+  assign _0498_ = _0490_ ^ _0496_;
+  assign _0499_ = ~(_0489_ & _0498_);
+  assign _0500_ = _0489_ ^ _0498_;
+  assign _0501_ = _0457_ & _0419_;
+  assign _0502_ = _0458_ & _0418_;
+  assign _0503_ = _0418_ & _0459_;
+  assign _0504_ = ~(_0472_ & _0503_);
+  assign _0505_ = ~(_0473_ ^ _0502_);
+  assign _0506_ = ~(_0501_ & _0505_);
+  assign _0507_ = _0501_ ^ _0505_;
+  assign _0508_ = ~(_0416_ & _0460_);
+  assign _0509_ = _0415_ & _0461_;
+  assign _0510_ = _0416_ & _0461_;
+  assign _0511_ = _0470_ & _0510_;
+  assign _0512_ = ~(_0508_ ^ _0509_);
+  assign _0513_ = _0507_ & _0512_;
+  assign _0514_ = _0507_ ^ _0512_;
+  assign _0515_ = ~(_0478_ & _0514_);
+  assign _0516_ = _0478_ ^ _0514_;
+  assign _0517_ = ~(_0500_ & _0516_);
+  assign _0518_ = _0500_ ^ _0516_;
+  assign _0519_ = ~(_0480_ & _0518_);
+  assign _0520_ = _0480_ ^ _0518_;
+  assign _0521_ = ~(_0488_ & _0520_);
+  assign _0522_ = _0488_ ^ _0520_;
+  assign _0523_ = _0487_ & _0522_;
+  assign _0524_ = _0487_ ^ _0522_;
+  assign _0525_ = ~(_0486_ & _0524_);
+  assign _0526_ = _0848_ ^ _0868_;
+  assign _0527_ = _0415_ & _0455_;
+  assign _0528_ = _0415_ & _0456_;
+  assign _0529_ = ~(_0828_ & _0528_);
+  assign _0530_ = _0828_ ^ _0528_;
+  assign _0531_ = ~(_0430_ & _0530_);
+  assign _0532_ = _0529_ & _0531_;
+  assign _0533_ = ~(_0431_ ^ _0830_);
+  assign _0534_ = _0532_ | _0533_;
+  assign _0535_ = _0532_ ^ _0533_;
+  assign _0536_ = ~(_0844_ & _0535_);
+  assign _0537_ = ~(_0534_ & _0536_);
+  assign _0538_ = _0840_ ^ _0846_;
+  assign _0539_ = ~(_0537_ & _0538_);
+  assign _0540_ = _0423_ & _0527_;
+  assign _0541_ = ~(_0430_ ^ _0530_);
+  assign _0542_ = _0540_ & ~(_0541_);
+  assign _0543_ = _0844_ ^ _0535_;
+  assign _0544_ = _0542_ & _0543_;
+  assign _0545_ = _0537_ ^ _0538_;
+  assign _0546_ = ~(_0544_ & _0545_);
+  assign _0547_ = ~(_0539_ & _0546_);
+  assign _0548_ = _0526_ & _0547_;
+  assign _0549_ = _0485_ & _0548_;
+  assign _0550_ = _0486_ ^ _0524_;
   assign _0551_ = ~(_0549_ & _0550_);
-  assign _0552_ = _0549_ ^ _0550_;
-  assign _0553_ = ~(_0542_ & _0552_);
-  assign _0554_ = _0542_ ^ _0552_;
-  assign _0555_ = _0477_ & _0437_;
-  assign _0556_ = _0436_ & _0478_;
-  assign _0557_ = _0436_ & _0479_;
-  assign _0558_ = ~(_0487_ & _0557_);
-  assign _0559_ = ~(_0520_ ^ _0556_);
-  assign _0560_ = ~(_0555_ & _0559_);
-  assign _0561_ = _0555_ ^ _0559_;
-  assign _0562_ = _0434_ & _0480_;
-  assign _0563_ = _0454_ & _0562_;
-  assign _0564_ = ~(_0454_ ^ _0562_);
-  assign _0565_ = _0561_ & ~(_0564_);
-  assign _0566_ = ~(_0561_ ^ _0564_);
-  assign _0567_ = ~(_0525_ & _0566_);
-  assign _0568_ = _0525_ ^ _0566_;
-  assign _0569_ = ~(_0554_ & _0568_);
-  assign _0570_ = _0554_ ^ _0568_;
-  assign _0571_ = ~(_0541_ & _0570_);
-  assign _0572_ = _0541_ ^ _0570_;
-  assign _0573_ = ~(_0540_ & _0572_);
-  assign _0574_ = _0540_ ^ _0572_;
-  assign _0575_ = ~(_0539_ & _0574_);
-  assign _0576_ = _0539_ ^ _0574_;
-  assign _0577_ = ~(_0538_ & _0576_);
-  assign _0470_ = _0538_ ^ _0576_;
-  assign _0578_ = ~(_0575_ & _0577_);
-  assign _0579_ = ~(_0571_ & _0573_);
-  assign _0580_ = ~(_0551_ & _0553_);
-  assign _0581_ = ~(_0567_ & _0569_);
-  assign _0582_ = ~(_0546_ & _0548_);
-  assign _0583_ = _0474_ & _0441_;
-  assign _0584_ = ~(_0475_ & _0440_);
-  assign _0585_ = _0476_ & _0440_;
-  assign _0586_ = ~(_0544_ & _0585_);
-  assign _0587_ = ~(_0545_ ^ _0584_);
-  assign _0588_ = ~(_0583_ & _0587_);
-  assign _0589_ = _0583_ ^ _0587_;
-  assign _0590_ = ~(_0558_ & _0560_);
-  assign _0591_ = ~(_0589_ & _0590_);
-  assign _0592_ = _0589_ ^ _0590_;
-  assign _0593_ = ~(_0582_ & _0592_);
-  assign _0594_ = _0582_ ^ _0592_;
-  assign _0595_ = _0477_ & _0438_;
-  assign _0596_ = _0437_ & _0478_;
-  assign _0597_ = _0437_ & _0479_;
-  assign _0598_ = ~(_0557_ & _0596_);
-  assign _0599_ = _0557_ ^ _0596_;
-  assign _0600_ = ~(_0595_ & _0599_);
-  assign _0601_ = _0595_ ^ _0599_;
-  assign _0602_ = _0435_ & _0480_;
-  assign _0603_ = _0434_ & _0481_;
-  assign _0604_ = _0455_ & _0603_;
-  assign _0605_ = ~(_0455_ ^ _0603_);
-  assign _0606_ = _0602_ & ~(_0605_);
-  assign _0607_ = ~(_0602_ ^ _0605_);
-  assign _0608_ = ~(_0563_ & _0607_);
-  assign _0609_ = _0563_ ^ _0607_;
-  assign _0610_ = ~(_0601_ & _0609_);
-  assign _0611_ = _0601_ ^ _0609_;
-  assign _0612_ = ~(_0565_ & _0611_);
-  assign _0613_ = _0565_ ^ _0611_;
-  assign _0614_ = ~(_0594_ & _0613_);
-  assign _0615_ = _0594_ ^ _0613_;
-  assign _0616_ = ~(_0581_ & _0615_);
-  assign _0617_ = _0581_ ^ _0615_;
-  assign _0618_ = ~(_0580_ & _0617_);
-  assign _0619_ = _0580_ ^ _0617_;
-  assign _0620_ = ~(_0579_ & _0619_);
-  assign _0621_ = _0579_ ^ _0619_;
-  assign _0622_ = ~(_0578_ & _0621_);
-  assign _0471_ = _0578_ ^ _0621_;
-  assign _0623_ = ~(_0620_ & _0622_);
-  assign _0624_ = ~(_0616_ & _0618_);
-  assign _0625_ = ~(_0591_ & _0593_);
-  assign _0626_ = ~(_0612_ & _0614_);
-  assign _0627_ = ~(_0586_ & _0588_);
-  assign _0628_ = ~(_0598_ & _0600_);
-  assign _0629_ = ~(_0475_ & _0441_);
-  assign _0630_ = ~(_0585_ ^ _0629_);
-  assign _0631_ = ~(_0628_ & _0630_);
-  assign _0632_ = _0628_ ^ _0630_;
-  assign _0633_ = ~(_0627_ & _0632_);
-  assign _0634_ = _0627_ ^ _0632_;
-  assign _0635_ = ~(_0608_ & _0610_);
-  assign _0636_ = _0477_ & _0439_;
-  assign _0637_ = _0478_ & _0438_;
-  assign _0638_ = _0438_ & _0479_;
-  assign _0639_ = ~(_0597_ & _0637_);
-  assign _0640_ = _0597_ ^ _0637_;
-  assign _0641_ = ~(_0636_ & _0640_);
-  assign _0642_ = _0636_ ^ _0640_;
-  assign _0643_ = _0604_ | _0606_;
-  assign _0644_ = _0436_ & _0480_;
-  assign _0645_ = _0435_ & _0481_;
-  assign _0646_ = _0456_ & _0645_;
-  assign _0647_ = ~(_0456_ ^ _0645_);
-  assign _0648_ = _0644_ & ~(_0647_);
-  assign _0649_ = ~(_0644_ ^ _0647_);
-  assign _0650_ = ~(_0643_ & _0649_);
-  assign _0651_ = _0643_ ^ _0649_;
-  assign _0652_ = ~(_0642_ & _0651_);
-  assign _0653_ = _0642_ ^ _0651_;
-  assign _0654_ = ~(_0635_ & _0653_);
-  assign _0655_ = _0635_ ^ _0653_;
-  assign _0656_ = ~(_0634_ & _0655_);
-  assign _0657_ = _0634_ ^ _0655_;
-  assign _0658_ = ~(_0626_ & _0657_);
-  assign _0659_ = _0626_ ^ _0657_;
-  assign _0660_ = ~(_0625_ & _0659_);
-  assign _0661_ = _0625_ ^ _0659_;
-  assign _0662_ = ~(_0624_ & _0661_);
-  assign _0663_ = _0624_ ^ _0661_;
-  assign _0664_ = ~(_0623_ & _0663_);
-  assign _0472_ = _0623_ ^ _0663_;
-  assign _0665_ = ~(_0662_ & _0664_);
-  assign _0666_ = ~(_0658_ & _0660_);
-  assign _0667_ = ~(_0631_ & _0633_);
-  assign _0668_ = ~(_0654_ & _0656_);
-  assign _0669_ = ~(_0650_ & _0652_);
-  assign _0670_ = _0477_ & _0440_;
-  assign _0671_ = _0478_ & _0439_;
-  assign _0672_ = _0479_ & _0439_;
-  assign _0673_ = ~(_0638_ & _0671_);
-  assign _0674_ = _0638_ ^ _0671_;
-  assign _0675_ = ~(_0670_ & _0674_);
-  assign _0676_ = _0670_ ^ _0674_;
-  assign _0677_ = _0646_ | _0648_;
-  assign _0678_ = _0437_ & _0480_;
-  assign _0679_ = _0436_ & _0481_;
-  assign _0680_ = _0457_ & _0679_;
-  assign _0681_ = ~(_0457_ ^ _0679_);
-  assign _0682_ = _0678_ & ~(_0681_);
-  assign _0683_ = ~(_0678_ ^ _0681_);
-  assign _0684_ = ~(_0677_ & _0683_);
-  assign _0685_ = _0677_ ^ _0683_;
-  assign _0686_ = ~(_0676_ & _0685_);
-  assign _0687_ = _0676_ ^ _0685_;
-  assign _0688_ = ~(_0669_ & _0687_);
-  assign _0689_ = _0669_ ^ _0687_;
-  assign _0690_ = _0639_ & _0641_;
-  assign _0691_ = _0476_ & _0441_;
-  assign _0692_ = _0584_ & _0691_;
-  assign _0693_ = ~(_0690_ ^ _0692_);
-  assign _0694_ = ~(_0689_ & _0693_);
-  assign _0695_ = _0689_ ^ _0693_;
-  assign _0696_ = ~(_0668_ & _0695_);
-  assign _0697_ = _0668_ ^ _0695_;
-  assign _0698_ = ~(_0667_ & _0697_);
-  assign _0699_ = _0667_ ^ _0697_;
-  assign _0700_ = ~(_0666_ & _0699_);
-  assign _0701_ = _0666_ ^ _0699_;
-  assign _0702_ = ~(_0665_ & _0701_);
-  assign _0473_ = _0665_ ^ _0701_;
-  assign _0703_ = ~(_0700_ & _0702_);
-  assign _0704_ = ~(_0696_ & _0698_);
-  assign _0705_ = ~(_0688_ & _0694_);
-  assign _0706_ = ~(_0673_ & _0675_);
-  assign _0707_ = ~(_0684_ & _0686_);
-  assign _0708_ = _0477_ & _0441_;
-  assign _0709_ = _0478_ & _0440_;
-  assign _0710_ = ~(_0479_ & _0440_);
-  assign _0711_ = ~(_0672_ & _0709_);
-  assign _0712_ = _0672_ ^ _0709_;
-  assign _0713_ = ~(_0708_ & _0712_);
-  assign _0714_ = _0708_ ^ _0712_;
-  assign _0715_ = _0680_ | _0682_;
-  assign _0716_ = _0438_ & _0480_;
-  assign _0717_ = _0437_ & _0481_;
-  assign _0718_ = _0443_ & _0717_;
-  assign _0719_ = ~(_0443_ ^ _0717_);
-  assign _0720_ = _0716_ & ~(_0719_);
-  assign _0721_ = ~(_0716_ ^ _0719_);
-  assign _0722_ = ~(_0715_ & _0721_);
-  assign _0723_ = _0715_ ^ _0721_;
-  assign _0724_ = ~(_0714_ & _0723_);
-  assign _0725_ = _0714_ ^ _0723_;
-  assign _0726_ = ~(_0707_ & _0725_);
-  assign _0727_ = _0707_ ^ _0725_;
-  assign _0728_ = ~(_0706_ & _0727_);
-  assign _0729_ = _0706_ ^ _0727_;
-  assign _0730_ = ~(_0705_ & _0729_);
-  assign _0731_ = _0705_ ^ _0729_;
-  assign _0732_ = ~(_0584_ & _0690_);
-  assign _0733_ = _0691_ & _0732_;
-  assign _0734_ = ~(_0731_ & _0733_);
-  assign _0735_ = _0731_ ^ _0733_;
-  assign _0736_ = ~(_0704_ & _0735_);
-  assign _0737_ = _0704_ ^ _0735_;
-  assign _0738_ = ~(_0703_ & _0737_);
-  assign _0459_ = _0703_ ^ _0737_;
-  assign _0739_ = ~(_0736_ & _0738_);
-  assign _0740_ = ~(_0730_ & _0734_);
-  assign _0741_ = ~(_0726_ & _0728_);
-  assign _0742_ = ~(_0711_ & _0713_);
-  assign _0743_ = ~(_0722_ & _0724_);
-  assign _0744_ = _0478_ & _0441_;
-  assign _0745_ = _0479_ & _0441_;
-  assign _0746_ = _0709_ & _0745_;
-  assign _0747_ = ~(_0710_ ^ _0744_);
-  assign _0748_ = _0718_ | _0720_;
-  assign _0749_ = _0439_ & _0480_;
-  assign _0750_ = _0438_ & _0481_;
-  assign _0751_ = _0444_ & _0750_;
-  assign _0752_ = ~(_0444_ ^ _0750_);
-  assign _0753_ = _0749_ & ~(_0752_);
-  assign _0754_ = ~(_0749_ ^ _0752_);
-  assign _0755_ = ~(_0748_ & _0754_);
-  assign _0756_ = _0748_ ^ _0754_;
-  assign _0757_ = ~(_0747_ & _0756_);
-  assign _0758_ = _0747_ ^ _0756_;
-  assign _0759_ = ~(_0743_ & _0758_);
-  assign _0760_ = _0743_ ^ _0758_;
-  assign _0761_ = ~(_0742_ & _0760_);
-  assign _0762_ = _0742_ ^ _0760_;
-  assign _0763_ = _0741_ & _0762_;
-  assign _0764_ = _0741_ ^ _0762_;
-  assign _0765_ = ~(_0740_ & _0764_);
-  assign _0766_ = _0740_ ^ _0764_;
-  assign _0767_ = ~(_0739_ & _0766_);
-  assign _0460_ = _0739_ ^ _0766_;
-  assign _0768_ = ~(_0765_ & _0767_);
-  assign _0769_ = ~(_0759_ & _0761_);
-  assign _0770_ = ~(_0755_ & _0757_);
-  assign _0771_ = _0751_ | _0753_;
-  assign _0772_ = _0480_ & _0440_;
-  assign _0773_ = _0439_ & _0481_;
-  assign _0774_ = _0445_ & _0773_;
-  assign _0775_ = ~(_0445_ ^ _0773_);
-  assign _0776_ = _0772_ & ~(_0775_);
-  assign _0777_ = ~(_0772_ ^ _0775_);
-  assign _0778_ = ~(_0771_ & _0777_);
-  assign _0779_ = _0771_ ^ _0777_;
-  assign _0780_ = ~(_0745_ & _0779_);
-  assign _0781_ = _0745_ ^ _0779_;
-  assign _0782_ = ~(_0770_ & _0781_);
-  assign _0783_ = _0770_ ^ _0781_;
-  assign _0784_ = ~(_0746_ & _0783_);
-  assign _0785_ = _0746_ ^ _0783_;
-  assign _0786_ = _0769_ & _0785_;
-  assign _0787_ = _0769_ ^ _0785_;
-  assign _0788_ = ~(_0763_ & _0787_);
-  assign _0789_ = _0763_ ^ _0787_;
-  assign _0790_ = ~(_0768_ & _0789_);
-  assign _0461_ = _0768_ ^ _0789_;
-  assign _0791_ = ~(_0788_ & _0790_);
-  assign _0792_ = ~(_0782_ & _0784_);
-  assign _0793_ = ~(_0778_ & _0780_);
-  assign _0794_ = _0774_ | _0776_;
-  assign _0795_ = ~(_0480_ & _0441_);
-  assign _0796_ = _0440_ & _0481_;
-  assign _0797_ = ~(_0446_ & _0796_);
-  assign _0798_ = ~(_0446_ ^ _0796_);
-  assign _0799_ = _0795_ | _0798_;
-  assign _0800_ = _0795_ ^ _0798_;
-  assign _0801_ = ~(_0794_ & _0800_);
-  assign _0802_ = _0794_ | _0800_;
+  assign _0552_ = ~(_0525_ & _0551_);
+  assign _0553_ = ~(_0519_ & _0521_);
+  assign _0554_ = ~(_0497_ & _0499_);
+  assign _0555_ = ~(_0515_ & _0517_);
+  assign _0556_ = _0417_ & _0460_;
+  assign _0557_ = _0462_ & ~(_0415_);
+  assign _0558_ = ~(_0510_ & _0557_);
+  assign _0559_ = _0510_ ^ _0557_;
+  assign _0560_ = ~(_0556_ & _0559_);
+  assign _0561_ = _0556_ ^ _0559_;
+  assign _0562_ = ~(_0511_ & _0561_);
+  assign _0563_ = _0511_ ^ _0561_;
+  assign _0564_ = _0457_ & _0420_;
+  assign _0565_ = _0458_ & _0419_;
+  assign _0566_ = _0419_ & _0459_;
+  assign _0567_ = ~(_0503_ & _0565_);
+  assign _0568_ = _0503_ ^ _0565_;
+  assign _0569_ = ~(_0564_ & _0568_);
+  assign _0570_ = _0564_ ^ _0568_;
+  assign _0571_ = ~(_0563_ & _0570_);
+  assign _0572_ = _0563_ ^ _0570_;
+  assign _0573_ = ~(_0513_ & _0572_);
+  assign _0574_ = _0513_ ^ _0572_;
+  assign _0575_ = ~(_0493_ & _0495_);
+  assign _0576_ = _0504_ & _0506_;
+  assign _0577_ = _0455_ & _0422_;
+  assign _0578_ = _0456_ & _0422_;
+  assign _0579_ = ~(_0492_ & _0577_);
+  assign _0580_ = _0492_ ^ _0577_;
+  assign _0581_ = ~(_0436_ & _0580_);
+  assign _0582_ = ~(_0436_ ^ _0580_);
+  assign _0583_ = _0576_ | _0582_;
+  assign _0584_ = _0576_ ^ _0582_;
+  assign _0585_ = ~(_0575_ & _0584_);
+  assign _0586_ = _0575_ ^ _0584_;
+  assign _0587_ = ~(_0574_ & _0586_);
+  assign _0588_ = _0574_ ^ _0586_;
+  assign _0589_ = ~(_0555_ & _0588_);
+  assign _0590_ = _0555_ ^ _0588_;
+  assign _0591_ = ~(_0554_ & _0590_);
+  assign _0592_ = _0554_ ^ _0590_;
+  assign _0593_ = ~(_0553_ & _0592_);
+  assign _0594_ = _0553_ ^ _0592_;
+  assign _0595_ = ~(_0462_ & _0594_);
+  assign _0596_ = ~(_0462_ ^ _0594_);
+  assign _0597_ = _0523_ & ~(_0596_);
+  assign _0598_ = ~(_0523_ ^ _0596_);
+  assign _0599_ = _0552_ & _0598_;
+  assign _0452_ = _0552_ ^ _0598_;
+  assign _0600_ = ~(_0573_ & _0587_);
+  assign _0601_ = ~(_0579_ & _0581_);
+  assign _0602_ = _0567_ & _0569_;
+  assign _0603_ = _0437_ & _0578_;
+  assign _0604_ = ~(_0437_ ^ _0578_);
+  assign _0605_ = _0602_ | _0604_;
+  assign _0606_ = _0602_ ^ _0604_;
+  assign _0607_ = ~(_0601_ & _0606_);
+  assign _0608_ = _0601_ ^ _0606_;
+  assign _0609_ = ~(_0562_ & _0571_);
+  assign _0610_ = _0457_ & _0421_;
+  assign _0611_ = _0458_ & _0420_;
+  assign _0612_ = ~(_0459_ & _0420_);
+  assign _0613_ = ~(_0566_ & _0611_);
+  assign _0614_ = _0566_ ^ _0611_;
+  assign _0615_ = ~(_0610_ & _0614_);
+  assign _0616_ = _0610_ ^ _0614_;
+  assign _0617_ = ~(_0558_ & _0560_);
+  assign _0618_ = _0418_ & _0460_;
+  assign _0619_ = _0462_ & ~(_0416_);
+  assign _0620_ = _0417_ & _0461_;
+  assign _0621_ = ~(_0619_ & _0620_);
+  assign _0622_ = _0619_ ^ _0620_;
+  assign _0623_ = ~(_0618_ & _0622_);
+  assign _0624_ = _0618_ ^ _0622_;
+  assign _0625_ = ~(_0617_ & _0624_);
+  assign _0626_ = _0617_ ^ _0624_;
+  assign _0627_ = ~(_0616_ & _0626_);
+  assign _0628_ = _0616_ ^ _0626_;
+  assign _0629_ = ~(_0609_ & _0628_);
+  assign _0630_ = _0609_ ^ _0628_;
+  assign _0631_ = ~(_0608_ & _0630_);
+  assign _0632_ = _0608_ ^ _0630_;
+  assign _0633_ = ~(_0600_ & _0632_);
+  assign _0634_ = ~(_0583_ & _0585_);
+  assign _0635_ = _0600_ ^ _0632_;
+  assign _0636_ = ~(_0634_ & _0635_);
+  assign _0637_ = ~(_0633_ & _0636_);
+  assign _0638_ = ~(_0605_ & _0607_);
+  assign _0639_ = ~(_0629_ & _0631_);
+  assign _0640_ = ~(_0613_ & _0615_);
+  assign _0641_ = ~(_0438_ & _0640_);
+  assign _0642_ = _0438_ ^ _0640_;
+  assign _0643_ = ~(_0603_ & _0642_);
+  assign _0644_ = _0603_ ^ _0642_;
+  assign _0645_ = ~(_0625_ & _0627_);
+  assign _0646_ = _0457_ & _0422_;
+  assign _0647_ = _0458_ & _0421_;
+  assign _0648_ = _0459_ & _0421_;
+  assign _0649_ = ~(_0611_ & _0648_);
+  assign _0650_ = ~(_0612_ ^ _0647_);
+  assign _0651_ = ~(_0646_ & _0650_);
+  assign _0652_ = _0646_ ^ _0650_;
+  assign _0653_ = ~(_0621_ & _0623_);
+  assign _0654_ = _0419_ & _0460_;
+  assign _0655_ = _0462_ & ~(_0417_);
+  assign _0656_ = _0418_ & _0461_;
+  assign _0657_ = ~(_0655_ & _0656_);
+  assign _0658_ = _0655_ ^ _0656_;
+  assign _0659_ = ~(_0654_ & _0658_);
+  assign _0660_ = _0654_ ^ _0658_;
+  assign _0661_ = ~(_0653_ & _0660_);
+  assign _0662_ = _0653_ ^ _0660_;
+  assign _0663_ = ~(_0652_ & _0662_);
+  assign _0664_ = _0652_ ^ _0662_;
+  assign _0665_ = ~(_0645_ & _0664_);
+  assign _0666_ = _0645_ ^ _0664_;
+  assign _0667_ = ~(_0644_ & _0666_);
+  assign _0668_ = _0644_ ^ _0666_;
+  assign _0669_ = ~(_0639_ & _0668_);
+  assign _0670_ = _0639_ ^ _0668_;
+  assign _0671_ = ~(_0638_ & _0670_);
+  assign _0672_ = _0638_ ^ _0670_;
+  assign _0673_ = _0637_ & _0672_;
+  assign _0674_ = ~(_0669_ & _0671_);
+  assign _0675_ = ~(_0641_ & _0643_);
+  assign _0676_ = ~(_0665_ & _0667_);
+  assign _0677_ = ~(_0661_ & _0663_);
+  assign _0678_ = ~(_0657_ & _0659_);
+  assign _0679_ = _0420_ & _0460_;
+  assign _0680_ = _0462_ & ~(_0418_);
+  assign _0681_ = _0419_ & _0461_;
+  assign _0682_ = ~(_0680_ & _0681_);
+  assign _0683_ = _0680_ ^ _0681_;
+  assign _0684_ = ~(_0679_ & _0683_);
+  assign _0685_ = _0679_ ^ _0683_;
+  assign _0686_ = ~(_0678_ & _0685_);
+  assign _0687_ = _0678_ ^ _0685_;
+  assign _0688_ = _0458_ & _0422_;
+  assign _0689_ = _0459_ & _0422_;
+  assign _0690_ = _0648_ & _0688_;
+  assign _0691_ = _0648_ ^ _0688_;
+  assign _0692_ = ~(_0687_ & _0691_);
+  assign _0693_ = _0687_ ^ _0691_;
+  assign _0694_ = ~(_0677_ & _0693_);
+  assign _0695_ = _0677_ ^ _0693_;
+  assign _0696_ = ~(_0649_ & _0651_);
+  assign _0697_ = _0424_ & _0696_;
+  assign _0698_ = _0424_ ^ _0696_;
+  assign _0699_ = ~(_0695_ & _0698_);
+  assign _0700_ = _0695_ ^ _0698_;
+  assign _0701_ = ~(_0676_ & _0700_);
+  assign _0702_ = _0676_ ^ _0700_;
+  assign _0703_ = ~(_0675_ & _0702_);
+  assign _0704_ = _0675_ ^ _0702_;
+  assign _0705_ = _0674_ & _0704_;
+  assign _0706_ = _0674_ ^ _0704_;
+  assign _0707_ = ~(_0673_ & _0706_);
+  assign _0708_ = _0673_ ^ _0706_;
+  assign _0709_ = ~(_0589_ & _0591_);
+  assign _0710_ = _0634_ ^ _0635_;
+  assign _0711_ = _0709_ & _0710_;
+  assign _0712_ = _0637_ ^ _0672_;
+  assign _0713_ = ~(_0711_ & _0712_);
+  assign _0714_ = _0711_ | _0712_;
+  assign _0715_ = ~(_0593_ & _0595_);
+  assign _0716_ = _0709_ ^ _0710_;
+  assign _0717_ = ~(_0715_ & _0716_);
+  assign _0718_ = _0597_ | _0599_;
+  assign _0719_ = _0715_ ^ _0716_;
+  assign _0720_ = ~(_0718_ & _0719_);
+  assign _0721_ = ~(_0717_ & _0720_);
+  assign _0722_ = ~(_0714_ & _0721_);
+  assign _0723_ = ~(_0713_ & _0722_);
+  assign _0724_ = ~(_0708_ & _0723_);
+  assign _0725_ = ~(_0707_ & _0724_);
+  assign _0726_ = ~(_0701_ & _0703_);
+  assign _0727_ = ~(_0694_ & _0699_);
+  assign _0728_ = ~(_0686_ & _0692_);
+  assign _0729_ = ~(_0682_ & _0684_);
+  assign _0730_ = _0460_ & _0421_;
+  assign _0731_ = _0462_ & ~(_0419_);
+  assign _0732_ = _0420_ & _0461_;
+  assign _0733_ = ~(_0731_ & _0732_);
+  assign _0734_ = _0731_ ^ _0732_;
+  assign _0735_ = ~(_0730_ & _0734_);
+  assign _0736_ = _0730_ ^ _0734_;
+  assign _0737_ = ~(_0729_ & _0736_);
+  assign _0738_ = _0729_ ^ _0736_;
+  assign _0739_ = ~(_0689_ & _0738_);
+  assign _0740_ = _0689_ ^ _0738_;
+  assign _0741_ = ~(_0728_ & _0740_);
+  assign _0742_ = ~(_0728_ ^ _0740_);
+  assign _0743_ = _0425_ & _0690_;
+  assign _0744_ = ~(_0425_ ^ _0690_);
+  assign _0745_ = _0742_ | _0744_;
+  assign _0746_ = _0742_ ^ _0744_;
+  assign _0747_ = ~(_0727_ & _0746_);
+  assign _0748_ = _0727_ ^ _0746_;
+  assign _0749_ = ~(_0697_ & _0748_);
+  assign _0750_ = _0697_ ^ _0748_;
+  assign _0751_ = _0726_ & _0750_;
+  assign _0752_ = _0726_ ^ _0750_;
+  assign _0753_ = ~(_0705_ & _0752_);
+  assign _0754_ = _0705_ ^ _0752_;
+  assign _0755_ = ~(_0725_ & _0754_);
+  assign _0441_ = _0725_ ^ _0754_;
+  assign _0448_ = _0544_ ^ _0545_;
+  assign _0756_ = ~(_0747_ & _0749_);
+  assign _0757_ = _0741_ & _0745_;
+  assign _0758_ = ~(_0737_ & _0739_);
+  assign _0759_ = ~(_0733_ & _0735_);
+  assign _0760_ = _0460_ & _0422_;
+  assign _0761_ = _0462_ & ~(_0420_);
+  assign _0762_ = _0421_ & _0461_;
+  assign _0763_ = ~(_0761_ & _0762_);
+  assign _0764_ = _0761_ ^ _0762_;
+  assign _0765_ = ~(_0760_ & _0764_);
+  assign _0766_ = _0760_ ^ _0764_;
+  assign _0767_ = _0759_ & _0766_;
+  assign _0768_ = _0759_ ^ _0766_;
+  assign _0769_ = ~(_0758_ & _0768_);
+  assign _0770_ = _0758_ ^ _0768_;
+  assign _0771_ = ~(_0426_ & _0770_);
+  assign _0772_ = ~(_0426_ ^ _0770_);
+  assign _0773_ = _0757_ | _0772_;
+  assign _0774_ = _0757_ ^ _0772_;
+  assign _0775_ = ~(_0743_ & _0774_);
+  assign _0776_ = _0743_ ^ _0774_;
+  assign _0777_ = _0756_ & _0776_;
+  assign _0778_ = ~(_0773_ & _0775_);
+  assign _0779_ = ~(_0769_ & _0771_);
+  assign _0780_ = ~(_0763_ & _0765_);
+  assign _0781_ = _0462_ & ~(_0421_);
+  assign _0782_ = _0461_ & _0422_;
+  assign _0783_ = ~(_0781_ & _0782_);
+  assign _0784_ = _0781_ ^ _0782_;
+  assign _0785_ = ~(_0780_ & _0784_);
+  assign _0786_ = _0780_ ^ _0784_;
+  assign _0787_ = ~(_0767_ & _0786_);
+  assign _0788_ = _0767_ ^ _0786_;
+  assign _0789_ = ~(_0427_ & _0788_);
+  assign _0790_ = ~(_0427_ ^ _0788_);
+  assign _0791_ = _0779_ & ~(_0790_);
+  assign _0792_ = ~(_0779_ ^ _0790_);
+  assign _0793_ = _0778_ & _0792_;
+  assign _0794_ = _0778_ ^ _0792_;
+  assign _0795_ = ~(_0777_ & _0794_);
+  assign _0796_ = _0756_ ^ _0776_;
+  assign _0797_ = ~(_0751_ & _0796_);
+  assign _0798_ = ~(_0753_ & _0755_);
+  assign _0799_ = _0751_ ^ _0796_;
+  assign _0800_ = ~(_0798_ & _0799_);
+  assign _0801_ = ~(_0797_ & _0800_);
+  assign _0802_ = _0777_ ^ _0794_;
   assign _0803_ = ~(_0801_ & _0802_);
-  assign _0804_ = ~(_0793_ & _0802_);
-  assign _0805_ = _0793_ & ~(_0803_);
-  assign _0806_ = ~(_0793_ ^ _0803_);
-  assign _0807_ = _0792_ & _0806_;
-  assign _0808_ = _0792_ ^ _0806_;
-  assign _0809_ = ~(_0786_ & _0808_);
-  assign _0810_ = _0786_ ^ _0808_;
-  assign _0811_ = ~(_0791_ & _0810_);
-  assign _0462_ = _0791_ ^ _0810_;
-  assign _0812_ = ~(_0809_ & _0811_);
-  assign _0813_ = _0797_ & _0799_;
-  assign _0814_ = _0481_ & _0441_;
-  assign _0815_ = ~(_0447_ & _0814_);
-  assign _0816_ = ~(_0447_ ^ _0814_);
-  assign _0817_ = _0813_ | _0816_;
-  assign _0818_ = ~(_0813_ & _0816_);
-  assign _0819_ = _0817_ & _0818_;
-  assign _0820_ = _0801_ & _0804_;
-  assign _0821_ = ~(_0819_ ^ _0820_);
-  assign _0822_ = ~(_0807_ & _0821_);
-  assign _0823_ = _0807_ ^ _0821_;
-  assign _0824_ = ~(_0812_ & _0823_);
-  assign _0463_ = _0812_ ^ _0823_;
-  assign _0825_ = _0822_ & _0824_;
-  assign _0826_ = _0805_ & _0819_;
-  assign _0827_ = ~(_0801_ & _0817_);
-  assign _0828_ = _0818_ & _0827_;
-  assign _0829_ = ~(_0448_ ^ _0815_);
-  assign _0830_ = ~(_0828_ ^ _0829_);
-  assign _0831_ = ~(_0826_ ^ _0830_);
-  assign _0464_ = ~(_0825_ ^ _0831_);
-  assign _0466_ = ~(_0866_ ^ _0871_);
-  assign _0465_ = _0833_ ^ _0869_;
-  assign _0474_ = W[0];
-  assign _0434_ = A[0];
-  assign _0442_ = B[0];
-  assign C[0] = _0458_;
-  assign _0477_ = W[3];
-  assign _0451_ = B[3];
-  assign _0476_ = W[2];
-  assign _0435_ = A[1];
-  assign _0475_ = W[1];
-  assign _0436_ = A[2];
-  assign _0437_ = A[3];
-  assign _0450_ = B[2];
-  assign _0449_ = B[1];
-  assign C[3] = _0467_;
-  assign _0478_ = W[4];
-  assign _0452_ = B[4];
-  assign _0438_ = A[4];
-  assign C[4] = _0468_;
-  assign _0479_ = W[5];
-  assign _0453_ = B[5];
-  assign _0439_ = A[5];
-  assign C[5] = _0469_;
-  assign _0480_ = W[6];
-  assign _0454_ = B[6];
-  assign _0440_ = A[6];
-  assign C[6] = _0470_;
-  assign _0481_ = W[7];
-  assign _0455_ = B[7];
-  assign _0441_ = A[7];
-  assign C[7] = _0471_;
-  assign _0456_ = B[8];
-  assign C[8] = _0472_;
-  assign _0457_ = B[9];
-  assign C[9] = _0473_;
-  assign _0443_ = B[10];
-  assign C[10] = _0459_;
-  assign _0444_ = B[11];
-  assign C[11] = _0460_;
-  assign _0445_ = B[12];
-  assign C[12] = _0461_;
-  assign _0446_ = B[13];
-  assign C[13] = _0462_;
-  assign _0447_ = B[14];
-  assign C[14] = _0463_;
-  assign _0448_ = B[15];
-  assign C[15] = _0464_;
-  assign C[2] = _0466_;
-  assign C[1] = _0465_;
+  assign _0804_ = ~(_0795_ & _0803_);
+  assign _0805_ = ~(_0787_ & _0789_);
+  assign _0806_ = _0422_ | ~(_0462_);
+  assign _0807_ = _0783_ & _0806_;
+  assign _0808_ = ~(_0785_ & _0807_);
+  assign _0809_ = ~(_0428_ & _0808_);
+  assign _0810_ = _0428_ ^ _0808_;
+  assign _0811_ = ~(_0805_ & _0810_);
+  assign _0812_ = _0805_ ^ _0810_;
+  assign _0813_ = ~(_0791_ & _0812_);
+  assign _0814_ = _0791_ ^ _0812_;
+  assign _0815_ = ~(_0793_ & _0814_);
+  assign _0816_ = _0793_ ^ _0814_;
+  assign _0817_ = ~(_0804_ & _0816_);
+  assign _0444_ = _0804_ ^ _0816_;
+  assign _0453_ = _0718_ ^ _0719_;
+  assign _0446_ = ~(_0540_ ^ _0541_);
+  assign _0451_ = _0549_ ^ _0550_;
+  assign _0443_ = _0801_ ^ _0802_;
+  assign _0449_ = _0526_ ^ _0547_;
+  assign _0818_ = _0815_ & _0817_;
+  assign _0819_ = ~(_0811_ & _0813_);
+  assign _0820_ = ~(_0462_ ^ _0429_);
+  assign _0821_ = ~(_0809_ ^ _0820_);
+  assign _0822_ = ~(_0819_ ^ _0821_);
+  assign _0445_ = ~(_0818_ ^ _0822_);
+  assign _0439_ = _0423_ ^ _0527_;
+  assign _0447_ = _0542_ ^ _0543_;
+  assign _0442_ = _0798_ ^ _0799_;
+  assign _0823_ = ~(_0869_ | _0548_);
+  assign _0450_ = ~(_0485_ ^ _0823_);
+  assign _0824_ = ~(_0713_ & _0714_);
+  assign _0454_ = ~(_0721_ ^ _0824_);
+  assign _0440_ = _0708_ ^ _0723_;
+  assign c_max = 19'h07fff;
+  assign sum = { 3'hx, C };
+  assign b_ext = { B[15], B };
+  assign sum_B = B;
+  assign result = C;
+  assign c_min = 19'h78000;
+  assign w_ext = { W[7], W };
+  assign a_ext = { 1'h0, A };
+  assign _0415_ = A[0];
+  assign _0458_ = W[3];
+  assign _0416_ = A[1];
+  assign _0457_ = W[2];
+  assign _0418_ = A[3];
+  assign _0456_ = W[1];
+  assign _0455_ = W[0];
+  assign _0419_ = A[4];
+  assign _0433_ = B[4];
+  assign _0417_ = A[2];
+  assign _0432_ = B[3];
+  assign _0459_ = W[4];
+  assign _0420_ = A[5];
+  assign _0434_ = B[5];
+  assign _0460_ = W[5];
+  assign _0431_ = B[2];
+  assign _0421_ = A[6];
+  assign _0435_ = B[6];
+  assign _0461_ = W[6];
+  assign _0430_ = B[1];
+  assign _0423_ = B[0];
+  assign _0462_ = W[7];
+  assign _0422_ = A[7];
+  assign _0436_ = B[7];
+  assign C[7] = _0452_;
+  assign _0437_ = B[8];
+  assign _0438_ = B[9];
+  assign _0424_ = B[10];
+  assign _0425_ = B[11];
+  assign C[11] = _0441_;
+  assign C[3] = _0448_;
+  assign _0426_ = B[12];
+  assign _0427_ = B[13];
+  assign _0428_ = B[14];
+  assign C[14] = _0444_;
+  assign C[8] = _0453_;
+  assign C[1] = _0446_;
+  assign C[6] = _0451_;
+  assign C[13] = _0443_;
+  assign C[4] = _0449_;
+  assign _0429_ = B[15];
+  assign C[15] = _0445_;
+  assign C[0] = _0439_;
+  assign C[2] = _0447_;
+  assign C[12] = _0442_;
+  assign C[5] = _0450_;
+  assign C[9] = _0454_;
+  assign C[10] = _0440_;
+endmodule
+
+(* dynports =  1  *)
+(* top =  1  *)
+(* src = "dnn_accelerator.v:14.1-214.10" *)
+module dnn_accelerator(clk, rst_n, start, input_data_0, input_data_1, input_data_2, input_data_3, output_data_0, output_data_1, done, valid);
+  (* src = "dnn_accelerator.v:25.11-25.14" *)
+  input clk;
+  wire clk;
+  (* src = "dnn_accelerator.v:26.11-26.16" *)
+  input rst_n;
+  wire rst_n;
+  (* src = "dnn_accelerator.v:27.11-27.16" *)
+  input start;
+  wire start;
+  (* src = "dnn_accelerator.v:28.17-28.29" *)
+  input [7:0] input_data_0;
+  wire [7:0] input_data_0;
+  (* src = "dnn_accelerator.v:29.17-29.29" *)
+  input [7:0] input_data_1;
+  wire [7:0] input_data_1;
+  (* src = "dnn_accelerator.v:30.17-30.29" *)
+  input [7:0] input_data_2;
+  wire [7:0] input_data_2;
+  (* src = "dnn_accelerator.v:31.17-31.29" *)
+  input [7:0] input_data_3;
+  wire [7:0] input_data_3;
+  (* src = "dnn_accelerator.v:32.23-32.36" *)
+  output [15:0] output_data_0;
+  reg [15:0] output_data_0;
+  (* src = "dnn_accelerator.v:33.23-33.36" *)
+  output [15:0] output_data_1;
+  reg [15:0] output_data_1;
+  (* src = "dnn_accelerator.v:34.16-34.20" *)
+  output done;
+  reg done;
+  (* src = "dnn_accelerator.v:35.16-35.21" *)
+  output valid;
+  wire valid;
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  wire [1:0] _0000_;
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  wire [15:0] _0001_;
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  wire [1:0] _0002_;
+  wire _0003_;
+  wire _0004_;
+  wire _0005_;
+  wire _0006_;
+  wire _0007_;
+  wire _0008_;
+  wire _0009_;
+  wire _0010_;
+  wire _0011_;
+  wire _0012_;
+  wire _0013_;
+  wire _0014_;
+  wire _0015_;
+  wire _0016_;
+  wire _0017_;
+  wire _0018_;
+  wire _0019_;
+  wire _0020_;
+  wire _0021_;
+  wire _0022_;
+  wire _0023_;
+  wire _0024_;
+  wire _0025_;
+  wire _0026_;
+  wire _0027_;
+  wire _0028_;
+  wire _0029_;
+  wire _0030_;
+  wire _0031_;
+  wire _0032_;
+  wire _0033_;
+  wire _0034_;
+  wire _0035_;
+  wire _0036_;
+  wire _0037_;
+  wire _0038_;
+  wire _0039_;
+  wire _0040_;
+  wire _0041_;
+  wire _0042_;
+  wire _0043_;
+  wire _0044_;
+  wire _0045_;
+  wire _0046_;
+  wire _0047_;
+  wire _0048_;
+  wire _0049_;
+  wire _0050_;
+  wire _0051_;
+  wire _0052_;
+  wire _0053_;
+  wire _0054_;
+  wire _0055_;
+  wire _0056_;
+  wire _0057_;
+  wire _0058_;
+  wire _0059_;
+  wire _0060_;
+  wire _0061_;
+  wire _0062_;
+  wire _0063_;
+  wire _0064_;
+  wire _0065_;
+  wire _0066_;
+  wire _0067_;
+  wire _0068_;
+  wire _0069_;
+  wire _0070_;
+  wire _0071_;
+  wire _0072_;
+  wire _0073_;
+  wire _0074_;
+  wire _0075_;
+  wire _0076_;
+  wire _0077_;
+  wire _0078_;
+  wire _0079_;
+  wire _0080_;
+  wire _0081_;
+  wire _0082_;
+  wire _0083_;
+  wire _0084_;
+  wire _0085_;
+  wire _0086_;
+  wire _0087_;
+  wire _0088_;
+  wire _0089_;
+  wire _0090_;
+  wire _0091_;
+  wire _0092_;
+  wire _0093_;
+  wire _0094_;
+  wire _0095_;
+  wire _0096_;
+  wire _0097_;
+  wire _0098_;
+  wire _0099_;
+  wire _0100_;
+  wire _0101_;
+  wire _0102_;
+  wire _0103_;
+  wire _0104_;
+  wire _0105_;
+  wire _0106_;
+  wire _0107_;
+  wire _0108_;
+  wire _0109_;
+  wire _0110_;
+  wire _0111_;
+  wire _0112_;
+  wire _0113_;
+  wire _0114_;
+  wire _0115_;
+  wire _0116_;
+  wire _0117_;
+  wire _0118_;
+  wire _0119_;
+  wire _0120_;
+  wire _0121_;
+  wire _0122_;
+  wire _0123_;
+  wire _0124_;
+  wire _0125_;
+  wire _0126_;
+  wire _0127_;
+  wire _0128_;
+  wire _0129_;
+  wire _0130_;
+  wire _0131_;
+  wire _0132_;
+  wire _0133_;
+  wire _0134_;
+  wire _0135_;
+  wire _0136_;
+  wire _0137_;
+  wire _0138_;
+  wire _0139_;
+  wire _0140_;
+  wire _0141_;
+  wire _0142_;
+  wire _0143_;
+  wire _0144_;
+  wire _0145_;
+  wire _0146_;
+  wire _0147_;
+  wire _0148_;
+  wire _0149_;
+  wire _0150_;
+  wire _0151_;
+  wire _0152_;
+  wire _0153_;
+  wire _0154_;
+  wire _0155_;
+  wire _0156_;
+  wire _0157_;
+  wire _0158_;
+  wire _0159_;
+  wire _0160_;
+  wire _0161_;
+  wire _0162_;
+  wire _0163_;
+  wire _0164_;
+  wire _0165_;
+  wire _0166_;
+  wire _0167_;
+  wire _0168_;
+  wire _0169_;
+  wire _0170_;
+  wire _0171_;
+  wire _0172_;
+  wire _0173_;
+  wire _0174_;
+  wire _0175_;
+  wire _0176_;
+  wire _0177_;
+  wire _0178_;
+  wire _0179_;
+  wire _0180_;
+  wire _0181_;
+  wire _0182_;
+  wire _0183_;
+  wire _0184_;
+  wire _0185_;
+  wire _0186_;
+  wire _0187_;
+  wire _0188_;
+  wire _0189_;
+  wire _0190_;
+  wire _0191_;
+  wire _0192_;
+  wire _0193_;
+  wire _0194_;
+  wire _0195_;
+  wire _0196_;
+  wire _0197_;
+  wire _0198_;
+  wire _0199_;
+  wire _0200_;
+  wire _0201_;
+  wire _0202_;
+  wire _0203_;
+  wire _0204_;
+  wire _0205_;
+  wire _0206_;
+  wire _0207_;
+  wire _0208_;
+  wire _0209_;
+  wire _0210_;
+  wire _0211_;
+  wire _0212_;
+  wire _0213_;
+  wire _0214_;
+  wire _0215_;
+  wire _0216_;
+  wire _0217_;
+  wire _0218_;
+  wire _0219_;
+  wire _0220_;
+  wire _0221_;
+  wire _0222_;
+  wire _0223_;
+  wire _0224_;
+  wire _0225_;
+  wire _0226_;
+  wire _0227_;
+  wire _0228_;
+  wire _0229_;
+  wire _0230_;
+  wire _0231_;
+  wire _0232_;
+  wire _0233_;
+  wire _0234_;
+  wire _0235_;
+  wire _0236_;
+  wire _0237_;
+  wire _0238_;
+  wire _0239_;
+  wire _0240_;
+  wire _0241_;
+  wire _0242_;
+  wire _0243_;
+  wire _0244_;
+  wire _0245_;
+  wire _0246_;
+  wire _0247_;
+  wire _0248_;
+  wire _0249_;
+  wire _0250_;
+  wire _0251_;
+  wire _0252_;
+  wire _0253_;
+  wire _0254_;
+  wire _0255_;
+  wire _0256_;
+  wire _0257_;
+  wire _0258_;
+  wire _0259_;
+  wire _0260_;
+  wire _0261_;
+  wire _0262_;
+  wire _0263_;
+  wire _0264_;
+  wire _0265_;
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  wire _0266_;
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  wire _0267_;
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  wire _0268_;
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  wire _0269_;
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  wire _0270_;
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  wire _0271_;
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  wire _0272_;
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  wire _0273_;
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  wire _0274_;
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  wire _0275_;
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  wire _0276_;
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  wire _0277_;
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  wire _0278_;
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  wire _0279_;
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  wire _0280_;
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  wire _0281_;
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  wire _0282_;
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  wire _0283_;
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  wire _0284_;
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  wire _0285_;
+  wire _0286_;
+  wire _0287_;
+  wire _0288_;
+  wire _0289_;
+  wire _0290_;
+  wire _0291_;
+  wire _0292_;
+  wire _0293_;
+  wire _0294_;
+  wire _0295_;
+  wire _0296_;
+  wire _0297_;
+  wire _0298_;
+  (* src = "dnn_accelerator.v:64.16-64.29" *)
+  wire _0299_;
+  (* src = "dnn_accelerator.v:64.16-64.29" *)
+  wire _0300_;
+  (* src = "dnn_accelerator.v:64.16-64.29" *)
+  wire _0301_;
+  (* src = "dnn_accelerator.v:64.16-64.29" *)
+  wire _0302_;
+  (* src = "dnn_accelerator.v:64.16-64.29" *)
+  wire _0303_;
+  (* src = "dnn_accelerator.v:64.16-64.29" *)
+  wire _0304_;
+  (* src = "dnn_accelerator.v:64.16-64.29" *)
+  wire _0305_;
+  (* src = "dnn_accelerator.v:64.16-64.29" *)
+  wire _0306_;
+  (* src = "dnn_accelerator.v:65.16-65.30" *)
+  wire _0307_;
+  (* src = "dnn_accelerator.v:65.16-65.30" *)
+  wire _0308_;
+  (* src = "dnn_accelerator.v:65.16-65.30" *)
+  wire _0309_;
+  (* src = "dnn_accelerator.v:65.16-65.30" *)
+  wire _0310_;
+  (* src = "dnn_accelerator.v:65.16-65.30" *)
+  wire _0311_;
+  (* src = "dnn_accelerator.v:65.16-65.30" *)
+  wire _0312_;
+  (* src = "dnn_accelerator.v:65.16-65.30" *)
+  wire _0313_;
+  (* src = "dnn_accelerator.v:95.16-95.26" *)
+  wire _0314_;
+  (* src = "dnn_accelerator.v:95.16-95.26" *)
+  wire _0315_;
+  (* src = "dnn_accelerator.v:95.16-95.26" *)
+  wire _0316_;
+  (* src = "dnn_accelerator.v:95.16-95.26" *)
+  wire _0317_;
+  (* src = "dnn_accelerator.v:95.16-95.26" *)
+  wire _0318_;
+  (* src = "dnn_accelerator.v:95.16-95.26" *)
+  wire _0319_;
+  (* src = "dnn_accelerator.v:95.16-95.26" *)
+  wire _0320_;
+  (* src = "dnn_accelerator.v:95.16-95.26" *)
+  wire _0321_;
+  (* src = "dnn_accelerator.v:44.15-44.27" *)
+  wire _0322_;
+  (* src = "dnn_accelerator.v:44.15-44.27" *)
+  wire _0323_;
+  (* src = "dnn_accelerator.v:44.15-44.27" *)
+  wire _0324_;
+  (* src = "dnn_accelerator.v:44.15-44.27" *)
+  wire _0325_;
+  (* src = "dnn_accelerator.v:44.15-44.27" *)
+  wire _0326_;
+  (* src = "dnn_accelerator.v:44.15-44.27" *)
+  wire _0327_;
+  (* src = "dnn_accelerator.v:44.15-44.27" *)
+  wire _0328_;
+  (* src = "dnn_accelerator.v:44.15-44.27" *)
+  wire _0329_;
+  (* src = "dnn_accelerator.v:44.15-44.27" *)
+  wire _0330_;
+  (* src = "dnn_accelerator.v:44.15-44.27" *)
+  wire _0331_;
+  (* src = "dnn_accelerator.v:44.15-44.27" *)
+  wire _0332_;
+  (* src = "dnn_accelerator.v:44.15-44.27" *)
+  wire _0333_;
+  (* src = "dnn_accelerator.v:44.15-44.27" *)
+  wire _0334_;
+  (* src = "dnn_accelerator.v:44.15-44.27" *)
+  wire _0335_;
+  (* src = "dnn_accelerator.v:44.15-44.27" *)
+  wire _0336_;
+  (* src = "dnn_accelerator.v:44.15-44.27" *)
+  wire _0337_;
+  (* src = "dnn_accelerator.v:44.15-44.27" *)
+  wire _0338_;
+  (* src = "dnn_accelerator.v:44.15-44.27" *)
+  wire _0339_;
+  (* src = "dnn_accelerator.v:44.15-44.27" *)
+  wire _0340_;
+  (* src = "dnn_accelerator.v:44.15-44.27" *)
+  wire _0341_;
+  (* src = "dnn_accelerator.v:44.15-44.27" *)
+  wire _0342_;
+  (* src = "dnn_accelerator.v:44.15-44.27" *)
+  wire _0343_;
+  (* src = "dnn_accelerator.v:44.15-44.27" *)
+  wire _0344_;
+  (* src = "dnn_accelerator.v:44.15-44.27" *)
+  wire _0345_;
+  (* src = "dnn_accelerator.v:28.17-28.29" *)
+  wire _0346_;
+  (* src = "dnn_accelerator.v:28.17-28.29" *)
+  wire _0347_;
+  (* src = "dnn_accelerator.v:28.17-28.29" *)
+  wire _0348_;
+  (* src = "dnn_accelerator.v:28.17-28.29" *)
+  wire _0349_;
+  (* src = "dnn_accelerator.v:28.17-28.29" *)
+  wire _0350_;
+  (* src = "dnn_accelerator.v:28.17-28.29" *)
+  wire _0351_;
+  (* src = "dnn_accelerator.v:28.17-28.29" *)
+  wire _0352_;
+  (* src = "dnn_accelerator.v:28.17-28.29" *)
+  wire _0353_;
+  (* src = "dnn_accelerator.v:29.17-29.29" *)
+  wire _0354_;
+  (* src = "dnn_accelerator.v:29.17-29.29" *)
+  wire _0355_;
+  (* src = "dnn_accelerator.v:29.17-29.29" *)
+  wire _0356_;
+  (* src = "dnn_accelerator.v:29.17-29.29" *)
+  wire _0357_;
+  (* src = "dnn_accelerator.v:29.17-29.29" *)
+  wire _0358_;
+  (* src = "dnn_accelerator.v:29.17-29.29" *)
+  wire _0359_;
+  (* src = "dnn_accelerator.v:29.17-29.29" *)
+  wire _0360_;
+  (* src = "dnn_accelerator.v:29.17-29.29" *)
+  wire _0361_;
+  (* src = "dnn_accelerator.v:30.17-30.29" *)
+  wire _0362_;
+  (* src = "dnn_accelerator.v:30.17-30.29" *)
+  wire _0363_;
+  (* src = "dnn_accelerator.v:30.17-30.29" *)
+  wire _0364_;
+  (* src = "dnn_accelerator.v:30.17-30.29" *)
+  wire _0365_;
+  (* src = "dnn_accelerator.v:30.17-30.29" *)
+  wire _0366_;
+  (* src = "dnn_accelerator.v:30.17-30.29" *)
+  wire _0367_;
+  (* src = "dnn_accelerator.v:30.17-30.29" *)
+  wire _0368_;
+  (* src = "dnn_accelerator.v:30.17-30.29" *)
+  wire _0369_;
+  (* src = "dnn_accelerator.v:31.17-31.29" *)
+  wire _0370_;
+  (* src = "dnn_accelerator.v:31.17-31.29" *)
+  wire _0371_;
+  (* src = "dnn_accelerator.v:31.17-31.29" *)
+  wire _0372_;
+  (* src = "dnn_accelerator.v:31.17-31.29" *)
+  wire _0373_;
+  (* src = "dnn_accelerator.v:31.17-31.29" *)
+  wire _0374_;
+  (* src = "dnn_accelerator.v:31.17-31.29" *)
+  wire _0375_;
+  (* src = "dnn_accelerator.v:31.17-31.29" *)
+  wire _0376_;
+  (* src = "dnn_accelerator.v:31.17-31.29" *)
+  wire _0377_;
+  (* src = "dnn_accelerator.v:50.15-50.24" *)
+  wire _0378_;
+  (* src = "dnn_accelerator.v:50.15-50.24" *)
+  wire _0379_;
+  (* src = "dnn_accelerator.v:80.26-80.31" *)
+  wire _0380_;
+  (* src = "dnn_accelerator.v:80.26-80.31" *)
+  wire _0381_;
+  (* src = "dnn_accelerator.v:80.26-80.31" *)
+  wire _0382_;
+  (* src = "dnn_accelerator.v:80.26-80.31" *)
+  wire _0383_;
+  (* src = "dnn_accelerator.v:80.26-80.31" *)
+  wire _0384_;
+  (* src = "dnn_accelerator.v:80.26-80.31" *)
+  wire _0385_;
+  (* src = "dnn_accelerator.v:80.26-80.31" *)
+  wire _0386_;
+  (* src = "dnn_accelerator.v:80.26-80.31" *)
+  wire _0387_;
+  (* src = "dnn_accelerator.v:80.26-80.31" *)
+  wire _0388_;
+  (* src = "dnn_accelerator.v:80.26-80.31" *)
+  wire _0389_;
+  (* src = "dnn_accelerator.v:80.26-80.31" *)
+  wire _0390_;
+  (* src = "dnn_accelerator.v:80.26-80.31" *)
+  wire _0391_;
+  (* src = "dnn_accelerator.v:80.26-80.31" *)
+  wire _0392_;
+  (* src = "dnn_accelerator.v:80.26-80.31" *)
+  wire _0393_;
+  (* src = "dnn_accelerator.v:80.26-80.31" *)
+  wire _0394_;
+  (* src = "dnn_accelerator.v:80.26-80.31" *)
+  wire _0395_;
+  (* src = "dnn_accelerator.v:49.15-49.25" *)
+  wire _0396_;
+  (* src = "dnn_accelerator.v:49.15-49.25" *)
+  wire _0397_;
+  wire _0398_;
+  wire _0399_;
+  wire _0400_;
+  wire _0401_;
+  wire _0402_;
+  wire _0403_;
+  wire _0404_;
+  wire _0405_;
+  wire _0406_;
+  wire _0407_;
+  wire _0408_;
+  wire _0409_;
+  wire _0410_;
+  wire _0411_;
+  wire _0412_;
+  wire _0413_;
+  wire _0414_;
+  wire _0415_;
+  wire _0416_;
+  wire _0417_;
+  wire _0418_;
+  wire _0419_;
+  wire _0420_;
+  wire _0421_;
+  wire _0422_;
+  wire _0423_;
+  wire _0424_;
+  wire _0425_;
+  wire _0426_;
+  wire _0427_;
+  wire _0428_;
+  wire _0429_;
+  wire _0430_;
+  wire _0431_;
+  wire _0432_;
+  wire _0433_;
+  wire _0434_;
+  wire _0435_;
+  wire _0436_;
+  wire _0437_;
+  wire _0438_;
+  wire _0439_;
+  wire _0440_;
+  wire _0441_;
+  wire _0442_;
+  wire _0443_;
+  wire _0444_;
+  wire _0445_;
+  wire _0446_;
+  wire _0447_;
+  wire _0448_;
+  wire _0449_;
+  wire _0450_;
+  wire _0451_;
+  wire _0452_;
+  wire _0453_;
+  wire _0454_;
+  wire _0455_;
+  wire _0456_;
+  wire _0457_;
+  wire _0458_;
+  wire _0459_;
+  wire _0460_;
+  wire _0461_;
+  wire _0462_;
+  wire _0463_;
+  wire _0464_;
+  wire _0465_;
+  wire _0466_;
+  wire _0467_;
+  wire _0468_;
+  wire _0469_;
+  wire _0470_;
+  wire _0471_;
+  wire _0472_;
+  wire _0473_;
+  wire _0474_;
+  wire _0475_;
+  wire _0476_;
+  wire _0477_;
+  wire _0478_;
+  wire _0479_;
+  wire _0480_;
+  wire _0481_;
+  wire _0482_;
+  wire _0483_;
+  wire _0484_;
+  wire _0485_;
+  wire _0486_;
+  wire _0487_;
+  wire _0488_;
+  wire _0489_;
+  wire _0490_;
+  wire _0491_;
+  wire _0492_;
+  wire _0493_;
+  wire _0494_;
+  wire _0495_;
+  wire _0496_;
+  wire _0497_;
+  wire _0498_;
+  wire _0499_;
+  wire _0500_;
+  wire _0501_;
+  wire _0502_;
+  wire _0503_;
+  wire _0504_;
+  wire _0505_;
+  wire _0506_;
+  wire _0507_;
+  wire _0508_;
+  wire _0509_;
+  wire _0510_;
+  wire _0511_;
+  wire _0512_;
+  wire _0513_;
+  wire _0514_;
+  wire _0515_;
+  wire _0516_;
+  wire _0517_;
+  wire _0518_;
+  wire _0519_;
+  wire _0520_;
+  wire _0521_;
+  wire _0522_;
+  wire _0523_;
+  wire _0524_;
+  wire _0525_;
+  wire _0526_;
+  wire _0527_;
+  wire _0528_;
+  wire _0529_;
+  wire _0530_;
+  wire _0531_;
+  wire _0532_;
+  wire _0533_;
+  wire _0534_;
+  wire _0535_;
+  wire _0536_;
+  wire _0537_;
+  wire _0538_;
+  wire _0539_;
+  wire _0540_;
+  wire _0541_;
+  wire _0542_;
+  wire _0543_;
+  wire _0544_;
+  wire _0545_;
+  wire _0546_;
+  wire _0547_;
+  wire _0548_;
+  wire _0549_;
+  wire _0550_;
+  wire _0551_;
+  wire _0552_;
+  wire _0553_;
+  wire _0554_;
+  wire _0555_;
+  wire _0556_;
+  wire _0557_;
+  wire _0558_;
+  wire _0559_;
+  wire _0560_;
+  wire _0561_;
+  wire _0562_;
+  wire _0563_;
+  wire _0564_;
+  wire _0565_;
+  wire _0566_;
+  wire _0567_;
+  wire _0568_;
+  wire _0569_;
+  wire _0570_;
+  wire _0571_;
+  wire _0572_;
+  wire _0573_;
+  wire _0574_;
+  wire _0575_;
+  wire _0576_;
+  wire _0577_;
+  wire _0578_;
+  wire _0579_;
+  wire _0580_;
+  wire _0581_;
+  wire _0582_;
+  wire _0583_;
+  wire _0584_;
+  wire _0585_;
+  wire _0586_;
+  wire _0587_;
+  wire _0588_;
+  wire _0589_;
+  wire _0590_;
+  wire _0591_;
+  wire _0592_;
+  wire _0593_;
+  wire _0594_;
+  wire _0595_;
+  wire _0596_;
+  wire _0597_;
+  wire _0598_;
+  wire _0599_;
+  wire _0600_;
+  wire _0601_;
+  wire _0602_;
+  wire _0603_;
+  wire _0604_;
+  wire _0605_;
+  wire _0606_;
+  wire _0607_;
+  wire _0608_;
+  wire _0609_;
+  wire _0610_;
+  wire _0611_;
+  wire _0612_;
+  wire _0613_;
+  wire _0614_;
+  wire _0615_;
+  wire _0616_;
+  wire _0617_;
+  wire _0618_;
+  wire _0619_;
+  wire _0620_;
+  wire _0621_;
+  wire _0622_;
+  wire _0623_;
+  wire _0624_;
+  wire _0625_;
+  wire _0626_;
+  wire _0627_;
+  wire _0628_;
+  wire _0629_;
+  wire _0630_;
+  wire _0631_;
+  wire _0632_;
+  wire _0633_;
+  wire _0634_;
+  wire _0635_;
+  wire _0636_;
+  wire _0637_;
+  wire _0638_;
+  wire _0639_;
+  wire _0640_;
+  wire _0641_;
+  wire _0642_;
+  wire _0643_;
+  (* src = "dnn_accelerator.v:26.11-26.16" *)
+  wire _0644_;
+  (* src = "dnn_accelerator.v:27.11-27.16" *)
+  wire _0645_;
+  wire _0646_;
+  wire _0647_;
+  wire _0648_;
+  wire _0649_;
+  (* src = "dnn_accelerator.v:41.16-41.27" *)
+  wire [15:0] \bias_layer1[0] ;
+  (* src = "dnn_accelerator.v:41.16-41.27" *)
+  wire [15:0] \bias_layer1[1] ;
+  (* src = "dnn_accelerator.v:41.16-41.27" *)
+  wire [15:0] \bias_layer1[2] ;
+  (* src = "dnn_accelerator.v:42.16-42.27" *)
+  wire [15:0] \bias_layer2[0] ;
+  (* src = "dnn_accelerator.v:42.16-42.27" *)
+  wire [15:0] \bias_layer2[1] ;
+  (* src = "dnn_accelerator.v:64.16-64.29" *)
+  wire [7:0] current_input;
+  (* src = "dnn_accelerator.v:65.16-65.30" *)
+  wire [7:0] current_weight;
+  (* src = "dnn_accelerator.v:95.16-95.26" *)
+  wire [7:0] hidden_act;
+  (* src = "dnn_accelerator.v:44.15-44.27" *)
+  reg [7:0] \hidden_layer[0] ;
+  (* src = "dnn_accelerator.v:44.15-44.27" *)
+  reg [7:0] \hidden_layer[1] ;
+  (* src = "dnn_accelerator.v:44.15-44.27" *)
+  reg [7:0] \hidden_layer[2] ;
+  (* src = "dnn_accelerator.v:50.15-50.24" *)
+  reg [1:0] input_idx;
+  (* src = "dnn_accelerator.v:80.26-80.31" *)
+  wire [15:0] mac_c;
+  (* src = "dnn_accelerator.v:81.24-81.36" *)
+  wire signed [15:0] mac_c_signed;
+  (* src = "dnn_accelerator.v:82.17-82.31" *)
+  wire [15:0] mac_c_unsigned;
+  (* src = "dnn_accelerator.v:66.17-66.24" *)
+  wire [15:0] mac_out;
+  (* src = "dnn_accelerator.v:55.10-55.19" *)
+  wire mac_ready;
+  (* src = "dnn_accelerator.v:45.16-45.26" *)
+  reg [15:0] mac_result;
+  (* src = "dnn_accelerator.v:49.15-49.25" *)
+  reg [1:0] neuron_idx;
+  (* hdlname = "requant_inst acc" *)
+  (* src = "dnn_accelerator.v:97.45-104.6|requant_unit.v:20.23-20.26" *)
+  wire [15:0] \requant_inst.acc ;
+  (* hdlname = "requant_inst acc_ext" *)
+  (* src = "dnn_accelerator.v:97.45-104.6|requant_unit.v:33.27-33.34" *)
+  wire signed [16:0] \requant_inst.acc_ext ;
+  (* hdlname = "requant_inst half" *)
+  (* src = "dnn_accelerator.v:97.45-104.6|requant_unit.v:41.29-41.33" *)
+  wire signed [32:0] \requant_inst.half ;
+  (* hdlname = "requant_inst mult_ext" *)
+  (* src = "dnn_accelerator.v:97.45-104.6|requant_unit.v:34.28-34.36" *)
+  wire signed [8:0] \requant_inst.mult_ext ;
+  (* hdlname = "requant_inst multiplier" *)
+  (* src = "dnn_accelerator.v:97.45-104.6|requant_unit.v:21.24-21.34" *)
+  wire [7:0] \requant_inst.multiplier ;
+  (* hdlname = "requant_inst q" *)
+  (* src = "dnn_accelerator.v:97.45-104.6|requant_unit.v:25.24-25.25" *)
+  wire [7:0] \requant_inst.q ;
+  (* hdlname = "requant_inst q_max" *)
+  (* src = "dnn_accelerator.v:97.45-104.6|requant_unit.v:47.29-47.34" *)
+  wire signed [32:0] \requant_inst.q_max ;
+  (* hdlname = "requant_inst q_min" *)
+  (* src = "dnn_accelerator.v:97.45-104.6|requant_unit.v:49.29-49.34" *)
+  wire signed [32:0] \requant_inst.q_min ;
+  (* hdlname = "requant_inst rectified" *)
+  (* src = "dnn_accelerator.v:97.45-104.6|requant_unit.v:38.29-38.38" *)
+  wire signed [32:0] \requant_inst.rectified ;
+  (* hdlname = "requant_inst relu" *)
+  (* src = "dnn_accelerator.v:97.45-104.6|requant_unit.v:24.11-24.15" *)
+  wire \requant_inst.relu ;
+  (* hdlname = "requant_inst round" *)
+  (* src = "dnn_accelerator.v:97.45-104.6|requant_unit.v:23.11-23.16" *)
+  wire \requant_inst.round ;
+  (* hdlname = "requant_inst rounded" *)
+  (* src = "dnn_accelerator.v:97.45-104.6|requant_unit.v:43.29-43.36" *)
+  wire signed [32:0] \requant_inst.rounded ;
+  (* hdlname = "requant_inst scaled" *)
+  (* src = "dnn_accelerator.v:97.45-104.6|requant_unit.v:37.30-37.36" *)
+  wire signed [25:0] \requant_inst.scaled ;
+  (* hdlname = "requant_inst shift" *)
+  (* src = "dnn_accelerator.v:97.45-104.6|requant_unit.v:22.25-22.30" *)
+  wire [4:0] \requant_inst.shift ;
+  (* hdlname = "requant_inst shifted" *)
+  (* src = "dnn_accelerator.v:97.45-104.6|requant_unit.v:44.29-44.36" *)
+  wire signed [32:0] \requant_inst.shifted ;
+  (* onehot = 32'd1 *)
+  reg [3:0] state;
+  (* src = "dnn_accelerator.v:39.15-39.29" *)
+  wire [7:0] \weights_layer1[0] ;
+  (* src = "dnn_accelerator.v:39.15-39.29" *)
+  wire [7:0] \weights_layer1[10] ;
+  (* src = "dnn_accelerator.v:39.15-39.29" *)
+  wire [7:0] \weights_layer1[11] ;
+  (* src = "dnn_accelerator.v:39.15-39.29" *)
+  wire [7:0] \weights_layer1[1] ;
+  (* src = "dnn_accelerator.v:39.15-39.29" *)
+  wire [7:0] \weights_layer1[2] ;
+  (* src = "dnn_accelerator.v:39.15-39.29" *)
+  wire [7:0] \weights_layer1[3] ;
+  (* src = "dnn_accelerator.v:39.15-39.29" *)
+  wire [7:0] \weights_layer1[4] ;
+  (* src = "dnn_accelerator.v:39.15-39.29" *)
+  wire [7:0] \weights_layer1[5] ;
+  (* src = "dnn_accelerator.v:39.15-39.29" *)
+  wire [7:0] \weights_layer1[6] ;
+  (* src = "dnn_accelerator.v:39.15-39.29" *)
+  wire [7:0] \weights_layer1[7] ;
+  (* src = "dnn_accelerator.v:39.15-39.29" *)
+  wire [7:0] \weights_layer1[8] ;
+  (* src = "dnn_accelerator.v:39.15-39.29" *)
+  wire [7:0] \weights_layer1[9] ;
+  (* src = "dnn_accelerator.v:40.15-40.29" *)
+  wire [7:0] \weights_layer2[0] ;
+  (* src = "dnn_accelerator.v:40.15-40.29" *)
+  wire [7:0] \weights_layer2[1] ;
+  (* src = "dnn_accelerator.v:40.15-40.29" *)
+  wire [7:0] \weights_layer2[2] ;
+  (* src = "dnn_accelerator.v:40.15-40.29" *)
+  wire [7:0] \weights_layer2[3] ;
+  (* src = "dnn_accelerator.v:40.15-40.29" *)
+  wire [7:0] \weights_layer2[4] ;
+  (* src = "dnn_accelerator.v:40.15-40.29" *)
+  wire [7:0] \weights_layer2[5] ;
+  assign _0398_ = _0648_ & ~(_0379_);
+  assign _0399_ = _0379_ & _0378_;
+  assign _0400_ = _0399_ | ~(_0649_);
+  assign _0401_ = _0398_ | ~(_0400_);
+  assign _0273_ = _0385_ & _0401_;
+  assign _0270_ = _0382_ & _0401_;
+  assign _0269_ = _0381_ & _0401_;
+  assign _0272_ = _0384_ & _0401_;
+  assign _0271_ = _0383_ & _0401_;
+  assign _0283_ = _0395_ & _0401_;
+  assign _0402_ = ~(_0394_ & _0401_);
+  assign _0403_ = _0649_ & _0399_;
+  assign _0404_ = _0396_ & ~(_0397_);
+  assign _0405_ = ~_0404_;
+  assign _0406_ = _0649_ & ~(_0397_);
+  assign _0407_ = ~(_0399_ & _0406_);
+  assign _0408_ = ~(_0403_ & _0404_);
+  assign _0282_ = ~(_0402_ & _0408_);
+  assign _0409_ = _0648_ | ~(_0400_);
+  assign _0410_ = ~(_0393_ & _0409_);
+  assign _0411_ = _0379_ & _0648_;
+  assign _0412_ = ~_0411_;
+  assign _0413_ = ~(_0403_ & _0405_);
+  assign _0414_ = _0412_ & _0413_;
+  assign _0281_ = ~(_0410_ & _0414_);
+  assign _0415_ = ~(_0392_ & _0401_);
+  assign _0416_ = _0397_ | _0396_;
+  assign _0417_ = _0403_ & ~(_0416_);
+  assign _0418_ = _0649_ | _0648_;
+  assign _0419_ = _0396_ | ~(_0411_);
+  assign _0420_ = _0418_ & _0419_;
+  assign _0421_ = _0420_ & ~(_0417_);
+  assign _0280_ = ~(_0415_ & _0421_);
+  assign _0422_ = ~(_0390_ & _0409_);
+  assign _0423_ = ~(_0397_ & _0403_);
+  assign _0424_ = _0412_ & _0423_;
+  assign _0278_ = ~(_0422_ & _0424_);
+  assign _0425_ = ~(_0391_ & _0401_);
+  assign _0426_ = _0408_ & _0420_;
+  assign _0279_ = ~(_0425_ & _0426_);
+  assign _0427_ = ~(_0649_ & _0416_);
+  assign _0428_ = ~(_0400_ & _0427_);
+  assign _0429_ = ~(_0396_ & _0411_);
+  assign _0430_ = _0388_ | _0399_;
+  assign _0431_ = ~(_0428_ & _0430_);
+  assign _0432_ = ~(_0388_ & _0398_);
+  assign _0433_ = _0418_ & _0432_;
+  assign _0434_ = _0429_ & _0433_;
+  assign _0276_ = ~(_0431_ & _0434_);
+  assign _0435_ = ~(_0389_ & _0401_);
+  assign _0436_ = _0407_ & _0419_;
+  assign _0277_ = ~(_0435_ & _0436_);
+  assign _0268_ = _0380_ & _0401_;
+  assign _0437_ = ~(_0387_ & _0409_);
+  assign _0275_ = ~(_0424_ & _0437_);
+  assign _0438_ = _0384_ & ~(_0386_);
+  assign _0439_ = _0382_ & ~(_0386_);
+  assign _0440_ = _0395_ & ~(_0386_);
+  assign _0441_ = _0386_ | ~(_0393_);
+  assign _0442_ = _0392_ & ~(_0386_);
+  assign _0443_ = _0393_ & _0442_;
+  assign _0444_ = _0394_ & _0443_;
+  assign _0445_ = _0440_ & _0444_;
+  assign _0446_ = _0381_ & _0445_;
+  assign _0447_ = _0439_ & _0446_;
+  assign _0448_ = _0383_ & _0447_;
+  assign _0449_ = _0438_ | _0448_;
+  assign _0450_ = _0438_ & _0448_;
+  assign _0451_ = ~(_0385_ & _0450_);
+  assign _0320_ = _0450_ ? _0385_ : _0449_;
+  assign _0452_ = _0386_ | ~(_0383_);
+  assign _0453_ = _0447_ ? _0383_ : _0452_;
+  assign _0319_ = ~(_0451_ & _0453_);
+  assign _0454_ = ~(_0439_ ^ _0446_);
+  assign _0318_ = ~(_0451_ & _0454_);
+  assign _0455_ = _0386_ | ~(_0381_);
+  assign _0456_ = _0445_ ? _0381_ : _0455_;
+  assign _0317_ = ~(_0451_ & _0456_);
+  assign _0457_ = ~(_0440_ ^ _0444_);
+  assign _0316_ = ~(_0451_ & _0457_);
+  assign _0458_ = _0386_ | ~(_0394_);
+  assign _0459_ = _0443_ ? _0394_ : _0458_;
+  assign _0315_ = ~(_0451_ & _0459_);
+  assign _0460_ = _0442_ ? _0393_ : _0441_;
+  assign _0314_ = ~(_0451_ & _0460_);
+  assign _0461_ = _0378_ & _0396_;
+  assign _0462_ = _0396_ | ~(_0397_);
+  assign _0463_ = _0397_ ^ _0396_;
+  assign _0464_ = ~(_0379_ & _0463_);
+  assign _0465_ = _0379_ ^ _0463_;
+  assign _0466_ = ~(_0461_ & _0465_);
+  assign _0467_ = _0379_ & ~(_0378_);
+  assign _0468_ = ~(_0404_ & _0467_);
+  assign _0469_ = _0466_ & _0468_;
+  assign _0470_ = _0379_ | _0462_;
+  assign _0471_ = _0379_ ? _0405_ : _0462_;
+  assign _0472_ = _0466_ & _0471_;
+  assign _0473_ = ~(_0378_ | _0396_);
+  assign _0474_ = ~(_0461_ | _0473_);
+  assign _0475_ = _0461_ | _0465_;
+  assign _0476_ = _0474_ & ~(_0465_);
+  assign _0477_ = ~(_0472_ & _0476_);
+  assign _0478_ = _0472_ & _0475_;
+  assign _0479_ = ~(_0472_ & _0475_);
+  assign _0480_ = _0477_ & _0479_;
+  assign _0481_ = ~(_0469_ & _0480_);
+  assign _0482_ = ~(_0474_ & _0478_);
+  assign _0483_ = _0649_ | ~(_0477_);
+  assign _0484_ = _0482_ & ~(_0483_);
+  assign _0485_ = ~(_0481_ & _0484_);
+  assign _0313_ = ~_0485_;
+  assign _0486_ = ~(_0428_ & _0464_);
+  assign _0312_ = _0485_ & _0486_;
+  assign _0487_ = _0378_ & ~(_0379_);
+  assign _0488_ = ~(_0463_ & _0487_);
+  assign _0489_ = ~(_0467_ | _0487_);
+  assign _0490_ = ~(_0649_ & _0489_);
+  assign _0491_ = ~(_0427_ & _0490_);
+  assign _0492_ = ~(_0488_ & _0491_);
+  assign _0311_ = _0485_ & _0492_;
+  assign _0493_ = _0378_ | _0397_;
+  assign _0494_ = ~(_0396_ ^ _0493_);
+  assign _0495_ = _0379_ | _0378_;
+  assign _0496_ = _0489_ | _0494_;
+  assign _0310_ = _0649_ ? _0496_ : _0476_;
+  assign _0497_ = _0480_ & ~(_0649_);
+  assign _0498_ = ~(_0404_ & _0489_);
+  assign _0499_ = _0470_ & _0498_;
+  assign _0500_ = _0491_ & _0499_;
+  assign _0309_ = ~(_0497_ | _0500_);
+  assign _0501_ = _0649_ | ~(_0468_);
+  assign _0502_ = ~(_0479_ & _0481_);
+  assign _0503_ = _0501_ | _0502_;
+  assign _0504_ = _0397_ ? _0473_ : _0378_;
+  assign _0505_ = ~(_0649_ & _0504_);
+  assign _0308_ = _0503_ & _0505_;
+  assign _0506_ = ~(_0469_ & _0482_);
+  assign _0307_ = _0649_ ? _0404_ : _0506_;
+  assign _0507_ = ~(_0646_ | _0647_);
+  assign _0508_ = _0648_ | ~(_0507_);
+  assign _0509_ = ~(_0328_ & _0489_);
+  assign _0510_ = ~(_0344_ & _0467_);
+  assign _0511_ = ~(_0336_ & _0487_);
+  assign _0512_ = _0510_ & _0511_;
+  assign _0513_ = ~(_0509_ & _0512_);
+  assign _0514_ = ~(_0508_ & _0513_);
+  assign _0515_ = ~(_0376_ & _0399_);
+  assign _0516_ = _0379_ & ~(_0368_);
+  assign _0517_ = _0379_ | ~(_0360_);
+  assign _0518_ = _0378_ | _0516_;
+  assign _0519_ = _0515_ & _0518_;
+  assign _0520_ = ~(_0517_ & _0519_);
+  assign _0521_ = _0352_ | _0495_;
+  assign _0522_ = _0521_ & ~(_0508_);
+  assign _0523_ = ~(_0520_ & _0522_);
+  assign _0305_ = ~(_0514_ & _0523_);
+  assign _0524_ = ~(_0327_ & _0489_);
+  assign _0525_ = ~(_0343_ & _0467_);
+  assign _0526_ = ~(_0335_ & _0487_);
+  assign _0527_ = _0525_ & _0526_;
+  assign _0528_ = ~(_0524_ & _0527_);
+  assign _0529_ = ~(_0508_ & _0528_);
+  assign _0530_ = ~(_0375_ & _0399_);
+  assign _0531_ = _0378_ | ~(_0367_);
+  assign _0532_ = _0378_ & ~(_0359_);
+  assign _0533_ = _0379_ | _0532_;
+  assign _0534_ = _0531_ & _0533_;
+  assign _0535_ = ~(_0530_ & _0534_);
+  assign _0536_ = _0351_ | _0495_;
+  assign _0537_ = _0536_ & ~(_0508_);
+  assign _0538_ = ~(_0535_ & _0537_);
+  assign _0304_ = ~(_0529_ & _0538_);
+  assign _0539_ = ~(_0326_ & _0489_);
+  assign _0540_ = ~(_0342_ & _0467_);
+  assign _0541_ = ~(_0334_ & _0487_);
+  assign _0542_ = _0540_ & _0541_;
+  assign _0543_ = ~(_0539_ & _0542_);
+  assign _0544_ = ~(_0508_ & _0543_);
+  assign _0545_ = ~(_0358_ & _0487_);
+  assign _0546_ = ~(_0374_ & _0399_);
+  assign _0547_ = _0378_ | ~(_0366_);
+  assign _0548_ = _0495_ & _0547_;
+  assign _0549_ = _0546_ & _0548_;
+  assign _0550_ = ~(_0545_ & _0549_);
+  assign _0551_ = _0350_ | _0495_;
+  assign _0552_ = _0551_ & ~(_0508_);
+  assign _0553_ = ~(_0550_ & _0552_);
+  assign _0303_ = ~(_0544_ & _0553_);
+  assign _0554_ = ~(_0325_ & _0489_);
+  assign _0555_ = ~(_0341_ & _0467_);
+  assign _0556_ = ~(_0333_ & _0487_);
+  assign _0557_ = _0555_ & _0556_;
+  assign _0558_ = ~(_0554_ & _0557_);
+  assign _0559_ = ~(_0508_ & _0558_);
+  assign _0560_ = ~(_0373_ & _0399_);
+  assign _0561_ = _0378_ | ~(_0365_);
+  assign _0562_ = ~(_0357_ & _0487_);
+  assign _0563_ = _0495_ & _0561_;
+  assign _0564_ = _0560_ & _0563_;
+  assign _0565_ = ~(_0562_ & _0564_);
+  assign _0566_ = _0349_ | _0495_;
+  assign _0567_ = _0566_ & ~(_0508_);
+  assign _0568_ = ~(_0565_ & _0567_);
+  assign _0302_ = ~(_0559_ & _0568_);
+  assign _0569_ = ~(_0324_ & _0489_);
+  assign _0570_ = ~(_0340_ & _0467_);
+  assign _0571_ = ~(_0332_ & _0487_);
+  assign _0572_ = _0570_ & _0571_;
+  assign _0573_ = ~(_0569_ & _0572_);
+  assign _0574_ = ~(_0508_ & _0573_);
+  assign _0575_ = ~(_0356_ & _0487_);
+  assign _0576_ = ~(_0372_ & _0399_);
+  assign _0577_ = _0378_ | ~(_0364_);
+  assign _0578_ = _0495_ & _0577_;
+  assign _0579_ = _0576_ & _0578_;
+  assign _0580_ = ~(_0575_ & _0579_);
+  assign _0581_ = _0348_ | _0495_;
+  assign _0582_ = _0581_ & ~(_0508_);
+  assign _0583_ = ~(_0580_ & _0582_);
+  assign _0301_ = ~(_0574_ & _0583_);
+  assign _0584_ = ~(_0323_ & _0489_);
+  assign _0585_ = ~(_0339_ & _0467_);
+  assign _0586_ = ~(_0331_ & _0487_);
+  assign _0587_ = _0585_ & _0586_;
+  assign _0588_ = ~(_0584_ & _0587_);
+  assign _0589_ = ~(_0508_ & _0588_);
+  assign _0590_ = ~(_0355_ & _0487_);
+  assign _0591_ = ~(_0371_ & _0399_);
+  assign _0592_ = _0378_ | ~(_0363_);
+  assign _0593_ = _0495_ & _0592_;
+  assign _0594_ = _0591_ & _0593_;
+  assign _0595_ = ~(_0590_ & _0594_);
+  assign _0596_ = _0347_ | _0495_;
+  assign _0597_ = _0596_ & ~(_0508_);
+  assign _0598_ = ~(_0595_ & _0597_);
+  assign _0300_ = ~(_0589_ & _0598_);
+  assign _0599_ = ~(_0322_ & _0489_);
+  assign _0600_ = ~(_0338_ & _0467_);
+  assign _0601_ = ~(_0330_ & _0487_);
+  assign _0602_ = _0600_ & _0601_;
+  assign _0603_ = ~(_0599_ & _0602_);
+  assign _0604_ = ~(_0508_ & _0603_);
+  assign _0605_ = ~(_0354_ & _0487_);
+  assign _0606_ = ~(_0370_ & _0399_);
+  assign _0607_ = _0378_ | ~(_0362_);
+  assign _0608_ = _0495_ & _0607_;
+  assign _0609_ = _0606_ & _0608_;
+  assign _0610_ = ~(_0605_ & _0609_);
+  assign _0611_ = _0346_ | _0495_;
+  assign _0612_ = _0611_ & ~(_0508_);
+  assign _0613_ = ~(_0610_ & _0612_);
+  assign _0299_ = ~(_0604_ & _0613_);
+  assign _0614_ = ~(_0648_ | _0406_);
+  assign _0284_ = ~(_0396_ | _0614_);
+  assign _0615_ = ~(_0649_ | _0398_);
+  assign _0266_ = ~(_0378_ | _0615_);
+  assign _0616_ = ~(_0648_ & _0416_);
+  assign _0617_ = ~(_0411_ & _0416_);
+  assign _0618_ = ~(_0647_ & _0645_);
+  assign _0287_ = ~(_0617_ & _0618_);
+  assign _0619_ = _0646_ & _0645_;
+  assign _0292_ = _0646_ ? _0645_ : _0418_;
+  assign _0293_ = _0617_ & _0292_;
+  assign _0296_ = _0644_ & _0417_;
+  assign _0620_ = ~(_0644_ & _0411_);
+  assign _0291_ = ~(_0416_ | _0620_);
+  assign _0298_ = _0644_ & ~(_0617_);
+  assign _0621_ = ~(_0379_ & _0416_);
+  assign _0622_ = ~(_0648_ & _0621_);
+  assign _0623_ = _0645_ ? _0647_ : _0646_;
+  assign _0624_ = _0508_ & ~(_0623_);
+  assign _0294_ = _0622_ & _0624_;
+  assign _0286_ = ~(_0645_ | _0507_);
+  assign _0625_ = ~(_0406_ | _0619_);
+  assign _0289_ = ~(_0400_ & _0625_);
+  assign _0274_ = _0386_ & _0401_;
+  assign _0267_ = ~(_0489_ | _0615_);
+  assign _0626_ = _0385_ & ~(_0386_);
+  assign _0321_ = _0450_ | _0626_;
+  assign _0627_ = ~(_0616_ & _0292_);
+  assign _0297_ = ~(_0401_ | _0627_);
+  assign _0285_ = _0463_ & ~(_0614_);
+  assign _0290_ = _0644_ & ~(_0408_);
+  assign _0628_ = _0644_ & ~(_0462_);
+  assign _0295_ = _0403_ & _0628_;
+  assign _0288_ = ~(_0423_ & _0622_);
+  assign _0629_ = ~(_0329_ & _0489_);
+  assign _0630_ = ~(_0345_ & _0467_);
+  assign _0631_ = ~(_0337_ & _0487_);
+  assign _0632_ = _0630_ & _0631_;
+  assign _0633_ = ~(_0629_ & _0632_);
+  assign _0634_ = ~(_0508_ & _0633_);
+  assign _0635_ = ~(_0361_ & _0487_);
+  assign _0636_ = ~(_0377_ & _0399_);
+  assign _0637_ = _0378_ | ~(_0369_);
+  assign _0638_ = _0495_ & _0637_;
+  assign _0639_ = _0636_ & _0638_;
+  assign _0640_ = ~(_0635_ & _0639_);
+  assign _0641_ = _0353_ | _0495_;
+  assign _0642_ = _0641_ & ~(_0508_);
+  assign _0643_ = ~(_0640_ & _0642_);
+  assign _0306_ = ~(_0634_ & _0643_);
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0015_) output_data_1[0] <= mac_c[0];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0015_) output_data_1[1] <= mac_c[1];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0015_) output_data_1[2] <= mac_c[2];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0015_) output_data_1[3] <= mac_c[3];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0015_) output_data_1[4] <= mac_c[4];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0015_) output_data_1[5] <= mac_c[5];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0015_) output_data_1[6] <= mac_c[6];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0015_) output_data_1[7] <= mac_c[7];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0015_) output_data_1[8] <= mac_c[8];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0015_) output_data_1[9] <= mac_c[9];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0015_) output_data_1[10] <= mac_c[10];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0015_) output_data_1[11] <= mac_c[11];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0015_) output_data_1[12] <= mac_c[12];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0015_) output_data_1[13] <= mac_c[13];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0015_) output_data_1[14] <= mac_c[14];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0015_) output_data_1[15] <= mac_c[15];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk, negedge rst_n)
+    if (!rst_n) done <= 1'h0;
+    else if (_0011_) done <= state[2];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk, negedge rst_n)
+    if (!rst_n) neuron_idx[0] <= 1'h0;
+    else if (_0014_) neuron_idx[0] <= _0002_[0];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk, negedge rst_n)
+    if (!rst_n) neuron_idx[1] <= 1'h0;
+    else if (_0014_) neuron_idx[1] <= _0002_[1];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0013_) \hidden_layer[0] [0] <= hidden_act[0];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0013_) \hidden_layer[0] [1] <= hidden_act[1];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0013_) \hidden_layer[0] [2] <= hidden_act[2];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0013_) \hidden_layer[0] [3] <= hidden_act[3];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0013_) \hidden_layer[0] [4] <= hidden_act[4];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0013_) \hidden_layer[0] [5] <= hidden_act[5];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0013_) \hidden_layer[0] [6] <= hidden_act[6];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0013_) \hidden_layer[0] [7] <= hidden_act[7];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0012_) \hidden_layer[2] [0] <= hidden_act[0];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0012_) \hidden_layer[2] [1] <= hidden_act[1];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0012_) \hidden_layer[2] [2] <= hidden_act[2];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0012_) \hidden_layer[2] [3] <= hidden_act[3];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0012_) \hidden_layer[2] [4] <= hidden_act[4];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0012_) \hidden_layer[2] [5] <= hidden_act[5];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0012_) \hidden_layer[2] [6] <= hidden_act[6];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0012_) \hidden_layer[2] [7] <= hidden_act[7];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk, negedge rst_n)
+    if (!rst_n) mac_result[0] <= 1'h0;
+    else if (_0010_) mac_result[0] <= _0001_[0];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk, negedge rst_n)
+    if (!rst_n) mac_result[1] <= 1'h0;
+    else if (_0010_) mac_result[1] <= _0001_[1];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk, negedge rst_n)
+    if (!rst_n) mac_result[2] <= 1'h0;
+    else if (_0010_) mac_result[2] <= _0001_[2];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk, negedge rst_n)
+    if (!rst_n) mac_result[3] <= 1'h0;
+    else if (_0010_) mac_result[3] <= _0001_[3];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk, negedge rst_n)
+    if (!rst_n) mac_result[4] <= 1'h0;
+    else if (_0010_) mac_result[4] <= _0001_[4];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk, negedge rst_n)
+    if (!rst_n) mac_result[5] <= 1'h0;
+    else if (_0010_) mac_result[5] <= _0001_[5];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk, negedge rst_n)
+    if (!rst_n) mac_result[6] <= 1'h0;
+    else if (_0010_) mac_result[6] <= _0001_[6];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk, negedge rst_n)
+    if (!rst_n) mac_result[7] <= 1'h0;
+    else if (_0010_) mac_result[7] <= _0001_[7];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk, negedge rst_n)
+    if (!rst_n) mac_result[8] <= 1'h0;
+    else if (_0010_) mac_result[8] <= _0001_[8];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk, negedge rst_n)
+    if (!rst_n) mac_result[9] <= 1'h0;
+    else if (_0010_) mac_result[9] <= _0001_[9];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk, negedge rst_n)
+    if (!rst_n) mac_result[10] <= 1'h0;
+    else if (_0010_) mac_result[10] <= _0001_[10];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk, negedge rst_n)
+    if (!rst_n) mac_result[11] <= 1'h0;
+    else if (_0010_) mac_result[11] <= _0001_[11];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk, negedge rst_n)
+    if (!rst_n) mac_result[12] <= 1'h0;
+    else if (_0010_) mac_result[12] <= _0001_[12];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk, negedge rst_n)
+    if (!rst_n) mac_result[13] <= 1'h0;
+    else if (_0010_) mac_result[13] <= _0001_[13];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk, negedge rst_n)
+    if (!rst_n) mac_result[14] <= 1'h0;
+    else if (_0010_) mac_result[14] <= _0001_[14];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk, negedge rst_n)
+    if (!rst_n) mac_result[15] <= 1'h0;
+    else if (_0010_) mac_result[15] <= _0001_[15];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk, negedge rst_n)
+    if (!rst_n) input_idx[0] <= 1'h0;
+    else if (_0009_) input_idx[0] <= _0000_[0];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk, negedge rst_n)
+    if (!rst_n) input_idx[1] <= 1'h0;
+    else if (_0009_) input_idx[1] <= _0000_[1];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0008_) output_data_0[0] <= mac_c[0];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0008_) output_data_0[1] <= mac_c[1];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0008_) output_data_0[2] <= mac_c[2];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0008_) output_data_0[3] <= mac_c[3];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0008_) output_data_0[4] <= mac_c[4];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0008_) output_data_0[5] <= mac_c[5];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0008_) output_data_0[6] <= mac_c[6];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0008_) output_data_0[7] <= mac_c[7];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0008_) output_data_0[8] <= mac_c[8];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0008_) output_data_0[9] <= mac_c[9];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0008_) output_data_0[10] <= mac_c[10];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0008_) output_data_0[11] <= mac_c[11];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0008_) output_data_0[12] <= mac_c[12];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0008_) output_data_0[13] <= mac_c[13];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0008_) output_data_0[14] <= mac_c[14];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0008_) output_data_0[15] <= mac_c[15];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0007_) \hidden_layer[1] [0] <= hidden_act[0];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0007_) \hidden_layer[1] [1] <= hidden_act[1];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0007_) \hidden_layer[1] [2] <= hidden_act[2];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0007_) \hidden_layer[1] [3] <= hidden_act[3];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0007_) \hidden_layer[1] [4] <= hidden_act[4];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0007_) \hidden_layer[1] [5] <= hidden_act[5];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0007_) \hidden_layer[1] [6] <= hidden_act[6];
+  (* src = "dnn_accelerator.v:107.5-212.8" *)
+  always @(posedge clk)
+    if (_0007_) \hidden_layer[1] [7] <= hidden_act[7];
+  always @(posedge clk, negedge rst_n)
+    if (!rst_n) state[0] <= 1'h1;
+    else state[0] <= _0003_;
+  always @(posedge clk, negedge rst_n)
+    if (!rst_n) state[1] <= 1'h0;
+    else state[1] <= _0004_;
+  always @(posedge clk, negedge rst_n)
+    if (!rst_n) state[2] <= 1'h0;
+    else state[2] <= _0005_;
+  always @(posedge clk, negedge rst_n)
+    if (!rst_n) state[3] <= 1'h0;
+    else state[3] <= _0006_;
+  (* src = "dnn_accelerator.v:86.70-92.6" *)
+  \$paramod$079cb365e8d4f2bc00a2147bd2bf67296f31546b\mac_unit  mac_inst (
+    .A(current_input),
+    .B(mac_result),
+    .C(mac_c),
+    .W({ 1'h0, current_weight[6:0] }),
+    .clk(clk)
+  );
+  assign \requant_inst.q_min  = 33'h000000000;
+  assign \requant_inst.q_max  = 33'h0000000ff;
+  assign \requant_inst.shifted  = { 24'h000000, \requant_inst.rounded [15:7] };
+  assign { \requant_inst.rounded [32:16], \requant_inst.rounded [5:0] } = { 17'h00000, \requant_inst.rectified [5:0] };
+  assign \requant_inst.half  = 33'h000000040;
+  assign \requant_inst.rectified [32:15] = 18'h00000;
+  assign \requant_inst.scaled  = { mac_c[15], mac_c[15], mac_c[15], mac_c[15], mac_c[15], mac_c[15], mac_c[15], mac_c[15], mac_c[15], mac_c[15], mac_c };
+  assign \requant_inst.mult_ext  = 9'h001;
+  assign \requant_inst.acc_ext  = { mac_c[15], mac_c };
+  assign \requant_inst.q  = hidden_act;
+  assign \requant_inst.relu  = 1'h1;
+  assign \requant_inst.round  = 1'h1;
+  assign \requant_inst.shift  = 5'h07;
+  assign \requant_inst.multiplier  = 8'h01;
+  assign \requant_inst.acc  = mac_c;
+  assign \bias_layer2[1]  = 16'h00fa;
+  assign \bias_layer2[0]  = 16'h0096;
+  assign \bias_layer1[2]  = 16'h012c;
+  assign \bias_layer1[1]  = 16'h00c8;
+  assign \bias_layer1[0]  = 16'h0064;
+  assign \weights_layer2[5]  = 8'h4b;
+  assign \weights_layer2[4]  = 8'h41;
+  assign \weights_layer2[3]  = 8'h37;
+  assign \weights_layer2[2]  = 8'h46;
+  assign \weights_layer2[1]  = 8'h3c;
+  assign \weights_layer2[0]  = 8'h32;
+  assign \weights_layer1[11]  = 8'h2a;
+  assign \weights_layer1[10]  = 8'h20;
+  assign \weights_layer1[9]  = 8'h16;
+  assign \weights_layer1[8]  = 8'h0c;
+  assign \weights_layer1[7]  = 8'h2d;
+  assign \weights_layer1[6]  = 8'h23;
+  assign \weights_layer1[5]  = 8'h19;
+  assign \weights_layer1[4]  = 8'h0f;
+  assign \weights_layer1[3]  = 8'h28;
+  assign \weights_layer1[2]  = 8'h1e;
+  assign \weights_layer1[1]  = 8'h14;
+  assign \weights_layer1[0]  = 8'h0a;
+  assign mac_c_unsigned = mac_c;
+  assign mac_c_signed = mac_c;
+  assign mac_out = mac_c;
+  assign current_weight[7] = 1'h0;
+  assign mac_ready = 1'h1;
+  assign valid = done;
+  assign _0649_ = state[3];
+  assign _0379_ = input_idx[1];
+  assign _0648_ = state[2];
+  assign _0378_ = input_idx[0];
+  assign _0385_ = mac_c[14];
+  assign _0001_[14] = _0273_;
+  assign _0382_ = mac_c[11];
+  assign _0001_[11] = _0270_;
+  assign _0381_ = mac_c[10];
+  assign _0001_[10] = _0269_;
+  assign _0384_ = mac_c[13];
+  assign _0001_[13] = _0272_;
+  assign _0383_ = mac_c[12];
+  assign _0001_[12] = _0271_;
+  assign _0395_ = mac_c[9];
+  assign _0001_[9] = _0283_;
+  assign _0394_ = mac_c[8];
+  assign _0397_ = neuron_idx[1];
+  assign _0396_ = neuron_idx[0];
+  assign _0001_[8] = _0282_;
+  assign _0393_ = mac_c[7];
+  assign _0001_[7] = _0281_;
+  assign _0392_ = mac_c[6];
+  assign _0001_[6] = _0280_;
+  assign _0390_ = mac_c[4];
+  assign _0001_[4] = _0278_;
+  assign _0391_ = mac_c[5];
+  assign _0001_[5] = _0279_;
+  assign _0388_ = mac_c[2];
+  assign _0001_[2] = _0276_;
+  assign _0389_ = mac_c[3];
+  assign _0001_[3] = _0277_;
+  assign _0380_ = mac_c[0];
+  assign _0001_[0] = _0268_;
+  assign _0387_ = mac_c[1];
+  assign _0001_[1] = _0275_;
+  assign _0386_ = mac_c[15];
+  assign hidden_act[6] = _0320_;
+  assign hidden_act[5] = _0319_;
+  assign hidden_act[4] = _0318_;
+  assign hidden_act[3] = _0317_;
+  assign hidden_act[2] = _0316_;
+  assign hidden_act[1] = _0315_;
+  assign hidden_act[0] = _0314_;
+  assign current_weight[6] = _0313_;
+  assign current_weight[5] = _0312_;
+  assign current_weight[4] = _0311_;
+  assign current_weight[3] = _0310_;
+  assign current_weight[2] = _0309_;
+  assign current_weight[1] = _0308_;
+  assign current_weight[0] = _0307_;
+  assign _0646_ = state[0];
+  assign _0647_ = state[1];
+  assign _0328_ = \hidden_layer[0] [6];
+  assign _0344_ = \hidden_layer[2] [6];
+  assign _0336_ = \hidden_layer[1] [6];
+  assign _0376_ = input_data_3[6];
+  assign _0360_ = input_data_1[6];
+  assign _0368_ = input_data_2[6];
+  assign _0352_ = input_data_0[6];
+  assign current_input[6] = _0305_;
+  assign _0327_ = \hidden_layer[0] [5];
+  assign _0343_ = \hidden_layer[2] [5];
+  assign _0335_ = \hidden_layer[1] [5];
+  assign _0375_ = input_data_3[5];
+  assign _0359_ = input_data_1[5];
+  assign _0367_ = input_data_2[5];
+  assign _0351_ = input_data_0[5];
+  assign current_input[5] = _0304_;
+  assign _0326_ = \hidden_layer[0] [4];
+  assign _0342_ = \hidden_layer[2] [4];
+  assign _0334_ = \hidden_layer[1] [4];
+  assign _0374_ = input_data_3[4];
+  assign _0358_ = input_data_1[4];
+  assign _0366_ = input_data_2[4];
+  assign _0350_ = input_data_0[4];
+  assign current_input[4] = _0303_;
+  assign _0325_ = \hidden_layer[0] [3];
+  assign _0341_ = \hidden_layer[2] [3];
+  assign _0333_ = \hidden_layer[1] [3];
+  assign _0373_ = input_data_3[3];
+  assign _0357_ = input_data_1[3];
+  assign _0365_ = input_data_2[3];
+  assign _0349_ = input_data_0[3];
+  assign current_input[3] = _0302_;
+  assign _0324_ = \hidden_layer[0] [2];
+  assign _0340_ = \hidden_layer[2] [2];
+  assign _0332_ = \hidden_layer[1] [2];
+  assign _0372_ = input_data_3[2];
+  assign _0356_ = input_data_1[2];
+  assign _0364_ = input_data_2[2];
+  assign _0348_ = input_data_0[2];
+  assign current_input[2] = _0301_;
+  assign _0323_ = \hidden_layer[0] [1];
+  assign _0339_ = \hidden_layer[2] [1];
+  assign _0331_ = \hidden_layer[1] [1];
+  assign _0371_ = input_data_3[1];
+  assign _0355_ = input_data_1[1];
+  assign _0363_ = input_data_2[1];
+  assign _0347_ = input_data_0[1];
+  assign current_input[1] = _0300_;
+  assign _0322_ = \hidden_layer[0] [0];
+  assign _0338_ = \hidden_layer[2] [0];
+  assign _0330_ = \hidden_layer[1] [0];
+  assign _0370_ = input_data_3[0];
+  assign _0354_ = input_data_1[0];
+  assign _0362_ = input_data_2[0];
+  assign _0346_ = input_data_0[0];
+  assign current_input[0] = _0299_;
+  assign _0002_[0] = _0284_;
+  assign _0000_[0] = _0266_;
+  assign _0645_ = start;
+  assign _0004_ = _0287_;
+  assign _0009_ = _0292_;
+  assign _0010_ = _0293_;
+  assign _0644_ = rst_n;
+  assign _0013_ = _0296_;
+  assign _0008_ = _0291_;
+  assign _0015_ = _0298_;
+  assign _0011_ = _0294_;
+  assign _0003_ = _0286_;
+  assign _0006_ = _0289_;
+  assign _0001_[15] = _0274_;
+  assign _0000_[1] = _0267_;
+  assign hidden_act[7] = _0321_;
+  assign _0014_ = _0297_;
+  assign _0002_[1] = _0285_;
+  assign _0007_ = _0290_;
+  assign _0012_ = _0295_;
+  assign _0005_ = _0288_;
+  assign _0329_ = \hidden_layer[0] [7];
+  assign _0345_ = \hidden_layer[2] [7];
+  assign _0337_ = \hidden_layer[1] [7];
+  assign _0377_ = input_data_3[7];
+  assign _0361_ = input_data_1[7];
+  assign _0369_ = input_data_2[7];
+  assign _0353_ = input_data_0[7];
+  assign current_input[7] = _0306_;
 endmodule
@@ -0,0 +1,135 @@
+// Native Batch Simulation Harness
+// Clocks a Verilator model of dnn_accelerator or configurable_dnn_accelerator
+// entirely in C++ and exposes a C API for verilator_backend.py (ctypes)
+//
+// Built by verilator_backend.py with --prefix Vdnn; DNN_CONFIGURABLE selects
+// the configurable accelerator's parameter load port.
+// Each inference uses the cocotb driver's handshake (dnn_driver.run_inference):
+// start for one edge, wait for done, read the outputs, wait for done to fall.
+
+#include <cstdint>
+#include "Vdnn.h"
+#include "verilated.h"
+
+double sc_time_stamp() { return 0; }
+
+namespace {
+
+struct Simulation {
+    VerilatedContext context;
+    Vdnn* top;
+    uint64_t cycles;
+
+    Simulation() : top(new Vdnn(&context)), cycles(0) {}
+    ~Simulation() { top->final(); delete top; }
+
+    // One rising clock edge; inputs set before the call are sampled by it
+    void tick() {
+        top->clk = 0;
+        top->eval();
+        top->clk = 1;
+        top->eval();
+        cycles++;
+    }
+};
+
+}  // namespace
+
+extern "C" {
+
+void* dnn_create() {
+    return new Simulation();
+}
+
+void dnn_destroy(void* handle) {
+    delete static_cast<Simulation*>(handle);
+}
+
+// Hold rst_n low for two edges with every control input low
+void dnn_reset(void* handle) {
+    Simulation* sim = static_cast<Simulation*>(handle);
+    Vdnn* top = sim->top;
+    top->rst_n = 0;
+    top->start = 0;
+#ifdef DNN_CONFIGURABLE
+    top->load_params = 0;
+    top->param_burst = 0;
+    top->param_valid = 0;
+#endif
+    sim->tick();
+    sim->tick();
+    top->rst_n = 1;
+    sim->tick();
+    sim->cycles = 0;
+}
+
+// Burst-mode parameter load of num_words 16-bit beats (hardware_model.parameter_words);
+// returns the cycles from load_params to params_loaded, or -1 without a load port
+int64_t dnn_load_parameters(void* handle, const uint16_t* words, int64_t num_words) {
+#ifdef DNN_CONFIGURABLE
+    Simulation* sim = static_cast<Simulation*>(handle);
+    Vdnn* top = sim->top;
+    uint64_t begin = sim->cycles;
+
+    top->param_burst = 1;
+    top->load_params = 1;
+    sim->tick();
+    top->load_params = 0;
+    for (int64_t i = 0; i < num_words; i++) {
+        top->param_data = words[i];
+        top->param_valid = 1;
+        sim->tick();
+    }
+    top->param_valid = 0;
+    while (!top->params_loaded) {
+        sim->tick();
+    }
+    return static_cast<int64_t>(sim->cycles - begin);
+#else
+    (void)handle;
+    (void)words;
+    (void)num_words;
+    return -1;
+#endif
+}
+
+// Run num_vectors inferences; inputs is (num_vectors, 4) uint8, outputs
+// (num_vectors, 2) uint16. latency (may be null) receives the edges from
+// the one that samples start to the one after which done is high.
+// Returns the total cycles, or -1 if an inference exceeded max_cycles.
+int64_t dnn_run(void* handle, const uint8_t* inputs, int64_t num_vectors,
+                uint16_t* outputs, uint32_t* latency, int64_t max_cycles) {
+    Simulation* sim = static_cast<Simulation*>(handle);
+    Vdnn* top = sim->top;
+    uint64_t begin = sim->cycles;
+
+    for (int64_t n = 0; n < num_vectors; n++) {
+        const uint8_t* x = inputs + 4 * n;
+        top->input_data_0 = x[0];
+        top->input_data_1 = x[1];
+        top->input_data_2 = x[2];
+        top->input_data_3 = x[3];
+
+        uint64_t launch = sim->cycles;
+        top->start = 1;
+        sim->tick();
+        top->start = 0;
+        while (!top->done) {
+            if (static_cast<int64_t>(sim->cycles - launch) > max_cycles) {
+                return -1;
+            }
+            sim->tick();
+        }
+        if (latency) {
+            latency[n] = static_cast<uint32_t>(sim->cycles - launch - 1);
+        }
+        outputs[2 * n] = top->output_data_0;
+        outputs[2 * n + 1] = top->output_data_1;
+        while (top->done) {
+            sim->tick();
+        }
+    }
+    return static_cast<int64_t>(sim->cycles - begin);
+}
+
+}  // extern "C"
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+DNN Accelerator cocotb Driver
+Reset, parameter-load and inference helpers shared by the cocotb testbenches,
+and a valid/ready stream driver for streaming_dnn_accelerator
+"""
+
+import random
+
+from cocotb.triggers import Timer, RisingEdge, ReadOnly
+
+from hardware_model import parameter_bytes, parameter_words
+
+async def reset_dut(dut):
+    """Hold the accelerator in reset with every control input low"""
+    dut.rst_n.value = 0
+    for name in ('start', 'in_valid', 'out_ready', 'swap_params'):
+        if hasattr(dut, name):
+            getattr(dut, name).value = 0
+    if hasattr(dut, 'load_params'):
+        dut.load_params.value = 0
+        dut.param_burst.value = 0
+        dut.param_valid.value = 0
+    await Timer(20, unit="ns")
+    dut.rst_n.value = 1
+    await Timer(20, unit="ns")
+
+async def load_parameters(dut, hw_params, burst=True):
+    """Load a model into configurable_dnn_accelerator
+
+    In burst mode the 15 16-bit words are presented back to back; in byte
+    mode param_valid toggles for each of the 30 bytes. Returns the number of
+    clock cycles from load_params to params_loaded.
+    """
+    beats = parameter_words(hw_params) if burst else parameter_bytes(hw_params)
+    return await load_beats(dut, beats, burst)
+
+async def load_beats(dut, beats, burst=True, loaded='params_loaded'):
+    """Drive a parameter load of the given beats (see load_parameters)
+
+    loaded names the output that signals the end of the load:
+    shadow_loaded for a shadow-bank load (SHADOW_PARAMS = 1).
+    """
+    loaded = getattr(dut, loaded)
+    # One cycle in IDLE with load_params enters LOAD_PARAMS and latches the mode
+    dut.param_burst.value = int(burst)
+    dut.load_params.value = 1
+    await RisingEdge(dut.clk)
+    dut.load_params.value = 0
+    cycles = 1
+
+    for index, data in enumerate(beats):
+        dut.param_data.value = data
+        dut.param_valid.value = 1
+        await RisingEdge(dut.clk)
+        cycles += 1
+        if not burst and index < len(beats) - 1:
+            dut.param_valid.value = 0
+            await RisingEdge(dut.clk)
+            cycles += 1
+    dut.param_valid.value = 0
+
+    while not loaded.value:
+        await RisingEdge(dut.clk)
+        cycles += 1
+
+    return cycles
+
+async def load_shadow_parameters(dut, hw_params, burst=True, swap=True):
+    """Load a model into the shadow bank (SHADOW_PARAMS = 1), then request a swap
+
+    Inference may keep running meanwhile. Returns the load cycles; the
+    swap takes effect at the next inference boundary (see swap_parameters).
+    """
+    beats = parameter_words(hw_params) if burst else parameter_bytes(hw_params)
+    cycles = await load_beats(dut, beats, burst, loaded='shadow_loaded')
+    if swap:
+        await swap_parameters(dut)
+    return cycles
+
+async def swap_parameters(dut):
+    """Request a bank swap and wait until the accelerator has made it"""
+    dut.swap_params.value = 1
+    await RisingEdge(dut.clk)
+    dut.swap_params.value = 0
+    while dut.shadow_loaded.value:
+        await RisingEdge(dut.clk)
+
+async def run_inference(dut, inputs, num_outputs=2):
+    """Run one inference and return (output_data_0, ..., output_data_<num_outputs-1>)"""
+    for i, value in enumerate(inputs):
+        getattr(dut, f"input_data_{i}").value = int(value)
+
+    # Start computation
+    dut.start.value = 1
+    await RisingEdge(dut.clk)
+    dut.start.value = 0
+
+    # Wait for completion
+    while not dut.done.value:
+        await RisingEdge(dut.clk)
+
+    outputs = tuple(int(getattr(dut, f"output_data_{i}").value) for i in range(num_outputs))
+
+    # Wait for done signal to be deasserted
+    while dut.done.value:
+        await RisingEdge(dut.clk)
+
+    return outputs
+
+def pack_vector(inputs):
+    """in_data word of streaming_dnn_accelerator: input i in bits [8i+7:8i]"""
+    word = 0
+    for i, value in enumerate(inputs):
+        word |= (int(value) & 0xFF) << (8 * i)
+    return word
+
+class StreamDriver:
+    """Drives the valid/ready streams of streaming_dnn_accelerator
+
+    send() presents input vectors on in_valid/in_data, holding each until
+    in_ready accepts it; accept_outputs() drives out_ready. Either side can
+    insert random gaps (valid or ready low) to exercise back-pressure.
+    """
+
+    def __init__(self, dut, seed=None):
+        self.dut = dut
+        self.rng = random.Random(seed)
+
+    async def send(self, vectors, gap_probability=0.0):
+        """Present every vector in order; returns when the last one is accepted"""
+        dut = self.dut
+        for vector in vectors:
+            while self.rng.random() < gap_probability:
+                dut.in_valid.value = 0
+                await RisingEdge(dut.clk)
+            dut.in_data.value = pack_vector(vector)
+            dut.in_valid.value = 1
+            # The vector is taken at the first edge that samples in_ready high
+            while True:
+                await ReadOnly()
+                accepted = bool(dut.in_ready.value)
+                await RisingEdge(dut.clk)
+                if accepted:
+                    break
+        dut.in_valid.value = 0
+
+    async def accept_outputs(self, ready_probability=1.0):
+        """Drive out_ready, high with the given probability each cycle, until cancelled"""
+        dut = self.dut
+        while True:
+            dut.out_ready.value = int(self.rng.random() < ready_probability)
+            await RisingEdge(dut.clk)
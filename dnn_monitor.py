@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+DNN Accelerator cocotb Performance Monitor
+Timestamps start/done/valid edges (or valid/ready stream transfers) and
+parameter loads, and exports latency histograms, throughput and idle cycles as JSON
+"""
+
+import json
+from collections import Counter
+
+import cocotb
+from cocotb.triggers import RisingEdge, ReadOnly
+
+class PerformanceMonitor:
+    """Passive monitor of an accelerator's control handshake
+
+    Every clock edge is numbered. An inference is launched at the edge
+    that samples start while the accelerator is idle (and has parameters,
+    if it loads them); its latency is the number of edges from the launch
+    to the one after which done is high, the convention of fsm_model. A
+    parameter load runs from the edge that samples load_params to the one
+    after which params_loaded is high, counted like dnn_driver.load_beats.
+    With shadow=True (SHADOW_PARAMS = 1) loads end at shadow_loaded and
+    run alongside inferences instead of blocking them.
+    """
+
+    def __init__(self, dut, clock_period_ns=10, name='dnn', shadow=False):
+        self.dut = dut
+        self.clock_period_ns = clock_period_ns
+        self.name = name
+        self.shadow = shadow
+        self.edge = 0
+        self.inferences = []
+        self.loads = []
+        self._task = None
+        self._busy = None
+        self._loading = None
+        self._done = self._valid = self._loaded = 0
+
+    def start(self):
+        """Start sampling the DUT on every rising clock edge"""
+        self._task = cocotb.start_soon(self._run())
+        return self
+
+    def stop(self):
+        """Stop sampling"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _signal(self, name):
+        """Current value of a control signal (0 if the DUT lacks it)"""
+        handle = getattr(self.dut, name, None)
+        return int(handle.value) if handle is not None else 0
+
+    async def _run(self):
+        has_params = hasattr(self.dut, 'params_loaded')
+        loaded_signal = 'shadow_loaded' if self.shadow else 'params_loaded'
+        while True:
+            await RisingEdge(self.dut.clk)
+            await ReadOnly()
+            self.edge += 1
+
+            done, valid = self._signal('done'), self._signal('valid')
+            params_loaded = self._signal('params_loaded')
+            loaded = self._signal(loaded_signal)
+
+            # Edges after which done / valid / the load-complete signal rose or fell
+            if self._busy is not None:
+                if done and not self._done:
+                    self._busy['done'] = self.edge
+                if valid and not self._valid and 'valid' not in self._busy:
+                    self._busy['valid'] = self.edge
+                if not done and self._done:
+                    self._busy['done_fall'] = self.edge
+                    self.inferences.append(self._busy)
+                    self._busy = None
+            if self._loading is not None and loaded and not self._loaded:
+                self._loading['loaded'] = self.edge
+                self.loads.append(self._loading)
+                self._loading = None
+            self._done, self._valid, self._loaded = done, valid, loaded
+
+            # Requests seen now are sampled by the next edge
+            if self.shadow:
+                if self._loading is None and self._signal('load_params'):
+                    self._loading = {'begin': self.edge + 1}
+                if self._busy is None and self._signal('start') and params_loaded:
+                    self._busy = {'launch': self.edge + 1}
+            else:
+                idle = self._busy is None and self._loading is None
+                if idle and self._signal('load_params'):
+                    self._loading = {'begin': self.edge + 1}
+                elif idle and self._signal('start') and (params_loaded or not has_params):
+                    self._busy = {'launch': self.edge + 1}
+
+    def summary(self):
+        """Latency histogram, throughput and idle cycles of the completed inferences"""
+        pairs = list(zip(self.inferences, self.inferences[1:]))
+        return summarize_histograms(
+            self.name, self.clock_period_ns,
+            latency=Counter(inf['done'] - inf['launch'] for inf in self.inferences),
+            valid_latency=Counter(inf['valid'] - inf['launch'] for inf in self.inferences if 'valid' in inf),
+            interval=Counter(b['launch'] - a['launch'] for a, b in pairs),
+            idle=Counter(b['launch'] - a['done_fall'] for a, b in pairs),
+            loads=[load['loaded'] - load['begin'] + 1 for load in self.loads])
+
+    def write_json(self, path):
+        """Save summary() to path"""
+        summary = self.summary()
+        with open(path, 'w') as f:
+            json.dump(summary, f, indent=2)
+        return summary
+
+class StreamMonitor:
+    """Passive monitor of streaming_dnn_accelerator's valid/ready channels
+
+    Every clock edge is numbered, as in PerformanceMonitor. A transfer
+    happens at an edge that samples valid and ready both high. Outputs are
+    matched to inputs in order: an inference's latency is the number of
+    edges from its input transfer to its output transfer, and its valid
+    latency the edges until out_valid rose for it. Sustained throughput
+    comes from the interval between consecutive output transfers; idle
+    cycles are those edges with out_valid low between two transfers.
+    """
+
+    def __init__(self, dut, clock_period_ns=10, name='streaming_dnn'):
+        self.dut = dut
+        self.clock_period_ns = clock_period_ns
+        self.name = name
+        self.edge = 0
+        self.accepted = []
+        self.outputs = []
+        self.output_edges = []
+        self.valid_edges = []
+        self.idle = []
+        self._task = None
+
+    def start(self):
+        """Start sampling the DUT on every rising clock edge"""
+        self._task = cocotb.start_soon(self._run())
+        return self
+
+    def stop(self):
+        """Stop sampling"""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self):
+        dut = self.dut
+        valid_edge = None
+        idle = 0
+        while True:
+            await RisingEdge(dut.clk)
+            await ReadOnly()
+            self.edge += 1
+
+            # out_valid may stay high from one output to the next
+            out_valid = int(dut.out_valid.value)
+            if out_valid and valid_edge is None:
+                valid_edge = self.edge
+            idle += not out_valid
+
+            # Handshakes seen now are sampled by the next edge
+            if int(dut.in_valid.value) and int(dut.in_ready.value):
+                self.accepted.append(self.edge + 1)
+            if out_valid and int(dut.out_ready.value):
+                self.outputs.append((int(dut.out_data_0.value), int(dut.out_data_1.value)))
+                self.output_edges.append(self.edge + 1)
+                self.valid_edges.append(valid_edge)
+                self.idle.append(idle)
+                valid_edge = None
+                idle = 0
+
+    def summary(self):
+        """Latency histogram, throughput and idle cycles of the completed inferences"""
+        done = self.output_edges
+        return summarize_histograms(
+            self.name, self.clock_period_ns,
+            latency=Counter(b - a for a, b in zip(self.accepted, done)),
+            valid_latency=Counter(v - a for a, v in zip(self.accepted, self.valid_edges)),
+            interval=Counter(b - a for a, b in zip(done, done[1:])),
+            idle=Counter(self.idle[1:]),
+            loads=[])
+
+    def write_json(self, path):
+        """Save summary() to path"""
+        summary = self.summary()
+        with open(path, 'w') as f:
+            json.dump(summary, f, indent=2)
+        return summary
+
+def histogram_stats(counts):
+    """Count, min, max, mean and histogram of a Counter of cycle counts"""
+    total = sum(counts.values())
+    return {
+        'count': total,
+        'min': min(counts, default=None),
+        'max': max(counts, default=None),
+        'mean': sum(k * v for k, v in counts.items()) / total if total else None,
+        'histogram': {str(k): v for k, v in sorted(counts.items())},
+    }
+
+def summarize_histograms(name, clock_period_ns, latency, valid_latency, interval, idle, loads):
+    """Performance summary from cycle-count histograms
+
+    Sustained throughput assumes inferences are issued back to back, one
+    every mean launch-to-launch interval.
+    """
+    cycles_per_inference = histogram_stats(interval)
+    mean_interval = cycles_per_inference['mean']
+    return {
+        'name': name,
+        'clock_period_ns': clock_period_ns,
+        'num_inferences': sum(latency.values()),
+        'latency_cycles': histogram_stats(latency),
+        'valid_latency_cycles': histogram_stats(valid_latency),
+        'cycles_per_inference': cycles_per_inference,
+        'idle_cycles': histogram_stats(idle),
+        'sustained_inferences_per_second': 1e9 / clock_period_ns / mean_interval if mean_interval else None,
+        'parameter_load_cycles': list(loads),
+    }
+
+def merge_summaries(summaries, name=None):
+    """One summary over several monitors' summaries (e.g. simulation shards)"""
+    def merged(key):
+        counts = Counter()
+        for summary in summaries:
+            counts.update({int(k): v for k, v in summary[key]['histogram'].items()})
+        return counts
+
+    return summarize_histograms(
+        name or summaries[0]['name'], summaries[0]['clock_period_ns'],
+        latency=merged('latency_cycles'),
+        valid_latency=merged('valid_latency_cycles'),
+        interval=merged('cycles_per_inference'),
+        idle=merged('idle_cycles'),
+        loads=[cycles for summary in summaries for cycles in summary['parameter_load_cycles']])
@@ -0,0 +1,173 @@
+// DNN Parameter Memory
+// Weight, bias and requantization storage with the parameter loading logic
+// Used by the configurable DNN accelerators
+//
+// Byte mode (param_burst = 0 at load start): one byte per beat, 30 beats
+//   beats  0..11 : layer 1 weights
+//   beats 12..17 : layer 2 weights
+//   beats 18..23 : layer 1 biases (low byte, then high byte)
+//   beats 24..27 : layer 2 biases (low byte, then high byte)
+//   beats 28..29 : requant word (low byte, then high byte)
+//
+// Burst mode (param_burst = 1 at load start): one 16-bit word per beat, 15 beats
+//   beats  0..5  : layer 1 weights, two per word ({w[2k+1], w[2k]})
+//   beats  6..8  : layer 2 weights, two per word
+//   beats  9..11 : layer 1 biases
+//   beats 12..13 : layer 2 biases
+//   beat  14     : requant word
+//
+// The requant word holds the hidden layer's requant_unit settings, so they
+// change with the model: {round[14], relu[13], shift[12:8], multiplier[7:0]}
+// (bit 15 is unused).
+//
+// Beats may be presented back to back; the load address auto-increments
+//
+// Shadow bank (SHADOW = 1): the memory holds two banks. The read ports show
+// the active bank while loads write the other (shadow) bank; bank_swap makes
+// the shadow bank active in one cycle. With SHADOW = 0 there is one bank,
+// written and read directly, and bank_swap is ignored.
+
+module dnn_param_memory #(
+    parameter SHADOW = 0                // 1 = active + shadow bank
+) (
+    input clk,                         // Clock signal
+    input rst_n,                       // Reset signal (active low)
+    input load_start,                  // Start a new load (resets the load address)
+    input bank_swap,                   // Make the shadow bank active (SHADOW = 1)
+    input param_burst,                 // Load mode, sampled with load_start
+    input param_write,                 // Parameter beat valid
+    input [15:0] param_data,           // Parameter beat data
+    output load_done,                  // Last beat of the load is being written
+    output [12*8-1:0] weights_layer1_flat,  // Layer 1 weights, weight i at [i*8 +: 8]
+    output [6*8-1:0] weights_layer2_flat,   // Layer 2 weights
+    output [3*16-1:0] bias_layer1_flat,     // Layer 1 biases, bias i at [i*16 +: 16]
+    output [2*16-1:0] bias_layer2_flat,     // Layer 2 biases
+    output [7:0] requant_mult,              // Hidden activation multiplier (requant_unit)
+    output [4:0] requant_shift,             // Hidden activation right shift
+    output requant_round,                   // 1 = round the shift half up
+    output requant_relu                     // 1 = ReLU on hidden activations
+);
+
+    localparam BANKS = SHADOW ? 2 : 1;
+
+    // Parameter storage, bank b at [b*N +: N]
+    reg [7:0] weights_layer1 [0:12*BANKS-1];  // Layer 1 weights (4 inputs × 3 neurons)
+    reg [7:0] weights_layer2 [0:6*BANKS-1];   // Layer 2 weights (3 neurons × 2 outputs)
+    reg [15:0] bias_layer1 [0:3*BANKS-1];     // Layer 1 biases (3 neurons)
+    reg [15:0] bias_layer2 [0:2*BANKS-1];     // Layer 2 biases (2 outputs)
+    reg [14:0] requant [0:BANKS-1];           // Requant word ({round, relu, shift, multiplier})
+
+    // Load control
+    reg [4:0] load_addr;              // Beat counter within the current load
+    reg burst_mode;                   // Load mode latched at load_start
+
+    // Bank selection: reads use the active bank, loads write the other one
+    reg active_bank;
+    wire read_bank = SHADOW ? active_bank : 1'b0;
+    wire write_bank = SHADOW ? !active_bank : 1'b0;
+
+    always @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            active_bank <= 0;
+        end else if (SHADOW && bank_swap) begin
+            active_bank <= !active_bank;
+        end
+    end
+
+    localparam BYTE_LAST_BEAT = 5'd29;
+    localparam BURST_LAST_BEAT = 5'd14;
+
+    assign load_done = param_write &&
+                       (load_addr == (burst_mode ? BURST_LAST_BEAT : BYTE_LAST_BEAT));
+
+    always @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            load_addr <= 0;
+            burst_mode <= 0;
+        end else if (load_start) begin
+            load_addr <= 0;
+            burst_mode <= param_burst;
+        end else if (param_write) begin
+            load_addr <= load_addr + 1;
+        end
+    end
+
+    // Parameter writes
+    always @(posedge clk) begin
+        if (param_write && !load_start) begin
+            if (burst_mode) begin
+                if (load_addr < 6) begin
+                    // Layer 1 weights, two per beat
+                    weights_layer1[write_bank * 12 + load_addr * 2] <= param_data[7:0];
+                    weights_layer1[write_bank * 12 + load_addr * 2 + 1] <= param_data[15:8];
+                end else if (load_addr < 9) begin
+                    // Layer 2 weights, two per beat
+                    weights_layer2[write_bank * 6 + (load_addr - 6) * 2] <= param_data[7:0];
+                    weights_layer2[write_bank * 6 + (load_addr - 6) * 2 + 1] <= param_data[15:8];
+                end else if (load_addr < 12) begin
+                    // Layer 1 bias (16-bit, one beat)
+                    bias_layer1[write_bank * 3 + load_addr - 9] <= param_data;
+                end else if (load_addr < 14) begin
+                    // Layer 2 bias (16-bit, one beat)
+                    bias_layer2[write_bank * 2 + load_addr - 12] <= param_data;
+                end else if (load_addr == 14) begin
+                    // Requant word (one beat)
+                    requant[write_bank] <= param_data[14:0];
+                end
+            end else begin
+                if (load_addr < 12) begin
+                    // Layer 1 weights
+                    weights_layer1[write_bank * 12 + load_addr] <= param_data[7:0];
+                end else if (load_addr < 18) begin
+                    // Layer 2 weights
+                    weights_layer2[write_bank * 6 + load_addr - 12] <= param_data[7:0];
+                end else if (load_addr < 24) begin
+                    // Layer 1 bias (16-bit, need 2 beats)
+                    if (load_addr[0] == 0) begin
+                        bias_layer1[write_bank * 3 + ((load_addr - 18) >> 1)][7:0] <= param_data[7:0];
+                    end else begin
+                        bias_layer1[write_bank * 3 + ((load_addr - 18) >> 1)][15:8] <= param_data[7:0];
+                    end
+                end else if (load_addr < 28) begin
+                    // Layer 2 bias (16-bit, need 2 beats)
+                    if (load_addr[0] == 0) begin
+                        bias_layer2[write_bank * 2 + ((load_addr - 24) >> 1)][7:0] <= param_data[7:0];
+                    end else begin
+                        bias_layer2[write_bank * 2 + ((load_addr - 24) >> 1)][15:8] <= param_data[7:0];
+                    end
+                end else if (load_addr < 30) begin
+                    // Requant word (2 beats)
+                    if (load_addr[0] == 0) begin
+                        requant[write_bank][7:0] <= param_data[7:0];
+                    end else begin
+                        requant[write_bank][14:8] <= param_data[6:0];
+                    end
+                end
+            end
+        end
+    end
+
+    // Flattened read ports
+    genvar i;
+    generate
+        for (i = 0; i < 12; i = i + 1) begin : layer1_weight_port
+            assign weights_layer1_flat[i*8 +: 8] = weights_layer1[read_bank * 12 + i];
+        end
+        for (i = 0; i < 6; i = i + 1) begin : layer2_weight_port
+            assign weights_layer2_flat[i*8 +: 8] = weights_layer2[read_bank * 6 + i];
+        end
+        for (i = 0; i < 3; i = i + 1) begin : layer1_bias_port
+            assign bias_layer1_flat[i*16 +: 16] = bias_layer1[read_bank * 3 + i];
+        end
+        for (i = 0; i < 2; i = i + 1) begin : layer2_bias_port
+            assign bias_layer2_flat[i*16 +: 16] = bias_layer2[read_bank * 2 + i];
+        end
+    endgenerate
+
+    wire [14:0] requant_word = requant[read_bank];
+    assign requant_mult = requant_word[7:0];
+    assign requant_shift = requant_word[12:8];
+    assign requant_relu = requant_word[13];
+    assign requant_round = requant_word[14];
+
+endmodule
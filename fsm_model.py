@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+"""
+Cycle-Accurate Accelerator FSM Model
+Python model of the dnn_accelerator / configurable_dnn_accelerator /
+parallel_dnn_accelerator state machine for latency and throughput estimates
+without a Verilator build
+"""
+
+import argparse
+import json
+import numpy as np
+
+from hardware_model import (
+    ACC_MASK, DATA_MASK, DNN_ACCELERATOR_PARAMS, MAC_PARAMS, REQUANT_PARAMS,
+    LAYER1_INPUTS, LAYER1_NEURONS, LAYER2_INPUTS, LAYER2_NEURONS,
+    hardware_parameters, load_hardware_parameters, parameter_bytes, parameter_words,
+    accelerator_mac, requant_unit, requant_settings, requant_word,
+)
+
+# State machine states (configurable_dnn_accelerator.v encoding)
+IDLE = 0
+LOAD_PARAMS = 1
+LAYER1_COMPUTE = 2
+LAYER2_COMPUTE = 3
+DONE_STATE = 4
+
+STATE_NAMES = {
+    IDLE: 'IDLE',
+    LOAD_PARAMS: 'LOAD_PARAMS',
+    LAYER1_COMPUTE: 'LAYER1_COMPUTE',
+    LAYER2_COMPUTE: 'LAYER2_COMPUTE',
+    DONE_STATE: 'DONE_STATE',
+}
+
+# Last beat of a parameter load (dnn_param_memory.v)
+BYTE_LAST_BEAT = 29
+BURST_LAST_BEAT = 14
+
+class AcceleratorFSM:
+    """Cycle-accurate model of the accelerator control FSM
+
+    Registers are NumPy arrays over a batch of independent lanes, so one
+    call to step() advances every lane by one clock edge. Each lane mirrors
+    the RTL's always @(posedge clk) block, including the MAC datapath.
+    Parameter memories are shared by all lanes. num_macs is the
+    parallel_dnn_accelerator NUM_MACS parameter: neurons are computed in
+    groups of num_macs, each with its own accumulator. mac_latency is
+    MAC_MUL_STAGE + MAC_ACC_STAGE of a pipelined mac_unit: each MAC step
+    (of every group of num_macs) waits that many cycles for its result. requant
+    overrides REQUANT_PARAMS, dnn_accelerator's REQUANT_* parameters; the
+    other variants requantize with the requant word of their parameters.
+    mac overrides MAC_PARAMS, the MAC_* datapath parameters.
+    """
+
+    def __init__(self, variant='configurable', hw_params=None, num_lanes=1, num_macs=1, mac_latency=0,
+                 requant=None, mac=None):
+        if variant not in ('dnn', 'configurable', 'parallel'):
+            raise ValueError(f"Unknown accelerator variant: {variant}")
+        if num_macs != 1 and variant != 'parallel':
+            raise ValueError(f"{variant} accelerator has a single mac_unit")
+        if num_macs < 1:
+            raise ValueError("num_macs must be at least 1")
+        if not 0 <= mac_latency <= 2:
+            raise ValueError("mac_latency must be 0, 1 or 2")
+        if requant is not None and variant != 'dnn':
+            raise ValueError(f"{variant} accelerator loads its requant word with the parameters")
+        self.variant = variant
+        self.num_macs = num_macs
+        self.mac_latency = mac_latency
+        self.requant = {**REQUANT_PARAMS, **(requant or {})}
+        self.mac = {**MAC_PARAMS, **(mac or {})}
+
+        if variant == 'dnn':
+            # dnn_accelerator loads fixed values on reset
+            hw_params = hardware_parameters(DNN_ACCELERATOR_PARAMS)
+
+        # Parameter memories (uninitialised registers read as zero)
+        self.weights_layer1 = np.zeros(LAYER1_INPUTS * LAYER1_NEURONS, dtype=np.int64)
+        self.weights_layer2 = np.zeros(LAYER2_INPUTS * LAYER2_NEURONS, dtype=np.int64)
+        self.bias_layer1 = np.zeros(LAYER1_NEURONS, dtype=np.int64)
+        self.bias_layer2 = np.zeros(LAYER2_NEURONS, dtype=np.int64)
+        self.preloaded = hw_params is not None
+        if hw_params is not None:
+            self.weights_layer1[:] = hw_params['weights_layer1']
+            self.weights_layer2[:] = hw_params['weights_layer2']
+            self.bias_layer1[:] = hw_params['bias_layer1']
+            self.bias_layer2[:] = hw_params['bias_layer2']
+        if variant != 'dnn':
+            self.requant = requant_settings(requant_word(hw_params.get('requant')) if self.preloaded else 0)
+
+        self.reset(num_lanes)
+
+    def reset(self, num_lanes=None):
+        """Apply rst_n to every lane (parameter memories are not reset)"""
+        if num_lanes is None:
+            num_lanes = len(self.state)
+        self.state = np.full(num_lanes, IDLE, dtype=np.int64)
+        self.neuron_idx = np.zeros(num_lanes, dtype=np.int64)
+        self.input_idx = np.zeros(num_lanes, dtype=np.int64)
+        self.mac_result = np.zeros((num_lanes, self.num_macs), dtype=np.int64)
+        self.mac_wait = np.zeros(num_lanes, dtype=np.int64)
+        self.hidden_layer = np.zeros((num_lanes, LAYER1_NEURONS), dtype=np.int64)
+        self.output_data = np.zeros((num_lanes, LAYER2_NEURONS), dtype=np.int64)
+        self.done = np.zeros(num_lanes, dtype=bool)
+        self.valid = np.zeros(num_lanes, dtype=bool)
+        self.inputs = np.zeros((num_lanes, LAYER1_INPUTS), dtype=np.int64)
+        self.param_load_addr = 0
+        self.burst_mode = False
+        # dnn_accelerator has no load path; a preloaded model starts loaded
+        self.params_loaded = np.full(num_lanes, self.variant == 'dnn' or self.preloaded)
+
+    def set_inputs(self, inputs):
+        """Drive input_data_0..3 on every lane"""
+        self.inputs = np.asarray(inputs, dtype=np.int64).reshape(len(self.state), LAYER1_INPUTS) & DATA_MASK
+
+    def write_parameter(self, addr, data):
+        """Parameter write decode of dnn_param_memory.v"""
+        if self.burst_mode:
+            if addr < 6:
+                self.weights_layer1[addr * 2] = data & 0xFF
+                self.weights_layer1[addr * 2 + 1] = (data >> 8) & 0xFF
+            elif addr < 9:
+                self.weights_layer2[(addr - 6) * 2] = data & 0xFF
+                self.weights_layer2[(addr - 6) * 2 + 1] = (data >> 8) & 0xFF
+            elif addr < 12:
+                self.bias_layer1[addr - 9] = data & ACC_MASK
+            elif addr < 14:
+                self.bias_layer2[addr - 12] = data & ACC_MASK
+            elif addr == 14:
+                self.requant = requant_settings(data & 0x7FFF)
+        else:
+            data &= DATA_MASK
+            if addr < 12:
+                self.weights_layer1[addr] = data
+            elif addr < 18:
+                self.weights_layer2[addr - 12] = data
+            elif addr < 28:
+                if addr < 24:
+                    bias, index = self.bias_layer1, (addr - 18) >> 1
+                else:
+                    bias, index = self.bias_layer2, (addr - 24) >> 1
+                if addr & 1 == 0:
+                    bias[index] = (bias[index] & 0xFF00) | data
+                else:
+                    bias[index] = (bias[index] & 0x00FF) | (data << 8)
+            elif addr < 30:
+                word = requant_word(self.requant)
+                if addr & 1 == 0:
+                    word = (word & 0x7F00) | data
+                else:
+                    word = (word & 0x00FF) | ((data & 0x7F) << 8)
+                self.requant = requant_settings(word)
+
+    def group_bias(self, bias, first_neuron):
+        """Bias preload of every MAC for groups starting at first_neuron
+
+        MACs past the last neuron of the layer are loaded with zero.
+        """
+        neuron = np.asarray(first_neuron, dtype=np.int64)[:, None] + np.arange(self.num_macs)
+        return np.where(neuron < len(bias), bias[np.minimum(neuron, len(bias) - 1)], 0)
+
+    def step(self, start, load_params=False, param_valid=False, param_data=0, param_burst=False):
+        """Advance every lane by one rising clock edge"""
+        n = len(self.state)
+        start = np.broadcast_to(np.asarray(start, dtype=bool), (n,))
+        state = self.state
+        lanes = np.arange(n)
+
+        # Combinational datapath: input mux, per-MAC weight mux and mac_unit
+        in_layer1 = state == LAYER1_COMPUTE
+        current_input = np.where(in_layer1, self.inputs[lanes, self.input_idx & 0x3],
+                                 self.hidden_layer[lanes, np.minimum(self.input_idx, LAYER2_INPUTS - 1)])
+        neuron = self.neuron_idx[:, None] + np.arange(self.num_macs)
+        input_idx = self.input_idx[:, None]
+        layer1_idx = np.minimum(neuron * LAYER1_INPUTS + input_idx, len(self.weights_layer1) - 1)
+        layer2_idx = np.minimum(neuron * LAYER2_INPUTS + input_idx, len(self.weights_layer2) - 1)
+        current_weight = np.where(in_layer1[:, None],
+                                  np.where(neuron < LAYER1_NEURONS, self.weights_layer1[layer1_idx], 0),
+                                  np.where(neuron < LAYER2_NEURONS, self.weights_layer2[layer2_idx], 0))
+        mac_out = accelerator_mac(current_input[:, None], current_weight, self.mac_result, self.mac)
+
+        # Pipelined mac_unit: the compute states act once mac_out is valid
+        mac_ready = self.mac_wait == self.mac_latency
+        computing = in_layer1 | (state == LAYER2_COMPUTE)
+        mac_wait = np.where(mac_ready, 0, self.mac_wait + computing)
+
+        # Next-state values default to holding the registers
+        next_state = state.copy()
+        neuron_idx = self.neuron_idx.copy()
+        input_idx = self.input_idx.copy()
+        mac_result = self.mac_result.copy()
+        done = self.done.copy()
+        valid = self.valid.copy()
+        params_loaded = self.params_loaded.copy()
+
+        # IDLE
+        idle = state == IDLE
+        if self.variant != 'dnn' and load_params:
+            enter_load = idle
+            next_state[enter_load] = LOAD_PARAMS
+            params_loaded[enter_load] = False
+            if enter_load.any():
+                self.param_load_addr = 0
+                self.burst_mode = bool(param_burst)
+            launch = np.zeros(n, dtype=bool)
+        else:
+            launch = idle & start & self.params_loaded
+        next_state[launch] = LAYER1_COMPUTE
+        neuron_idx[launch] = 0
+        input_idx[launch] = 0
+        mac_result[launch] = self.group_bias(self.bias_layer1, np.zeros(launch.sum(), dtype=np.int64))
+        done[launch] = False
+        valid[launch] = False
+
+        # LOAD_PARAMS (all lanes share the parameter bus and memories)
+        loading = state == LOAD_PARAMS
+        if loading.any() and param_valid:
+            addr = self.param_load_addr
+            self.write_parameter(addr, int(param_data))
+            self.param_load_addr = (addr + 1) & 0x1F
+            if addr == (BURST_LAST_BEAT if self.burst_mode else BYTE_LAST_BEAT):
+                next_state[loading] = IDLE
+                params_loaded[loading] = True
+
+        # LAYER1_COMPUTE
+        step1 = in_layer1 & mac_ready
+        accumulate = step1 & (self.input_idx < LAYER1_INPUTS - 1)
+        mac_result[accumulate] = mac_out[accumulate]
+        input_idx[accumulate] = self.input_idx[accumulate] + 1
+
+        finish = step1 & (self.input_idx >= LAYER1_INPUTS - 1)
+        for k in range(self.num_macs):
+            store = finish & (self.neuron_idx + k < LAYER1_NEURONS)
+            self.hidden_layer[lanes[store], self.neuron_idx[store] + k] = requant_unit(mac_out[store, k],
+                                                                                       acc_signed=self.mac['signed'],
+                                                                                       **self.requant)
+        input_idx[finish] = 0
+        next_neuron = finish & (self.neuron_idx + self.num_macs < LAYER1_NEURONS)
+        neuron_idx[next_neuron] = self.neuron_idx[next_neuron] + self.num_macs
+        mac_result[next_neuron] = self.group_bias(self.bias_layer1, neuron_idx[next_neuron])
+        to_layer2 = finish & ~next_neuron
+        next_state[to_layer2] = LAYER2_COMPUTE
+        neuron_idx[to_layer2] = 0
+        mac_result[to_layer2] = self.group_bias(self.bias_layer2, neuron_idx[to_layer2])
+
+        # LAYER2_COMPUTE
+        in_layer2 = (state == LAYER2_COMPUTE) & mac_ready
+        accumulate = in_layer2 & (self.input_idx < LAYER2_INPUTS - 1)
+        mac_result[accumulate] = mac_out[accumulate]
+        input_idx[accumulate] = self.input_idx[accumulate] + 1
+
+        finish = in_layer2 & (self.input_idx >= LAYER2_INPUTS - 1)
+        for k in range(self.num_macs):
+            store = finish & (self.neuron_idx + k < LAYER2_NEURONS)
+            self.output_data[lanes[store], self.neuron_idx[store] + k] = mac_out[store, k]
+        input_idx[finish] = 0
+        next_neuron = finish & (self.neuron_idx + self.num_macs < LAYER2_NEURONS)
+        neuron_idx[next_neuron] = self.neuron_idx[next_neuron] + self.num_macs
+        mac_result[next_neuron] = self.group_bias(self.bias_layer2, neuron_idx[next_neuron])
+        complete = finish & ~next_neuron
+        next_state[complete] = DONE_STATE
+        done[complete] = True
+        valid[complete] = True
+
+        # DONE_STATE
+        release = (state == DONE_STATE) & ~start
+        next_state[release] = IDLE
+        done[release] = False
+        valid[release] = False
+
+        self.state = next_state
+        self.neuron_idx = neuron_idx & 0x3
+        self.input_idx = input_idx & 0x3
+        self.mac_result = mac_result & ACC_MASK
+        self.mac_wait = mac_wait
+        self.done = done
+        self.valid = valid
+        self.params_loaded = params_loaded
+
+    def load_parameters(self, beats, burst=False, valid_gap=None, max_cycles=10000):
+        """Drive the LOAD_PARAMS handshake the way the cocotb driver does
+
+        load_params is raised for one cycle, then each beat is presented
+        with param_valid for one cycle followed by valid_gap idle cycles
+        (1 in byte mode, 0 for back-to-back bursts by default).
+        Returns the number of clock cycles until params_loaded rises.
+        """
+        if valid_gap is None:
+            valid_gap = 0 if burst else 1
+        self.reset(len(self.state))
+        self.params_loaded[:] = False
+        self.step(start=False, load_params=True, param_burst=burst)
+        cycles = 1
+        for data in beats:
+            if self.params_loaded[0] or cycles >= max_cycles:
+                break
+            self.step(start=False, param_valid=True, param_data=data)
+            cycles += 1
+            for _ in range(valid_gap):
+                if self.params_loaded[0]:
+                    break
+                self.step(start=False)
+                cycles += 1
+        return cycles
+
+    def run(self, inputs, issue_delay=0, start_hold=1, batch_size=65536, max_cycles=1000):
+        """Run a stream of inferences and report per-inference timing
+
+        Each inference follows the testbench handshake: start is raised
+        issue_delay cycles after the accelerator returns to IDLE and held
+        for start_hold cycles; the host then waits for done to fall.
+        Inferences are independent, so lanes of one batch model successive
+        inferences of the same device.
+        """
+        inputs = np.asarray(inputs).reshape(-1, LAYER1_INPUTS)
+        total = len(inputs)
+        outputs = np.zeros((total, LAYER2_NEURONS), dtype=np.uint16)
+        latency = np.zeros(total, dtype=np.int64)
+        occupancy = np.zeros(total, dtype=np.int64)
+        compute = np.zeros(total, dtype=np.int64)
+
+        loaded = bool(self.params_loaded.all())
+        if not loaded:
+            raise RuntimeError("Parameters must be loaded before running inferences")
+
+        for offset in range(0, total, batch_size):
+            batch = inputs[offset:offset + batch_size]
+            n = len(batch)
+            self.reset(n)
+            self.params_loaded[:] = loaded
+            self.set_inputs(batch)
+
+            launched = np.full(n, -1, dtype=np.int64)
+            finished = np.full(n, -1, dtype=np.int64)
+            returned = np.full(n, -1, dtype=np.int64)
+            busy = np.zeros(n, dtype=np.int64)
+
+            for cycle in range(max_cycles):
+                start = (cycle >= issue_delay) & (cycle < issue_delay + start_hold)
+                previous_state = self.state
+                self.step(np.full(n, start))
+
+                busy += (previous_state == LAYER1_COMPUTE) | (previous_state == LAYER2_COMPUTE)
+                new_launch = (launched < 0) & (previous_state == IDLE) & (self.state == LAYER1_COMPUTE)
+                launched[new_launch] = cycle
+                new_done = (finished < 0) & self.done
+                finished[new_done] = cycle
+                new_return = (returned < 0) & (finished >= 0) & (self.state == IDLE)
+                returned[new_return] = cycle
+                if (returned >= 0).all():
+                    break
+            else:
+                raise RuntimeError(f"Inferences did not complete within {max_cycles} cycles")
+
+            outputs[offset:offset + n] = self.output_data
+            latency[offset:offset + n] = finished - launched
+            occupancy[offset:offset + n] = returned + 1
+            compute[offset:offset + n] = busy
+
+        return {
+            'outputs': outputs,
+            'latency_cycles': latency,
+            'cycles_per_inference': occupancy,
+            'compute_cycles': compute,
+            'handshake_stall_cycles': occupancy - compute,
+            'total_cycles': int(occupancy.sum()),
+        }
+
+def summarize(result, load_cycles=0, clock_period_ns=10):
+    """Throughput summary for a run() result"""
+    num_inferences = len(result['outputs'])
+    total_cycles = result['total_cycles'] + load_cycles
+    clock_hz = 1e9 / clock_period_ns
+    return {
+        'num_inferences': num_inferences,
+        'load_cycles': int(load_cycles),
+        'total_cycles': int(total_cycles),
+        'mean_latency_cycles': float(result['latency_cycles'].mean()) if num_inferences else 0.0,
+        'mean_cycles_per_inference': float(result['cycles_per_inference'].mean()) if num_inferences else 0.0,
+        'mean_handshake_stall_cycles': float(result['handshake_stall_cycles'].mean()) if num_inferences else 0.0,
+        'inferences_per_second': num_inferences * clock_hz / total_cycles if total_cycles else 0.0,
+        'clock_period_ns': clock_period_ns,
+    }
+
+def main():
+    """Estimate latency and throughput for the stored test vectors"""
+    parser = argparse.ArgumentParser(description="Cycle-accurate accelerator FSM model")
+    parser.add_argument('--variant', choices=['dnn', 'configurable', 'parallel'], default='configurable')
+    parser.add_argument('--num-macs', type=int, default=3, help="NUM_MACS of the parallel variant")
+    parser.add_argument('--mac-latency', type=int, default=0,
+                        help="MAC_MUL_STAGE + MAC_ACC_STAGE of a pipelined mac_unit")
+    parser.add_argument('--vectors', default='test_vectors.npy', help="input vectors (.npy)")
+    parser.add_argument('--params', default='model_parameters.bin', help="model parameters")
+    parser.add_argument('--issue-delay', type=int, default=0, help="host cycles between IDLE and start")
+    parser.add_argument('--start-hold', type=int, default=1, help="cycles start is held high")
+    parser.add_argument('--byte-load', action='store_true', help="model the byte-mode parameter load")
+    parser.add_argument('--clock-period-ns', type=float, default=10)
+    parser.add_argument('--output', default='fsm_model_results.json')
+    args = parser.parse_args()
+
+    print("=== Accelerator FSM Model ===")
+    inputs = np.load(args.vectors)
+    print(f"Loaded {len(inputs)} input vectors")
+
+    load_cycles = 0
+    if args.variant != 'dnn':
+        hw_params = load_hardware_parameters(args.params)
+        num_macs = args.num_macs if args.variant == 'parallel' else 1
+        model = AcceleratorFSM(args.variant, num_macs=num_macs, mac_latency=args.mac_latency)
+        if args.byte_load:
+            load_cycles = model.load_parameters(parameter_bytes(hw_params))
+        else:
+            load_cycles = model.load_parameters(parameter_words(hw_params), burst=True)
+        print(f"Parameter load: {load_cycles} cycles ({'byte' if args.byte_load else 'burst'} mode)")
+    else:
+        model = AcceleratorFSM('dnn', mac_latency=args.mac_latency)
+
+    result = model.run(inputs, issue_delay=args.issue_delay, start_hold=args.start_hold)
+    summary = summarize(result, load_cycles, args.clock_period_ns)
+
+    print(f"Latency (start to done): {summary['mean_latency_cycles']:.1f} cycles")
+    print(f"Cycles per inference: {summary['mean_cycles_per_inference']:.1f}")
+    print(f"Handshake stalls per inference: {summary['mean_handshake_stall_cycles']:.1f} cycles")
+    print(f"Throughput: {summary['inferences_per_second']:,.0f} inferences/s "
+          f"at {1e3 / args.clock_period_ns:.0f} MHz")
+
+    summary['variant'] = args.variant
+    summary['num_macs'] = model.num_macs
+    summary['mac_latency'] = model.mac_latency
+    summary['outputs'] = result['outputs'][:10].tolist()
+    with open(args.output, 'w') as f:
+        json.dump(summary, f, indent=2)
+    print(f"\nResults saved to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+DNN Accelerator Generator
+Generates a serial accelerator, its parameter memory layout and address map
+for any stack of nn.Linear/ReLU layers in model_parameters.bin
+"""
+
+import argparse
+import json
+
+from hardware_model import network_layers
+from param_file import load_model_parameters
+
+# Calibrated datapath settings written by train_software_dnn.extract_parameters
+QUANTIZATION_KEYS = ('acc_width', 'act_width', 'output_shift')
+
+def clog2(n):
+    """Bits needed to count 0..n-1 (at least 1)"""
+    return max(1, (int(n) - 1).bit_length())
+
+def topology_from_params(params):
+    """Layer shapes, ReLU flags and calibrated widths of a parameter file"""
+    exported = params.get('layers', [])
+    topology = []
+    for i, layer in enumerate(network_layers(params)):
+        shape = {'fan_in': int(layer['weights'].shape[1]),
+                 'fan_out': int(layer['weights'].shape[0]),
+                 'relu': layer['relu']}
+        if i < len(exported):
+            shape.update({key: exported[i][key] for key in QUANTIZATION_KEYS if key in exported[i]})
+        topology.append(shape)
+    return topology
+
+def parse_topology(widths, relu=True):
+    """Topology from layer widths such as '16,8,4' (ReLU after every hidden layer)"""
+    widths = [int(w) for w in widths.split(',')]
+    if len(widths) < 2 or min(widths) < 1:
+        raise ValueError(f"Topology needs an input width and at least one layer: {widths}")
+    return [{'fan_in': fan_in, 'fan_out': fan_out, 'relu': relu and i < len(widths) - 2}
+            for i, (fan_in, fan_out) in enumerate(zip(widths[:-1], widths[1:]))]
+
+def address_map(topology, module_name='generated_dnn_accelerator'):
+    """Parameter and activation memory layout of a generated accelerator
+
+    Weights are stored layer by layer, neuron-major (weight (n, i) of a
+    layer at weight_base + n * fan_in + i), so the compute loop reads them
+    in address order. Activations hold the network inputs followed by the
+    outputs of each hidden layer.
+    """
+    layers = []
+    weight_base = bias_base = 0
+    act_base = topology[0]['fan_in']
+    act_in_base = 0
+    for i, shape in enumerate(topology):
+        last = i == len(topology) - 1
+        layers.append({
+            'fan_in': shape['fan_in'],
+            'fan_out': shape['fan_out'],
+            'relu': bool(shape['relu']) and not last,
+            'weight_base': weight_base,
+            'bias_base': bias_base,
+            'act_in_base': act_in_base,
+            'act_out_base': None if last else act_base,
+            **{key: shape[key] for key in QUANTIZATION_KEYS if key in shape},
+        })
+        weight_base += shape['fan_in'] * shape['fan_out']
+        bias_base += shape['fan_out']
+        if not last:
+            act_in_base = act_base
+            act_base += shape['fan_out']
+
+    num_weights, num_biases = weight_base, bias_base
+    weight_words = (num_weights + 1) // 2
+    return {
+        'module': module_name,
+        'num_inputs': topology[0]['fan_in'],
+        'num_outputs': topology[-1]['fan_out'],
+        'layers': layers,
+        'num_weights': num_weights,
+        'num_biases': num_biases,
+        'num_activations': act_base,
+        'byte_load': {
+            'beats': num_weights + 2 * num_biases,
+            'weights': [0, num_weights],
+            'biases': [num_weights, num_weights + 2 * num_biases],
+        },
+        'burst_load': {
+            'beats': weight_words + num_biases,
+            'weights': [0, weight_words],
+            'biases': [weight_words, weight_words + num_biases],
+        },
+        'compute_cycles': sum(layer['fan_in'] * layer['fan_out'] for layer in layers),
+    }
+
+def describe(topology):
+    """Human-readable topology, e.g. 4 -> 3 (ReLU) -> 2"""
+    text = str(topology[0]['fan_in'])
+    for i, layer in enumerate(topology):
+        relu = ' (ReLU)' if layer['relu'] and i < len(topology) - 1 else ''
+        text += f" -> {layer['fan_out']}{relu}"
+    return text
+
+def generate_rtl(topology, module_name='generated_dnn_accelerator', source='command line'):
+    """Verilog for a serial accelerator of the given topology"""
+    amap = address_map(topology, module_name)
+    layers = amap['layers']
+    num_layers = len(layers)
+    for i, layer in enumerate(layers):
+        if not 0 <= layer.get('output_shift', 0) < 32:
+            raise ValueError(f"Layer {i} output_shift {layer['output_shift']} does not fit requant_unit's 5-bit shift")
+
+    layer_w = clog2(num_layers)
+    neuron_w = clog2(max(layer['fan_out'] for layer in layers))
+    input_w = clog2(max(layer['fan_in'] for layer in layers))
+    weight_w = clog2(amap['num_weights'])
+    bias_w = clog2(amap['num_biases'])
+    act_w = clog2(amap['num_activations'])
+    load_w = clog2(max(amap['byte_load']['beats'], amap['burst_load']['beats']))
+
+    def const(width, value):
+        return f"{width}'d{value}"
+
+    v = f"""// Generated DNN Accelerator
+// Generated by generate_accelerator.py from {source}
+// Topology: {describe(topology)}
+// One mac_unit, one multiply-accumulate per cycle: {amap['compute_cycles']} compute cycles per inference
+// Weights (int8) and biases (int16) are two's complement, inputs unsigned
+// Hidden layers pass an 8-bit activation to the next layer: requant_unit
+// shifts the 16-bit accumulator (two's complement) right by the layer's
+// output_shift, rounding half up, applies its ReLU and clamps to 0..255.
+// Output layer results are the 16-bit accumulators.
+// Parameters load one byte per beat or as 16-bit bursts (param_burst);
+// the memory layout is in {module_name}_map.json
+
+module {module_name} (
+    input clk,                    // Clock signal
+    input rst_n,                  // Reset signal (active low)
+    input start,                  // Start computation signal
+    input load_params,            // Load parameters signal
+    input param_burst,            // Load mode: 0 = bytes, 1 = 16-bit burst
+    input [15:0] param_data,      // Parameter data input (bytes use [7:0])
+    input param_valid,            // Parameter data valid
+"""
+    for i in range(amap['num_inputs']):
+        v += f"    input [7:0] input_data_{i},{' ' * max(1, 4 - len(str(i)))}// Input data {i}\n"
+    for i in range(amap['num_outputs']):
+        v += f"    output reg [15:0] output_data_{i},{' ' * max(1, 4 - len(str(i)))}// Output data {i}\n"
+    v += f"""    output reg done,              // Computation done signal
+    output reg valid,             // Output valid signal
+    output reg params_loaded      // Parameters loaded signal
+);
+
+    // Memory sizes
+    localparam NUM_WEIGHTS = {amap['num_weights']};
+    localparam NUM_BIASES = {amap['num_biases']};
+    localparam NUM_ACTIVATIONS = {amap['num_activations']};
+    localparam WEIGHT_WORDS = {amap['burst_load']['weights'][1]};
+    localparam BYTE_LAST_BEAT = {const(load_w, amap['byte_load']['beats'] - 1)};
+    localparam BURST_LAST_BEAT = {const(load_w, amap['burst_load']['beats'] - 1)};
+    localparam LAST_LAYER = {const(layer_w, num_layers - 1)};
+
+    // Parameter memory: each layer's weights (neuron-major), then biases
+    reg [7:0] weights [0:NUM_WEIGHTS-1];
+    reg [15:0] biases [0:NUM_BIASES-1];
+
+    // Activation memory: network inputs, then each hidden layer's outputs
+    reg [7:0] activations [0:NUM_ACTIVATIONS-1];
+
+    reg [15:0] mac_result;            // Partial sum of the current neuron
+
+    // Control signals
+    reg [1:0] state;                  // State machine
+    reg [{layer_w - 1}:0] layer_idx;              // Current layer
+    reg [{neuron_w - 1}:0] neuron_idx;             // Current neuron within the layer
+    reg [{input_w - 1}:0] input_idx;              // Current input within the neuron
+    reg [{weight_w - 1}:0] weight_addr;            // Weight read address
+    reg [{bias_w - 1}:0] bias_addr;              // Bias of the current neuron
+    reg [{load_w - 1}:0] load_addr;              // Parameter load beat counter
+    reg burst_mode;                   // Load mode latched at load start
+
+    // State machine states
+    localparam IDLE = 2'b00;
+    localparam LOAD_PARAMS = 2'b01;
+    localparam COMPUTE = 2'b10;
+    localparam DONE_STATE = 2'b11;
+
+    // Layer table
+    reg [{input_w - 1}:0] last_input;             // fan_in - 1 of the current layer
+    reg [{neuron_w - 1}:0] last_neuron;            // fan_out - 1 of the current layer
+    reg [{act_w - 1}:0] act_in_base;            // Activation address of the layer inputs
+    reg [{act_w - 1}:0] act_out_base;           // Activation address of the layer outputs
+    reg relu;                         // ReLU on the layer outputs
+    reg [4:0] shift;                  // Right shift of the layer outputs (output_shift)
+
+    always @(*) begin
+        case (layer_idx)
+"""
+    for i, layer in enumerate(layers):
+        label = 'default' if i == num_layers - 1 else const(layer_w, i)
+        out_base = layer['act_out_base'] if layer['act_out_base'] is not None else 0
+        v += f"""            {label}: begin
+                last_input = {const(input_w, layer['fan_in'] - 1)};
+                last_neuron = {const(neuron_w, layer['fan_out'] - 1)};
+                act_in_base = {const(act_w, layer['act_in_base'])};
+                act_out_base = {const(act_w, out_base)};
+                relu = 1'b{int(layer['relu'])};
+                shift = {const(5, layer.get('output_shift', 0))};
+            end
+"""
+    v += f"""        endcase
+    end
+
+    wire last_layer = (layer_idx == LAST_LAYER);
+    wire neuron_done = (input_idx == last_input);
+    wire launch = (state == IDLE) && !load_params && start && params_loaded;
+
+    // MAC unit instantiation
+    wire [7:0] current_input;
+    wire [7:0] current_weight;
+    wire [15:0] current_sum;
+    wire [15:0] mac_out;
+    wire [7:0] activation;
+
+    assign current_input = activations[act_in_base + input_idx];
+    assign current_weight = weights[weight_addr];
+
+    // The first input of each neuron adds its bias
+    assign current_sum = (input_idx == 0) ? biases[bias_addr] : mac_result;
+
+    // Weights and biases are two's complement, as exported by training
+    mac_unit #(.SIGNED(1), .WEIGHT_W(8), .ACC_W(16)) mac_inst (
+        .clk(clk),
+        .A(current_input),
+        .W(current_weight),
+        .B(current_sum),
+        .C(mac_out)
+    );
+
+    // Activation of a finished hidden neuron
+    requant_unit requant_inst (
+        .acc(mac_out),
+        .multiplier(8'd1),
+        .shift(shift),
+        .round(1'b1),
+        .relu(relu),
+        .q(activation)
+    );
+
+    // Parameter loading and computation control
+    always @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            // Initialize control signals
+            state <= IDLE;
+            layer_idx <= 0;
+            neuron_idx <= 0;
+            input_idx <= 0;
+            weight_addr <= 0;
+            bias_addr <= 0;
+            load_addr <= 0;
+            burst_mode <= 0;
+            mac_result <= 0;
+            done <= 0;
+            valid <= 0;
+            params_loaded <= 0;
+        end else begin
+            case (state)
+                IDLE: begin
+                    if (load_params) begin
+                        state <= LOAD_PARAMS;
+                        params_loaded <= 0;
+                        load_addr <= 0;
+                        burst_mode <= param_burst;
+                    end else if (launch) begin
+                        state <= COMPUTE;
+                        layer_idx <= 0;
+                        neuron_idx <= 0;
+                        input_idx <= 0;
+                        weight_addr <= 0;
+                        bias_addr <= 0;
+                        done <= 0;
+                        valid <= 0;
+                    end
+                end
+
+                LOAD_PARAMS: begin
+                    // Beats are written below; finish on the last one
+                    if (param_valid) begin
+                        load_addr <= load_addr + 1;
+                        if (load_addr == (burst_mode ? BURST_LAST_BEAT : BYTE_LAST_BEAT)) begin
+                            state <= IDLE;
+                            params_loaded <= 1;
+                        end
+                    end
+                end
+
+                COMPUTE: begin
+                    weight_addr <= weight_addr + 1;
+                    if (!neuron_done) begin
+                        mac_result <= mac_out;
+                        input_idx <= input_idx + 1;
+                    end else begin
+                        input_idx <= 0;
+
+                        if (last_layer) begin
+                            // Store output result
+                            case (neuron_idx)
+"""
+    for i in range(amap['num_outputs']):
+        label = 'default' if i == amap['num_outputs'] - 1 else const(neuron_w, i)
+        v += f"                                {label}: output_data_{i} <= mac_out;\n"
+    v += """                            endcase
+                        end
+
+                        if (neuron_idx != last_neuron) begin
+                            neuron_idx <= neuron_idx + 1;
+                            bias_addr <= bias_addr + 1;
+                        end else if (!last_layer) begin
+                            // Layer complete, move to the next layer
+                            layer_idx <= layer_idx + 1;
+                            neuron_idx <= 0;
+                            bias_addr <= bias_addr + 1;
+                        end else begin
+                            // Computation complete (weight_addr back in range)
+                            state <= DONE_STATE;
+                            weight_addr <= 0;
+                            done <= 1;
+                            valid <= 1;
+                        end
+                    end
+                end
+
+                DONE_STATE: begin
+                    if (!start) begin
+                        state <= IDLE;
+                        done <= 0;
+                        valid <= 0;
+                    end
+                end
+
+                default: state <= IDLE;
+            endcase
+        end
+    end
+
+    // Parameter and activation memory writes
+    always @(posedge clk) begin
+        if (state == LOAD_PARAMS && param_valid) begin
+            if (burst_mode) begin
+                if (load_addr < WEIGHT_WORDS) begin
+                    // Two weights per beat
+                    weights[load_addr * 2] <= param_data[7:0];
+                    if (load_addr * 2 + 1 < NUM_WEIGHTS) begin
+                        weights[load_addr * 2 + 1] <= param_data[15:8];
+                    end
+                end else if (load_addr < WEIGHT_WORDS + NUM_BIASES) begin
+                    // One bias per beat
+                    biases[load_addr - WEIGHT_WORDS] <= param_data;
+                end
+            end else begin
+                if (load_addr < NUM_WEIGHTS) begin
+                    weights[load_addr] <= param_data[7:0];
+                end else if (load_addr < NUM_WEIGHTS + 2 * NUM_BIASES) begin
+                    // Bias low byte, then high byte
+"""
+    v += f"""                    if (load_addr[0] == 1'b{amap['num_weights'] % 2}) begin
+                        biases[(load_addr - NUM_WEIGHTS) >> 1][7:0] <= param_data[7:0];
+                    end else begin
+                        biases[(load_addr - NUM_WEIGHTS) >> 1][15:8] <= param_data[7:0];
+                    end
+                end
+            end
+        end
+
+        if (launch) begin
+            // Latch the network inputs
+"""
+    for i in range(amap['num_inputs']):
+        v += f"            activations[{i}] <= input_data_{i};\n"
+    v += """        end else if (state == COMPUTE && neuron_done && !last_layer) begin
+            // Store the hidden activation for the next layer
+            activations[act_out_base + neuron_idx] <= activation;
+        end
+    end
+
+endmodule
+"""
+    return v
+
+def main():
+    """Generate the accelerator RTL and address map"""
+    parser = argparse.ArgumentParser(description="Generate a DNN accelerator for a layer stack")
+    parser.add_argument('--params', default='model_parameters.bin', help="model parameters")
+    parser.add_argument('--topology', help="layer widths such as 16,8,4 (overrides --params)")
+    parser.add_argument('--name', default='generated_dnn_accelerator', help="module name")
+    args = parser.parse_args()
+
+    print("=== DNN Accelerator Generator ===")
+
+    if args.topology:
+        topology = parse_topology(args.topology)
+        source = f"--topology {args.topology}"
+    else:
+        topology = topology_from_params(load_model_parameters(args.params))
+        source = args.params
+
+    amap = address_map(topology, args.name)
+    print(f"Topology: {describe(topology)}")
+    print(f"Weights: {amap['num_weights']}, biases: {amap['num_biases']}, "
+          f"activations: {amap['num_activations']}")
+    print(f"Parameter load: {amap['byte_load']['beats']} byte beats or "
+          f"{amap['burst_load']['beats']} burst beats")
+    print(f"Compute cycles per inference: {amap['compute_cycles']}")
+
+    rtl_file = f"{args.name}.v"
+    with open(rtl_file, 'w') as f:
+        f.write(generate_rtl(topology, args.name, source))
+    print(f"\nAccelerator saved to {rtl_file}")
+
+    map_file = f"{args.name}_map.json"
+    with open(map_file, 'w') as f:
+        json.dump(amap, f, indent=2)
+    print(f"Address map saved to {map_file}")
+
+if __name__ == "__main__":
+    main()
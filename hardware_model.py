@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Bit-Accurate Hardware Model
+Vectorized NumPy reference for mac_unit.v and the DNN accelerators
+"""
+
+import numpy as np
+
+from param_file import load_model_parameters
+
+# Datapath widths of mac_unit.v
+DATA_WIDTH = 8
+ACC_WIDTH = 16
+DATA_MASK = (1 << DATA_WIDTH) - 1
+ACC_MASK = (1 << ACC_WIDTH) - 1
+
+# Network shape implemented by the accelerators
+LAYER1_INPUTS = 4
+LAYER1_NEURONS = 3
+LAYER2_INPUTS = 3
+LAYER2_NEURONS = 2
+
+# Default mac_unit settings of the accelerators (MAC_SIGNED, MAC_WEIGHT_W,
+# MAC_ACC_W): two's complement weights and biases at their storage widths
+MAC_PARAMS = {'signed': True, 'weight_w': DATA_WIDTH, 'acc_w': ACC_WIDTH}
+
+# Default requant_unit settings of the accelerators' hidden layer: the
+# REQUANT_* parameters of dnn_accelerator, and the requant word the
+# configurable accelerators load when a model does not set one
+REQUANT_PARAMS = {'multiplier': 1, 'shift': 7, 'round': True, 'relu': True}
+
+# Reset values hard-coded in dnn_accelerator.v (RTL memory order)
+DNN_ACCELERATOR_PARAMS = {
+    'weights_layer1': [10, 20, 30, 40, 15, 25, 35, 45, 12, 22, 32, 42],
+    'weights_layer2': [50, 60, 70, 55, 65, 75],
+    'bias_layer1': [100, 200, 300],
+    'bias_layer2': [150, 250],
+}
+
+def to_signed(values, bits):
+    """Read bits-wide register values as two's complement"""
+    values = np.asarray(values, dtype=np.int64) & ((1 << bits) - 1)
+    return np.where(values >= 1 << (bits - 1), values - (1 << bits), values)
+
+def mac_unit(A, W, B, data_w=DATA_WIDTH, weight_w=DATA_WIDTH, acc_w=ACC_WIDTH,
+             signed=False, data_signed=False, saturate=False):
+    """C = A * W + B for any mac_unit.v parameter set (DATA_W, WEIGHT_W, ACC_W, ...)
+
+    Operands are reduced to their port widths and read as unsigned or two's
+    complement (signed: W, B and C; data_signed: A). The exact sum wraps to
+    acc_w bits, or with saturate is clamped to the range of C. Returns the
+    C port bits (uint16 for the default 8 x 8 + 16 unit).
+    """
+    def operand(values, bits, is_signed):
+        if is_signed:
+            return to_signed(values, bits)
+        return np.asarray(values, dtype=np.int64) & ((1 << bits) - 1)
+
+    acc = operand(A, data_w, data_signed) * operand(W, weight_w, signed) + operand(B, acc_w, signed)
+    if saturate:
+        if signed:
+            acc = np.clip(acc, -(1 << (acc_w - 1)), (1 << (acc_w - 1)) - 1)
+        else:
+            acc = np.clip(acc, 0, (1 << acc_w) - 1)
+    dtype = np.uint16 if acc_w <= 16 else np.uint32 if acc_w <= 32 else np.uint64
+    return (acc & ((1 << acc_w) - 1)).astype(dtype)
+
+def accelerator_mac(A, W, B, mac=None):
+    """mac_out of an accelerator's mac_unit, extended to its 16-bit registers
+
+    mac overrides MAC_PARAMS. W and B are the stored 8-bit weight and 16-bit
+    accumulator register values; C is sign-extended (signed) or
+    zero-extended from MAC_ACC_W bits.
+    """
+    mac = {**MAC_PARAMS, **(mac or {})}
+    c = mac_unit(A, W, B, weight_w=mac['weight_w'], acc_w=mac['acc_w'], signed=mac['signed'])
+    if mac['signed']:
+        c = to_signed(c, mac['acc_w'])
+    return np.asarray(c, dtype=np.int64) & ACC_MASK
+
+def requant_unit(acc, multiplier=1, shift=0, round=True, relu=True, acc_w=ACC_WIDTH, mult_w=DATA_WIDTH,
+                 shift_w=5, out_w=DATA_WIDTH, acc_signed=True, out_signed=False):
+    """Q of requant_unit.v: clamp(round((ACC * MULTIPLIER) >> SHIFT)), optional ReLU
+
+    acc is reduced to acc_w bits (two's complement if acc_signed), multiplier
+    and shift to their port widths. Returns the Q port bits as int64.
+    """
+    acc = np.asarray(acc, dtype=np.int64)
+    value = to_signed(acc, acc_w) if acc_signed else acc & ((1 << acc_w) - 1)
+    value = value * (np.asarray(multiplier, dtype=np.int64) & ((1 << mult_w) - 1))
+    if relu:
+        value = np.maximum(value, 0)
+    shift = np.asarray(shift, dtype=np.int64) & ((1 << shift_w) - 1)
+    if round:
+        value = value + np.where(shift > 0, np.left_shift(1, np.maximum(shift - 1, 0)), 0)
+    value = value >> shift
+    if out_signed:
+        value = np.clip(value, -(1 << (out_w - 1)), (1 << (out_w - 1)) - 1)
+    else:
+        value = np.clip(value, 0, (1 << out_w) - 1)
+    return value & ((1 << out_w) - 1)
+
+def hardware_parameters(params):
+    """Convert model parameters to the accelerator's register contents
+
+    Accepts either the signed PyTorch-layout parameters written by
+    train_software_dnn.py (layer1_weights, ...) or parameters already in
+    RTL memory order (weights_layer1, ...). Weights are reinterpreted as
+    8-bit two's complement and biases as 16-bit two's complement, exactly
+    as the parameter loader stores them. 'requant' holds the hidden layer's
+    requant_unit settings (requant_parameters(), overridden by a 'requant'
+    entry of params), loaded with the weights as the requant word.
+    """
+    if 'weights_layer1' in params:
+        weights_layer1 = params['weights_layer1']
+        weights_layer2 = params['weights_layer2']
+        bias_layer1 = params['bias_layer1']
+        bias_layer2 = params['bias_layer2']
+    else:
+        # nn.Linear stores (out, in), which flattens to neuron * fan_in + input
+        weights_layer1 = params['layer1_weights']
+        weights_layer2 = params['layer2_weights']
+        bias_layer1 = params['layer1_bias']
+        bias_layer2 = params['layer2_bias']
+
+    def to_unsigned(values, mask, dtype):
+        return (np.asarray(values, dtype=np.int64).reshape(-1) & mask).astype(dtype)
+
+    return {
+        'weights_layer1': to_unsigned(weights_layer1, DATA_MASK, np.uint8),
+        'weights_layer2': to_unsigned(weights_layer2, DATA_MASK, np.uint8),
+        'bias_layer1': to_unsigned(bias_layer1, ACC_MASK, np.uint16),
+        'bias_layer2': to_unsigned(bias_layer2, ACC_MASK, np.uint16),
+        'requant': {**requant_parameters(params), **(params.get('requant') or {})},
+    }
+
+def random_hardware_parameters(rng):
+    """Random register contents over the full 8/16-bit ranges
+
+    The requant word is random too: any multiplier, shift and flags.
+    rng is a seed or a np.random.Generator; a Generator advances, so
+    successive calls give different models.
+    """
+    rng = np.random.default_rng(rng)
+    return hardware_parameters({
+        'weights_layer1': rng.integers(0, DATA_MASK + 1, LAYER1_INPUTS * LAYER1_NEURONS),
+        'weights_layer2': rng.integers(0, DATA_MASK + 1, LAYER2_INPUTS * LAYER2_NEURONS),
+        'bias_layer1': rng.integers(0, ACC_MASK + 1, LAYER1_NEURONS),
+        'bias_layer2': rng.integers(0, ACC_MASK + 1, LAYER2_NEURONS),
+        'requant': {
+            'multiplier': int(rng.integers(0, DATA_MASK + 1)),
+            'shift': int(rng.integers(0, 32)),
+            'round': bool(rng.integers(0, 2)),
+            'relu': bool(rng.integers(0, 2)),
+        },
+    })
+
+def requant_parameters(params):
+    """REQUANT_* settings that run a parameter file's hidden layer
+
+    A file calibrated by quantization.py stores the first layer's
+    output_shift and relu flag; anything it leaves out keeps REQUANT_PARAMS.
+    """
+    layer = (params.get('layers') or [{}])[0]
+    requant = dict(REQUANT_PARAMS)
+    if 'output_shift' in layer:
+        requant['shift'] = int(layer['output_shift'])
+    if 'relu' in layer:
+        requant['relu'] = bool(layer['relu'])
+    return requant
+
+def requant_generics(requant):
+    """REQUANT_* Verilog parameters of a requant settings dict
+
+    Simulator builds pass them as -G<name>=<value> and include them in
+    their sim_cache key, so a calibrated build never reuses a default one.
+    """
+    requant = {**REQUANT_PARAMS, **(requant or {})}
+    return {
+        'REQUANT_MULT': int(requant['multiplier']),
+        'REQUANT_SHIFT': int(requant['shift']),
+        'REQUANT_ROUND': int(bool(requant['round'])),
+        'REQUANT_RELU': int(bool(requant['relu'])),
+    }
+
+def requant_word(requant):
+    """Requant word of a parameter load (see dnn_param_memory.v)
+
+    {round[14], relu[13], shift[12:8], multiplier[7:0]}
+    """
+    requant = {**REQUANT_PARAMS, **(requant or {})}
+    return ((int(bool(requant['round'])) << 14) | (int(bool(requant['relu'])) << 13)
+            | ((int(requant['shift']) & 0x1F) << 8) | (int(requant['multiplier']) & DATA_MASK))
+
+def requant_settings(word):
+    """requant_unit settings of a requant word (inverse of requant_word())"""
+    return {
+        'multiplier': word & DATA_MASK,
+        'shift': (word >> 8) & 0x1F,
+        'round': bool((word >> 14) & 1),
+        'relu': bool((word >> 13) & 1),
+    }
+
+def load_hardware_parameters(params_file='model_parameters.bin'):
+    """Load a parameter file (binary or JSON) as accelerator register contents"""
+    return hardware_parameters(load_model_parameters(params_file))
+
+def parameter_bytes(hw_params):
+    """Beats of a byte-mode parameter load (see dnn_param_memory.v)
+
+    Layer 1 weights, layer 2 weights, then every bias and the requant word
+    as low byte followed by high byte.
+    """
+    stream = list(np.asarray(hw_params['weights_layer1'], dtype=np.int64))
+    stream += list(np.asarray(hw_params['weights_layer2'], dtype=np.int64))
+    words = list(hw_params['bias_layer1']) + list(hw_params['bias_layer2'])
+    for word in words + [requant_word(hw_params.get('requant'))]:
+        stream += [int(word) & 0xFF, (int(word) >> 8) & 0xFF]
+    return [int(b) & DATA_MASK for b in stream]
+
+def parameter_words(hw_params):
+    """Beats of a 16-bit burst parameter load (see dnn_param_memory.v)
+
+    Weights are packed two per word, low byte first; each bias is one word,
+    followed by the requant word.
+    """
+    w1 = np.asarray(hw_params['weights_layer1'], dtype=np.int64) & DATA_MASK
+    w2 = np.asarray(hw_params['weights_layer2'], dtype=np.int64) & DATA_MASK
+    stream = list(w1[0::2] | (w1[1::2] << 8)) + list(w2[0::2] | (w2[1::2] << 8))
+    stream += list(hw_params['bias_layer1']) + list(hw_params['bias_layer2'])
+    stream.append(requant_word(hw_params.get('requant')))
+    return [int(w) & ACC_MASK for w in stream]
+
+def network_layers(params):
+    """Layer stack of a model as accelerator register contents
+
+    Reads the generic 'layers' list written by train_software_dnn.py
+    (weights in nn.Linear (out, in) layout, plus the ReLU flag of each
+    layer); older parameter files are read as the two-layer network of
+    SimpleDNN. Each layer is a dict with 'weights' (uint8, fan_out x fan_in),
+    'bias' (uint16), 'relu' and 'output_shift' (the calibrated right shift
+    of its activations, 0 when the file has none).
+    """
+    if 'layers' in params:
+        stack = [(layer['weights'], layer['bias'], layer.get('relu', False), layer.get('output_shift', 0))
+                 for layer in params['layers']]
+    else:
+        hw_params = hardware_parameters(params)
+        stack = [
+            (np.reshape(hw_params['weights_layer1'], (LAYER1_NEURONS, LAYER1_INPUTS)),
+             hw_params['bias_layer1'], True, 0),
+            (np.reshape(hw_params['weights_layer2'], (LAYER2_NEURONS, LAYER2_INPUTS)),
+             hw_params['bias_layer2'], False, 0),
+        ]
+
+    layers = []
+    for weights, bias, relu, output_shift in stack:
+        weights = np.atleast_2d(np.asarray(weights, dtype=np.int64))
+        layers.append({
+            'weights': (weights & DATA_MASK).astype(np.uint8),
+            'bias': (np.asarray(bias, dtype=np.int64).reshape(-1) & ACC_MASK).astype(np.uint16),
+            'relu': bool(relu),
+            'output_shift': int(output_shift),
+        })
+    return layers
+
+def activation(acc, relu, shift=0):
+    """8-bit activation a generated accelerator feeds to the next layer
+
+    The requant_unit of the generated RTL: the 16-bit two's complement
+    accumulator is shifted right by the layer's output_shift (rounding half
+    up), with optional ReLU, and clamped to 0..255.
+    """
+    return requant_unit(acc, shift=shift, relu=relu)
+
+def network_forward(inputs, layers):
+    """Batch forward pass of a generated accelerator (generate_accelerator.py)
+
+    inputs is an (N, fan_in) array of 8-bit vectors. Weights and biases
+    are read as two's complement, like the generated signed mac_unit, and
+    accumulators wrap at 16 bits. Hidden layers pass activation() of their
+    accumulators (with their output_shift) on; the last layer's 16-bit
+    accumulators are returned as (N, fan_out) uint16.
+    """
+    inputs = np.asarray(inputs)
+    single = inputs.ndim == 1
+    x = np.atleast_2d(inputs).astype(np.int64) & DATA_MASK
+
+    for i, layer in enumerate(layers):
+        weights = to_signed(layer['weights'], DATA_WIDTH)
+        acc = (x @ weights.T + to_signed(layer['bias'], ACC_WIDTH)) & ACC_MASK
+        if i < len(layers) - 1:
+            x = activation(acc, layer['relu'], layer.get('output_shift', 0))
+
+    outputs = acc.astype(np.uint16)
+    return outputs[0] if single else outputs
+
+def network_parameter_bytes(layers):
+    """Beats of a byte-mode load into a generated accelerator
+
+    Every layer's weights (neuron-major), then every bias as low byte
+    followed by high byte. For the 4-3-2 network this is parameter_bytes().
+    """
+    weights = np.concatenate([np.asarray(layer['weights'], dtype=np.int64).reshape(-1) for layer in layers])
+    biases = np.concatenate([np.asarray(layer['bias'], dtype=np.int64) for layer in layers])
+    bias_bytes = np.stack([biases & 0xFF, (biases >> 8) & 0xFF], axis=1).reshape(-1)
+    return [int(b) for b in np.concatenate([weights & DATA_MASK, bias_bytes])]
+
+def network_parameter_words(layers):
+    """Beats of a 16-bit burst load into a generated accelerator
+
+    Weights are packed two per word, low byte first (an odd weight count
+    leaves the last high byte unused), then one word per bias.
+    """
+    weights = np.concatenate([np.asarray(layer['weights'], dtype=np.int64).reshape(-1) for layer in layers])
+    biases = np.concatenate([np.asarray(layer['bias'], dtype=np.int64) for layer in layers])
+    if len(weights) % 2:
+        weights = np.append(weights, 0)
+    words = (weights[0::2] & DATA_MASK) | ((weights[1::2] & DATA_MASK) << 8)
+    return [int(w) for w in np.concatenate([words, biases & ACC_MASK])]
+
+def dnn_forward(inputs, hw_params, return_hidden=False, requant=None, mac=None):
+    """Batch forward pass matching the accelerator bit for bit
+
+    inputs is an (N, 4) array of 8-bit input vectors (a single vector of
+    shape (4,) is also accepted). Returns the (N, 2) uint16 values that
+    output_data_0/1 hold when done rises; with return_hidden also the 8-bit
+    hidden activations. The hidden layer uses hw_params['requant'] (the
+    loaded requant word, REQUANT_PARAMS when absent); requant overrides it,
+    as dnn_accelerator's REQUANT_* parameters do. mac holds the MAC_*
+    parameters (MAC_PARAMS by default).
+    """
+    requant = {**REQUANT_PARAMS, **(hw_params.get('requant') or {}), **(requant or {})}
+    mac = {**MAC_PARAMS, **(mac or {})}
+    acc_mask = (1 << mac['acc_w']) - 1
+    inputs = np.asarray(inputs)
+    single = inputs.ndim == 1
+    x = np.atleast_2d(inputs).astype(np.int64) & DATA_MASK
+
+    w1 = np.asarray(hw_params['weights_layer1'], dtype=np.int64).reshape(LAYER1_NEURONS, LAYER1_INPUTS)
+    w2 = np.asarray(hw_params['weights_layer2'], dtype=np.int64).reshape(LAYER2_NEURONS, LAYER2_INPUTS)
+    b1 = np.asarray(hw_params['bias_layer1'], dtype=np.int64)
+    b2 = np.asarray(hw_params['bias_layer2'], dtype=np.int64)
+
+    def layer(x, weights, bias):
+        # Every mac_unit step wraps at MAC_ACC_W bits; addition modulo
+        # 2^MAC_ACC_W is associative, so wrapping the exact int64 dot product
+        # once is identical to wrapping after each of the serial MAC cycles.
+        if mac['signed']:
+            weights = to_signed(weights, mac['weight_w'])
+            bias = to_signed(bias, mac['acc_w'])
+        else:
+            weights = weights & ((1 << mac['weight_w']) - 1)
+        acc = (x @ weights.T + bias) & acc_mask
+        if mac['signed']:
+            acc = to_signed(acc, mac['acc_w'])
+        return acc & ACC_MASK
+
+    # requant_unit reads the accumulator with the MAC's signedness (ACC_SIGNED = MAC_SIGNED)
+    hidden = requant_unit(layer(x, w1, b1), acc_signed=mac['signed'], **requant)
+
+    # LAYER2_COMPUTE drives mac_unit.A from hidden_layer
+    outputs = layer(hidden, w2, b2)
+
+    outputs = outputs.astype(np.uint16)
+    hidden = hidden.astype(np.uint8)
+    if single:
+        outputs = outputs[0]
+        hidden = hidden[0]
+
+    if return_hidden:
+        return outputs, hidden
+    return outputs
@@ -0,0 +1,380 @@
+// Layer-Pipelined DNN Accelerator
+// streaming_dnn_accelerator with a compute unit per layer
+// Layer 1: 4 inputs -> 3 hidden neurons
+// Layer 2: 3 hidden neurons -> 2 outputs
+// The layer 1 unit writes one bank of a ping-pong hidden_layer buffer while
+// the layer 2 unit reads the other, so layer 1 works on vector k+1 while
+// layer 2 finishes vector k. Layer 1 computes LAYER1_MACS neurons at a time
+// (ceil(3/LAYER1_MACS)*4 cycles), layer 2 takes 6 cycles with one mac_unit;
+// back to back, one result leaves every max of the two (8 cycles for the
+// default LAYER1_MACS = 2, against 18 for streaming_dnn_accelerator).
+// Each layer 1 lane requantizes its finished neurons (requant_unit, with the
+// requant word loaded with the parameters) into the 8-bit activations layer 2 reads. Outputs are
+// bit-identical to streaming_dnn_accelerator; ports, parameter loading and
+// the MAC_* datapath parameters are the same.
+//
+// With MAC_MUL_STAGE / MAC_ACC_STAGE every mac_unit is pipelined: each MAC
+// step of either unit then waits MAC_MUL_STAGE + MAC_ACC_STAGE extra cycles
+// for its result.
+
+module layer_pipelined_dnn_accelerator #(
+    parameter FIFO_DEPTH = 2,         // Queued input vectors (power of two)
+    parameter integer LAYER1_MACS = 2, // mac_unit instances of the layer 1 unit (1..3)
+    parameter MAC_SIGNED = 1,     // 1 = two's complement weights and biases
+    parameter MAC_WEIGHT_W = 8,   // mac_unit weight width (up to 8)
+    parameter MAC_ACC_W = 16,     // mac_unit accumulator width (up to 16)
+    parameter MAC_MUL_STAGE = 0,  // mac_unit register stage after the multiply
+    parameter MAC_ACC_STAGE = 0   // mac_unit register stage after the accumulate
+) (
+    input clk,                    // Clock signal
+    input rst_n,                  // Reset signal (active low)
+    input load_params,            // Load parameters signal
+    input param_burst,            // Load mode: 0 = bytes, 1 = 16-bit burst
+    input [15:0] param_data,      // Parameter data input (bytes use [7:0])
+    input [3:0] param_addr,       // Parameter address (unused, loads auto-increment)
+    input param_valid,            // Parameter data valid
+    output reg params_loaded,     // Parameters loaded signal
+    // Input stream: one vector per transfer, input i in in_data[8*i +: 8]
+    input in_valid,               // Input vector valid
+    output in_ready,              // Input FIFO has room
+    input [31:0] in_data,         // Input vector
+    // Output stream
+    output reg out_valid,         // Output vector valid
+    input out_ready,              // Consumer takes the output vector
+    output reg [15:0] out_data_0, // Output data 0
+    output reg [15:0] out_data_1  // Output data 1
+);
+
+    localparam PTR_BITS = (FIFO_DEPTH > 1) ? $clog2(FIFO_DEPTH) : 1;
+
+    // Neurons advanced per layer 1 group
+    localparam [1:0] GROUP_STEP = LAYER1_MACS[1:0];
+
+    // Pipelined mac_unit: cycles to wait for mac_out after the operands change
+    localparam MAC_LATENCY = MAC_MUL_STAGE + MAC_ACC_STAGE;
+
+    // Parameter memory read ports
+    wire [12*8-1:0] weights_layer1;   // Layer 1 weights (4 inputs × 3 neurons)
+    wire [6*8-1:0] weights_layer2;    // Layer 2 weights (3 neurons × 2 outputs)
+    wire [3*16-1:0] bias_layer1;      // Layer 1 biases (3 neurons)
+    wire [2*16-1:0] bias_layer2;      // Layer 2 biases (2 outputs)
+    wire [7:0] requant_mult;          // Hidden requantization (loaded with the parameters)
+    wire [4:0] requant_shift;
+    wire requant_round;
+    wire requant_relu;
+    wire load_done;                   // Last parameter beat being written
+
+    // Input FIFO
+    reg [31:0] fifo [0:FIFO_DEPTH-1];
+    reg [PTR_BITS-1:0] wr_ptr;
+    reg [PTR_BITS-1:0] rd_ptr;
+    reg [PTR_BITS:0] count;
+
+    // Ping-pong hidden buffer: bank b holds neurons at hidden_layer[b*3 +: 3]
+    reg [7:0] hidden_layer [0:5];     // Hidden layer activations (requantized)
+    reg [1:0] bank_full;              // Bank written by layer 1, not yet read by layer 2
+    reg wr_bank;                      // Bank the layer 1 unit writes
+    reg rd_bank;                      // Bank the layer 2 unit reads
+
+    // Layer 1 unit
+    reg l1_busy;                      // Computing a vector
+    reg [31:0] l1_vector;             // Vector being computed
+    reg [1:0] l1_neuron_idx;          // First neuron of the current group
+    reg [1:0] l1_input_idx;           // Current input index
+    reg [LAYER1_MACS*16-1:0] l1_mac_result; // Accumulators, lane p at [p*16 +: 16]
+    reg [1:0] l1_mac_wait;            // Cycles waited for the current MAC step
+    wire l1_mac_ready = (MAC_LATENCY == 0) || (l1_mac_wait == MAC_LATENCY);
+
+    // Layer 2 unit
+    reg l2_busy;                      // Computing a bank
+    reg l2_hold;                      // Results ready, output register still full
+    reg [1:0] l2_neuron_idx;          // Current neuron index
+    reg [1:0] l2_input_idx;           // Current input index
+    reg [15:0] l2_mac_result;         // MAC computation result
+    reg [1:0] l2_mac_wait;            // Cycles waited for the current MAC step
+    wire l2_mac_ready = (MAC_LATENCY == 0) || (l2_mac_wait == MAC_LATENCY);
+    reg [15:0] result_0;              // Layer 2 results not yet in the output register
+    reg [15:0] result_1;
+
+    reg loading;                      // Parameter load in progress
+
+    // Layer 1 hand-off: the last group's last input writes the bank
+    wire l1_last = l1_busy && l1_mac_ready && (l1_input_idx == 3) && ({2'b00, l1_neuron_idx} + LAYER1_MACS >= 3);
+    wire l1_bank = l1_last ? !wr_bank : wr_bank;          // Bank of the next vector
+
+    // Layer 2 completion and output hand-over
+    wire out_free = !out_valid || out_ready;
+    wire l2_last = l2_busy && l2_mac_ready && (l2_input_idx == 2) && (l2_neuron_idx == 1);
+    wire retire = (l2_last || l2_hold) && out_free;
+    wire l2_bank = l2_last ? !rd_bank : rd_bank;          // Bank of the next start
+    wire l2_start = ((!l2_busy && !l2_hold) || retire) && bank_full[l2_bank];
+
+    // Stream handshakes: a vector enters layer 1 once its bank is free
+    wire pipeline_idle = !l1_busy && !l2_busy && !l2_hold && (bank_full == 2'b00);
+    wire load_start = pipeline_idle && !loading && load_params;
+    wire bank_free = !bank_full[l1_bank] || (l2_last && rd_bank == l1_bank);
+    wire push = in_valid && in_ready;
+    wire pop = (count != 0) && params_loaded && !load_start && (!l1_busy || l1_last) && bank_free;
+
+    assign in_ready = (count != FIFO_DEPTH);
+
+    dnn_param_memory param_mem (
+        .clk(clk),
+        .rst_n(rst_n),
+        .load_start(load_start),
+        .bank_swap(1'b0),
+        .param_burst(param_burst),
+        .param_write(loading && param_valid),
+        .param_data(param_data),
+        .load_done(load_done),
+        .weights_layer1_flat(weights_layer1),
+        .weights_layer2_flat(weights_layer2),
+        .bias_layer1_flat(bias_layer1),
+        .bias_layer2_flat(bias_layer2),
+        .requant_mult(requant_mult),
+        .requant_shift(requant_shift),
+        .requant_round(requant_round),
+        .requant_relu(requant_relu)
+    );
+
+    // Layer 1 unit: LAYER1_MACS lanes share the input mux; lanes past the
+    // last neuron see zero weights and biases and their results are dropped
+    wire [7:0] l1_input = l1_vector[l1_input_idx * 8 +: 8];
+    wire [LAYER1_MACS*16-1:0] l1_mac_out;
+    wire [LAYER1_MACS*8-1:0] hidden_act;          // Requantized l1_mac_out of each lane
+    wire [LAYER1_MACS*16-1:0] first_bias_layer1;  // Biases of the first group
+    wire [LAYER1_MACS*16-1:0] next_bias_layer1;   // Biases of the next group
+
+    genvar p;
+    generate
+        for (p = 0; p < LAYER1_MACS; p = p + 1) begin : l1_lane
+            localparam [3:0] LANE = p;
+
+            wire [3:0] neuron = {2'b00, l1_neuron_idx} + LANE;
+            wire [3:0] next_neuron = {2'b00, l1_neuron_idx} + {2'b00, GROUP_STEP} + LANE;
+            wire [7:0] weight = (neuron < 3) ? weights_layer1[(neuron * 4 + l1_input_idx) * 8 +: 8] : 8'd0;
+
+            // C extended back to the 16-bit accumulator registers
+            wire [MAC_ACC_W-1:0] mac_c;
+            wire signed [15:0] mac_c_signed = $signed(mac_c);
+            wire [15:0] mac_c_unsigned = mac_c;
+            assign l1_mac_out[p*16 +: 16] = MAC_SIGNED ? mac_c_signed : mac_c_unsigned;
+
+            mac_unit #(.WEIGHT_W(MAC_WEIGHT_W), .ACC_W(MAC_ACC_W), .SIGNED(MAC_SIGNED),
+                       .MUL_STAGE(MAC_MUL_STAGE), .ACC_STAGE(MAC_ACC_STAGE)) mac_inst (
+                .clk(clk),
+                .A(l1_input),
+                .W(weight[MAC_WEIGHT_W-1:0]),
+                .B(l1_mac_result[p*16 +: MAC_ACC_W]),
+                .C(mac_c)
+            );
+
+            // Requantize the lane's finished hidden neuron
+            requant_unit #(.ACC_SIGNED(MAC_SIGNED)) requant_inst (
+                .acc(l1_mac_out[p*16 +: 16]),
+                .multiplier(requant_mult),
+                .shift(requant_shift),
+                .round(requant_round),
+                .relu(requant_relu),
+                .q(hidden_act[p*8 +: 8])
+            );
+
+            if (p < 3) begin : active_lane
+                assign first_bias_layer1[p*16 +: 16] = bias_layer1[p*16 +: 16];
+            end else begin : idle_lane
+                assign first_bias_layer1[p*16 +: 16] = 16'd0;
+            end
+
+            assign next_bias_layer1[p*16 +: 16] = (next_neuron < 3) ? bias_layer1[next_neuron * 16 +: 16] : 16'd0;
+        end
+    endgenerate
+
+    // Layer 2 unit: reads the hidden activations of its bank
+    wire [7:0] l2_input = hidden_layer[rd_bank * 3 + l2_input_idx];
+    wire [7:0] l2_weight = weights_layer2[(l2_neuron_idx * 3 + l2_input_idx) * 8 +: 8];
+    wire [15:0] l2_mac_out;
+
+    // C extended back to the 16-bit accumulator registers
+    wire [MAC_ACC_W-1:0] l2_mac_c;
+    wire signed [15:0] l2_mac_c_signed = $signed(l2_mac_c);
+    wire [15:0] l2_mac_c_unsigned = l2_mac_c;
+    assign l2_mac_out = MAC_SIGNED ? l2_mac_c_signed : l2_mac_c_unsigned;
+
+    mac_unit #(.WEIGHT_W(MAC_WEIGHT_W), .ACC_W(MAC_ACC_W), .SIGNED(MAC_SIGNED),
+               .MUL_STAGE(MAC_MUL_STAGE), .ACC_STAGE(MAC_ACC_STAGE)) l2_mac_inst (
+        .clk(clk),
+        .A(l2_input),
+        .W(l2_weight[MAC_WEIGHT_W-1:0]),
+        .B(l2_mac_result[MAC_ACC_W-1:0]),
+        .C(l2_mac_c)
+    );
+
+    // Input FIFO
+    always @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            wr_ptr <= 0;
+            rd_ptr <= 0;
+            count <= 0;
+        end else begin
+            if (push) begin
+                fifo[wr_ptr] <= in_data;
+                wr_ptr <= wr_ptr + 1;
+            end
+            if (pop) begin
+                rd_ptr <= rd_ptr + 1;
+            end
+            count <= count + push - pop;
+        end
+    end
+
+    // Parameter loading
+    always @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            loading <= 0;
+            params_loaded <= 0;
+        end else if (load_start) begin
+            loading <= 1;
+            params_loaded <= 0;
+        end else if (loading && param_valid && load_done) begin
+            // Beats are written by param_mem; finish on the last one
+            loading <= 0;
+            params_loaded <= 1;
+        end
+    end
+
+    // Ping-pong bank control
+    always @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            bank_full <= 0;
+            wr_bank <= 0;
+            rd_bank <= 0;
+        end else begin
+            if (l1_last) begin
+                wr_bank <= !wr_bank;
+            end
+            if (l2_last) begin
+                rd_bank <= !rd_bank;
+            end
+            // Layer 1 fills its bank as layer 2 releases the other one
+            bank_full <= (bank_full | ({1'b0, l1_last} << wr_bank)) & ~({1'b0, l2_last} << rd_bank);
+        end
+    end
+
+    // Layer 1 unit
+    integer k;
+    always @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            l1_busy <= 0;
+            l1_neuron_idx <= 0;
+            l1_input_idx <= 0;
+            l1_mac_result <= 0;
+            l1_mac_wait <= 0;
+        end else begin
+            // Count the wait for each MAC step's result
+            if (l1_mac_ready) begin
+                l1_mac_wait <= 0;
+            end else if (l1_busy) begin
+                l1_mac_wait <= l1_mac_wait + 1;
+            end
+
+            if (l1_busy) begin
+                if (!l1_mac_ready) begin
+                    // l1_mac_out not valid yet
+                end else if (l1_input_idx < 3) begin
+                    l1_mac_result <= l1_mac_out;
+                    l1_input_idx <= l1_input_idx + 1;
+                end else begin
+                    // Store hidden layer activations of the group in the bank
+                    for (k = 0; k < LAYER1_MACS; k = k + 1) begin
+                        if (l1_neuron_idx + k < 3) begin
+                            hidden_layer[wr_bank * 3 + l1_neuron_idx + k] <= hidden_act[k*8 +: 8];
+                        end
+                    end
+                    l1_input_idx <= 0;
+
+                    if (!l1_last) begin
+                        l1_neuron_idx <= l1_neuron_idx + GROUP_STEP;
+                        l1_mac_result <= next_bias_layer1;
+                    end else begin
+                        // Layer 1 complete, hand the bank to layer 2
+                        l1_busy <= 0;
+                    end
+                end
+            end
+
+            // Next vector: straight from the FIFO into layer 1
+            if (pop) begin
+                l1_vector <= fifo[rd_ptr];
+                l1_busy <= 1;
+                l1_neuron_idx <= 0;
+                l1_input_idx <= 0;
+                l1_mac_result <= first_bias_layer1;
+            end
+        end
+    end
+
+    // Layer 2 unit
+    always @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            l2_busy <= 0;
+            l2_hold <= 0;
+            l2_neuron_idx <= 0;
+            l2_input_idx <= 0;
+            l2_mac_result <= 0;
+            l2_mac_wait <= 0;
+            out_valid <= 0;
+        end else begin
+            // The consumer took the output and nothing replaces it
+            if (out_valid && out_ready && !retire) begin
+                out_valid <= 0;
+            end
+
+            // Count the wait for each MAC step's result
+            if (l2_mac_ready) begin
+                l2_mac_wait <= 0;
+            end else if (l2_busy) begin
+                l2_mac_wait <= l2_mac_wait + 1;
+            end
+
+            if (l2_busy) begin
+                if (!l2_mac_ready) begin
+                    // l2_mac_out not valid yet
+                end else if (l2_input_idx < 2) begin
+                    l2_mac_result <= l2_mac_out;
+                    l2_input_idx <= l2_input_idx + 1;
+                end else if (l2_neuron_idx < 1) begin
+                    result_0 <= l2_mac_out;
+                    l2_input_idx <= 0;
+                    l2_neuron_idx <= l2_neuron_idx + 1;
+                    l2_mac_result <= bias_layer2[(l2_neuron_idx + 1) * 16 +: 16];
+                end else begin
+                    // Bank read completely: hand over the results, or hold
+                    // them while the output register is full
+                    result_1 <= l2_mac_out;
+                    l2_busy <= 0;
+                    if (retire) begin
+                        out_data_0 <= result_0;
+                        out_data_1 <= l2_mac_out;
+                        out_valid <= 1;
+                    end else begin
+                        l2_hold <= 1;
+                    end
+                end
+            end else if (retire) begin
+                out_data_0 <= result_0;
+                out_data_1 <= result_1;
+                out_valid <= 1;
+                l2_hold <= 0;
+            end
+
+            // Next bank from layer 1
+            if (l2_start) begin
+                l2_busy <= 1;
+                l2_neuron_idx <= 0;
+                l2_input_idx <= 0;
+                l2_mac_result <= bias_layer2[15:0];
+            end
+        end
+    end
+
+endmodule
@@ -0,0 +1,28 @@
+// Batched MAC Testbench Wrapper
+// LANES independent mac_unit instances behind wide packed buses, so a
+// testbench can apply and check thousands of (A, W, B) tuples per step
+// Lane i: A[i*8 +: 8], W[i*8 +: 8], B[i*16 +: 16] -> C[i*16 +: 16]
+
+module mac_batch_tb #(
+    parameter LANES = 1024        // mac_unit instances
+) (
+    input [LANES*8-1:0] A,        // Inputs A of every lane
+    input [LANES*8-1:0] W,        // Weights W of every lane
+    input [LANES*16-1:0] B,       // Accumulator inputs B of every lane
+    output [LANES*16-1:0] C       // Results C of every lane
+);
+
+    genvar i;
+    generate
+        for (i = 0; i < LANES; i = i + 1) begin : lane
+            mac_unit mac_inst (
+                .clk(1'b0),
+                .A(A[i*8 +: 8]),
+                .W(W[i*8 +: 8]),
+                .B(B[i*16 +: 16]),
+                .C(C[i*16 +: 16])
+            );
+        end
+    endgenerate
+
+endmodule
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+MAC Datapath Sizing
+Runs each layer of the exported model through the vectorized mac_unit
+reference, one serial MAC step at a time as the accelerators do, and picks
+the narrowest signed / saturating mac_unit parameters that stay exact
+"""
+
+import argparse
+import json
+import numpy as np
+
+from hardware_model import mac_unit, to_signed
+from param_file import load_model_parameters
+from quantization import requantize
+
+# Activation width fed to every layer (uint8 inputs, 8-bit hidden activations)
+ACT_BITS = 8
+
+# Widest accumulator considered
+MAX_ACC_W = 32
+
+# Datapath of the current accelerators (MAC_PARAMS defaults)
+CURRENT = {'data_w': 8, 'weight_w': 8, 'acc_w': 16, 'signed': True, 'data_signed': False, 'saturate': False}
+
+# Weight and accumulator register widths of the accelerators
+MAX_WEIGHT_W = 8
+MAX_MAC_ACC_W = 16
+
+def serial_layer(x, weights, bias, config):
+    """(N, fan_out) C values of a layer: bias preload, then one MAC per input
+
+    x is (N, fan_in), weights (fan_out, fan_in) and bias (fan_out,), all as
+    integers; config holds mac_unit keyword parameters.
+    """
+    x = np.asarray(x, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.int64)
+    acc = np.broadcast_to(np.asarray(bias, dtype=np.int64), (len(x), len(weights)))
+    acc = acc & ((1 << config['acc_w']) - 1)
+    for i in range(weights.shape[1]):
+        acc = mac_unit(x[:, i:i + 1], weights[None, :, i], acc, **config).astype(np.int64)
+    return acc
+
+def layer_inputs(params, vectors):
+    """Integer inputs of every layer and its exact accumulators
+
+    Hidden activations are requantized as in quantization.py: ReLU, the
+    layer's output_shift (or the smallest shift fitting ACT_BITS when the
+    file has none), clamp to ACT_BITS.
+    """
+    x = np.asarray(vectors, dtype=np.int64)
+    stages = []
+    layers = params['layers']
+    for i, layer in enumerate(layers):
+        weights = np.asarray(layer['weights'], dtype=np.int64)
+        bias = np.asarray(layer['bias'], dtype=np.int64)
+        exact = x @ weights.T + bias
+        stages.append((x, weights, bias, exact))
+        if i < len(layers) - 1:
+            shift = layer.get('output_shift')
+            if shift is None:
+                peak = int(np.max(np.maximum(exact, 0) if layer['relu'] else np.abs(exact)))
+                shift = max(0, (peak // ((1 << ACT_BITS) - 1)).bit_length())
+            x = requantize(exact, shift, layer['relu'], ACT_BITS)
+    return stages
+
+def mismatches(x, weights, bias, exact, config):
+    """Results of the serial MAC that differ from the exact accumulators"""
+    got = serial_layer(x, weights, bias, config)
+    if config['signed']:
+        got = to_signed(got, config['acc_w'])
+    return int(np.count_nonzero(got != exact))
+
+def operand_width(values, signed):
+    """Bits holding every value (two's complement if signed)"""
+    peak = int(np.max(np.abs(values))) if np.size(values) else 0
+    return max(peak.bit_length() + int(signed), 1)
+
+def smallest_datapath(x, weights, bias, exact, saturate):
+    """Narrowest exact mac_unit parameters for one layer (None if over MAX_ACC_W)"""
+    data_signed = bool(np.min(x) < 0)
+    signed = bool(np.min(weights) < 0 or np.min(bias) < 0 or np.min(exact) < 0 or data_signed)
+    config = {
+        'data_w': operand_width(x, data_signed),
+        'weight_w': operand_width(weights, signed),
+        'signed': signed,
+        'data_signed': data_signed,
+        'saturate': saturate,
+    }
+    start = max(config['weight_w'], operand_width(bias, signed))
+    for acc_w in range(start, MAX_ACC_W + 1):
+        candidate = {**config, 'acc_w': acc_w}
+        if mismatches(x, weights, bias, exact, candidate) == 0:
+            return candidate
+    return None
+
+def verilog_parameters(config):
+    """mac_unit parameter overrides for a reference config"""
+    return {
+        'DATA_W': config['data_w'],
+        'WEIGHT_W': config['weight_w'],
+        'ACC_W': config['acc_w'],
+        'SIGNED': int(config['signed']),
+        'DATA_SIGNED': int(config['data_signed']),
+        'SATURATE': int(config['saturate']),
+    }
+
+def accelerator_parameters(configs):
+    """MAC_* overrides of an accelerator whose mac_unit serves every layer
+
+    The shared unit takes the widest wrap datapath of the layers; None if a
+    layer has none or it does not fit the 8-bit weight and 16-bit
+    accumulator registers.
+    """
+    if any(config is None or config['data_signed'] or config['data_w'] > 8 for config in configs):
+        return None
+    weight_w = max(config['weight_w'] for config in configs)
+    acc_w = max(config['acc_w'] for config in configs)
+    if weight_w > MAX_WEIGHT_W or acc_w > MAX_MAC_ACC_W:
+        return None
+    return {
+        'MAC_SIGNED': int(any(config['signed'] for config in configs)),
+        'MAC_WEIGHT_W': weight_w,
+        'MAC_ACC_W': acc_w,
+    }
+
+def main():
+    """Size the MAC datapath of every layer and save the choices"""
+    parser = argparse.ArgumentParser(description="Pick the smallest exact mac_unit datapath per layer")
+    parser.add_argument('--params', default='model_parameters.bin', help="model parameters")
+    parser.add_argument('--vectors', default='test_vectors.npy', help="input vectors (.npy)")
+    parser.add_argument('--random-vectors', type=int, default=100000,
+                        help="uniform random 8-bit input vectors added to the stored ones")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--synth', action='store_true', help="synthesize the chosen variants with synth_sweep.py")
+    parser.add_argument('--output', default='mac_sizing_results.json')
+    args = parser.parse_args()
+
+    print("=== MAC Datapath Sizing ===")
+    params = load_model_parameters(args.params)
+    vectors = np.load(args.vectors).astype(np.int64)
+    fan_in = vectors.shape[1]
+    if args.random_vectors:
+        rng = np.random.default_rng(args.seed)
+        vectors = np.concatenate([vectors, rng.integers(0, 1 << ACT_BITS, (args.random_vectors, fan_in))])
+    print(f"{len(vectors):,} input vectors, {len(params['layers'])} layers")
+
+    results = []
+    wraps = []
+    for i, (x, weights, bias, exact) in enumerate(layer_inputs(params, vectors), start=1):
+        current = mismatches(x, weights, bias, exact, CURRENT)
+        wrap = smallest_datapath(x, weights, bias, exact, saturate=False)
+        saturate = smallest_datapath(x, weights, bias, exact, saturate=True)
+        wraps.append(wrap)
+        results.append({
+            'layer': i,
+            'weight_range': [int(weights.min()), int(weights.max())],
+            'accumulator_range': [int(exact.min()), int(exact.max())],
+            'current_mismatches': current,
+            'wrap': wrap and verilog_parameters(wrap),
+            'saturate': saturate and verilog_parameters(saturate),
+        })
+
+        print(f"\nLayer {i}: weights {weights.min()}..{weights.max()}, "
+              f"accumulators {exact.min()}..{exact.max()}")
+        print(f"  Current signed 8 x 8 + 16 datapath: {current:,} of {exact.size:,} results wrong")
+        for name, config in (('wrap', wrap), ('saturate', saturate)):
+            if config is None:
+                print(f"  {name:<9} no exact datapath up to {MAX_ACC_W} bits")
+            else:
+                print(f"  {name:<9} {verilog_parameters(config)}")
+
+    accelerator = accelerator_parameters(wraps)
+    accelerator_row = accelerator and dict(accelerator)
+    if accelerator is None:
+        print("\nAccelerators: no exact shared mac_unit within the 8-bit weight / 16-bit accumulator registers")
+    else:
+        print(f"\nAccelerators (one mac_unit for every layer): {accelerator}")
+
+    if args.synth:
+        from synth_sweep import run_sweep
+        variants = []
+        for row in results:
+            variants += [('mac_unit', row[mode]) for mode in ('wrap', 'saturate') if row[mode]]
+        variants.append(('mac_unit', verilog_parameters(CURRENT)))
+        if accelerator:
+            variants += [('configurable_dnn_accelerator', {}), ('configurable_dnn_accelerator', accelerator)]
+        print("\nSynthesizing the chosen variants...")
+        synth = run_sweep(variants)
+        for row in results:
+            for mode in ('wrap', 'saturate'):
+                match = [s for s in synth if row[mode] and s['parameters'] == row[mode]]
+                if match:
+                    row[f'{mode}_cells'] = match[0]['cells']
+                    row[f'{mode}_critical_path_delay'] = match[0]['critical_path_delay']
+            print(f"Layer {row['layer']}: wrap {row.get('wrap_cells', '-')} cells, "
+                  f"saturate {row.get('saturate_cells', '-')} cells")
+        current_cells = [s['cells'] for s in synth if s['design'] == 'mac_unit' and s['parameters'] == verilog_parameters(CURRENT)]
+        print(f"Current datapath: {current_cells[0]} cells")
+        if accelerator:
+            default, sized = synth[-2:]
+            accelerator_row.update(default_cells=default['cells'], cells=sized['cells'])
+            print(f"configurable_dnn_accelerator: {default['cells']} cells, {sized['cells']} with {accelerator}")
+
+    with open(args.output, 'w') as f:
+        json.dump({'layers': results, 'accelerator': accelerator_row}, f, indent=2)
+    print(f"\nResults saved to {args.output}")
+
+if __name__ == "__main__":
+    main()
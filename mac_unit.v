@@ -1,21 +1,92 @@
 // Simple MAC (Multiply-Accumulate) Unit for DNN
 // This is the core building block of any DNN accelerator
 // Function: C = A * W + B
+//
+// Operand widths are parameters. With SIGNED = 1, W, B and C are two's
+// complement (the exported int8 weights and int16 biases); DATA_SIGNED = 1
+// makes A two's complement as well, otherwise it is an unsigned activation.
+// The sum is computed exactly and then either wraps to ACC_W bits or, with
+// SATURATE = 1, clamps to the range of C. The defaults are the original
+// unsigned 8 x 8 + 16 unit with 16-bit wraparound.
+//
+// Optional register stages trade latency for a shorter critical path:
+// MUL_STAGE registers the product (and B alongside it), ACC_STAGE registers C.
+// C follows its operands after MUL_STAGE + ACC_STAGE clock edges, one new
+// operand set per cycle; with both stages 0 the unit is combinational and
+// clk is unused.
 
-module mac_unit (
-    input [7:0] A,    // Input A (8-bit)
-    input [7:0] W,    // Weight W (8-bit)
-    input [15:0] B,   // Bias B or previous accumulated value (16-bit)
-    output [15:0] C   // Output C (accumulated result, 16-bit)
+module mac_unit #(
+    parameter DATA_W = 8,       // Width of A
+    parameter WEIGHT_W = 8,     // Width of W
+    parameter ACC_W = 16,       // Width of B and C
+    parameter SIGNED = 0,       // 1 = W, B and C are two's complement
+    parameter DATA_SIGNED = 0,  // 1 = A is two's complement
+    parameter SATURATE = 0,     // 1 = clamp C instead of wrapping
+    parameter MUL_STAGE = 0,    // 1 = register stage after the multiply
+    parameter ACC_STAGE = 0     // 1 = register stage after the accumulate
+) (
+    input clk,                  // Clock (register stages only)
+    input [DATA_W-1:0] A,       // Input A
+    input [WEIGHT_W-1:0] W,     // Weight W
+    input [ACC_W-1:0] B,        // Bias B or previous accumulated value
+    output [ACC_W-1:0] C        // Output C (accumulated result)
 );
 
-    // Multiplier output: 8-bit × 8-bit = 16-bit
-    wire [15:0] product; 
-    
+    // Exact product and sum widths (one extra bit makes every operand signed)
+    localparam PROD_W = DATA_W + WEIGHT_W + 2;
+    localparam SUM_W = (PROD_W > ACC_W + 1 ? PROD_W : ACC_W + 1) + 1;
+
+    wire signed [DATA_W:0] a_ext = {DATA_SIGNED ? A[DATA_W-1] : 1'b0, A};
+    wire signed [WEIGHT_W:0] w_ext = {SIGNED ? W[WEIGHT_W-1] : 1'b0, W};
+
     // Perform multiplication
-    assign product = A * W; 
-    
+    wire signed [PROD_W-1:0] product;
+    assign product = a_ext * w_ext;
+
+    // Multiply stage: product and B move to the adder together
+    wire signed [PROD_W-1:0] sum_product;
+    wire [ACC_W-1:0] sum_B;
+    generate
+        if (MUL_STAGE) begin : mul_stage
+            reg signed [PROD_W-1:0] product_q;
+            reg [ACC_W-1:0] B_q;
+            always @(posedge clk) begin
+                product_q <= product;
+                B_q <= B;
+            end
+            assign sum_product = product_q;
+            assign sum_B = B_q;
+        end else begin : mul_comb
+            assign sum_product = product;
+            assign sum_B = B;
+        end
+    endgenerate
+
     // Perform accumulation
-    assign C = product + B; 
+    wire signed [ACC_W:0] b_ext = {SIGNED ? sum_B[ACC_W-1] : 1'b0, sum_B};
+    wire signed [SUM_W-1:0] sum;
+    assign sum = sum_product + b_ext;
+
+    // Wrap, or clamp to the range of C
+    wire signed [SUM_W-1:0] c_max = SIGNED ? $signed({{(SUM_W-ACC_W+1){1'b0}}, {(ACC_W-1){1'b1}}})
+                                           : $signed({{(SUM_W-ACC_W){1'b0}}, {ACC_W{1'b1}}});
+    wire signed [SUM_W-1:0] c_min = SIGNED ? $signed({{(SUM_W-ACC_W+1){1'b1}}, {(ACC_W-1){1'b0}}})
+                                           : {SUM_W{1'b0}};
+    wire [ACC_W-1:0] result = !SATURATE ? sum[ACC_W-1:0] :
+                              (sum > c_max) ? c_max[ACC_W-1:0] :
+                              (sum < c_min) ? c_min[ACC_W-1:0] : sum[ACC_W-1:0];
+
+    // Accumulate stage
+    generate
+        if (ACC_STAGE) begin : acc_stage
+            reg [ACC_W-1:0] C_q;
+            always @(posedge clk) begin
+                C_q <= result;
+            end
+            assign C = C_q;
+        end else begin : acc_comb
+            assign C = result;
+        end
+    endgenerate
 
 endmodule
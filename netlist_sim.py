@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Bit-Parallel Gate-Level Netlist Simulator
+Loads a Yosys JSON netlist (write_json after abc), levelizes its cells and
+evaluates them bit-sliced in NumPy: every net is a row of uint64 words and
+every bit of a word is an independent stimulus vector
+"""
+
+import argparse
+import json
+import re
+import time
+from collections import defaultdict
+import numpy as np
+
+from hardware_model import DNN_ACCELERATOR_PARAMS, dnn_forward, hardware_parameters, mac_unit
+
+# Vectors per machine word
+LANES_PER_WORD = 64
+
+# Constant nets: Yosys bit ids start at 2, so 0 and 1 are free
+CONST0 = 0
+CONST1 = 1
+
+# Combinational Yosys gate cells: input ports and bit-sliced function
+GATES = {
+    '$_BUF_': (('A',), lambda a: a),
+    '$_NOT_': (('A',), lambda a: ~a),
+    '$_AND_': (('A', 'B'), lambda a, b: a & b),
+    '$_NAND_': (('A', 'B'), lambda a, b: ~(a & b)),
+    '$_OR_': (('A', 'B'), lambda a, b: a | b),
+    '$_NOR_': (('A', 'B'), lambda a, b: ~(a | b)),
+    '$_XOR_': (('A', 'B'), lambda a, b: a ^ b),
+    '$_XNOR_': (('A', 'B'), lambda a, b: ~(a ^ b)),
+    '$_ANDNOT_': (('A', 'B'), lambda a, b: a & ~b),
+    '$_ORNOT_': (('A', 'B'), lambda a, b: a | ~b),
+    '$_MUX_': (('A', 'B', 'S'), lambda a, b, s: (a & ~s) | (b & s)),
+    '$_NMUX_': (('A', 'B', 'S'), lambda a, b, s: ~((a & ~s) | (b & s))),
+    '$_AOI3_': (('A', 'B', 'C'), lambda a, b, c: ~((a & b) | c)),
+    '$_OAI3_': (('A', 'B', 'C'), lambda a, b, c: ~((a | b) & c)),
+    '$_AOI4_': (('A', 'B', 'C', 'D'), lambda a, b, c, d: ~((a & b) | (c & d))),
+    '$_OAI4_': (('A', 'B', 'C', 'D'), lambda a, b, c, d: ~((a | b) & (c | d))),
+}
+
+# Single-clock flip-flops: $_DFF_P_, $_DFF_PN0_, $_DFFE_PP_, $_DFFE_PN0P_, ...
+FLOP_PATTERN = re.compile(r"^\$_(DFFE?)_P(?:([PN])([01]))?([PN])?_$")
+
+class Netlist:
+    """Flattened gate-level netlist of one Yosys JSON module
+
+    Nets are renumbered from 2 upwards while submodule instances are
+    inlined; combinational cells are grouped by (level, type) so each
+    group evaluates as a single NumPy operation.
+    """
+
+    def __init__(self, netlist_file, top=None):
+        with open(netlist_file, 'r') as f:
+            self.modules = json.load(f)['modules']
+        self.top = top or self._find_top()
+        self.num_nets = 2
+        self.gates = []
+        self.flops = []
+        self.names = {}
+
+        module = self.modules[self.top]
+        self.ports = {}
+        bits = {}
+        for name, port in module['ports'].items():
+            self.ports[name] = (port['direction'], [self._net(bit, bits) for bit in port['bits']])
+        self._inline(self.top, bits)
+        self.levels = self._levelize()
+
+    def _find_top(self):
+        """The module marked top, else the one no other module instantiates"""
+        for name, module in self.modules.items():
+            if int(module.get('attributes', {}).get('top', 0)):
+                return name
+        used = {cell['type'] for module in self.modules.values() for cell in module['cells'].values()}
+        candidates = [name for name in self.modules if name not in used]
+        if len(candidates) != 1:
+            raise ValueError(f"Cannot tell the top module from {', '.join(self.modules)}; pass top")
+        return candidates[0]
+
+    def _net(self, bit, bits):
+        """Global net of a module-local bit, allocating it on first use"""
+        if bit in ('0', 'x', 'z'):
+            return CONST0
+        if bit == '1':
+            return CONST1
+        if bit not in bits:
+            bits[bit] = self.num_nets
+            self.num_nets += 1
+        return bits[bit]
+
+    def _inline(self, name, bits, prefix=''):
+        """Collect the cells and net names of module name, recursing into submodules"""
+        for net_name, info in self.modules[name]['netnames'].items():
+            if info.get('hide_name'):
+                continue
+            for i, bit in enumerate(info['bits']):
+                if isinstance(bit, int):
+                    label = f"{prefix}{net_name}[{i}]" if len(info['bits']) > 1 else f"{prefix}{net_name}"
+                    self.names.setdefault(self._net(bit, bits), label)
+        for cell_name, cell in self.modules[name]['cells'].items():
+            kind = cell['type']
+            pins = {pin: [self._net(bit, bits) for bit in nets] for pin, nets in cell['connections'].items()}
+            if kind == '$scopeinfo':
+                # Hierarchy annotation left by synth -flatten, no logic
+                continue
+            if kind in GATES:
+                self.gates.append((kind, [pins[pin][0] for pin in GATES[kind][0]], pins['Y'][0]))
+            elif FLOP_PATTERN.match(kind):
+                self.flops.append(self._flop(kind, pins))
+            elif kind in self.modules:
+                # Submodule: its ports alias our nets, everything else is new
+                inner = {}
+                for port, port_bits in self.modules[kind]['ports'].items():
+                    for bit, net in zip(port_bits['bits'], pins[port]):
+                        if isinstance(bit, int):
+                            inner[bit] = net
+                instance = cell_name.lstrip('\\')
+                self._inline(kind, inner, f"{prefix}{instance}.")
+            else:
+                raise ValueError(f"Unsupported cell {cell_name} of type {kind}; "
+                                 f"synthesize to generic gates with abc")
+
+    def net_name(self, net):
+        """Readable name of a global net (a generated one for unnamed nets)"""
+        if net in (CONST0, CONST1):
+            return f"1'b{net}"
+        return self.names.get(net, f"n{net}")
+
+    def _flop(self, kind, pins):
+        """(D, Q, enable, enable polarity, reset, reset polarity, reset value) of a flip-flop"""
+        _, reset_polarity, reset_value, enable_polarity = FLOP_PATTERN.match(kind).groups()
+        return (
+            pins['D'][0], pins['Q'][0],
+            pins['E'][0] if 'E' in pins else None, enable_polarity != 'N',
+            pins['R'][0] if 'R' in pins else None, reset_polarity == 'P', int(reset_value or 0),
+        )
+
+    def _levelize(self):
+        """Combinational cells grouped by logic level, then type
+
+        Level 0 nets are constants, primary inputs, undriven nets and
+        flip-flop outputs; a cell sits one level above its deepest input.
+        """
+        drivers = {y: i for i, (_, _, y) in enumerate(self.gates)}
+        level = {}
+        pending = defaultdict(list)
+        indegree = []
+        for i, (_, inputs, _) in enumerate(self.gates):
+            driven = [net for net in inputs if net in drivers]
+            indegree.append(len(driven))
+            for net in driven:
+                pending[drivers[net]].append(i)
+        ready = [i for i, count in enumerate(indegree) if count == 0]
+        order = []
+        while ready:
+            i = ready.pop()
+            order.append(i)
+            level[i] = 1 + max((level[drivers[net]] for net in self.gates[i][1] if net in drivers), default=0)
+            for j in pending[i]:
+                indegree[j] -= 1
+                if indegree[j] == 0:
+                    ready.append(j)
+        if len(order) != len(self.gates):
+            raise ValueError(f"Combinational loop through {len(self.gates) - len(order)} cells")
+
+        self.depth = max(level.values(), default=0)
+        groups = defaultdict(list)
+        for i in order:
+            groups[(level[i], self.gates[i][0])].append(self.gates[i])
+        levels = []
+        for (depth, kind) in sorted(groups):
+            cells = groups[(depth, kind)]
+            inputs = [np.array([cell[1][k] for cell in cells]) for k in range(len(GATES[kind][0]))]
+            levels.append((kind, inputs, np.array([cell[2] for cell in cells])))
+        return levels
+
+class NetlistSimulator:
+    """Bit-parallel simulation of num_vectors copies of a netlist
+
+    Every net holds ceil(num_vectors / 64) uint64 words; lane i of the
+    batch is bit i % 64 of word i // 64. Ports take and return integer
+    arrays of num_vectors values.
+    """
+
+    def __init__(self, netlist, num_vectors):
+        self.netlist = netlist
+        self.num_vectors = num_vectors
+        self.words = -(-num_vectors // LANES_PER_WORD)
+        self.values = np.zeros((netlist.num_nets, self.words), dtype=np.uint64)
+        self.values[CONST1] = ~np.uint64(0)
+
+        flops = netlist.flops
+        self.flop_d = np.array([flop[0] for flop in flops], dtype=np.int64)
+        self.flop_q = np.array([flop[1] for flop in flops], dtype=np.int64)
+        self.flop_enable = np.array([CONST1 if flop[2] is None else flop[2] for flop in flops], dtype=np.int64)
+        self.flop_enable_low = np.array([not flop[3] for flop in flops], dtype=bool)
+        self.flop_reset = np.array([CONST0 if flop[4] is None else flop[4] for flop in flops], dtype=np.int64)
+        self.flop_reset_low = np.array([flop[4] is not None and not flop[5] for flop in flops], dtype=bool)
+        self.flop_reset_value = np.array([~np.uint64(0) if flop[6] else np.uint64(0) for flop in flops],
+                                         dtype=np.uint64)
+
+    def _port(self, name, direction):
+        port_direction, nets = self.netlist.ports[name]
+        if port_direction != direction:
+            raise ValueError(f"{name} is an {port_direction} port")
+        return nets
+
+    def set_input(self, name, values):
+        """Drive an input port with one value per vector (or one value for all)"""
+        nets = self._port(name, 'input')
+        values = np.broadcast_to(np.asarray(values, dtype=np.uint64), (self.num_vectors,))
+        for bit, net in enumerate(nets):
+            lanes = ((values >> np.uint64(bit)) & np.uint64(1)).astype(np.uint8)
+            packed = np.packbits(lanes, bitorder='little')
+            packed = np.pad(packed, (0, self.words * 8 - len(packed)))
+            self.values[net] = packed.view(np.uint64)
+
+    def get(self, name):
+        """Per-vector integer values of a port"""
+        _, nets = self.netlist.ports[name]
+        result = np.zeros(self.num_vectors, dtype=np.uint64)
+        for bit, net in enumerate(nets):
+            lanes = np.unpackbits(self.values[net].view(np.uint8), bitorder='little')[:self.num_vectors]
+            result |= lanes.astype(np.uint64) << np.uint64(bit)
+        return result
+
+    def evaluate(self):
+        """Settle the combinational logic, one NumPy operation per (level, type) group"""
+        values = self.values
+        for kind, inputs, outputs in self.netlist.levels:
+            values[outputs] = GATES[kind][1](*(values[nets] for nets in inputs))
+
+    def step(self):
+        """One rising clock edge: settle, update every flip-flop, settle again"""
+        self.evaluate()
+        if len(self.flop_q):
+            values = self.values
+            enable = values[self.flop_enable]
+            enable[self.flop_enable_low] = ~enable[self.flop_enable_low]
+            reset = values[self.flop_reset]
+            reset[self.flop_reset_low] = ~reset[self.flop_reset_low]
+            q = values[self.flop_q]
+            q = (values[self.flop_d] & enable) | (q & ~enable)
+            q = (self.flop_reset_value[:, None] & reset) | (q & ~reset)
+            values[self.flop_q] = q
+        self.evaluate()
+
+def check_mac_unit(netlist, num_vectors, seed):
+    """Random A, W, B against hardware_model.mac_unit; returns (mismatches, details)"""
+    rng = np.random.default_rng(seed)
+    a = rng.integers(0, 1 << 8, num_vectors)
+    w = rng.integers(0, 1 << 8, num_vectors)
+    b = rng.integers(0, 1 << 16, num_vectors)
+
+    sim = NetlistSimulator(netlist, num_vectors)
+    sim.set_input('A', a)
+    sim.set_input('W', w)
+    sim.set_input('B', b)
+    sim.evaluate()
+    got = sim.get('C')
+    bad = np.flatnonzero(got != mac_unit(a, w, b))
+    return bad, [{'A': int(a[i]), 'W': int(w[i]), 'B': int(b[i]), 'got': int(got[i])} for i in bad[:10]]
+
+def check_dnn_accelerator(netlist, num_vectors, seed, max_cycles=100):
+    """One inference per vector, all in lock step, against dnn_forward"""
+    rng = np.random.default_rng(seed)
+    inputs = rng.integers(0, 256, (num_vectors, 4))
+
+    sim = NetlistSimulator(netlist, num_vectors)
+    for port in ('rst_n', 'start', 'input_data_0', 'input_data_1', 'input_data_2', 'input_data_3'):
+        sim.set_input(port, 0)
+    sim.step()
+    sim.step()
+    sim.set_input('rst_n', 1)
+    sim.step()
+
+    for i in range(4):
+        sim.set_input(f'input_data_{i}', inputs[:, i])
+    sim.set_input('start', 1)
+    sim.step()
+    sim.set_input('start', 0)
+    for _ in range(max_cycles):
+        if sim.get('done').all():
+            break
+        sim.step()
+    else:
+        raise RuntimeError(f"done did not rise within {max_cycles} cycles")
+
+    got = np.stack([sim.get('output_data_0'), sim.get('output_data_1')], axis=1)
+    expected = dnn_forward(inputs, hardware_parameters(DNN_ACCELERATOR_PARAMS))
+    bad = np.flatnonzero(np.any(got != expected, axis=1))
+    return bad, [{'inputs': inputs[i].tolist(), 'got': got[i].tolist(), 'expected': expected[i].tolist()}
+                 for i in bad[:10]]
+
+# Golden-model checks by top module
+CHECKS = {
+    'mac_unit': check_mac_unit,
+    'dnn_accelerator': check_dnn_accelerator,
+}
+
+def main():
+    """Simulate a synthesized netlist over random vectors and check it against the golden model"""
+    parser = argparse.ArgumentParser(description="Bit-parallel gate-level simulation of Yosys JSON netlists")
+    parser.add_argument('netlist', nargs='?', default='mac_unit.json', help="Yosys JSON netlist")
+    parser.add_argument('--top', default=None, help="top module (default: from the netlist)")
+    parser.add_argument('--vectors', type=int, default=1000000, help="stimulus vectors")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print("=== Gate-Level Netlist Simulation ===")
+    start = time.time()
+    netlist = Netlist(args.netlist, args.top)
+    print(f"{netlist.top}: {len(netlist.gates)} gates in {len(netlist.levels)} (level, type) groups, "
+          f"{len(netlist.flops)} flip-flops, depth {netlist.depth} ({time.time() - start:.2f} s)")
+
+    if netlist.top not in CHECKS:
+        raise SystemExit(f"No golden-model check for {netlist.top}; choose from {', '.join(CHECKS)}")
+
+    start = time.time()
+    bad, details = CHECKS[netlist.top](netlist, args.vectors, args.seed)
+    elapsed = time.time() - start
+    print(f"Simulated {args.vectors:,} vectors in {elapsed:.2f} s ({args.vectors / elapsed:,.0f} vectors/s)")
+    print(f"Mismatches against the golden model: {len(bad)}")
+    for detail in details:
+        print(f"  {detail}")
+    if len(bad):
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+// Parallel DNN Accelerator
+// Variant of the configurable DNN accelerator with NUM_MACS mac_unit instances
+// Layer 1: 4 inputs -> 3 hidden neurons
+// Layer 2: 3 hidden neurons -> 2 outputs
+// Layer 2 reads the hidden activations: requant_unit turns each finished
+// layer 1 accumulator into an 8-bit value (the requant word loaded with the
+// parameters, so it follows each model).
+// mac_unit reads weights and biases as two's complement (MAC_SIGNED) at
+// MAC_WEIGHT_W / MAC_ACC_W bits; mac_sizing.py picks the narrowest exact
+// widths for a model. The defaults take any int8 weight and int16 bias.
+// Each group of NUM_MACS neurons shares the input mux and is computed in
+// parallel, one input per cycle, so one inference takes
+// ceil(3/NUM_MACS)*4 + ceil(2/NUM_MACS)*3 compute cycles (18 for NUM_MACS = 1,
+// 11 for 2, 7 for 3). Outputs are bit-identical to configurable_dnn_accelerator.
+// Ports and parameter loading are the same as configurable_dnn_accelerator.
+//
+// With MAC_MUL_STAGE / MAC_ACC_STAGE every lane's mac_unit is pipelined: each
+// MAC step then waits MAC_MUL_STAGE + MAC_ACC_STAGE extra cycles for its result.
+
+module parallel_dnn_accelerator #(
+    parameter integer NUM_MACS = 3, // Parallel mac_unit instances (1..3)
+    parameter MAC_SIGNED = 1,     // 1 = two's complement weights and biases
+    parameter MAC_WEIGHT_W = 8,   // mac_unit weight width (up to 8)
+    parameter MAC_ACC_W = 16,     // mac_unit accumulator width (up to 16)
+    parameter MAC_MUL_STAGE = 0,  // mac_unit register stage after the multiply
+    parameter MAC_ACC_STAGE = 0   // mac_unit register stage after the accumulate
+) (
+    input clk,                    // Clock signal
+    input rst_n,                  // Reset signal (active low)
+    input start,                  // Start computation signal
+    input load_params,            // Load parameters signal
+    input param_burst,            // Load mode: 0 = bytes, 1 = 16-bit burst
+    input [15:0] param_data,      // Parameter data input (bytes use [7:0])
+    input [3:0] param_addr,       // Parameter address (unused, loads auto-increment)
+    input param_valid,            // Parameter data valid
+    input [7:0] input_data_0,    // Input data 0
+    input [7:0] input_data_1,    // Input data 1
+    input [7:0] input_data_2,    // Input data 2
+    input [7:0] input_data_3,    // Input data 3
+    output reg [15:0] output_data_0, // Output data 0
+    output reg [15:0] output_data_1, // Output data 1
+    output reg done,              // Computation done signal
+    output reg valid,             // Output valid signal
+    output reg params_loaded      // Parameters loaded signal
+);
+
+    // Parameter memory read ports
+    wire [12*8-1:0] weights_layer1;   // Layer 1 weights (4 inputs × 3 neurons)
+    wire [6*8-1:0] weights_layer2;    // Layer 2 weights (3 neurons × 2 outputs)
+    wire [3*16-1:0] bias_layer1;      // Layer 1 biases (3 neurons)
+    wire [2*16-1:0] bias_layer2;      // Layer 2 biases (2 outputs)
+    wire [7:0] requant_mult;          // Hidden requantization (loaded with the parameters)
+    wire [4:0] requant_shift;
+    wire requant_round;
+    wire requant_relu;
+    wire load_done;                   // Last parameter beat being written
+
+    reg [7:0] hidden_layer [0:2];     // Hidden layer activations (requantized)
+    reg [NUM_MACS*16-1:0] mac_result; // MAC accumulators, lane p at [p*16 +: 16]
+
+    // Control signals
+    reg [2:0] state;                  // State machine
+    reg [1:0] neuron_idx;              // First neuron of the current group
+    reg [1:0] input_idx;               // Current input index
+
+    // Pipelined mac_unit: cycles to wait for mac_out after the operands change
+    localparam MAC_LATENCY = MAC_MUL_STAGE + MAC_ACC_STAGE;
+    reg [1:0] mac_wait;
+    wire mac_ready = (MAC_LATENCY == 0) || (mac_wait == MAC_LATENCY);
+
+    // State machine states
+    localparam IDLE = 3'b000;
+    localparam LOAD_PARAMS = 3'b001;
+    localparam LAYER1_COMPUTE = 3'b010;
+    localparam LAYER2_COMPUTE = 3'b011;
+    localparam DONE_STATE = 3'b100;
+
+    // Neurons advanced per group
+    localparam [1:0] GROUP_STEP = NUM_MACS[1:0];
+
+    dnn_param_memory param_mem (
+        .clk(clk),
+        .rst_n(rst_n),
+        .load_start(state == IDLE && load_params),
+        .bank_swap(1'b0),
+        .param_burst(param_burst),
+        .param_write(state == LOAD_PARAMS && param_valid),
+        .param_data(param_data),
+        .load_done(load_done),
+        .weights_layer1_flat(weights_layer1),
+        .weights_layer2_flat(weights_layer2),
+        .bias_layer1_flat(bias_layer1),
+        .bias_layer2_flat(bias_layer2),
+        .requant_mult(requant_mult),
+        .requant_shift(requant_shift),
+        .requant_round(requant_round),
+        .requant_relu(requant_relu)
+    );
+
+    // Multiplexer for input data (shared by every lane): network inputs,
+    // then hidden activations
+    wire [7:0] current_input;
+    assign current_input = (state != LAYER1_COMPUTE) ? hidden_layer[input_idx] :
+                          (input_idx == 2'b00) ? input_data_0 :
+                          (input_idx == 2'b01) ? input_data_1 :
+                          (input_idx == 2'b10) ? input_data_2 : input_data_3;
+
+    // Per-lane MAC outputs and bias preloads; lanes past the last neuron
+    // of a layer see zero weights and biases and their results are dropped
+    wire [NUM_MACS*16-1:0] mac_out;
+    wire [NUM_MACS*8-1:0] hidden_act;          // Requantized mac_out of each lane
+    wire [NUM_MACS*16-1:0] first_bias_layer1;  // Biases of the first layer 1 group
+    wire [NUM_MACS*16-1:0] first_bias_layer2;  // Biases of the first layer 2 group
+    wire [NUM_MACS*16-1:0] next_bias_layer1;   // Biases of the next layer 1 group
+    wire [NUM_MACS*16-1:0] next_bias_layer2;   // Biases of the next layer 2 group
+
+    genvar p;
+    generate
+        for (p = 0; p < NUM_MACS; p = p + 1) begin : mac_lane
+            localparam [3:0] LANE = p;
+
+            wire [3:0] neuron = {2'b00, neuron_idx} + LANE;
+            wire [3:0] next_neuron = {2'b00, neuron_idx} + {2'b00, GROUP_STEP} + LANE;
+            wire [7:0] current_weight;
+
+            // Multiplexer for this lane's weight
+            assign current_weight = (state == LAYER1_COMPUTE) ?
+                                    ((neuron < 3) ? weights_layer1[(neuron * 4 + input_idx) * 8 +: 8] : 8'd0) :
+                                    ((neuron < 2) ? weights_layer2[(neuron * 3 + input_idx) * 8 +: 8] : 8'd0);
+
+            // C extended back to the 16-bit accumulator registers
+            wire [MAC_ACC_W-1:0] mac_c;
+            wire signed [15:0] mac_c_signed = $signed(mac_c);
+            wire [15:0] mac_c_unsigned = mac_c;
+            assign mac_out[p*16 +: 16] = MAC_SIGNED ? mac_c_signed : mac_c_unsigned;
+
+            mac_unit #(.WEIGHT_W(MAC_WEIGHT_W), .ACC_W(MAC_ACC_W), .SIGNED(MAC_SIGNED),
+                       .MUL_STAGE(MAC_MUL_STAGE), .ACC_STAGE(MAC_ACC_STAGE)) mac_inst (
+                .clk(clk),
+                .A(current_input),
+                .W(current_weight[MAC_WEIGHT_W-1:0]),
+                .B(mac_result[p*16 +: MAC_ACC_W]),
+                .C(mac_c)
+            );
+
+            // Requantize the lane's finished hidden neuron
+            requant_unit #(.ACC_SIGNED(MAC_SIGNED)) requant_inst (
+                .acc(mac_out[p*16 +: 16]),
+                .multiplier(requant_mult),
+                .shift(requant_shift),
+                .round(requant_round),
+                .relu(requant_relu),
+                .q(hidden_act[p*8 +: 8])
+            );
+
+            if (p < 3) begin : layer1_lane
+                assign first_bias_layer1[p*16 +: 16] = bias_layer1[p*16 +: 16];
+            end else begin : layer1_idle_lane
+                assign first_bias_layer1[p*16 +: 16] = 16'd0;
+            end
+
+            if (p < 2) begin : layer2_lane
+                assign first_bias_layer2[p*16 +: 16] = bias_layer2[p*16 +: 16];
+            end else begin : layer2_idle_lane
+                assign first_bias_layer2[p*16 +: 16] = 16'd0;
+            end
+
+            assign next_bias_layer1[p*16 +: 16] = (next_neuron < 3) ? bias_layer1[next_neuron * 16 +: 16] : 16'd0;
+            assign next_bias_layer2[p*16 +: 16] = (next_neuron < 2) ? bias_layer2[next_neuron * 16 +: 16] : 16'd0;
+        end
+    endgenerate
+
+    // Parameter loading and computation control
+    integer k;
+    always @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            // Initialize control signals
+            state <= IDLE;
+            neuron_idx <= 0;
+            input_idx <= 0;
+            mac_result <= 0;
+            mac_wait <= 0;
+            done <= 0;
+            valid <= 0;
+            params_loaded <= 0;
+        end else begin
+            // Count the wait for each MAC step's result
+            if (mac_ready) begin
+                mac_wait <= 0;
+            end else if (state == LAYER1_COMPUTE || state == LAYER2_COMPUTE) begin
+                mac_wait <= mac_wait + 1;
+            end
+
+            case (state)
+                IDLE: begin
+                    if (load_params) begin
+                        state <= LOAD_PARAMS;
+                        params_loaded <= 0;
+                    end else if (start && params_loaded) begin
+                        state <= LAYER1_COMPUTE;
+                        neuron_idx <= 0;
+                        input_idx <= 0;
+                        mac_result <= first_bias_layer1;
+                        done <= 0;
+                        valid <= 0;
+                    end
+                end
+
+                LOAD_PARAMS: begin
+                    // Beats are written by param_mem; finish on the last one
+                    if (param_valid && load_done) begin
+                        state <= IDLE;
+                        params_loaded <= 1;
+                    end
+                end
+
+                LAYER1_COMPUTE: begin
+                    if (!mac_ready) begin
+                        // mac_out not valid yet
+                    end else if (input_idx < 3) begin
+                        mac_result <= mac_out;
+                        input_idx <= input_idx + 1;
+                    end else begin
+                        // Store hidden layer activations of the group
+                        for (k = 0; k < NUM_MACS; k = k + 1) begin
+                            if (neuron_idx + k < 3) begin
+                                hidden_layer[neuron_idx + k] <= hidden_act[k*8 +: 8];
+                            end
+                        end
+                        input_idx <= 0;
+
+                        if (neuron_idx + NUM_MACS < 3) begin
+                            neuron_idx <= neuron_idx + GROUP_STEP;
+                            mac_result <= next_bias_layer1;
+                        end else begin
+                            // Layer 1 complete, move to layer 2
+                            state <= LAYER2_COMPUTE;
+                            neuron_idx <= 0;
+                            input_idx <= 0;
+                            mac_result <= first_bias_layer2;
+                        end
+                    end
+                end
+
+                LAYER2_COMPUTE: begin
+                    if (!mac_ready) begin
+                        // mac_out not valid yet
+                    end else if (input_idx < 2) begin
+                        mac_result <= mac_out;
+                        input_idx <= input_idx + 1;
+                    end else begin
+                        // Store output results of the group
+                        for (k = 0; k < NUM_MACS; k = k + 1) begin
+                            if (neuron_idx + k == 0) begin
+                                output_data_0 <= mac_out[k*16 +: 16];
+                            end else if (neuron_idx + k == 1) begin
+                                output_data_1 <= mac_out[k*16 +: 16];
+                            end
+                        end
+
+                        input_idx <= 0;
+
+                        if (neuron_idx + NUM_MACS < 2) begin
+                            neuron_idx <= neuron_idx + GROUP_STEP;
+                            mac_result <= next_bias_layer2;
+                        end else begin
+                            // Computation complete
+                            state <= DONE_STATE;
+                            done <= 1;
+                            valid <= 1;
+                        end
+                    end
+                end
+
+                DONE_STATE: begin
+                    if (!start) begin
+                        state <= IDLE;
+                        done <= 0;
+                        valid <= 0;
+                    end
+                end
+
+                default: state <= IDLE;
+            endcase
+        end
+    end
+
+endmodule
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Binary Parameter File
+Versioned, memory-mappable model parameter format (model_parameters.bin)
+read zero-copy with NumPy; JSON parameter files are still accepted
+"""
+
+import argparse
+import json
+import os
+import numpy as np
+
+MAGIC = b'DNNP'
+VERSION = 2
+
+# Section offsets are multiples of this so every array view is aligned
+ALIGNMENT = 64
+
+# File header, followed by one LAYER record per layer
+HEADER = np.dtype([
+    ('magic', 'S4'),
+    ('version', '<u2'),
+    ('num_layers', '<u2'),
+    ('metadata_offset', '<u8'),
+    ('metadata_size', '<u8'),
+    ('reserved', '<u4'),
+])
+
+# Layer flags
+RELU = 1
+HAS_FLOAT = 2
+
+# Calibrated widths and shifts; QUANT_MISSING where the layer has none.
+# Shifts can be negative (a bias scale below 1), so the marker is the one
+# int8 value no field may take. Version 1 files marked missing fields -1.
+QUANT_FIELDS = ('acc_width', 'act_width', 'output_shift', 'weight_shift', 'bias_shift')
+QUANT_MISSING = -128
+
+LAYER = np.dtype([
+    ('fan_in', '<u4'),
+    ('fan_out', '<u4'),
+    ('flags', '<u4'),
+    ('weights_offset', '<u8'),      # int8, fan_out x fan_in (nn.Linear layout)
+    ('bias_offset', '<u8'),         # int16, fan_out
+    ('weights_fp_offset', '<u8'),   # float32 copies, if HAS_FLOAT
+    ('bias_fp_offset', '<u8'),
+] + [(name, '<i1') for name in QUANT_FIELDS])
+
+def align(offset):
+    """Round offset up to the next section boundary"""
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+def exported_layers(params):
+    """Layer dicts of a parameter dict: the generic 'layers' list or the 4-3-2 keys"""
+    if 'layers' in params:
+        return params['layers']
+    layers = []
+    for l, relu in ((1, True), (2, False)):
+        layer = {'weights': params[f'layer{l}_weights'], 'bias': params[f'layer{l}_bias'], 'relu': relu}
+        if f'layer{l}_weights_fp' in params:
+            layer['weights_fp'] = params[f'layer{l}_weights_fp']
+            layer['bias_fp'] = params[f'layer{l}_bias_fp']
+        layers.append(layer)
+    return layers
+
+def write_parameter_file(path, params):
+    """Write a parameter dict (as built by train_software_dnn.extract_parameters)
+
+    Integer weights and biases are stored as two's complement int8/int16,
+    float copies as float32; everything that is not a layer array (e.g.
+    the quantization report) goes into a JSON metadata section.
+    """
+    layers = exported_layers(params)
+    table = np.zeros(len(layers), dtype=LAYER)
+    sections = []
+    offset = align(HEADER.itemsize + LAYER.itemsize * len(layers))
+
+    def place(array):
+        nonlocal offset
+        start = offset
+        sections.append((start, np.ascontiguousarray(array)))
+        offset = align(start + array.nbytes)
+        return start
+
+    for record, layer in zip(table, layers):
+        weights = np.atleast_2d(np.asarray(layer['weights'], dtype=np.int64))
+        record['fan_out'], record['fan_in'] = weights.shape
+        record['flags'] = RELU if layer.get('relu', False) else 0
+        record['weights_offset'] = place((weights & 0xFF).astype(np.uint8).view(np.int8))
+        bias = np.asarray(layer['bias'], dtype=np.int64).reshape(-1)
+        record['bias_offset'] = place((bias & 0xFFFF).astype(np.uint16).view('<i2'))
+        if 'weights_fp' in layer:
+            record['flags'] |= HAS_FLOAT
+            record['weights_fp_offset'] = place(np.asarray(layer['weights_fp'], dtype='<f4').reshape(weights.shape))
+            record['bias_fp_offset'] = place(np.asarray(layer['bias_fp'], dtype='<f4').reshape(-1))
+        for name in QUANT_FIELDS:
+            value = int(layer.get(name, QUANT_MISSING))
+            if name in layer and not QUANT_MISSING < value <= 127:
+                raise ValueError(f"{name} = {value} does not fit the parameter file's int8 field")
+            record[name] = value
+
+    metadata = {key: value for key, value in params.items()
+                if key != 'layers' and not key.startswith('layer')}
+    blob = json.dumps(metadata, separators=(',', ':')).encode()
+    header = np.zeros(1, dtype=HEADER)
+    header['magic'] = MAGIC
+    header['version'] = VERSION
+    header['num_layers'] = len(layers)
+    header['metadata_offset'] = offset
+    header['metadata_size'] = len(blob)
+
+    with open(path, 'wb') as f:
+        f.write(header.tobytes())
+        f.write(table.tobytes())
+        for start, array in sections:
+            f.seek(start)
+            f.write(array.tobytes())
+        f.seek(offset)
+        f.write(blob)
+    return offset + len(blob)
+
+def read_parameter_file(path):
+    """Memory-map a parameter file into a parameter dict
+
+    Weight and bias arrays are read-only views into the mapped file, so
+    loading costs no copies however large the model. Two-layer models
+    also get the layer1_weights/... keys of the original JSON format.
+    """
+    data = np.memmap(path, dtype=np.uint8, mode='r')
+    header = data[:HEADER.itemsize].view(HEADER)[0]
+    if bytes(header['magic']) != MAGIC:
+        raise ValueError(f"{path} is not a DNN parameter file")
+    if header['version'] > VERSION:
+        raise ValueError(f"{path} has format version {header['version']}, this reader supports {VERSION}")
+
+    num_layers = int(header['num_layers'])
+    table = data[HEADER.itemsize:HEADER.itemsize + LAYER.itemsize * num_layers].view(LAYER)
+
+    def view(offset, dtype, shape):
+        dtype = np.dtype(dtype)
+        count = int(np.prod(shape))
+        return data[offset:offset + count * dtype.itemsize].view(dtype).reshape(shape)
+
+    layers = []
+    for record in table:
+        shape = (int(record['fan_out']), int(record['fan_in']))
+        layer = {
+            'in_features': shape[1],
+            'out_features': shape[0],
+            'weights': view(int(record['weights_offset']), np.int8, shape),
+            'bias': view(int(record['bias_offset']), '<i2', (shape[0],)),
+            'relu': bool(record['flags'] & RELU),
+        }
+        if record['flags'] & HAS_FLOAT:
+            layer['weights_fp'] = view(int(record['weights_fp_offset']), '<f4', shape)
+            layer['bias_fp'] = view(int(record['bias_fp_offset']), '<f4', (shape[0],))
+        if header['version'] >= 2:
+            layer.update({name: int(record[name]) for name in QUANT_FIELDS if record[name] != QUANT_MISSING})
+        else:
+            layer.update({name: int(record[name]) for name in QUANT_FIELDS if record[name] >= 0})
+        layers.append(layer)
+
+    start = int(header['metadata_offset'])
+    params = json.loads(bytes(data[start:start + int(header['metadata_size'])]) or b'{}')
+    params['layers'] = layers
+    if num_layers == 2:
+        for l, layer in enumerate(layers, start=1):
+            params[f'layer{l}_weights'] = layer['weights']
+            params[f'layer{l}_bias'] = layer['bias']
+            if 'weights_fp' in layer:
+                params[f'layer{l}_weights_fp'] = layer['weights_fp']
+                params[f'layer{l}_bias_fp'] = layer['bias_fp']
+    return params
+
+def load_model_parameters(path='model_parameters.bin'):
+    """Load a binary or JSON parameter file as a parameter dict"""
+    with open(path, 'rb') as f:
+        binary = f.read(len(MAGIC)) == MAGIC
+    if binary:
+        return read_parameter_file(path)
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def main():
+    """Convert a parameter file to the binary format"""
+    parser = argparse.ArgumentParser(description="Convert model parameters to the binary format")
+    parser.add_argument('input', help="parameter file (JSON or binary)")
+    parser.add_argument('output', nargs='?', default='model_parameters.bin')
+    args = parser.parse_args()
+
+    params = load_model_parameters(args.input)
+    size = write_parameter_file(args.output, params)
+    print(f"{args.input} ({os.path.getsize(args.input)} bytes) -> {args.output} ({size} bytes)")
+
+if __name__ == "__main__":
+    main()
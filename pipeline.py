@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Incremental Pipeline Runner
+Runs the train, convert, simulate, verify and synth stages as a DAG, skipping
+stages whose inputs and code are unchanged and running independent ones in parallel
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+STATE_FILE = '.pipeline_state.json'
+LOG_DIR = 'pipeline_logs'
+
+CONFIGURABLE_RTL = ['mac_unit.v', 'requant_unit.v', 'dnn_param_memory.v', 'configurable_dnn_accelerator.v']
+SYNTH_RTL = ['mac_unit.v', 'requant_unit.v', 'dnn_accelerator.v', 'dnn_param_memory.v',
+             'configurable_dnn_accelerator.v', 'parallel_dnn_accelerator.v',
+             'streaming_dnn_accelerator.v', 'layer_pipelined_dnn_accelerator.v']
+
+# Each stage: the command, the stages it needs, the data files it reads,
+# the code it runs and the files it produces (glob patterns allowed).
+# A stage is up to date when the hash of its command, inputs and code is
+# the one recorded when its outputs were last produced, and the outputs
+# are still there, unmodified.
+STAGES = {
+    'train': {
+        'command': ['python3', 'train_software_dnn.py'],
+        'needs': [],
+        'inputs': [],
+        'code': ['train_software_dnn.py', 'quantization.py', 'param_file.py'],
+        'outputs': ['model_parameters.bin', 'test_vectors.npy', 'software_predictions.npy'],
+    },
+    'convert': {
+        'command': ['python3', 'convert_parameters.py'],
+        'needs': ['train'],
+        'inputs': ['model_parameters.bin', 'test_vectors.npy', 'software_predictions.npy'],
+        'code': ['convert_parameters.py', 'hardware_model.py', 'param_file.py'],
+        'outputs': ['hardware_parameters.v', 'hardware_parameters_*.hex', 'testbench_hardware_dnn.v'],
+    },
+    'simulate': {
+        'command': ['python3', 'test_consistency.py'],
+        'needs': ['train'],
+        'inputs': ['model_parameters.bin', 'test_vectors.npy'],
+        'code': ['test_consistency.py', 'hardware_model.py', 'param_file.py', 'dnn_driver.py',
+                 'dnn_monitor.py', 'sim_cache.py', 'verilator_backend.py', 'dnn_batch_sim.cpp',
+                 'Makefile'] + CONFIGURABLE_RTL,
+        'outputs': ['hardware_outputs.npy', 'consistency_test_results.json', 'hardware_performance.json'],
+    },
+    'verify': {
+        'command': ['python3', 'verify_consistency.py'],
+        'needs': ['train'],
+        'inputs': ['model_parameters.bin', 'test_vectors.npy'],
+        'code': ['verify_consistency.py', 'hardware_model.py', 'param_file.py'],
+        'outputs': ['consistency_verification_results.json'],
+    },
+    'synth': {
+        'command': ['python3', 'synth_sweep.py', '--sweep', 'NUM_MACS=1,2,3'],
+        'needs': [],
+        'inputs': [],
+        'code': ['synth_sweep.py', 'timing_report.py', 'netlist_sim.py'] + SYNTH_RTL,
+        'outputs': ['synth_sweep_results.json'],
+    },
+}
+
+class FileHasher:
+    """SHA-256 of files, reusing digests of files whose size and mtime are unchanged"""
+
+    def __init__(self, cache=None):
+        self.cache = cache if cache is not None else {}
+
+    def digest(self, path):
+        stat = os.stat(path)
+        stamp = [stat.st_size, stat.st_mtime_ns]
+        cached = self.cache.get(path)
+        if cached is not None and cached[:2] == stamp:
+            return cached[2]
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        self.cache[path] = stamp + [digest.hexdigest()]
+        return digest.hexdigest()
+
+def expand(patterns):
+    """Files matching patterns, in a stable order (missing plain names kept)"""
+    files = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern))
+        files.extend(matches if matches or glob.has_magic(pattern) else [pattern])
+    return files
+
+def fingerprint(name, hasher):
+    """Hash of a stage's command, input data and code"""
+    stage = STAGES[name]
+    digest = hashlib.sha256(json.dumps(stage['command']).encode())
+    for path in expand(stage['inputs']) + expand(stage['code']):
+        digest.update(path.encode())
+        digest.update(hasher.digest(path).encode() if os.path.exists(path) else b'missing')
+    return digest.hexdigest()
+
+def output_hashes(name, hasher):
+    """Digests of a stage's outputs (None if any is missing)"""
+    files = expand(STAGES[name]['outputs'])
+    if not files or not all(os.path.exists(path) for path in files):
+        return None
+    return {path: hasher.digest(path) for path in files}
+
+def up_to_date(name, state, hasher):
+    """True if the stage's last recorded run still matches its inputs and outputs"""
+    record = state['stages'].get(name)
+    if record is None or record['fingerprint'] != fingerprint(name, hasher):
+        return False
+    return output_hashes(name, hasher) == record['outputs']
+
+def load_state():
+    """Fingerprints of the last successful run of each stage"""
+    if not os.path.exists(STATE_FILE):
+        return {'stages': {}, 'files': {}}
+    with open(STATE_FILE, 'r') as f:
+        return json.load(f)
+
+def save_state(state):
+    """Write the state file atomically"""
+    with open(STATE_FILE + '.tmp', 'w') as f:
+        json.dump(state, f, indent=2)
+    os.replace(STATE_FILE + '.tmp', STATE_FILE)
+
+def with_dependencies(targets):
+    """targets plus every stage they need, in STAGES order"""
+    selected = set()
+    pending = list(targets)
+    while pending:
+        name = pending.pop()
+        if name not in selected:
+            selected.add(name)
+            pending.extend(STAGES[name]['needs'])
+    return [name for name in STAGES if name in selected]
+
+def run_command(name):
+    """Run one stage, logging its output; returns (exit code, seconds)"""
+    os.makedirs(LOG_DIR, exist_ok=True)
+    start = time.time()
+    with open(os.path.join(LOG_DIR, f"{name}.log"), 'w') as log:
+        result = subprocess.run(STAGES[name]['command'], stdout=log, stderr=subprocess.STDOUT)
+    return result.returncode, time.time() - start
+
+def run_pipeline(targets, force=(), jobs=None, dry_run=False):
+    """Run the stages needed for targets; returns {stage: status}
+
+    A stage starts as soon as every stage it needs has finished. It is
+    skipped if it and all of its upstream stages are up to date; a stage
+    whose upstream stage reran is checked again against the new outputs.
+    """
+    state = load_state()
+    hasher = FileHasher(state.setdefault('files', {}))
+    stages = with_dependencies(targets)
+    status = {}
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=jobs or len(stages)) as pool:
+        while len(status) < len(stages):
+            for name in stages:
+                if name in status or name in running.values():
+                    continue
+                if any(status.get(need) in ('failed', 'blocked') for need in STAGES[name]['needs']):
+                    status[name] = 'blocked'
+                    print(f"[{name}] blocked by a failed upstream stage")
+                    continue
+                if not all(status.get(need) in ('skipped', 'done') for need in STAGES[name]['needs']):
+                    continue
+                if name not in force and up_to_date(name, state, hasher):
+                    status[name] = 'skipped'
+                    print(f"[{name}] up to date")
+                elif dry_run:
+                    status[name] = 'done'
+                    print(f"[{name}] would run: {' '.join(STAGES[name]['command'])}")
+                else:
+                    print(f"[{name}] running: {' '.join(STAGES[name]['command'])}")
+                    running[pool.submit(run_command, name)] = name
+
+            if not running:
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                code, seconds = future.result()
+                if code != 0:
+                    status[name] = 'failed'
+                    print(f"[{name}] FAILED after {seconds:.1f} s, see {LOG_DIR}/{name}.log")
+                    state['stages'].pop(name, None)
+                    continue
+                outputs = output_hashes(name, hasher)
+                if outputs is None:
+                    status[name] = 'failed'
+                    print(f"[{name}] FAILED: missing outputs {', '.join(STAGES[name]['outputs'])}")
+                    continue
+                status[name] = 'done'
+                state['stages'][name] = {'fingerprint': fingerprint(name, hasher), 'outputs': outputs,
+                                         'seconds': round(seconds, 2), 'finished': time.time()}
+                print(f"[{name}] done in {seconds:.1f} s")
+
+    if not dry_run:
+        save_state(state)
+    return status
+
+def main():
+    """Run the pipeline incrementally"""
+    parser = argparse.ArgumentParser(description="Incremental, parallel DNN pipeline")
+    parser.add_argument('targets', nargs='*', default=list(STAGES),
+                        help=f"stages to bring up to date ({', '.join(STAGES)})")
+    parser.add_argument('--force', nargs='*', default=None, metavar='STAGE',
+                        help="rerun these stages even if up to date (no names: all)")
+    parser.add_argument('--jobs', type=int, default=None, help="stages run at once (default: all ready)")
+    parser.add_argument('--dry-run', action='store_true', help="show what would run")
+    args = parser.parse_args()
+
+    force = set(STAGES) if args.force == [] else set(args.force or [])
+    unknown = [name for name in set(args.targets) | force if name not in STAGES]
+    if unknown:
+        parser.error(f"unknown stage(s) {', '.join(unknown)}; choose from {', '.join(STAGES)}")
+
+    print("=== DNN Pipeline ===")
+    start = time.time()
+    status = run_pipeline(args.targets, force, args.jobs, args.dry_run)
+
+    print(f"\nPipeline finished in {time.time() - start:.1f} s")
+    for name, result in status.items():
+        print(f"  {name:<10} {result}")
+    if any(result in ('failed', 'blocked') for result in status.values()):
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
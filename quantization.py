@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Calibrated Quantization
+Per-layer power-of-two scales and minimum datapath widths chosen by running
+the float model and its integer emulation over calibration data
+"""
+
+import numpy as np
+
+# Exported integer formats
+WEIGHT_BITS = 8
+BIAS_BITS = 16
+
+# Accumulator registers of the accelerators
+ACC_BITS = 16
+
+# Largest accepted drop from the float model's accuracy
+ACCURACY_TOLERANCE = 0.01
+
+def float_forward(x, layers):
+    """Float forward pass of a (weights, bias, relu) layer stack"""
+    x = np.asarray(x, dtype=np.float64)
+    for weights, bias, relu in layers:
+        x = x @ np.asarray(weights, dtype=np.float64).T + np.asarray(bias, dtype=np.float64)
+        if relu:
+            x = np.maximum(x, 0)
+    return x
+
+def accuracy(logits, labels):
+    """Fraction of rows whose largest logit is the label"""
+    return float(np.mean(np.argmax(logits, axis=1) == np.asarray(labels)))
+
+def to_fixed(values, shift, bits):
+    """Round values * 2**shift to the nearest signed bits-wide integer (saturating)"""
+    limit = 1 << (bits - 1)
+    scaled = np.floor(np.asarray(values, dtype=np.float64) * 2.0 ** shift + 0.5)
+    return np.clip(scaled, -limit, limit - 1).astype(np.int64)
+
+def weight_shift(weights, bits=WEIGHT_BITS):
+    """Largest power-of-two scale that keeps every weight inside a signed bits-wide integer"""
+    max_abs = float(np.max(np.abs(weights)))
+    if max_abs == 0:
+        return 0
+    return int(np.floor(np.log2(((1 << (bits - 1)) - 1) / max_abs)))
+
+def requantize(acc, shift, relu, act_bits):
+    """Hidden activation: ReLU, rounding right shift by shift, clamp to act_bits unsigned"""
+    acc = np.asarray(acc, dtype=np.int64)
+    if relu:
+        acc = np.maximum(acc, 0)
+    if shift > 0:
+        acc = (acc + (1 << (shift - 1))) >> shift
+    return np.clip(acc, 0, (1 << act_bits) - 1)
+
+def signed_width(max_abs):
+    """Bits of a two's complement register holding -max_abs..max_abs"""
+    return int(max_abs).bit_length() + 1
+
+def quantize_layers(layers, x, act_bits=8, input_shift=0, acc_bits=ACC_BITS):
+    """Quantize a float layer stack with scales calibrated on inputs x
+
+    Inputs are integers scaled by 2**input_shift. Each layer gets the
+    largest weight scale that fits WEIGHT_BITS and keeps its calibrated
+    accumulators inside acc_bits; its bias is scaled to the accumulator
+    (input scale times weight scale). Hidden layers pick the
+    smallest right shift that fits the largest calibrated activation into
+    act_bits, which sets the input scale of the next layer.
+    """
+    x = np.asarray(x, dtype=np.int64)
+    in_shift = input_shift
+    quantized = []
+    for i, (weights, bias, relu) in enumerate(layers):
+        w_shift = weight_shift(weights)
+        while True:
+            q_weights = to_fixed(weights, w_shift, WEIGHT_BITS)
+            acc_shift = in_shift + w_shift
+            q_bias = to_fixed(bias, acc_shift, BIAS_BITS)
+            acc = x @ q_weights.T + q_bias
+            # Halve the scale until the accumulator register holds every sum
+            if not acc.size or signed_width(np.max(np.abs(acc))) <= acc_bits or not np.any(q_weights):
+                break
+            w_shift -= 1
+
+        layer = {
+            'weights': q_weights,
+            'bias': q_bias,
+            'relu': bool(relu),
+            'input_shift': in_shift,
+            'weight_shift': w_shift,
+            'bias_shift': acc_shift,
+            'max_abs_acc': int(np.max(np.abs(acc))) if acc.size else 0,
+        }
+        if i < len(layers) - 1:
+            peak = int(np.max(np.maximum(acc, 0) if relu else np.abs(acc))) if acc.size else 0
+            out_shift = max(0, (peak // ((1 << act_bits) - 1)).bit_length())
+            layer['output_shift'] = out_shift
+            x = requantize(acc, out_shift, relu, act_bits)
+            in_shift = acc_shift - out_shift
+        layer['acc_width'] = signed_width(layer['max_abs_acc'])
+        quantized.append(layer)
+    return quantized
+
+def integer_forward(x, quantized, act_bits=8):
+    """Integer emulation of a quantized layer stack; returns the last accumulators"""
+    x = np.asarray(x, dtype=np.int64)
+    for i, layer in enumerate(quantized):
+        acc = x @ layer['weights'].T + layer['bias']
+        if i < len(quantized) - 1:
+            x = requantize(acc, layer['output_shift'], layer['relu'], act_bits)
+    return acc
+
+def calibrate(layers, x, labels, tolerance=ACCURACY_TOLERANCE, max_act_bits=8):
+    """Pick per-layer shifts and the narrowest activation width within tolerance
+
+    Every activation width from max_act_bits down to 1 is quantized and
+    scored on the calibration set; the narrowest one that, like every wider
+    width, stays at most tolerance below the float model's accuracy wins
+    (max_act_bits if none does).
+    Accumulator widths are the smallest that never overflow on the
+    calibration set at that activation width.
+    """
+    float_accuracy = accuracy(float_forward(x, layers), labels)
+
+    sweep = []
+    chosen = None
+    for act_bits in range(max_act_bits, 0, -1):
+        quantized = quantize_layers(layers, x, act_bits)
+        score = accuracy(integer_forward(x, quantized, act_bits), labels)
+        sweep.append({'activation_width': act_bits, 'accuracy': score})
+        if score < float_accuracy - tolerance:
+            break
+        chosen = (act_bits, quantized, score)
+    within_tolerance = chosen is not None
+    if chosen is None:
+        quantized = quantize_layers(layers, x, max_act_bits)
+        chosen = (max_act_bits, quantized, sweep[0]['accuracy'])
+
+    act_bits, quantized, score = chosen
+    return {
+        'calibration_samples': int(len(x)),
+        'float_accuracy': float_accuracy,
+        'quantized_accuracy': score,
+        'accuracy_tolerance': tolerance,
+        'within_tolerance': within_tolerance,
+        'activation_width': act_bits,
+        'accumulator_widths': [layer['acc_width'] for layer in quantized],
+        'sweep': sweep,
+        'layers': quantized,
+    }
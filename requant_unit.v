@@ -0,0 +1,54 @@
+// Requantization Unit
+// Turns a layer accumulator into the activation fed to the next layer
+// Function: Q = clamp(round((ACC * MULTIPLIER) >> SHIFT)), with optional ReLU
+//
+// ACC is read as two's complement (ACC_SIGNED = 1) or unsigned, MULTIPLIER
+// as unsigned. With relu negative products become 0; with round the shift
+// rounds half up instead of truncating. The shifted value is clamped to the
+// unsigned (OUT_SIGNED = 0) or two's complement range of Q. Purely
+// combinational; every step is exact, so hardware_model.requant_unit
+// mirrors it bit for bit.
+
+module requant_unit #(
+    parameter ACC_W = 16,         // Width of ACC
+    parameter MULT_W = 8,         // Width of MULTIPLIER
+    parameter SHIFT_W = 5,        // Width of SHIFT
+    parameter OUT_W = 8,          // Width of Q
+    parameter ACC_SIGNED = 1,     // 1 = ACC is two's complement
+    parameter OUT_SIGNED = 0      // 1 = clamp Q to the two's complement range
+) (
+    input [ACC_W-1:0] acc,        // Accumulator
+    input [MULT_W-1:0] multiplier,// Scale multiplier (1 = shift only)
+    input [SHIFT_W-1:0] shift,    // Right shift after the multiply
+    input round,                  // 1 = round half up, 0 = truncate
+    input relu,                   // 1 = negative values become 0
+    output [OUT_W-1:0] q          // Requantized activation
+);
+
+    // Exact product width, and room for the largest rounding constant
+    localparam PROD_W = ACC_W + MULT_W + 2;
+    localparam MAX_SHIFT = (1 << SHIFT_W) - 1;
+    localparam RND_W = (PROD_W > MAX_SHIFT ? PROD_W : MAX_SHIFT) + 2;
+
+    wire signed [ACC_W:0] acc_ext = {ACC_SIGNED ? acc[ACC_W-1] : 1'b0, acc};
+    wire signed [MULT_W:0] mult_ext = {1'b0, multiplier};
+
+    // Scale and rectify
+    wire signed [PROD_W-1:0] scaled = acc_ext * mult_ext;
+    wire signed [RND_W-1:0] rectified = (relu && scaled < 0) ? $signed({RND_W{1'b0}}) : scaled;
+
+    // Rounding right shift
+    wire signed [RND_W-1:0] half = (round && shift != 0) ? ({{(RND_W-1){1'b0}}, 1'b1} << (shift - 1'b1))
+                                                         : {RND_W{1'b0}};
+    wire signed [RND_W-1:0] rounded = rectified + half;
+    wire signed [RND_W-1:0] shifted = rounded >>> shift;
+
+    // Clamp to the range of Q
+    wire signed [RND_W-1:0] q_max = OUT_SIGNED ? $signed({{(RND_W-OUT_W+1){1'b0}}, {(OUT_W-1){1'b1}}})
+                                               : $signed({{(RND_W-OUT_W){1'b0}}, {OUT_W{1'b1}}});
+    wire signed [RND_W-1:0] q_min = OUT_SIGNED ? $signed({{(RND_W-OUT_W+1){1'b1}}, {(OUT_W-1){1'b0}}})
+                                               : {RND_W{1'b0}};
+    assign q = (shifted > q_max) ? q_max[OUT_W-1:0] :
+               (shifted < q_min) ? q_min[OUT_W-1:0] : shifted[OUT_W-1:0];
+
+endmodule
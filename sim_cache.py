@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Simulator Build Cache
+Content-addressed cache of Verilator build directories, keyed by the HDL
+sources, toplevel, simulator flags and tool versions
+"""
+
+import argparse
+import hashlib
+import os
+import shutil
+import subprocess
+import time
+
+# Cache lives next to this script so symlinked work directories share it
+CACHE_DIR = os.environ.get(
+    'SIM_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.realpath(__file__)), '.sim_cache'))
+
+# Total cache size before least recently used builds are evicted
+MAX_CACHE_MB = int(os.environ.get('SIM_CACHE_MAX_MB', '2048'))
+
+LAST_USED_FILE = '.last_used'
+
+def tool_version(command):
+    """Version string of an external tool ('unavailable' if not installed)"""
+    try:
+        result = subprocess.run(command, capture_output=True, text=True)
+        return result.stdout.strip() or result.stderr.strip()
+    except OSError:
+        return 'unavailable'
+
+def build_key(sources, toplevel, sim='verilator', flags=''):
+    """Hash identifying one simulator build"""
+    digest = hashlib.sha256()
+    for source in sources:
+        digest.update(os.path.basename(source).encode())
+        with open(source, 'rb') as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    digest.update(f"toplevel={toplevel}\n".encode())
+    digest.update(f"sim={sim}\n".encode())
+    digest.update(f"flags={' '.join(flags.split())}\n".encode())
+    digest.update(tool_version([sim, '--version']).encode())
+    # cocotb's verilator.cpp harness is compiled into every build
+    digest.update(tool_version(['cocotb-config', '--version']).encode())
+    return digest.hexdigest()[:16]
+
+def directory_size(path):
+    """Total size in bytes of the files below path"""
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            file_path = os.path.join(root, name)
+            if not os.path.islink(file_path):
+                total += os.path.getsize(file_path)
+    return total
+
+def last_used(entry):
+    """Time a cache entry was last resolved"""
+    stamp = os.path.join(entry, LAST_USED_FILE)
+    if os.path.exists(stamp):
+        return os.path.getmtime(stamp)
+    return os.path.getmtime(entry)
+
+def evict(max_bytes, keep=None, cache_dir=CACHE_DIR):
+    """Remove least recently used builds until the cache fits in max_bytes"""
+    if not os.path.isdir(cache_dir):
+        return []
+
+    entries = [os.path.join(cache_dir, name) for name in os.listdir(cache_dir)]
+    entries = [entry for entry in entries if os.path.isdir(entry)]
+    sizes = {entry: directory_size(entry) for entry in entries}
+    total = sum(sizes.values())
+
+    evicted = []
+    for entry in sorted(entries, key=last_used):
+        if total <= max_bytes:
+            break
+        if keep is not None and os.path.abspath(entry) == os.path.abspath(keep):
+            continue
+        shutil.rmtree(entry, ignore_errors=True)
+        total -= sizes[entry]
+        evicted.append(entry)
+    return evicted
+
+def resolve_build_dir(sources, toplevel, sim='verilator', flags='', cache_dir=CACHE_DIR):
+    """Build directory for this configuration, marking it most recently used
+
+    The directory is not created here; cocotb creates it on first build.
+    On a cache hit the build products are re-stamped so make does not
+    rebuild them just because a source file's timestamp moved (the key
+    already proves the contents are unchanged).
+    """
+    entry = os.path.join(cache_dir, f"{toplevel}-{build_key(sources, toplevel, sim, flags)}")
+
+    if os.path.isdir(entry):
+        now = time.time()
+        for product in ('Vtop.mk', 'Vtop'):
+            path = os.path.join(entry, product)
+            if os.path.exists(path):
+                os.utime(path, (now, now))
+        with open(os.path.join(entry, LAST_USED_FILE), 'w') as f:
+            f.write(f"{now}\n")
+
+    evict(MAX_CACHE_MB * 1024 * 1024, keep=entry, cache_dir=cache_dir)
+    return entry
+
+def main():
+    """Print the cached build directory for a simulator configuration"""
+    parser = argparse.ArgumentParser(description="Content-addressed simulator build cache")
+    parser.add_argument('sources', nargs='*', help="HDL source files")
+    parser.add_argument('--toplevel', default='')
+    parser.add_argument('--sim', default='verilator')
+    parser.add_argument('--flags', default='', help="extra simulator compile flags")
+    parser.add_argument('--list', action='store_true', help="list cached builds")
+    parser.add_argument('--clear', action='store_true', help="remove every cached build")
+    args = parser.parse_args()
+
+    if args.clear:
+        shutil.rmtree(CACHE_DIR, ignore_errors=True)
+        print(f"Removed {CACHE_DIR}")
+        return
+
+    if args.list:
+        if not os.path.isdir(CACHE_DIR):
+            return
+        for name in sorted(os.listdir(CACHE_DIR)):
+            entry = os.path.join(CACHE_DIR, name)
+            age = time.time() - last_used(entry)
+            print(f"{name}  {directory_size(entry) / 1e6:8.1f} MB  last used {age / 60:.0f} min ago")
+        return
+
+    print(resolve_build_dir(args.sources, args.toplevel, args.sim, args.flags))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+// Streaming DNN Accelerator
+// configurable_dnn_accelerator datapath behind valid/ready stream interfaces
+// Layer 1: 4 inputs -> 3 hidden neurons
+// Layer 2: 3 hidden neurons -> 2 outputs
+// Layer 2 reads the hidden activations: requant_unit turns each finished
+// layer 1 accumulator into an 8-bit value (the requant word loaded with the
+// parameters, so it follows each model).
+// mac_unit reads weights and biases as two's complement (MAC_SIGNED) at
+// MAC_WEIGHT_W / MAC_ACC_W bits; mac_sizing.py picks the narrowest exact
+// widths for a model. The defaults take any int8 weight and int16 bias.
+// Input vectors are queued in a small FIFO, so the next vector is accepted
+// while the current one computes and inferences run back to back. Results
+// are held in an output register until the consumer takes them.
+// Parameters load as in configurable_dnn_accelerator (see dnn_param_memory.v)
+//
+// With MAC_MUL_STAGE / MAC_ACC_STAGE the mac_unit is pipelined: every MAC
+// step then waits MAC_MUL_STAGE + MAC_ACC_STAGE extra cycles for its result.
+
+module streaming_dnn_accelerator #(
+    parameter FIFO_DEPTH = 2,     // Queued input vectors (power of two)
+    parameter MAC_SIGNED = 1,     // 1 = two's complement weights and biases
+    parameter MAC_WEIGHT_W = 8,   // mac_unit weight width (up to 8)
+    parameter MAC_ACC_W = 16,     // mac_unit accumulator width (up to 16)
+    parameter MAC_MUL_STAGE = 0,  // mac_unit register stage after the multiply
+    parameter MAC_ACC_STAGE = 0   // mac_unit register stage after the accumulate
+) (
+    input clk,                    // Clock signal
+    input rst_n,                  // Reset signal (active low)
+    input load_params,            // Load parameters signal
+    input param_burst,            // Load mode: 0 = bytes, 1 = 16-bit burst
+    input [15:0] param_data,      // Parameter data input (bytes use [7:0])
+    input [3:0] param_addr,       // Parameter address (unused, loads auto-increment)
+    input param_valid,            // Parameter data valid
+    output reg params_loaded,     // Parameters loaded signal
+    // Input stream: one vector per transfer, input i in in_data[8*i +: 8]
+    input in_valid,               // Input vector valid
+    output in_ready,              // Input FIFO has room
+    input [31:0] in_data,         // Input vector
+    // Output stream
+    output reg out_valid,         // Output vector valid
+    input out_ready,              // Consumer takes the output vector
+    output reg [15:0] out_data_0, // Output data 0
+    output reg [15:0] out_data_1  // Output data 1
+);
+
+    localparam PTR_BITS = (FIFO_DEPTH > 1) ? $clog2(FIFO_DEPTH) : 1;
+
+    // Parameter memory read ports
+    wire [12*8-1:0] weights_layer1;   // Layer 1 weights (4 inputs × 3 neurons)
+    wire [6*8-1:0] weights_layer2;    // Layer 2 weights (3 neurons × 2 outputs)
+    wire [3*16-1:0] bias_layer1;      // Layer 1 biases (3 neurons)
+    wire [2*16-1:0] bias_layer2;      // Layer 2 biases (2 outputs)
+    wire [7:0] requant_mult;          // Hidden requantization (loaded with the parameters)
+    wire [4:0] requant_shift;
+    wire requant_round;
+    wire requant_relu;
+    wire load_done;                   // Last parameter beat being written
+
+    // Input FIFO
+    reg [31:0] fifo [0:FIFO_DEPTH-1];
+    reg [PTR_BITS-1:0] wr_ptr;
+    reg [PTR_BITS-1:0] rd_ptr;
+    reg [PTR_BITS:0] count;
+
+    reg [31:0] vector;                // Vector being computed
+    reg [7:0] hidden_layer [0:2];     // Hidden layer activations (requantized)
+    reg [15:0] result_0;              // Layer 2 results not yet in the output register
+    reg [15:0] result_1;
+    reg [15:0] mac_result;            // MAC computation result
+
+    // Control signals
+    reg [2:0] state;                  // State machine
+    reg [1:0] neuron_idx;             // Current neuron index
+    reg [1:0] input_idx;              // Current input index
+
+    // Pipelined mac_unit: cycles to wait for mac_out after the operands change
+    localparam MAC_LATENCY = MAC_MUL_STAGE + MAC_ACC_STAGE;
+    reg [1:0] mac_wait;
+    wire mac_ready = (MAC_LATENCY == 0) || (mac_wait == MAC_LATENCY);
+
+    // State machine states
+    localparam IDLE = 3'b000;
+    localparam LOAD_PARAMS = 3'b001;
+    localparam LAYER1_COMPUTE = 3'b010;
+    localparam LAYER2_COMPUTE = 3'b011;
+    localparam OUTPUT_WAIT = 3'b100;  // Results ready, output register still full
+
+    // Stream handshakes
+    wire push = in_valid && in_ready;
+    wire out_free = !out_valid || out_ready;
+    wire last_mac = (state == LAYER2_COMPUTE) && (input_idx == 2) && (neuron_idx == 1) && mac_ready;
+    wire retire = (last_mac || state == OUTPUT_WAIT) && out_free;
+    wire idle_launch = (state == IDLE) && !load_params && params_loaded;
+    wire pop = (count != 0) && (idle_launch || retire);
+
+    assign in_ready = (count != FIFO_DEPTH);
+
+    dnn_param_memory param_mem (
+        .clk(clk),
+        .rst_n(rst_n),
+        .load_start(state == IDLE && load_params),
+        .bank_swap(1'b0),
+        .param_burst(param_burst),
+        .param_write(state == LOAD_PARAMS && param_valid),
+        .param_data(param_data),
+        .load_done(load_done),
+        .weights_layer1_flat(weights_layer1),
+        .weights_layer2_flat(weights_layer2),
+        .bias_layer1_flat(bias_layer1),
+        .bias_layer2_flat(bias_layer2),
+        .requant_mult(requant_mult),
+        .requant_shift(requant_shift),
+        .requant_round(requant_round),
+        .requant_relu(requant_relu)
+    );
+
+    // MAC unit instantiation
+    wire [7:0] current_input;
+    wire [7:0] current_weight;
+    wire [15:0] mac_out;
+
+    // Multiplexer for input data: network inputs, then hidden activations
+    assign current_input = (state == LAYER1_COMPUTE) ? vector[input_idx * 8 +: 8] : hidden_layer[input_idx];
+
+    // Multiplexer for weights
+    assign current_weight = (state == LAYER1_COMPUTE) ?
+                           weights_layer1[(neuron_idx * 4 + input_idx) * 8 +: 8] :
+                           weights_layer2[(neuron_idx * 3 + input_idx) * 8 +: 8];
+
+    // C extended back to the 16-bit accumulator registers
+    wire [MAC_ACC_W-1:0] mac_c;
+    wire signed [15:0] mac_c_signed = $signed(mac_c);
+    wire [15:0] mac_c_unsigned = mac_c;
+    assign mac_out = MAC_SIGNED ? mac_c_signed : mac_c_unsigned;
+
+    mac_unit #(.WEIGHT_W(MAC_WEIGHT_W), .ACC_W(MAC_ACC_W), .SIGNED(MAC_SIGNED),
+               .MUL_STAGE(MAC_MUL_STAGE), .ACC_STAGE(MAC_ACC_STAGE)) mac_inst (
+        .clk(clk),
+        .A(current_input),
+        .W(current_weight[MAC_WEIGHT_W-1:0]),
+        .B(mac_result[MAC_ACC_W-1:0]),
+        .C(mac_c)
+    );
+
+    // Requantize each finished hidden neuron to the 8-bit layer 2 input
+    wire [7:0] hidden_act;
+
+    requant_unit #(.ACC_SIGNED(MAC_SIGNED)) requant_inst (
+        .acc(mac_out),
+        .multiplier(requant_mult),
+        .shift(requant_shift),
+        .round(requant_round),
+        .relu(requant_relu),
+        .q(hidden_act)
+    );
+
+    // Input FIFO
+    always @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            wr_ptr <= 0;
+            rd_ptr <= 0;
+            count <= 0;
+        end else begin
+            if (push) begin
+                fifo[wr_ptr] <= in_data;
+                wr_ptr <= wr_ptr + 1;
+            end
+            if (pop) begin
+                rd_ptr <= rd_ptr + 1;
+            end
+            count <= count + push - pop;
+        end
+    end
+
+    // Parameter loading and computation control
+    always @(posedge clk or negedge rst_n) begin
+        if (!rst_n) begin
+            // Initialize control signals
+            state <= IDLE;
+            neuron_idx <= 0;
+            input_idx <= 0;
+            mac_result <= 0;
+            mac_wait <= 0;
+            out_valid <= 0;
+            params_loaded <= 0;
+        end else begin
+            // The consumer took the output and nothing replaces it
+            if (out_valid && out_ready && !retire) begin
+                out_valid <= 0;
+            end
+
+            // Count the wait for each MAC step's result
+            if (mac_ready) begin
+                mac_wait <= 0;
+            end else if (state == LAYER1_COMPUTE || state == LAYER2_COMPUTE) begin
+                mac_wait <= mac_wait + 1;
+            end
+
+            // Next vector: straight from the FIFO into layer 1
+            if (pop) begin
+                vector <= fifo[rd_ptr];
+                state <= LAYER1_COMPUTE;
+                neuron_idx <= 0;
+                input_idx <= 0;
+                mac_result <= bias_layer1[15:0];
+            end
+
+            case (state)
+                IDLE: begin
+                    if (load_params) begin
+                        state <= LOAD_PARAMS;
+                        params_loaded <= 0;
+                    end
+                end
+
+                LOAD_PARAMS: begin
+                    // Beats are written by param_mem; finish on the last one
+                    if (param_valid && load_done) begin
+                        state <= IDLE;
+                        params_loaded <= 1;
+                    end
+                end
+
+                LAYER1_COMPUTE: begin
+                    if (!mac_ready) begin
+                        // mac_out not valid yet
+                    end else if (input_idx < 3) begin
+                        mac_result <= mac_out;
+                        input_idx <= input_idx + 1;
+                    end else begin
+                        // Store hidden layer activation
+                        hidden_layer[neuron_idx] <= hidden_act;
+                        input_idx <= 0;
+
+                        if (neuron_idx < 2) begin
+                            neuron_idx <= neuron_idx + 1;
+                            mac_result <= bias_layer1[(neuron_idx + 1) * 16 +: 16];
+                        end else begin
+                            // Layer 1 complete, move to layer 2
+                            state <= LAYER2_COMPUTE;
+                            neuron_idx <= 0;
+                            input_idx <= 0;
+                            mac_result <= bias_layer2[15:0];
+                        end
+                    end
+                end
+
+                LAYER2_COMPUTE: begin
+                    if (!mac_ready) begin
+                        // mac_out not valid yet
+                    end else if (input_idx < 2) begin
+                        mac_result <= mac_out;
+                        input_idx <= input_idx + 1;
+                    end else if (neuron_idx < 1) begin
+                        result_0 <= mac_out;
+                        input_idx <= 0;
+                        neuron_idx <= neuron_idx + 1;
+                        mac_result <= bias_layer2[(neuron_idx + 1) * 16 +: 16];
+                    end else begin
+                        // Computation complete: hand over the results, or
+                        // hold them while the output register is full
+                        result_1 <= mac_out;
+                        if (retire) begin
+                            out_data_0 <= result_0;
+                            out_data_1 <= mac_out;
+                            out_valid <= 1;
+                            if (!pop) state <= IDLE;
+                        end else begin
+                            state <= OUTPUT_WAIT;
+                        end
+                    end
+                end
+
+                OUTPUT_WAIT: begin
+                    if (retire) begin
+                        out_data_0 <= result_0;
+                        out_data_1 <= result_1;
+                        out_valid <= 1;
+                        if (!pop) state <= IDLE;
+                    end
+                end
+
+                default: state <= IDLE;
+            endcase
+        end
+    end
+
+endmodule
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Parallel MAC Array Synthesis Sweep
+Synthesizes parallel_dnn_accelerator for each NUM_MACS and reports cell counts
+next to the cycles per inference of the FSM model
+"""
+
+import argparse
+import json
+import numpy as np
+
+from fsm_model import AcceleratorFSM, summarize
+from hardware_model import DNN_ACCELERATOR_PARAMS, hardware_parameters
+from synth_sweep import run_sweep
+
+TOPLEVEL = 'parallel_dnn_accelerator'
+
+def cycles_per_inference(num_macs):
+    """Compute latency and back-to-back cycles per inference from the FSM model"""
+    model = AcceleratorFSM('parallel', hardware_parameters(DNN_ACCELERATOR_PARAMS), num_macs=num_macs)
+    result = model.run(np.zeros((16, 4), dtype=np.int64))
+    return summarize(result)
+
+def main():
+    """Sweep NUM_MACS and save the area/cycle trade-off"""
+    parser = argparse.ArgumentParser(description="Synthesize parallel_dnn_accelerator for each NUM_MACS")
+    parser.add_argument('--num-macs', type=int, nargs='+', default=[1, 2, 3])
+    parser.add_argument('--jobs', type=int, default=None, help="parallel Yosys processes (default: CPUs)")
+    parser.add_argument('--output', default='parallel_synth_results.json')
+    args = parser.parse_args()
+
+    print("=== Parallel MAC Array Synthesis Sweep ===")
+
+    print(f"Synthesizing NUM_MACS={', '.join(map(str, args.num_macs))}...")
+    areas = run_sweep([(TOPLEVEL, {'NUM_MACS': num_macs}) for num_macs in args.num_macs], args.jobs)
+
+    results = []
+    for num_macs, area in zip(args.num_macs, areas):
+        timing = cycles_per_inference(num_macs)
+        results.append({
+            'num_macs': num_macs,
+            'latency_cycles': timing['mean_latency_cycles'],
+            'cycles_per_inference': timing['mean_cycles_per_inference'],
+            'cells': area['cells'],
+            'flip_flops': area['flip_flops'],
+            'logic_depth': area['logic_depth'],
+            'cell_types': area['cell_types'],
+        })
+
+    print(f"\n{'NUM_MACS':>8} {'latency':>8} {'cycles/inf':>10} {'cells':>8} {'flip-flops':>10} {'depth':>6}")
+    for row in results:
+        print(f"{row['num_macs']:>8} {row['latency_cycles']:>8.0f} {row['cycles_per_inference']:>10.0f} "
+              f"{row['cells']:>8} {row['flip_flops']:>10} {row['logic_depth']:>6}")
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults saved to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Yosys Synthesis Sweep
+Synthesizes design and parameter variants headless across a process pool,
+parses cell counts, logic depth and the estimated critical path into JSON
+and caches results by source hash
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from timing_report import DELAY_TABLE, report as timing_report
+
+YOSYS = os.environ.get('YOSYS', 'yosys')
+
+# Results live next to this script so every work directory shares them
+CACHE_DIR = os.environ.get(
+    'SYNTH_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.realpath(__file__)), '.synth_cache'))
+
+# Designs the sweep knows about: toplevel -> sources and sweepable parameters
+DESIGNS = {
+    'mac_unit': {
+        'sources': ['mac_unit.v'],
+        'parameters': ['DATA_W', 'WEIGHT_W', 'ACC_W', 'SIGNED', 'DATA_SIGNED', 'SATURATE',
+                       'MUL_STAGE', 'ACC_STAGE'],
+    },
+    'requant_unit': {
+        'sources': ['requant_unit.v'],
+        'parameters': ['ACC_W', 'MULT_W', 'SHIFT_W', 'OUT_W', 'ACC_SIGNED', 'OUT_SIGNED'],
+    },
+    'dnn_accelerator': {
+        'sources': ['mac_unit.v', 'requant_unit.v', 'dnn_accelerator.v'],
+        'parameters': ['MAC_MUL_STAGE', 'MAC_ACC_STAGE', 'REQUANT_MULT', 'REQUANT_SHIFT',
+                       'MAC_SIGNED', 'MAC_WEIGHT_W', 'MAC_ACC_W'],
+    },
+    'configurable_dnn_accelerator': {
+        'sources': ['mac_unit.v', 'requant_unit.v', 'dnn_param_memory.v', 'configurable_dnn_accelerator.v'],
+        'parameters': ['SHADOW_PARAMS', 'MAC_MUL_STAGE', 'MAC_ACC_STAGE', 'MAC_SIGNED', 'MAC_WEIGHT_W', 'MAC_ACC_W'],
+    },
+    'parallel_dnn_accelerator': {
+        'sources': ['mac_unit.v', 'requant_unit.v', 'dnn_param_memory.v', 'parallel_dnn_accelerator.v'],
+        'parameters': ['NUM_MACS', 'MAC_MUL_STAGE', 'MAC_ACC_STAGE', 'MAC_SIGNED', 'MAC_WEIGHT_W', 'MAC_ACC_W'],
+    },
+    'streaming_dnn_accelerator': {
+        'sources': ['mac_unit.v', 'requant_unit.v', 'dnn_param_memory.v', 'streaming_dnn_accelerator.v'],
+        'parameters': ['FIFO_DEPTH', 'MAC_MUL_STAGE', 'MAC_ACC_STAGE', 'MAC_SIGNED', 'MAC_WEIGHT_W', 'MAC_ACC_W'],
+    },
+    'layer_pipelined_dnn_accelerator': {
+        'sources': ['mac_unit.v', 'requant_unit.v', 'dnn_param_memory.v', 'layer_pipelined_dnn_accelerator.v'],
+        'parameters': ['FIFO_DEPTH', 'LAYER1_MACS', 'MAC_MUL_STAGE', 'MAC_ACC_STAGE',
+                       'MAC_SIGNED', 'MAC_WEIGHT_W', 'MAC_ACC_W'],
+    },
+    'generated_dnn_accelerator': {
+        'sources': ['mac_unit.v', 'requant_unit.v', 'generated_dnn_accelerator.v'],
+        'parameters': [],
+    },
+}
+
+# Flattened generic-gate flow; the JSON netlist feeds timing_report.py
+SCRIPT = [
+    "read_verilog {sources}",
+    "{chparams}",
+    "synth -flatten -top {top}",
+    "abc",
+    "opt_clean",
+    "tee -q -o stat.json stat -json",
+    "tee -q -o ltp.txt ltp -noff",
+    "write_json netlist.json",
+]
+
+LTP_PATTERN = re.compile(r"Longest topological path in \S+ \(length=(\d+)\)")
+
+def yosys_version():
+    """Version string of the Yosys binary ('unavailable' if not installed)"""
+    try:
+        return subprocess.run([YOSYS, '-V'], capture_output=True, text=True).stdout.strip()
+    except OSError:
+        return 'unavailable'
+
+def variant_name(top, params):
+    """Readable variant name, e.g. parallel_dnn_accelerator[NUM_MACS=2]"""
+    if not params:
+        return top
+    return f"{top}[{','.join(f'{k}={v}' for k, v in sorted(params.items()))}]"
+
+def cache_key(top, params, version):
+    """Hash of the sources, parameters, flow and Yosys version of one variant"""
+    digest = hashlib.sha256()
+    for source in DESIGNS[top]['sources']:
+        digest.update(source.encode())
+        with open(source, 'rb') as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    digest.update(f"top={top}\n".encode())
+    digest.update(json.dumps(sorted(params.items())).encode())
+    digest.update('\n'.join(SCRIPT).encode())
+    digest.update(json.dumps(sorted(DELAY_TABLE.items())).encode())
+    digest.update(version.encode())
+    return digest.hexdigest()[:16]
+
+def parse_results(top, stat_file, ltp_file):
+    """Cell counts from `stat -json` and logic depth from `ltp -noff`"""
+    with open(stat_file, 'r') as f:
+        stat = json.load(f)
+    module = stat['modules'][f"\\{top}"]
+    cell_types = {name: count for name, count in module['num_cells_by_type'].items()
+                  if name != '$scopeinfo'}
+
+    with open(ltp_file, 'r') as f:
+        match = LTP_PATTERN.search(f.read())
+
+    return {
+        'cells': sum(cell_types.values()),
+        'flip_flops': sum(count for name, count in cell_types.items() if 'DFF' in name),
+        'logic_depth': int(match.group(1)) if match else None,
+        'wire_bits': module['num_wire_bits'],
+        'cell_types': cell_types,
+    }
+
+def synthesize(top, params, version):
+    """Synthesize one variant in a scratch directory and return its results
+
+    Sources are copied into the scratch directory so parallel runs never
+    share output files (and sandboxed Yosys builds can read them).
+    """
+    with tempfile.TemporaryDirectory(prefix='synth_') as work:
+        for source in DESIGNS[top]['sources']:
+            shutil.copy(source, work)
+        chparams = ' '.join(f"-set {name} {value}" for name, value in sorted(params.items()))
+        script = '; '.join(SCRIPT).format(
+            sources=' '.join(DESIGNS[top]['sources']),
+            chparams=f"chparam {chparams} {top}" if params else '',
+            top=top)
+
+        start = time.time()
+        result = subprocess.run([YOSYS, '-q', '-p', script], cwd=work, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"Yosys failed for {variant_name(top, params)}:\n{result.stderr}")
+
+        results = parse_results(top, os.path.join(work, 'stat.json'), os.path.join(work, 'ltp.txt'))
+        timing = timing_report(os.path.join(work, 'netlist.json'), top, top_k=1, delay_model='table')
+        path = timing['paths'][0] if timing['paths'] else None
+        results['critical_path_delay'] = timing['critical_path_delay']
+        results['critical_path'] = f"{path['startpoint']} -> {path['endpoint']}" if path else None
+
+    return {
+        'design': top,
+        'parameters': params,
+        **results,
+        'yosys': version,
+        'synth_seconds': round(time.time() - start, 2),
+    }
+
+def cached_synthesize(task):
+    """Synthesize a (top, params, version) task unless its results are cached"""
+    top, params, version = task
+    entry = os.path.join(CACHE_DIR, f"{top}-{cache_key(top, params, version)}.json")
+    if os.path.exists(entry):
+        with open(entry, 'r') as f:
+            return {**json.load(f), 'cached': True}
+
+    result = synthesize(top, params, version)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(entry + '.tmp', 'w') as f:
+        json.dump(result, f, indent=2)
+    os.replace(entry + '.tmp', entry)
+    return {**result, 'cached': False}
+
+def expand_variants(designs, sweeps):
+    """(top, params) pairs for every design and combination of swept values
+
+    A swept parameter only applies to the designs that declare it.
+    """
+    variants = []
+    for top in designs:
+        if top not in DESIGNS:
+            raise ValueError(f"Unknown design {top}; choose from {', '.join(DESIGNS)}")
+        names = [name for name in sweeps if name in DESIGNS[top]['parameters']]
+        for values in itertools.product(*(sweeps[name] for name in names)):
+            variants.append((top, dict(zip(names, values))))
+    return variants
+
+def run_sweep(variants, jobs=None):
+    """Synthesize (top, params) variants across a process pool, in order"""
+    version = yosys_version()
+    tasks = [(top, params, version) for top, params in variants]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(cached_synthesize, tasks))
+
+def parse_sweep(specs):
+    """{'NUM_MACS': [1, 2, 3]} from ['NUM_MACS=1,2,3']"""
+    sweeps = {}
+    for spec in specs:
+        name, _, values = spec.partition('=')
+        if not values:
+            raise ValueError(f"Expected PARAM=v1,v2,... but got {spec}")
+        sweeps[name] = [int(value) for value in values.split(',')]
+    return sweeps
+
+def main():
+    """Run a synthesis sweep and save the parsed results"""
+    parser = argparse.ArgumentParser(description="Parallel, cached Yosys synthesis sweep")
+    parser.add_argument('designs', nargs='*', default=['mac_unit', 'dnn_accelerator',
+                                                       'configurable_dnn_accelerator',
+                                                       'parallel_dnn_accelerator',
+                                                       'streaming_dnn_accelerator',
+                                                       'layer_pipelined_dnn_accelerator'],
+                        help=f"toplevels to synthesize ({', '.join(DESIGNS)})")
+    parser.add_argument('--sweep', action='append', default=[], metavar='PARAM=v1,v2',
+                        help="parameter values to sweep, e.g. NUM_MACS=1,2,3 (repeatable)")
+    parser.add_argument('--jobs', type=int, default=None, help="parallel Yosys processes (default: CPUs)")
+    parser.add_argument('--output', default='synth_sweep_results.json')
+    args = parser.parse_args()
+
+    print("=== Yosys Synthesis Sweep ===")
+
+    variants = expand_variants(args.designs, parse_sweep(args.sweep))
+    print(f"Synthesizing {len(variants)} variants...")
+    start = time.time()
+    results = run_sweep(variants, args.jobs)
+
+    print(f"\n{'variant':<44} {'cells':>7} {'flip-flops':>10} {'depth':>6} {'delay':>6} {'':>7}")
+    for row in results:
+        depth = row['logic_depth'] if row['logic_depth'] is not None else '-'
+        print(f"{variant_name(row['design'], row['parameters']):<44} {row['cells']:>7} "
+              f"{row['flip_flops']:>10} {depth:>6} {row['critical_path_delay']:>6} "
+              f"{'cached' if row['cached'] else '':>7}")
+    print(f"\nSweep took {time.time() - start:.1f} s "
+          f"({sum(row['cached'] for row in results)}/{len(results)} cached)")
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"Results saved to {args.output}")
+
+if __name__ == "__main__":
+    main()
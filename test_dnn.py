@@ -1,7 +1,30 @@
+import os
 import cocotb
 from cocotb.triggers import Timer, RisingEdge, FallingEdge
 from cocotb.clock import Clock
 import random
+import numpy as np
+
+from hardware_model import DNN_ACCELERATOR_PARAMS, dnn_forward, hardware_parameters
+from dnn_driver import reset_dut, run_inference
+from dnn_monitor import PerformanceMonitor
+from fsm_model import AcceleratorFSM
+
+# Latency/throughput artifact written by dnn_test_performance_profile
+PERF_FILE = 'dnn_accelerator_perf.json'
+
+# mac_unit register stages the simulator was built with (-GMAC_MUL_STAGE / -GMAC_ACC_STAGE)
+MAC_LATENCY = int(os.environ.get('MAC_MUL_STAGE', 0)) + int(os.environ.get('MAC_ACC_STAGE', 0))
+
+# Hidden layer requantization the simulator was built with (-GREQUANT_SHIFT=... etc.)
+REQUANT = {key: int(os.environ[name]) for key, name in (('multiplier', 'REQUANT_MULT'), ('shift', 'REQUANT_SHIFT'),
+                                                        ('round', 'REQUANT_ROUND'), ('relu', 'REQUANT_RELU'))
+           if name in os.environ}
+
+# mac_unit datapath the simulator was built with (-GMAC_WEIGHT_W=... etc.)
+MAC = {key: int(os.environ[name]) for key, name in (('signed', 'MAC_SIGNED'), ('weight_w', 'MAC_WEIGHT_W'),
+                                                    ('acc_w', 'MAC_ACC_W'))
+       if name in os.environ}
 
 @cocotb.test()
 async def dnn_test_basic_functionality(dut):
@@ -250,3 +273,38 @@ async def dnn_test_random_inputs(dut):
         # Wait for done signal to be deasserted
         while dut.done.value:
             await RisingEdge(dut.clk)
+
+@cocotb.test()
+async def dnn_test_performance_profile(dut):
+    """Exact per-inference latency and throughput, exported as JSON"""
+    
+    # Start clock
+    clock = Clock(dut.clk, 10, units="ns")
+    cocotb.start_soon(clock.start())
+    
+    await reset_dut(dut)
+    monitor = PerformanceMonitor(dut, name='dnn_accelerator').start()
+    
+    vectors = np.random.default_rng(13).integers(0, 256, (20, 4))
+    outputs = []
+    for vector in vectors:
+        outputs.append(await run_inference(dut, vector))
+    await RisingEdge(dut.clk)
+    monitor.stop()
+    
+    golden = dnn_forward(vectors, hardware_parameters(DNN_ACCELERATOR_PARAMS), requant=REQUANT, mac=MAC)
+    assert outputs == [tuple(int(v) for v in row) for row in golden], \
+        f"Outputs differ from the golden model with {MAC_LATENCY} mac_unit register stages"
+    
+    summary = monitor.write_json(PERF_FILE)
+    expected = AcceleratorFSM('dnn', mac_latency=MAC_LATENCY, requant=REQUANT, mac=MAC).run(vectors)
+    latency = int(expected['latency_cycles'][0])
+    dut._log.info(f"Latency {summary['latency_cycles']['histogram']}, "
+                  f"{summary['cycles_per_inference']['mean']} cycles per inference, "
+                  f"{summary['sustained_inferences_per_second']:,.0f} inferences/s; saved to {PERF_FILE}")
+    
+    assert summary['num_inferences'] == len(vectors)
+    assert summary['latency_cycles']['histogram'] == {str(latency): len(vectors)}, \
+        f"Latency histogram {summary['latency_cycles']['histogram']}, FSM model says {latency} cycles"
+    assert summary['cycles_per_inference']['mean'] == expected['cycles_per_inference'].mean(), \
+        f"{summary['cycles_per_inference']['mean']} cycles per inference, FSM model says {expected['cycles_per_inference'].mean()}"
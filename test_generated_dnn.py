@@ -0,0 +1,134 @@
+import os
+import json
+import cocotb
+from cocotb.triggers import RisingEdge
+from cocotb.clock import Clock
+import numpy as np
+
+from hardware_model import (
+    ACC_MASK, network_forward, network_layers, network_parameter_bytes, network_parameter_words,
+)
+from dnn_driver import reset_dut, load_beats, run_inference
+from param_file import load_model_parameters
+from quantization import integer_forward
+
+# Address map written by generate_accelerator.py next to the RTL
+MAP_FILE = os.environ.get('GENERATED_MAP', 'generated_dnn_accelerator_map.json')
+
+# Parameter file the accelerator was generated from (make generate-accelerator)
+PARAMS_FILE = os.environ.get('GENERATED_PARAMS', 'model_parameters.bin')
+
+NUM_VECTORS = 30
+
+def load_map():
+    with open(MAP_FILE, 'r') as f:
+        return json.load(f)
+
+def random_layers(amap, seed):
+    """Random parameters for the generated topology
+
+    Half of each layer's weights are kept small so that hidden activations
+    fall inside 0..255 as well as saturating.
+    """
+    rng = np.random.default_rng(seed)
+    layers = []
+    for layer in amap['layers']:
+        shape = (layer['fan_out'], layer['fan_in'])
+        weights = np.where(rng.random(shape) < 0.5, rng.integers(0, 4, shape), rng.integers(0, 256, shape))
+        layers.append({
+            'weights': weights.astype(np.uint8),
+            'bias': rng.integers(0, 65536, layer['fan_out']).astype(np.uint16),
+            'relu': layer['relu'],
+            'output_shift': layer.get('output_shift', 0),
+        })
+    return layers
+
+async def check_against_golden_model(dut, burst):
+    """Load random parameters and compare every output with network_forward"""
+    amap = load_map()
+
+    # Start clock
+    clock = Clock(dut.clk, 10, units="ns")
+    cocotb.start_soon(clock.start())
+
+    await reset_dut(dut)
+
+    layers = random_layers(amap, seed=int(burst))
+    beats = network_parameter_words(layers) if burst else network_parameter_bytes(layers)
+    assert len(beats) == amap['burst_load' if burst else 'byte_load']['beats']
+    cycles = await load_beats(dut, beats, burst)
+    dut._log.info(f"{'Burst' if burst else 'Byte'} load of {len(beats)} beats: {cycles} cycles")
+
+    vectors = np.random.default_rng(8).integers(0, 256, (NUM_VECTORS, amap['num_inputs']))
+    expected = network_forward(vectors, layers)
+    for i, vector in enumerate(vectors):
+        outputs = await run_inference(dut, vector, amap['num_outputs'])
+        assert outputs == tuple(int(v) for v in expected[i]), \
+            f"Vector {i}: got {outputs}, expected {expected[i].tolist()}"
+
+@cocotb.test()
+async def generated_test_byte_load(dut):
+    """Byte-mode load, outputs bit-exact with the golden model"""
+    await check_against_golden_model(dut, burst=False)
+
+@cocotb.test()
+async def generated_test_burst_load(dut):
+    """Burst-mode load, outputs bit-exact with the golden model"""
+    await check_against_golden_model(dut, burst=True)
+
+@cocotb.test()
+async def generated_test_matches_integer_forward(dut):
+    """The trained model's outputs match quantization.integer_forward
+
+    integer_forward is the calibrated integer model the exporter scores;
+    its last accumulators are compared modulo the 16-bit output registers.
+    """
+    amap = load_map()
+    params = load_model_parameters(PARAMS_FILE)
+    layers = network_layers(params)
+    shapes = [(layer['fan_out'], layer['fan_in']) for layer in amap['layers']]
+    if 'layers' not in params or shapes != [layer['weights'].shape for layer in layers]:
+        dut._log.info(f"Accelerator was not generated from {PARAMS_FILE}; nothing to compare")
+        return
+
+    # Start clock
+    clock = Clock(dut.clk, 10, units="ns")
+    cocotb.start_soon(clock.start())
+
+    await reset_dut(dut)
+    await load_beats(dut, network_parameter_words(layers))
+
+    vectors = np.random.default_rng(9).integers(0, 256, (NUM_VECTORS, amap['num_inputs']))
+    expected = integer_forward(vectors, params['layers']) & ACC_MASK
+    assert (network_forward(vectors, layers) == expected).all(), "network_forward differs from integer_forward"
+    for i, vector in enumerate(vectors):
+        outputs = await run_inference(dut, vector, amap['num_outputs'])
+        assert outputs == tuple(int(v) for v in expected[i]), \
+            f"Vector {i}: got {outputs}, integer_forward gives {expected[i].tolist()}"
+
+@cocotb.test()
+async def generated_test_compute_cycles(dut):
+    """One multiply-accumulate per cycle, as recorded in the address map"""
+    amap = load_map()
+
+    # Start clock
+    clock = Clock(dut.clk, 10, units="ns")
+    cocotb.start_soon(clock.start())
+
+    await reset_dut(dut)
+    await load_beats(dut, network_parameter_words(random_layers(amap, seed=2)))
+
+    for i in range(amap['num_inputs']):
+        getattr(dut, f"input_data_{i}").value = i
+
+    dut.start.value = 1
+    await RisingEdge(dut.clk)
+    dut.start.value = 0
+    cycles = 0
+    while not dut.done.value:
+        await RisingEdge(dut.clk)
+        cycles += 1
+
+    dut._log.info(f"Compute cycles per inference: {cycles}")
+    assert cycles == amap['compute_cycles'], \
+        f"Inference took {cycles} cycles, address map says {amap['compute_cycles']}"
@@ -0,0 +1,58 @@
+import os
+import cocotb
+import numpy as np
+
+from hardware_model import LAYER1_INPUTS, LAYER1_NEURONS, LAYER2_INPUTS, LAYER2_NEURONS
+from test_streaming_dnn import MAC_CYCLES, MAC_LATENCY, setup, stream, check_outputs
+
+# Latency/throughput artifact written by layer_pipelined_test_sustained_throughput
+PERF_FILE = 'layer_pipelined_dnn_perf.json'
+
+# Layer 1 mac_units the simulator was built with (-GLAYER1_MACS)
+LAYER1_MACS = int(os.environ.get('LAYER1_MACS', 2))
+
+# Each layer unit takes its MAC cycles; back to back the slower one sets the pace
+LAYER1_CYCLES = -(-LAYER1_NEURONS // LAYER1_MACS) * LAYER1_INPUTS * (1 + MAC_LATENCY)
+LAYER2_CYCLES = LAYER2_NEURONS * LAYER2_INPUTS * (1 + MAC_LATENCY)
+INTERVAL = max(LAYER1_CYCLES, LAYER2_CYCLES)
+
+@cocotb.test()
+async def layer_pipelined_test_outputs(dut):
+    """Back-to-back vectors produce the golden outputs in order"""
+    hw_params = await setup(dut, seed=51)
+    vectors = np.random.default_rng(52).integers(0, 256, (50, 4))
+
+    monitor = await stream(dut, vectors, seed=53)
+    check_outputs(monitor, vectors, hw_params)
+
+@cocotb.test()
+async def layer_pipelined_test_backpressure(dut):
+    """Stalls on either side never let layer 1 overwrite a bank layer 2 still needs"""
+    hw_params = await setup(dut, seed=61)
+    vectors = np.random.default_rng(62).integers(0, 256, (200, 4))
+
+    monitor = await stream(dut, vectors, seed=63, gap_probability=0.3, ready_probability=0.3)
+    check_outputs(monitor, vectors, hw_params)
+    assert monitor.summary()['cycles_per_inference']['max'] > INTERVAL, \
+        "The consumer should have stalled the accelerator at least once"
+
+@cocotb.test()
+async def layer_pipelined_test_sustained_throughput(dut):
+    """Sustained throughput against the single-MAC streaming accelerator, exported as JSON"""
+    hw_params = await setup(dut, seed=71)
+    vectors = np.random.default_rng(72).integers(0, 256, (100, 4))
+
+    monitor = await stream(dut, vectors, seed=73)
+    check_outputs(monitor, vectors, hw_params)
+
+    summary = monitor.write_json(PERF_FILE)
+    speedup = MAC_CYCLES / summary['cycles_per_inference']['mean']
+    dut._log.info(f"LAYER1_MACS={LAYER1_MACS}: latency {summary['latency_cycles']['histogram']}, "
+                  f"{summary['cycles_per_inference']['mean']} cycles per inference "
+                  f"({speedup:.2f}x streaming_dnn_accelerator), "
+                  f"{summary['sustained_inferences_per_second']:,.0f} inferences/s; saved to {PERF_FILE}")
+
+    assert summary['cycles_per_inference']['histogram'] == {str(INTERVAL): len(vectors) - 1}, \
+        f"Output intervals {summary['cycles_per_inference']['histogram']}, expected {INTERVAL} cycles"
+    if LAYER1_MACS >= 2:
+        assert speedup >= 2, f"Only {speedup:.2f}x the streaming accelerator's throughput"
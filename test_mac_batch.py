@@ -0,0 +1,78 @@
+import json
+import os
+import time
+
+import cocotb
+from cocotb.triggers import Timer
+import numpy as np
+
+from hardware_model import mac_unit
+
+# Accumulator values swept for every A x W pair: the edges of the 16-bit
+# range plus random values (MAC_B_SAMPLES in total, default 16)
+B_EDGES = [0x0000, 0x0001, 0x00FF, 0x0100, 0x7FFF, 0x8000, 0xFF00, 0xFFFF]
+B_SAMPLES = int(os.environ.get('MAC_B_SAMPLES', 16))
+
+# Summary written by mac_batch_test_exhaustive
+RESULTS_FILE = 'mac_exhaustive_results.json'
+MAX_REPORTED = 1000
+
+def sweep_tuples(b_values):
+    """Every (A, W) pair with each accumulator value: three flat arrays"""
+    pairs = np.arange(256 * 256, dtype=np.int64)
+    a = np.tile(pairs >> 8, len(b_values))
+    w = np.tile(pairs & 0xFF, len(b_values))
+    b = np.repeat(np.asarray(b_values, dtype=np.int64), len(pairs))
+    return a, w, b
+
+def pack_lanes(values, dtype):
+    """One wide bus value from per-lane values, lane 0 in the low bits"""
+    return int.from_bytes(np.asarray(values, dtype=dtype).tobytes(), 'little')
+
+def unpack_lanes(value, lanes):
+    """Per-lane 16-bit values of a wide bus value"""
+    return np.frombuffer(int(value).to_bytes(lanes * 2, 'little'), dtype='<u2')
+
+@cocotb.test()
+async def mac_batch_test_exhaustive(dut):
+    """Every A x W pair over a sweep of B, checked in bulk against the NumPy model"""
+    lanes = len(dut.A) // 8
+    rng = np.random.default_rng(7)
+    extra = max(B_SAMPLES - len(B_EDGES), 0)
+    b_values = (B_EDGES + rng.integers(0, 1 << 16, extra).tolist())[:B_SAMPLES]
+    a, w, b = sweep_tuples(b_values)
+    total = len(a)
+
+    start = time.perf_counter()
+    got = np.empty(total, dtype=np.uint16)
+    for offset in range(0, total, lanes):
+        batch = slice(offset, offset + lanes)
+        n = len(a[batch])
+        pad = lanes - n
+        dut.A.value = pack_lanes(np.pad(a[batch], (0, pad)), '<u1')
+        dut.W.value = pack_lanes(np.pad(w[batch], (0, pad)), '<u1')
+        dut.B.value = pack_lanes(np.pad(b[batch], (0, pad)), '<u2')
+        await Timer(1, unit="ns")  # Wait for combinational logic to stabilize
+        got[batch] = unpack_lanes(dut.C.value, lanes)[:n]
+    elapsed = time.perf_counter() - start
+
+    expected = mac_unit(a, w, b)
+    bad = np.flatnonzero(got != expected)
+    mismatches = [{'A': int(a[i]), 'W': int(w[i]), 'B': int(b[i]), 'expected': int(expected[i]), 'got': int(got[i])}
+                  for i in bad[:MAX_REPORTED]]
+    with open(RESULTS_FILE, 'w') as f:
+        json.dump({
+            'lanes': lanes,
+            'b_values': [int(v) for v in b_values],
+            'tuples': total,
+            'seconds': elapsed,
+            'tuples_per_second': total / elapsed,
+            'mismatches': int(len(bad)),
+            'first_mismatches': mismatches,
+        }, f, indent=2)
+
+    dut._log.info(f"{total:,} tuples ({len(b_values)} B values) in {elapsed:.2f} s "
+                  f"({total / elapsed:,.0f} tuples/s, {lanes} lanes); saved to {RESULTS_FILE}")
+    for m in mismatches[:20]:
+        dut._log.error(f"({m['A']} * {m['W']} + {m['B']}) = {m['got']}, expected {m['expected']}")
+    assert len(bad) == 0, f"{len(bad)} of {total} tuples mismatched, see {RESULTS_FILE}"
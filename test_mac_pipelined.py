@@ -0,0 +1,46 @@
+import os
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge, ReadOnly
+import numpy as np
+
+from hardware_model import mac_unit
+
+# Register stages the simulator was built with (-GMUL_STAGE / -GACC_STAGE)
+MUL_STAGE = int(os.environ.get('MUL_STAGE', 0))
+ACC_STAGE = int(os.environ.get('ACC_STAGE', 0))
+LATENCY = MUL_STAGE + ACC_STAGE
+
+NUM_VECTORS = 2000
+
+@cocotb.test()
+async def mac_pipelined_test_stream(dut):
+    """One operand set per cycle; C follows each set LATENCY edges later"""
+
+    # Start clock
+    clock = Clock(dut.clk, 10, units="ns")
+    cocotb.start_soon(clock.start())
+
+    rng = np.random.default_rng(LATENCY)
+    a = rng.integers(0, 1 << 8, NUM_VECTORS)
+    w = rng.integers(0, 1 << 8, NUM_VECTORS)
+    b = rng.integers(0, 1 << 16, NUM_VECTORS)
+    expected = mac_unit(a, w, b)
+
+    got = []
+    for i in range(NUM_VECTORS + LATENCY):
+        if i < NUM_VECTORS:
+            dut.A.value = int(a[i])
+            dut.W.value = int(w[i])
+            dut.B.value = int(b[i])
+        # Sample C after the operands settle, before the next edge
+        await ReadOnly()
+        if i >= LATENCY:
+            got.append(int(dut.C.value))
+        await RisingEdge(dut.clk)
+
+    bad = np.flatnonzero(np.asarray(got) != expected)
+    dut._log.info(f"MUL_STAGE={MUL_STAGE} ACC_STAGE={ACC_STAGE}: {NUM_VECTORS} operand sets, "
+                  f"latency {LATENCY}, {len(bad)} mismatches")
+    assert len(bad) == 0, \
+        f"({a[bad[0]]} * {w[bad[0]]} + {b[bad[0]]}) = {got[bad[0]]}, expected {expected[bad[0]]}"
@@ -0,0 +1,78 @@
+import os
+import cocotb
+from cocotb.triggers import RisingEdge
+from cocotb.clock import Clock
+import numpy as np
+
+from hardware_model import dnn_forward, random_hardware_parameters
+from fsm_model import AcceleratorFSM
+from dnn_driver import reset_dut, load_parameters, run_inference
+
+# NUM_MACS the simulator was built with (passed to Verilator as -GNUM_MACS)
+NUM_MACS = int(os.environ.get('NUM_MACS', 3))
+
+# mac_unit register stages the simulator was built with (-GMAC_MUL_STAGE / -GMAC_ACC_STAGE)
+MAC_LATENCY = int(os.environ.get('MAC_MUL_STAGE', 0)) + int(os.environ.get('MAC_ACC_STAGE', 0))
+
+NUM_VECTORS = 50
+
+@cocotb.test()
+async def parallel_test_matches_golden_model(dut):
+    """Outputs are bit-identical to the serial accelerator's golden model"""
+
+    # Start clock
+    clock = Clock(dut.clk, 10, units="ns")
+    cocotb.start_soon(clock.start())
+
+    await reset_dut(dut)
+
+    hw_params = random_hardware_parameters(7)
+    await load_parameters(dut, hw_params)
+
+    vectors = np.random.default_rng(7).integers(0, 256, (NUM_VECTORS, 4))
+    expected = dnn_forward(vectors, hw_params)
+    for i, vector in enumerate(vectors):
+        outputs = await run_inference(dut, vector)
+        assert outputs == tuple(int(v) for v in expected[i]), \
+            f"NUM_MACS={NUM_MACS}, vector {vector.tolist()}: got {outputs}, expected {expected[i].tolist()}"
+
+@cocotb.test()
+async def parallel_test_cycles_per_inference(dut):
+    """Start-to-done latency and back-to-back cycles per inference"""
+
+    # Start clock
+    clock = Clock(dut.clk, 10, units="ns")
+    cocotb.start_soon(clock.start())
+
+    await reset_dut(dut)
+    await load_parameters(dut, random_hardware_parameters(8))
+
+    dut.input_data_0.value = 1
+    dut.input_data_1.value = 2
+    dut.input_data_2.value = 3
+    dut.input_data_3.value = 4
+
+    # Latency: cycles from the start edge until done is seen
+    dut.start.value = 1
+    await RisingEdge(dut.clk)
+    dut.start.value = 0
+    latency = 0
+    while not dut.done.value:
+        await RisingEdge(dut.clk)
+        latency += 1
+
+    # Occupancy: cycles until the accelerator accepts the next start
+    occupancy = latency + 1
+    while dut.done.value:
+        await RisingEdge(dut.clk)
+        occupancy += 1
+
+    model = AcceleratorFSM('parallel', random_hardware_parameters(8), num_macs=NUM_MACS,
+                           mac_latency=MAC_LATENCY)
+    expected = model.run(np.array([[1, 2, 3, 4]]))
+
+    dut._log.info(f"NUM_MACS={NUM_MACS}: latency {latency} cycles, {occupancy} cycles per inference")
+    assert latency == expected['latency_cycles'][0], \
+        f"Latency {latency} differs from the FSM model ({expected['latency_cycles'][0]})"
+    assert occupancy == expected['cycles_per_inference'][0], \
+        f"{occupancy} cycles per inference differ from the FSM model ({expected['cycles_per_inference'][0]})"
@@ -0,0 +1,134 @@
+import os
+import tempfile
+import cocotb
+from cocotb.clock import Clock
+import numpy as np
+
+from hardware_model import DNN_ACCELERATOR_PARAMS, hardware_parameters, dnn_forward, random_hardware_parameters
+from dnn_driver import reset_dut, load_parameters, run_inference
+from param_file import QUANT_FIELDS, load_model_parameters, write_parameter_file
+
+NUM_VECTORS = 20
+
+async def check_load_mode(dut, burst):
+    """Load random parameters in one mode and check outputs against the golden model"""
+
+    # Start clock
+    clock = Clock(dut.clk, 10, units="ns")
+    cocotb.start_soon(clock.start())
+
+    await reset_dut(dut)
+
+    rng = np.random.default_rng(6)
+    hw_params = random_hardware_parameters(rng)
+
+    cycles = await load_parameters(dut, hw_params, burst=burst)
+    dut._log.info(f"{'Burst' if burst else 'Byte'} load: {cycles} cycles per model")
+
+    vectors = rng.integers(0, 256, (NUM_VECTORS, 4))
+    expected = dnn_forward(vectors, hw_params)
+    for i, vector in enumerate(vectors):
+        outputs = await run_inference(dut, vector)
+        assert outputs == tuple(int(v) for v in expected[i]), \
+            f"Vector {vector.tolist()}: got {outputs}, expected {expected[i].tolist()}"
+
+    return cycles
+
+@cocotb.test()
+async def param_load_test_byte_mode(dut):
+    """Byte-wide loads store every weight and bias"""
+    await check_load_mode(dut, burst=False)
+
+@cocotb.test()
+async def param_load_test_burst_mode(dut):
+    """Back-to-back 16-bit bursts store every weight and bias"""
+    await check_load_mode(dut, burst=True)
+
+@cocotb.test()
+async def param_load_test_reload(dut):
+    """A burst load replaces a model loaded byte by byte, in far fewer cycles"""
+
+    # Start clock
+    clock = Clock(dut.clk, 10, units="ns")
+    cocotb.start_soon(clock.start())
+
+    await reset_dut(dut)
+
+    first = hardware_parameters(DNN_ACCELERATOR_PARAMS)
+    second = hardware_parameters({key: np.asarray(values) + 1
+                                  for key, values in DNN_ACCELERATOR_PARAMS.items()})
+    vector = [10, 20, 30, 40]
+
+    byte_cycles = await load_parameters(dut, first, burst=False)
+    outputs = await run_inference(dut, vector)
+    assert outputs == tuple(int(v) for v in dnn_forward(vector, first))
+
+    burst_cycles = await load_parameters(dut, second, burst=True)
+    outputs = await run_inference(dut, vector)
+    assert outputs == tuple(int(v) for v in dnn_forward(vector, second))
+
+    dut._log.info(f"Load cycles per model: byte {byte_cycles}, burst {burst_cycles}")
+    assert burst_cycles * 3 < byte_cycles, "Burst load should take under a third of the byte load cycles"
+
+@cocotb.test()
+async def param_load_test_requant(dut):
+    """Reloading only the requant word changes the hidden layer scaling"""
+
+    # Start clock
+    clock = Clock(dut.clk, 10, units="ns")
+    cocotb.start_soon(clock.start())
+
+    await reset_dut(dut)
+
+    rng = np.random.default_rng(23)
+    vectors = rng.integers(0, 256, (NUM_VECTORS, 4))
+    models = [hardware_parameters({**DNN_ACCELERATOR_PARAMS, 'requant': requant})
+              for requant in ({'shift': 7}, {'multiplier': 3, 'shift': 9, 'round': False}, {'shift': 6, 'relu': False})]
+    tables = [dnn_forward(vectors, hw_params) for hw_params in models]
+    assert not np.array_equal(tables[0], tables[1]), "The requant words should give different outputs"
+
+    for hw_params, expected, burst in zip(models, tables, [True, False, True]):
+        await load_parameters(dut, hw_params, burst=burst)
+        for i, vector in enumerate(vectors):
+            outputs = await run_inference(dut, vector)
+            assert outputs == tuple(int(v) for v in expected[i]), \
+                f"requant {hw_params['requant']}, vector {vector.tolist()}: got {outputs}, expected {expected[i].tolist()}"
+
+@cocotb.test()
+async def param_load_test_parameter_file(dut):
+    """A calibrated model round-trips through model_parameters.bin, negative shifts included"""
+
+    # Start clock
+    clock = Clock(dut.clk, 10, units="ns")
+    cocotb.start_soon(clock.start())
+
+    await reset_dut(dut)
+
+    rng = np.random.default_rng(14)
+    # quantize_layers gives a negative bias_shift when the inputs are scaled
+    # below 1, and an output_shift of 0 when activations already fit
+    layers = [
+        {'weights': rng.integers(-128, 128, (3, 4)), 'bias': rng.integers(-32768, 32768, 3), 'relu': True,
+         'weight_shift': 5, 'bias_shift': -3, 'output_shift': 0, 'acc_width': 16, 'act_width': 8},
+        {'weights': rng.integers(-128, 128, (2, 3)), 'bias': rng.integers(-32768, 32768, 2), 'relu': False,
+         'weight_shift': 6, 'bias_shift': -127, 'acc_width': 15},
+    ]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'model_parameters.bin')
+        write_parameter_file(path, {'layers': layers})
+        params = load_model_parameters(path)
+        for written, read in zip(layers, params['layers']):
+            assert {name: read[name] for name in QUANT_FIELDS if name in read} == \
+                   {name: written[name] for name in QUANT_FIELDS if name in written}
+            assert np.array_equal(read['weights'], written['weights'])
+            assert np.array_equal(read['bias'], written['bias'])
+        hw_params = hardware_parameters(params)
+
+    await load_parameters(dut, hw_params, burst=True)
+    vectors = rng.integers(0, 256, (NUM_VECTORS, 4))
+    expected = dnn_forward(vectors, hw_params)
+    for i, vector in enumerate(vectors):
+        outputs = await run_inference(dut, vector)
+        assert outputs == tuple(int(v) for v in expected[i]), \
+            f"Vector {vector.tolist()}: got {outputs}, expected {expected[i].tolist()}"
@@ -0,0 +1,66 @@
+import os
+import itertools
+import cocotb
+from cocotb.triggers import Timer
+import numpy as np
+
+from hardware_model import requant_unit
+
+# requant_unit parameters the simulator was built with (-GACC_W=... etc.)
+CONFIG = {
+    'acc_w': int(os.environ.get('ACC_W', 16)),
+    'mult_w': int(os.environ.get('MULT_W', 8)),
+    'shift_w': int(os.environ.get('SHIFT_W', 5)),
+    'out_w': int(os.environ.get('OUT_W', 8)),
+    'acc_signed': bool(int(os.environ.get('ACC_SIGNED', 1))),
+    'out_signed': bool(int(os.environ.get('OUT_SIGNED', 0))),
+}
+
+NUM_VECTORS = 2000
+
+def edge_values(bits):
+    """Bit patterns at the unsigned and two's complement range limits"""
+    top = (1 << bits) - 1
+    return [0, 1, 2, 3, top, top - 1, 1 << (bits - 1), (1 << (bits - 1)) - 1, (1 << (bits - 1)) + 1]
+
+async def check(dut, operands, round, relu):
+    """Drive (acc, multiplier, shift) rows and compare Q with the reference"""
+    dut.round.value = int(round)
+    dut.relu.value = int(relu)
+    expected = requant_unit(operands[:, 0], operands[:, 1], operands[:, 2], round=round, relu=relu, **CONFIG)
+
+    got = []
+    for acc, multiplier, shift in operands:
+        dut.acc.value = int(acc)
+        dut.multiplier.value = int(multiplier)
+        dut.shift.value = int(shift)
+        await Timer(1, unit="ns")
+        got.append(int(dut.q.value))
+
+    bad = np.flatnonzero(np.asarray(got) != expected)
+    dut._log.info(f"round={int(round)} relu={int(relu)}: {len(operands)} operand sets, {len(bad)} mismatches")
+    assert len(bad) == 0, \
+        f"ACC={operands[bad[0], 0]} MULTIPLIER={operands[bad[0], 1]} SHIFT={operands[bad[0], 2]} " \
+        f"round={int(round)} relu={int(relu)}: Q={got[bad[0]]}, expected {expected[bad[0]]}"
+
+@cocotb.test()
+async def requant_test_edges(dut):
+    """Range-limit accumulators and multipliers at every shift"""
+
+    shifts = range(1 << CONFIG['shift_w'])
+    operands = np.array(list(itertools.product(edge_values(CONFIG['acc_w']), edge_values(CONFIG['mult_w']), shifts)),
+                        dtype=np.int64)
+    dut._log.info(f"{CONFIG}")
+    for round, relu in itertools.product((False, True), repeat=2):
+        await check(dut, operands, round, relu)
+
+@cocotb.test()
+async def requant_test_random(dut):
+    """Random accumulators, multipliers and shifts"""
+
+    rng = np.random.default_rng(CONFIG['acc_w'] + CONFIG['out_w'])
+    operands = np.stack([rng.integers(0, 1 << CONFIG['acc_w'], NUM_VECTORS),
+                         rng.integers(0, 1 << CONFIG['mult_w'], NUM_VECTORS),
+                         rng.integers(0, 1 << CONFIG['shift_w'], NUM_VECTORS)], axis=1)
+    for round, relu in itertools.product((False, True), repeat=2):
+        await check(dut, operands, round, relu)
@@ -0,0 +1,121 @@
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge
+import numpy as np
+
+from hardware_model import dnn_forward, parameter_words, random_hardware_parameters
+from dnn_driver import reset_dut, load_beats, load_shadow_parameters, swap_parameters, run_inference
+from dnn_monitor import PerformanceMonitor
+from fsm_model import AcceleratorFSM
+
+# Requires configurable_dnn_accelerator built with SHADOW_PARAMS = 1 (make test-shadow)
+
+def model_sources(outputs, vectors, models):
+    """Index of the model in models that produced each output (None if none did)"""
+    expected = [dnn_forward(vectors, hw_params) for hw_params in models]
+    sources = []
+    for i, output in enumerate(outputs):
+        matches = [m for m, table in enumerate(expected) if output == tuple(int(v) for v in table[i])]
+        sources.append(matches[0] if matches else None)
+    return sources
+
+async def setup(dut, hw_params):
+    """Start the clock, reset, and make hw_params the active model"""
+
+    # Start clock
+    clock = Clock(dut.clk, 10, units="ns")
+    cocotb.start_soon(clock.start())
+
+    await reset_dut(dut)
+    await load_shadow_parameters(dut, hw_params)
+    assert dut.params_loaded.value == 1, "Swap should make the first model active"
+
+@cocotb.test()
+async def shadow_test_swap_without_stall(dut):
+    """A model loaded during back-to-back inferences swaps in without a lost cycle"""
+    rng = np.random.default_rng(51)
+    first, second = random_hardware_parameters(rng), random_hardware_parameters(rng)
+    await setup(dut, first)
+
+    monitor = PerformanceMonitor(dut, name='shadow_swap', shadow=True).start()
+    vectors = rng.integers(0, 256, (40, 4))
+    outputs = []
+    loader = None
+    for i, vector in enumerate(vectors):
+        if i == 10:
+            loader = cocotb.start_soon(load_shadow_parameters(dut, second))
+        outputs.append(await run_inference(dut, vector))
+    await RisingEdge(dut.clk)
+    monitor.stop()
+
+    assert loader.done(), "The shadow load and swap should finish within the run"
+    sources = model_sources(outputs, vectors, [first, second])
+    assert None not in sources, f"Outputs from neither model: {sources}"
+    switch = sources.index(1)
+    assert sources == [0] * switch + [1] * (len(vectors) - switch), \
+        f"Every inference before the swap should use the first model, every one after the second: {sources}"
+    assert switch > 10, "The first model should stay active while the second loads"
+
+    summary = monitor.summary()
+    handshake = AcceleratorFSM('configurable', first).run(vectors)['cycles_per_inference'].mean()
+    dut._log.info(f"Swap after inference {switch}, load {summary['parameter_load_cycles']} cycles, "
+                  f"{summary['cycles_per_inference']['histogram']} cycles per inference")
+    assert summary['cycles_per_inference']['histogram'] == {str(int(handshake)): len(vectors) - 1}, \
+        f"Loading and swapping should not stall inference: {summary['cycles_per_inference']['histogram']}"
+
+@cocotb.test()
+async def shadow_test_swap_waits_for_load(dut):
+    """A swap requested before the shadow bank is complete waits for the last beat"""
+    rng = np.random.default_rng(61)
+    first, second = random_hardware_parameters(rng), random_hardware_parameters(rng)
+    await setup(dut, first)
+    vector = rng.integers(0, 256, 4)
+
+    # Request the swap first, then load only part of the second model
+    dut.swap_params.value = 1
+    await RisingEdge(dut.clk)
+    dut.swap_params.value = 0
+    beats = parameter_words(second)
+    dut.param_burst.value = 1
+    dut.load_params.value = 1
+    await RisingEdge(dut.clk)
+    dut.load_params.value = 0
+    for data in beats[:-1]:
+        dut.param_data.value = data
+        dut.param_valid.value = 1
+        await RisingEdge(dut.clk)
+    dut.param_valid.value = 0
+
+    outputs = await run_inference(dut, vector)
+    assert outputs == tuple(int(v) for v in dnn_forward(vector, first)), \
+        "A partly loaded shadow bank must not be swapped in"
+
+    # The last beat completes the bank; the pending swap then takes effect
+    dut.param_data.value = beats[-1]
+    dut.param_valid.value = 1
+    await RisingEdge(dut.clk)
+    dut.param_valid.value = 0
+    for _ in range(4):
+        await RisingEdge(dut.clk)
+    assert dut.shadow_loaded.value == 0, "The pending swap should have consumed the shadow bank"
+
+    outputs = await run_inference(dut, vector)
+    assert outputs == tuple(int(v) for v in dnn_forward(vector, second))
+
+@cocotb.test()
+async def shadow_test_reload_shadow(dut):
+    """Loading the shadow bank twice before a swap keeps only the second model"""
+    rng = np.random.default_rng(71)
+    first, second, third = random_hardware_parameters(rng), random_hardware_parameters(rng), random_hardware_parameters(rng)
+    await setup(dut, first)
+    vector = rng.integers(0, 256, 4)
+
+    await load_beats(dut, parameter_words(second), burst=True, loaded='shadow_loaded')
+    await load_beats(dut, parameter_words(third), burst=True, loaded='shadow_loaded')
+    outputs = await run_inference(dut, vector)
+    assert outputs == tuple(int(v) for v in dnn_forward(vector, first)), \
+        "Without a swap the active model must not change"
+
+    await swap_parameters(dut)
+    outputs = await run_inference(dut, vector)
+    assert outputs == tuple(int(v) for v in dnn_forward(vector, third))
@@ -0,0 +1,104 @@
+import os
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge
+import numpy as np
+
+from hardware_model import (
+    LAYER1_INPUTS, LAYER1_NEURONS, LAYER2_INPUTS, LAYER2_NEURONS,
+    dnn_forward, random_hardware_parameters,
+)
+from dnn_driver import reset_dut, load_parameters, StreamDriver
+from dnn_monitor import StreamMonitor
+from fsm_model import AcceleratorFSM
+
+# Latency/throughput artifact written by streaming_test_sustained_throughput
+PERF_FILE = 'streaming_dnn_perf.json'
+
+# mac_unit register stages the simulator was built with (-GMAC_MUL_STAGE / -GMAC_ACC_STAGE)
+MAC_LATENCY = int(os.environ.get('MAC_MUL_STAGE', 0)) + int(os.environ.get('MAC_ACC_STAGE', 0))
+
+# One MAC step per weight, each waiting MAC_LATENCY cycles for its result;
+# back to back there is no handshake overhead
+MAC_CYCLES = (LAYER1_INPUTS * LAYER1_NEURONS + LAYER2_INPUTS * LAYER2_NEURONS) * (1 + MAC_LATENCY)
+
+async def setup(dut, seed):
+    """Start the clock, reset, and load a random model; returns its parameters"""
+
+    # Start clock
+    clock = Clock(dut.clk, 10, units="ns")
+    cocotb.start_soon(clock.start())
+
+    await reset_dut(dut)
+
+    hw_params = random_hardware_parameters(seed)
+    await load_parameters(dut, hw_params, burst=True)
+    return hw_params
+
+async def stream(dut, vectors, seed, gap_probability=0.0, ready_probability=1.0):
+    """Stream vectors through the accelerator; returns the monitor once every output is taken"""
+    driver = StreamDriver(dut, seed=seed)
+    monitor = StreamMonitor(dut).start()
+    sink = cocotb.start_soon(driver.accept_outputs(ready_probability))
+
+    await driver.send(vectors, gap_probability)
+    timeout = (len(vectors) + 2) * MAC_CYCLES * 20
+    for _ in range(timeout):
+        if len(monitor.outputs) == len(vectors):
+            break
+        await RisingEdge(dut.clk)
+    else:
+        raise AssertionError(f"Only {len(monitor.outputs)}/{len(vectors)} outputs within {timeout} cycles")
+
+    sink.cancel()
+    dut.out_ready.value = 0
+    await RisingEdge(dut.clk)
+    monitor.stop()
+    return monitor
+
+def check_outputs(monitor, vectors, hw_params):
+    """Outputs arrive in order and match the golden model"""
+    expected = [tuple(int(v) for v in row) for row in dnn_forward(vectors, hw_params)]
+    for i, (got, want) in enumerate(zip(monitor.outputs, expected)):
+        assert got == want, f"Vector {i} {vectors[i].tolist()}: got {got}, expected {want}"
+    assert len(monitor.outputs) == len(expected)
+
+@cocotb.test()
+async def streaming_test_outputs(dut):
+    """Back-to-back vectors produce the golden outputs in order"""
+    hw_params = await setup(dut, seed=21)
+    vectors = np.random.default_rng(22).integers(0, 256, (50, 4))
+
+    monitor = await stream(dut, vectors, seed=23)
+    check_outputs(monitor, vectors, hw_params)
+
+@cocotb.test()
+async def streaming_test_backpressure(dut):
+    """Input gaps and a stalling consumer neither drop nor reorder results"""
+    hw_params = await setup(dut, seed=31)
+    vectors = np.random.default_rng(32).integers(0, 256, (100, 4))
+
+    monitor = await stream(dut, vectors, seed=33, gap_probability=0.3, ready_probability=0.3)
+    check_outputs(monitor, vectors, hw_params)
+    assert monitor.summary()['cycles_per_inference']['max'] > MAC_CYCLES, \
+        "The consumer should have stalled the accelerator at least once"
+
+@cocotb.test()
+async def streaming_test_sustained_throughput(dut):
+    """Sustained throughput with a full FIFO, exported as JSON"""
+    hw_params = await setup(dut, seed=41)
+    vectors = np.random.default_rng(42).integers(0, 256, (100, 4))
+
+    monitor = await stream(dut, vectors, seed=43)
+    check_outputs(monitor, vectors, hw_params)
+
+    summary = monitor.write_json(PERF_FILE)
+    handshake = AcceleratorFSM('configurable', hw_params, mac_latency=MAC_LATENCY).run(vectors)['cycles_per_inference'].mean()
+    dut._log.info(f"Latency {summary['latency_cycles']['histogram']}, "
+                  f"{summary['cycles_per_inference']['mean']} cycles per inference "
+                  f"(start/done handshake: {handshake}), "
+                  f"{summary['sustained_inferences_per_second']:,.0f} inferences/s; saved to {PERF_FILE}")
+
+    assert summary['cycles_per_inference']['histogram'] == {str(MAC_CYCLES): len(vectors) - 1}, \
+        f"Output intervals {summary['cycles_per_inference']['histogram']}, expected {MAC_CYCLES} cycles"
+    assert summary['cycles_per_inference']['mean'] < handshake
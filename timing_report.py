@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Static Logic-Depth and Critical-Path Estimator
+Builds the cell graph of a Yosys JSON netlist, propagates arrival times
+with a unit-delay or per-gate delay table and reports the top-K paths
+"""
+
+import argparse
+import json
+
+from netlist_sim import Netlist
+
+# Relative gate delays (an inverter is 1.0), roughly following logical
+# effort for generic CMOS gates; only the ratios matter
+DELAY_TABLE = {
+    '$_BUF_': 1.0,
+    '$_NOT_': 1.0,
+    '$_NAND_': 1.0,
+    '$_NOR_': 1.2,
+    '$_AND_': 1.4,
+    '$_OR_': 1.6,
+    '$_ANDNOT_': 1.4,
+    '$_ORNOT_': 1.6,
+    '$_XOR_': 2.0,
+    '$_XNOR_': 2.0,
+    '$_MUX_': 2.0,
+    '$_NMUX_': 1.8,
+    '$_AOI3_': 1.4,
+    '$_OAI3_': 1.4,
+    '$_AOI4_': 1.6,
+    '$_OAI4_': 1.6,
+}
+
+# Register overhead added to flip-flop paths with the table model
+CLK_TO_Q = 2.0
+SETUP = 1.0
+
+def arrival_times(netlist, delays=None):
+    """Arrival time, logic depth and driving gate of every net
+
+    Start points (primary inputs, constants, flip-flop outputs) arrive at
+    0, or CLK_TO_Q for flip-flop outputs with a delay table; a gate output
+    arrives at its latest input plus the gate delay (1 with delays=None).
+    """
+    arrival = {}
+    depth = {}
+    driver = {}
+    if delays is not None:
+        for flop in netlist.flops:
+            arrival[flop[1]] = CLK_TO_Q
+    for kind, inputs, outputs in netlist.levels:
+        delay = 1.0 if delays is None else delays[kind]
+        for k, y in enumerate(outputs):
+            nets = [int(pin[k]) for pin in inputs]
+            latest = max(nets, key=lambda net: arrival.get(net, 0.0))
+            arrival[int(y)] = arrival.get(latest, 0.0) + delay
+            depth[int(y)] = 1 + max(depth.get(net, 0) for net in nets)
+            driver[int(y)] = (kind, latest)
+    return arrival, depth, driver
+
+def endpoints(netlist):
+    """(net, label, setup) of every timing end point: outputs and flip-flop D/E/R pins"""
+    points = []
+    for name, (direction, nets) in netlist.ports.items():
+        if direction == 'output':
+            points.extend((net, f"{name}[{i}]" if len(nets) > 1 else name, False) for i, net in enumerate(nets))
+    for d, q, enable, _, reset, _, _ in netlist.flops:
+        register = netlist.net_name(q)
+        points.append((d, f"{register} (D)", True))
+        if enable is not None:
+            points.append((enable, f"{register} (E)", True))
+        if reset is not None:
+            points.append((reset, f"{register} (R)", True))
+    return points
+
+def trace(netlist, driver, net):
+    """Cells from the start point to net, as (type, output net name) pairs"""
+    cells = []
+    while net in driver:
+        kind, previous = driver[net]
+        cells.append({'cell': kind, 'net': netlist.net_name(net)})
+        net = previous
+    cells.reverse()
+    return netlist.net_name(net), cells
+
+def critical_paths(netlist, top_k=10, delays=None):
+    """The top_k slowest end points, each with the path that sets its arrival time"""
+    arrival, depth, driver = arrival_times(netlist, delays)
+    rows = []
+    for net, label, register in endpoints(netlist):
+        time = arrival.get(net, 0.0)
+        if delays is not None and register:
+            time += SETUP
+        rows.append((time, depth.get(net, 0), net, label))
+    rows.sort(key=lambda row: (-row[0], -row[1], row[3]))
+
+    paths = []
+    for time, levels, net, label in rows[:top_k]:
+        start, cells = trace(netlist, driver, net)
+        paths.append({
+            'startpoint': start,
+            'endpoint': label,
+            'arrival': round(time, 3),
+            'depth': levels,
+            'cells': cells,
+        })
+    return paths
+
+def report(netlist_file, top=None, top_k=10, delay_model='unit', unit_ns=None):
+    """Timing summary of one netlist as a JSON-serializable dict"""
+    netlist = Netlist(netlist_file, top)
+    delays = DELAY_TABLE if delay_model == 'table' else None
+    paths = critical_paths(netlist, top_k, delays)
+    worst = paths[0]['arrival'] if paths else 0.0
+    summary = {
+        'netlist': netlist_file,
+        'design': netlist.top,
+        'delay_model': delay_model,
+        'gates': len(netlist.gates),
+        'flip_flops': len(netlist.flops),
+        'logic_depth': netlist.depth,
+        'critical_path_delay': worst,
+        'paths': paths,
+    }
+    if unit_ns:
+        summary['critical_path_ns'] = round(worst * unit_ns, 3)
+        summary['fmax_mhz'] = round(1000.0 / (worst * unit_ns), 1) if worst else None
+    return summary
+
+def main():
+    """Report the critical paths of synthesized netlists"""
+    parser = argparse.ArgumentParser(description="Logic-depth and critical-path estimate of Yosys JSON netlists")
+    parser.add_argument('netlists', nargs='*', default=['mac_unit.json'], help="Yosys JSON netlists")
+    parser.add_argument('--top', default=None, help="top module (default: from the netlist)")
+    parser.add_argument('--paths', type=int, default=5, help="critical paths to report per netlist")
+    parser.add_argument('--delay-model', choices=['unit', 'table'], default='unit',
+                        help="unit delay per gate, or the relative per-gate delay table")
+    parser.add_argument('--unit-ns', type=float, default=None,
+                        help="ns per delay unit, to turn the critical path into an fmax estimate")
+    parser.add_argument('--output', default='timing_report.json')
+    args = parser.parse_args()
+
+    print("=== Critical Path Estimate ===")
+    reports = []
+    for netlist_file in args.netlists:
+        summary = report(netlist_file, args.top, args.paths, args.delay_model, args.unit_ns)
+        reports.append(summary)
+
+        print(f"\n{summary['design']} ({netlist_file}): {summary['gates']} gates, "
+              f"{summary['flip_flops']} flip-flops, logic depth {summary['logic_depth']}")
+        line = f"Critical path: {summary['critical_path_delay']} ({args.delay_model} delay)"
+        if 'fmax_mhz' in summary:
+            line += f", {summary['critical_path_ns']} ns, fmax ~{summary['fmax_mhz']} MHz"
+        print(line)
+        for i, path in enumerate(summary['paths'], 1):
+            print(f"  {i}. {path['startpoint']} -> {path['endpoint']}: "
+                  f"arrival {path['arrival']}, {path['depth']} levels")
+
+    with open(args.output, 'w') as f:
+        json.dump(reports, f, indent=2)
+    print(f"\nReport saved to {args.output}")
+
+if __name__ == "__main__":
+    main()
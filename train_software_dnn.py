@@ -4,16 +4,18 @@ Software DNN Training Script
 This script trains a small neural network and exports parameters for hardware implementation
 """
 
+import argparse
+import copy
 import numpy as np
 import torch
 import torch.nn as nn
 import torch.optim as optim
-from sklearn.datasets import make_classification
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
-import json
+from torch.utils.data import DataLoader, Dataset
 import os
 
+from quantization import ACCURACY_TOLERANCE, calibrate
+from param_file import write_parameter_file
+
 class SimpleDNN(nn.Module):
     """Simple 2-layer neural network matching our hardware architecture"""
     
@@ -27,74 +29,208 @@ class SimpleDNN(nn.Module):
         x = self.relu(self.layer1(x))
         x = self.layer2(x)
         return x
+    
+    def layer_stack(self):
+        """Modules in forward order"""
+        return [self.layer1, self.relu, self.layer2]
+
+def linear_layers(model):
+    """(nn.Linear, followed by ReLU) pairs of a model in forward order
+    
+    Accepts SimpleDNN or any nn.Sequential of nn.Linear and nn.ReLU modules.
+    """
+    modules = model.layer_stack() if hasattr(model, 'layer_stack') else list(model)
+    layers = []
+    for module in modules:
+        if isinstance(module, nn.Linear):
+            layers.append([module, False])
+        elif isinstance(module, nn.ReLU) and layers:
+            layers[-1][1] = True
+        else:
+            raise ValueError(f"Unsupported module for hardware export: {module}")
+    return [tuple(layer) for layer in layers]
 
-def generate_synthetic_data(n_samples=1000, n_features=4, n_classes=2):
-    """Generate synthetic classification data"""
-    X, y = make_classification(
-        n_samples=n_samples,
-        n_features=n_features,
-        n_redundant=0,
-        n_informative=n_features,
-        n_clusters_per_class=1,
-        n_classes=n_classes,
-        random_state=42
-    )
-    
-    # Scale features to 0-255 range (8-bit)
-    scaler = StandardScaler()
-    X_scaled = scaler.fit_transform(X)
-    X_scaled = (X_scaled - X_scaled.min()) / (X_scaled.max() - X_scaled.min())
-    X_scaled = (X_scaled * 255).astype(np.uint8)
-    
-    return X_scaled, y
-
-def train_model():
-    """Train the neural network model"""
-    print("Generating synthetic data...")
-    X, y = generate_synthetic_data()
-    
-    # Convert to PyTorch tensors
-    X_tensor = torch.FloatTensor(X)
-    y_tensor = torch.LongTensor(y)
-    
-    # Split data
-    X_train, X_test, y_train, y_test = train_test_split(
-        X_tensor, y_tensor, test_size=0.2, random_state=42
-    )
+def synthetic_clusters(n_features=4, n_classes=2, seed=42):
+    """One Gaussian cluster per class, placed and shaped like make_classification"""
+    rng = np.random.default_rng(seed)
+    vertices = rng.permutation(2 ** n_features)[:n_classes]
+    centroids = np.array([[(v >> f) & 1 for f in range(n_features)] for v in vertices]) * 2.0 - 1.0
+    transforms = rng.random((n_classes, n_features, n_features)) * 2 - 1
+    return centroids, transforms
+
+def synthetic_chunk(clusters, n_samples, rng):
+    """Draw n_samples labelled float samples from the clusters"""
+    centroids, transforms = clusters
+    y = rng.integers(0, len(centroids), n_samples)
+    noise = rng.standard_normal((n_samples, centroids.shape[1]))
+    X = np.einsum('nf,nfg->ng', noise, transforms[y]) + centroids[y]
+    return X, y
+
+def build_dataset_store(prefix, n_samples, chunk_size=1_000_000, n_features=4, n_classes=2, seed=42):
+    """Generate a dataset chunk by chunk into memory-mapped .npy files
+    
+    Features are standardized and scaled to 0-255 (8-bit), with the
+    scaling fixed by the first chunk so every chunk is mapped alike.
+    Returns the paths of the feature and label files.
+    """
+    X_path, y_path = f"{prefix}_X.npy", f"{prefix}_y.npy"
+    X_store = np.lib.format.open_memmap(X_path, mode='w+', dtype=np.uint8, shape=(n_samples, n_features))
+    y_store = np.lib.format.open_memmap(y_path, mode='w+', dtype=np.uint8, shape=(n_samples,))
+    
+    clusters = synthetic_clusters(n_features, n_classes, seed)
+    rng = np.random.default_rng(seed + 1)
+    scale = None
+    for start in range(0, n_samples, chunk_size):
+        stop = min(start + chunk_size, n_samples)
+        X, y = synthetic_chunk(clusters, stop - start, rng)
+        if scale is None:
+            mean, std = X.mean(axis=0), X.std(axis=0)
+            standardized = (X - mean) / std
+            low, high = standardized.min(), standardized.max()
+            scale = (mean, std, low, high)
+        mean, std, low, high = scale
+        X = ((X - mean) / std - low) / (high - low) * 255
+        X_store[start:stop] = np.clip(X, 0, 255).astype(np.uint8)
+        y_store[start:stop] = y
+    
+    X_store.flush()
+    y_store.flush()
+    del X_store, y_store
+    return X_path, y_path
+
+class MemmapBatches(Dataset):
+    """Contiguous mini-batches of rows [start, stop) of a memory-mapped dataset
+    
+    Each item is a whole batch, so a DataLoader with batch_size=None reads
+    one slice of the files per step. The files are opened lazily in each
+    worker process rather than pickled.
+    """
+    
+    def __init__(self, X_path, y_path, start, stop, batch_size):
+        self.X_path, self.y_path = X_path, y_path
+        self.start, self.stop = start, stop
+        self.batch_size = batch_size
+        self.X = self.y = None
+    
+    def __len__(self):
+        return (self.stop - self.start + self.batch_size - 1) // self.batch_size
+    
+    def __getitem__(self, index):
+        if self.X is None:
+            self.X = np.load(self.X_path, mmap_mode='r')
+            self.y = np.load(self.y_path, mmap_mode='r')
+        lo = self.start + index * self.batch_size
+        hi = min(lo + self.batch_size, self.stop)
+        return (torch.from_numpy(self.X[lo:hi].astype(np.float32)),
+                torch.from_numpy(self.y[lo:hi].astype(np.int64)))
+
+def batch_loader(X_path, y_path, start, stop, batch_size, num_workers, shuffle):
+    """DataLoader over rows [start, stop) in batches of batch_size"""
+    return DataLoader(MemmapBatches(X_path, y_path, start, stop, batch_size),
+                      batch_size=None, shuffle=shuffle, num_workers=num_workers,
+                      persistent_workers=num_workers > 0)
+
+def evaluate(model, criterion, loader):
+    """Mean loss and accuracy of model over a loader"""
+    total_loss, correct, count = 0.0, 0, 0
+    with torch.no_grad():
+        for X, y in loader:
+            outputs = model(X)
+            total_loss += criterion(outputs, y).item() * len(y)
+            correct += (outputs.argmax(dim=1) == y).sum().item()
+            count += len(y)
+    return total_loss / count, correct / count
+
+def train_model(n_samples=1000, chunk_size=1_000_000, batch_size=64, num_workers=0,
+                num_threads=None, max_epochs=100, patience=10, data_prefix='train_data',
+                calibration_samples=100_000):
+    """Train the neural network model
+    
+    The dataset is generated into memory-mapped files and streamed in
+    mini-batches, so memory use does not grow with n_samples. The last 30%
+    of the rows are held out, 10% for early stopping on validation loss
+    (patience epochs without improvement) and 20% for the test accuracy,
+    evaluated in streamed batches. Returns the model and up to
+    calibration_samples training rows for quantization calibration.
+    """
+    if num_threads:
+        torch.set_num_threads(num_threads)
+    
+    print(f"Generating {n_samples} synthetic samples into {data_prefix}_*.npy...")
+    X_path, y_path = build_dataset_store(data_prefix, n_samples, chunk_size)
+    
+    # Split data: train | validation | test
+    train_end = int(n_samples * 0.7)
+    val_end = int(n_samples * 0.8)
+    train_loader = batch_loader(X_path, y_path, 0, train_end, batch_size, num_workers, shuffle=True)
+    val_loader = batch_loader(X_path, y_path, train_end, val_end, batch_size, num_workers, shuffle=False)
+    test_loader = batch_loader(X_path, y_path, val_end, n_samples, batch_size, num_workers, shuffle=False)
     
     # Create model
     model = SimpleDNN(input_size=4, hidden_size=3, output_size=2)
     criterion = nn.CrossEntropyLoss()
     optimizer = optim.Adam(model.parameters(), lr=0.01)
     
-    print("Training model...")
-    # Training loop
-    epochs = 100
-    for epoch in range(epochs):
-        optimizer.zero_grad()
-        outputs = model(X_train)
-        loss = criterion(outputs, y_train)
-        loss.backward()
-        optimizer.step()
+    print(f"Training model (batch size {batch_size}, {num_workers} workers, "
+          f"{torch.get_num_threads()} threads)...")
+    best_loss, best_state, stale = float('inf'), None, 0
+    for epoch in range(max_epochs):
+        model.train()
+        for X, y in train_loader:
+            optimizer.zero_grad()
+            loss = criterion(model(X), y)
+            loss.backward()
+            optimizer.step()
+        
+        model.eval()
+        val_loss, val_accuracy = evaluate(model, criterion, val_loader)
+        if (epoch + 1) % 10 == 0:
+            print(f'Epoch [{epoch+1}/{max_epochs}], Val Loss: {val_loss:.4f}, Val Accuracy: {val_accuracy:.4f}')
         
-        if (epoch + 1) % 20 == 0:
-            print(f'Epoch [{epoch+1}/{epochs}], Loss: {loss.item():.4f}')
+        # Early stopping on validation loss
+        if val_loss < best_loss:
+            best_loss, best_state, stale = val_loss, copy.deepcopy(model.state_dict()), 0
+        else:
+            stale += 1
+            if stale >= patience:
+                print(f'Early stopping after epoch {epoch+1} (best Val Loss: {best_loss:.4f})')
+                break
+    
+    # No epoch ran, or none had a finite validation loss
+    if best_state is not None:
+        model.load_state_dict(best_state)
+    else:
+        print('No validation improvement recorded, keeping the last weights')
     
     # Test accuracy
-    with torch.no_grad():
-        test_outputs = model(X_test)
-        _, predicted = torch.max(test_outputs.data, 1)
-        accuracy = (predicted == y_test).sum().item() / y_test.size(0)
-        print(f'Test Accuracy: {accuracy:.4f}')
+    _, accuracy = evaluate(model, criterion, test_loader)
+    print(f'Test Accuracy: {accuracy:.4f}')
     
-    return model, X_test, y_test
+    X_store = np.load(X_path, mmap_mode='r')
+    y_store = np.load(y_path, mmap_mode='r')
+    calib_end = min(train_end, calibration_samples)
+    X_calib, y_calib = np.array(X_store[:calib_end]), np.array(y_store[:calib_end])
+    return model, X_calib, y_calib
 
-def extract_parameters(model):
-    """Extract model parameters for hardware implementation"""
+def extract_parameters(model, X_calib, y_calib, accuracy_tolerance=ACCURACY_TOLERANCE):
+    """Extract model parameters for hardware implementation
+    
+    Integer weights and biases come from a calibration pass over
+    (X_calib, y_calib): per-layer power-of-two shifts fitted to the actual
+    value ranges, and the narrowest activation and accumulator widths that
+    keep accuracy within accuracy_tolerance of the float model.
+    """
     params = {}
     
     # Extract weights and biases
     with torch.no_grad():
+        stack = linear_layers(model)
+        layers_fp = [(linear.weight.data.numpy(), linear.bias.data.numpy(), relu)
+                     for linear, relu in stack]
+        report = calibrate(layers_fp, np.asarray(X_calib), np.asarray(y_calib), accuracy_tolerance)
+        quantized = report['layers']
+        print_calibration_report(report)
+        
         # Layer 1 weights (4x3)
         layer1_weights = model.layer1.weight.data.numpy()
         layer1_bias = model.layer1.bias.data.numpy()
@@ -103,18 +239,39 @@ def extract_parameters(model):
         layer2_weights = model.layer2.weight.data.numpy()
         layer2_bias = model.layer2.bias.data.numpy()
         
-        # Convert to 8-bit integers for hardware
-        # Scale weights to fit in 8-bit range
-        layer1_weights_scaled = (layer1_weights * 127).astype(np.int8)
-        layer1_bias_scaled = (layer1_bias * 127).astype(np.int16)
+        # Calibrated 8-bit weights and 16-bit biases for hardware
+        params['layer1_weights'] = quantized[0]['weights'].tolist()
+        params['layer1_bias'] = quantized[0]['bias'].tolist()
+        params['layer2_weights'] = quantized[1]['weights'].tolist()
+        params['layer2_bias'] = quantized[1]['bias'].tolist()
         
-        layer2_weights_scaled = (layer2_weights * 127).astype(np.int8)
-        layer2_bias_scaled = (layer2_bias * 127).astype(np.int16)
+        # Generic layer stack for generate_accelerator.py, with the
+        # calibrated shifts and datapath widths of each layer
+        params['layers'] = []
+        for (linear, relu), layer in zip(stack, quantized):
+            entry = {
+                'in_features': linear.in_features,
+                'out_features': linear.out_features,
+                'weights': layer['weights'].tolist(),
+                'bias': layer['bias'].tolist(),
+                'relu': relu,
+                'weight_shift': layer['weight_shift'],
+                'bias_shift': layer['bias_shift'],
+                'acc_width': layer['acc_width'],
+                'weights_fp': linear.weight.data.numpy().tolist(),
+                'bias_fp': linear.bias.data.numpy().tolist(),
+            }
+            if 'output_shift' in layer:
+                entry['output_shift'] = layer['output_shift']
+                entry['act_width'] = report['activation_width']
+            params['layers'].append(entry)
         
-        params['layer1_weights'] = layer1_weights_scaled.tolist()
-        params['layer1_bias'] = layer1_bias_scaled.tolist()
-        params['layer2_weights'] = layer2_weights_scaled.tolist()
-        params['layer2_bias'] = layer2_bias_scaled.tolist()
+        params['quantization'] = {
+            key: report[key] for key in ('calibration_samples', 'float_accuracy',
+                                         'quantized_accuracy', 'accuracy_tolerance',
+                                         'within_tolerance', 'activation_width',
+                                         'accumulator_widths', 'sweep')
+        }
         
         # Also store original floating point values for comparison
         params['layer1_weights_fp'] = layer1_weights.tolist()
@@ -124,34 +281,67 @@ def extract_parameters(model):
     
     return params
 
-def save_parameters(params, filename='model_parameters.json'):
-    """Save parameters to JSON file"""
-    with open(filename, 'w') as f:
-        json.dump(params, f, indent=2)
-    print(f"Parameters saved to {filename}")
+def print_calibration_report(report):
+    """Print the calibrated shifts and datapath widths"""
+    print(f"Calibration over {report['calibration_samples']} samples:")
+    for width in report['sweep']:
+        print(f"  {width['activation_width']}-bit activations: accuracy {width['accuracy']:.4f}")
+    status = "within" if report['within_tolerance'] else "NOT within"
+    print(f"Float accuracy {report['float_accuracy']:.4f}, quantized {report['quantized_accuracy']:.4f} "
+          f"({status} {report['accuracy_tolerance']:.4f})")
+    print(f"Minimum activation width: {report['activation_width']} bits")
+    for i, layer in enumerate(report['layers'], start=1):
+        shift = f", output shift {layer['output_shift']}" if 'output_shift' in layer else ""
+        print(f"  Layer {i}: weight shift {layer['weight_shift']}, "
+              f"accumulator {layer['acc_width']} bits{shift}")
 
-def generate_test_vectors(n_samples=10):
-    """Generate test vectors for hardware verification"""
-    X, _ = generate_synthetic_data(n_samples=n_samples)
-    return X
+def save_parameters(params, filename='model_parameters.bin'):
+    """Save parameters to a binary parameter file (see param_file.py)"""
+    size = write_parameter_file(filename, params)
+    print(f"Parameters saved to {filename} ({size} bytes)")
+
+def generate_test_vectors(n_samples=10, data_prefix='train_data'):
+    """Test vectors for hardware verification: the last rows of the dataset store
+
+    They come from the same clusters and 8-bit scaling as the training
+    data, and from the held-out test split, so the model never trained
+    on them.
+    """
+    X_store = np.load(f"{data_prefix}_X.npy", mmap_mode='r')
+    return np.array(X_store[max(0, len(X_store) - n_samples):])
 
 def main():
     """Main training function"""
+    parser = argparse.ArgumentParser(description="Train the software DNN and export its parameters")
+    parser.add_argument('--samples', type=int, default=1000, help="Dataset size")
+    parser.add_argument('--chunk-size', type=int, default=1_000_000, help="Rows generated per chunk")
+    parser.add_argument('--batch-size', type=int, default=64, help="Mini-batch size")
+    parser.add_argument('--workers', type=int, default=0, help="DataLoader worker processes")
+    parser.add_argument('--threads', type=int, default=None, help="torch intra-op threads")
+    parser.add_argument('--epochs', type=int, default=100, help="Maximum epochs")
+    parser.add_argument('--patience', type=int, default=10,
+                        help="Epochs without validation improvement before stopping")
+    parser.add_argument('--data-prefix', default='train_data', help="Prefix of the memory-mapped dataset files")
+    args = parser.parse_args()
+    
     print("=== Software DNN Training ===")
     
     # Train model
-    model, X_test, y_test = train_model()
+    model, X_calib, y_calib = train_model(
+        n_samples=args.samples, chunk_size=args.chunk_size, batch_size=args.batch_size,
+        num_workers=args.workers, num_threads=args.threads, max_epochs=args.epochs,
+        patience=args.patience, data_prefix=args.data_prefix)
     
-    # Extract parameters
+    # Extract parameters, calibrated on the training set
     print("\nExtracting parameters...")
-    params = extract_parameters(model)
+    params = extract_parameters(model, X_calib, y_calib)
     
     # Save parameters
     save_parameters(params)
     
     # Generate test vectors
     print("\nGenerating test vectors...")
-    test_vectors = generate_test_vectors(10)
+    test_vectors = generate_test_vectors(10, args.data_prefix)
     
     # Save test vectors
     np.save('test_vectors.npy', test_vectors)
@@ -173,7 +363,7 @@ def main():
     
     print("\n=== Training Complete ===")
     print("Files generated:")
-    print("- model_parameters.json: Model weights and biases")
+    print("- model_parameters.bin: Model weights and biases")
     print("- test_vectors.npy: Test input vectors")
     print("- software_predictions.npy: Software model predictions")
 
@@ -1,15 +1,24 @@
 #!/usr/bin/env python3
 """
 Simplified Software-Hardware Consistency Verification
-Direct comparison of software DNN calculations with hardware DNN logic
+Direct comparison of software DNN calculations with a bit-accurate model of the hardware DNN
 """
 
+import argparse
 import numpy as np
-import torch
 import json
+import time
 
-def software_dnn_forward(inputs, weights_layer1, bias_layer1, weights_layer2, bias_layer2):
-    """Software DNN forward pass"""
+from hardware_model import hardware_parameters, dnn_forward, requant_parameters
+from param_file import load_model_parameters
+from quantization import requantize
+
+def software_dnn_forward(inputs, weights_layer1, bias_layer1, weights_layer2, bias_layer2, requant):
+    """Software DNN forward pass
+
+    Hidden activations are requantized as quantization.py defines them
+    (ReLU, rounding right shift, clamp to 8 bits) with requant's settings.
+    """
     
     # Convert to numpy arrays
     inputs = np.array(inputs)
@@ -21,7 +30,7 @@ def software_dnn_forward(inputs, weights_layer1, bias_layer1, weights_layer2, bi
     # Layer 1: 4 inputs -> 3 hidden neurons
     # weights_layer1 shape is (3, 4), so we need to transpose for dot product
     hidden = np.dot(inputs, weights_layer1.T) + bias_layer1
-    hidden = np.maximum(0, hidden)  # ReLU activation
+    hidden = requantize(hidden, requant['shift'], requant['relu'], 8)  # ReLU and requantization
     
     # Layer 2: 3 hidden neurons -> 2 outputs
     # weights_layer2 shape is (2, 3), so we need to transpose for dot product
@@ -29,51 +38,50 @@ def software_dnn_forward(inputs, weights_layer1, bias_layer1, weights_layer2, bi
     
     return outputs
 
-def hardware_dnn_forward(inputs, weights_layer1, bias_layer1, weights_layer2, bias_layer2):
-    """Hardware DNN forward pass simulation"""
-    
-    # Convert to numpy arrays
-    inputs = np.array(inputs)
-    weights_layer1 = np.array(weights_layer1)
-    bias_layer1 = np.array(bias_layer1)
-    weights_layer2 = np.array(weights_layer2)
-    bias_layer2 = np.array(bias_layer2)
-    
-    # Simulate hardware MAC operations
-    # Layer 1 computation
-    hidden = np.zeros(3)
-    for neuron in range(3):
-        # MAC operation: accumulate input * weight + bias
-        mac_result = bias_layer1[neuron]
-        for input_idx in range(4):
-            mac_result += inputs[input_idx] * weights_layer1[input_idx, neuron]
-        hidden[neuron] = max(0, mac_result)  # ReLU
-    
-    # Layer 2 computation
-    outputs = np.zeros(2)
-    for neuron in range(2):
-        # MAC operation: accumulate hidden * weight + bias
-        mac_result = bias_layer2[neuron]
-        for input_idx in range(3):
-            mac_result += hidden[input_idx] * weights_layer2[input_idx, neuron]
-        outputs[neuron] = mac_result
-    
-    return outputs
+def hardware_dnn_forward(inputs, weights_layer1, bias_layer1, weights_layer2, bias_layer2, requant):
+    """Hardware DNN forward pass simulation
+
+    Bit-accurate batch model of the accelerator (see hardware_model.py).
+    inputs may be a single vector of 4 values or an (N, 4) batch; weights
+    are given in hardware format (4x3 and 3x2) and requant holds the
+    REQUANT_* settings of the hidden layer. Returns 16-bit outputs.
+    """
+    
+    # Hardware format is (inputs, neurons); RTL memories are neuron-major
+    hw_params = hardware_parameters({
+        'weights_layer1': np.asarray(weights_layer1).T,
+        'bias_layer1': bias_layer1,
+        'weights_layer2': np.asarray(weights_layer2).T,
+        'bias_layer2': bias_layer2
+    })
+    
+    return dnn_forward(inputs, hw_params, requant=requant)
 
-def main():
+def main(num_random_vectors=0, seed=0):
     """Main verification function"""
     
     print("=== Software-Hardware DNN Consistency Verification ===")
     
     # Load parameters
-    with open('model_parameters.json', 'r') as f:
-        params = json.load(f)
+    params = load_model_parameters('model_parameters.bin')
     
     # Load test vectors
     test_vectors = np.load('test_vectors.npy')
     
     print(f"Loaded {len(test_vectors)} test vectors")
-    print(f"Parameters loaded from model_parameters.json")
+    print(f"Parameters loaded from model_parameters.bin")
+    
+    # Hidden layer requantization the accelerator runs this model with
+    requant = requant_parameters(params)
+    print(f"Hidden requantization: shift {requant['shift']}, relu {int(requant['relu'])}")
+    
+    # Optionally extend the run with random 8-bit vectors
+    vectors = test_vectors
+    if num_random_vectors > 0:
+        rng = np.random.default_rng(seed)
+        random_vectors = rng.integers(0, 256, size=(num_random_vectors, 4), dtype=np.uint8)
+        vectors = np.concatenate([test_vectors.astype(np.uint8), random_vectors])
+        print(f"Added {num_random_vectors} random vectors (seed={seed})")
     
     # Extract parameters
     layer1_weights = np.array(params['layer1_weights'])
@@ -92,43 +100,48 @@ def main():
     
     print("\n=== Running Consistency Tests ===")
     
-    all_consistent = True
-    max_diff = 0
-    
-    for i, test_input in enumerate(test_vectors):
-        # Software computation
-        software_output = software_dnn_forward(
-            test_input, layer1_weights, layer1_bias, 
-            layer2_weights, layer2_bias
-        )
-        
-        # Hardware computation
-        hardware_output = hardware_dnn_forward(
-            test_input, layer1_weights_hw, layer1_bias,
-            layer2_weights_hw, layer2_bias
-        )
-        
-        # Calculate differences
-        diff = np.abs(software_output - hardware_output)
-        max_diff_test = np.max(diff)
-        max_diff = max(max_diff, max_diff_test)
-        
+    # Software computation (whole batch)
+    software_outputs = software_dnn_forward(
+        vectors, layer1_weights, layer1_bias,
+        layer2_weights, layer2_bias, requant
+    )
+    
+    # Hardware computation (whole batch, bit-accurate)
+    start_time = time.perf_counter()
+    hardware_outputs = hardware_dnn_forward(
+        vectors, layer1_weights_hw, layer1_bias,
+        layer2_weights_hw, layer2_bias, requant
+    )
+    elapsed = time.perf_counter() - start_time
+    vectors_per_second = len(vectors) / elapsed if elapsed > 0 else float('inf')
+    
+    # The output registers are 16 bits wide, so compare the software result
+    # reduced to the same width
+    software_16bit = np.mod(np.rint(software_outputs).astype(np.int64), 1 << 16)
+    diff = np.abs(software_16bit - hardware_outputs.astype(np.int64))
+    max_diff = float(diff.max()) if len(diff) else 0.0
+    
+    # Check consistency (allow small numerical differences)
+    tolerance = 0.01
+    mismatched = np.nonzero(np.any(diff >= tolerance, axis=1))[0]
+    all_consistent = len(mismatched) == 0
+    
+    # Show the stored test vectors in detail; random vectors only in summary
+    for i in range(len(test_vectors)):
         print(f"\nTest {i+1}:")
-        print(f"  Input: {test_input.tolist()}")
-        print(f"  Software: [{software_output[0]:8.2f}, {software_output[1]:8.2f}]")
-        print(f"  Hardware: [{hardware_output[0]:8.2f}, {hardware_output[1]:8.2f}]")
-        print(f"  Difference: [{diff[0]:8.2f}, {diff[1]:8.2f}]")
+        print(f"  Input: {vectors[i].tolist()}")
+        print(f"  Software: [{software_16bit[i, 0]:8d}, {software_16bit[i, 1]:8d}]")
+        print(f"  Hardware: [{hardware_outputs[i, 0]:8d}, {hardware_outputs[i, 1]:8d}]")
+        print(f"  Difference: [{diff[i, 0]:8d}, {diff[i, 1]:8d}]")
         
-        # Check consistency (allow small numerical differences)
-        tolerance = 0.01
-        consistent = np.all(diff < tolerance)
-        if not consistent:
-            all_consistent = False
+        if np.any(diff[i] >= tolerance):
             print(f"  ❌ FAIL - Difference exceeds tolerance ({tolerance})")
         else:
             print(f"  ✅ PASS - Within tolerance ({tolerance})")
     
     print(f"\n=== Summary ===")
+    print(f"Checked {len(vectors)} vectors in {elapsed:.4f} s ({vectors_per_second:,.0f} vectors/s)")
+    print(f"Mismatching vectors: {len(mismatched)}")
     print(f"Maximum difference across all tests: {max_diff:.6f}")
     
     if all_consistent:
@@ -139,9 +152,26 @@ def main():
     # Save results
     results = {
         'test_vectors': test_vectors.tolist(),
-        'max_difference': float(max_diff),
-        'all_consistent': all_consistent,
-        'tolerance': 0.01,
+        'hardware_model': 'bit_accurate',
+        'num_vectors': int(len(vectors)),
+        'num_random_vectors': int(num_random_vectors),
+        'seed': seed,
+        'software_outputs_16bit': software_16bit[:len(test_vectors)].tolist(),
+        'hardware_outputs': hardware_outputs[:len(test_vectors)].tolist(),
+        'num_mismatches': int(len(mismatched)),
+        'mismatches': [
+            {
+                'index': int(i),
+                'input': vectors[i].tolist(),
+                'software': software_16bit[i].tolist(),
+                'hardware': hardware_outputs[i].tolist()
+            }
+            for i in mismatched[:10]
+        ],
+        'max_difference': max_diff,
+        'all_consistent': bool(all_consistent),
+        'tolerance': tolerance,
+        'vectors_per_second': vectors_per_second,
         'layer1_weights_shape': layer1_weights.shape,
         'layer2_weights_shape': layer2_weights.shape
     }
@@ -154,4 +184,9 @@ def main():
     return all_consistent
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Software-hardware DNN consistency verification")
+    parser.add_argument('--random-vectors', type=int, default=0,
+                        help="number of random input vectors to check in addition to test_vectors.npy")
+    parser.add_argument('--seed', type=int, default=0, help="seed for the random vectors")
+    args = parser.parse_args()
+    main(args.random_vectors, args.seed)
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Native Verilator Batch Backend
+Builds dnn_accelerator / configurable_dnn_accelerator with dnn_batch_sim.cpp
+into a shared library and runs whole batches of inferences in native code
+"""
+
+import argparse
+import ctypes
+import os
+import subprocess
+import time
+import numpy as np
+
+import sim_cache
+from hardware_model import (
+    DNN_ACCELERATOR_PARAMS, dnn_forward, hardware_parameters, parameter_words, requant_generics,
+)
+from param_file import load_model_parameters
+
+VERILATOR = os.environ.get('VERILATOR', 'verilator')
+HARNESS = 'dnn_batch_sim.cpp'
+
+VARIANTS = {
+    'dnn': {
+        'toplevel': 'dnn_accelerator',
+        'sources': ['mac_unit.v', 'requant_unit.v', 'dnn_accelerator.v'],
+        'defines': [],
+    },
+    'configurable': {
+        'toplevel': 'configurable_dnn_accelerator',
+        'sources': ['mac_unit.v', 'requant_unit.v', 'dnn_param_memory.v', 'configurable_dnn_accelerator.v'],
+        'defines': ['DNN_CONFIGURABLE'],
+    },
+}
+
+# Cycles one inference may take before dnn_run gives up
+MAX_INFERENCE_CYCLES = 10000
+
+def build_library(variant='configurable', verbose=False, requant=None):
+    """Path of the variant's shared library, building it on a cache miss
+
+    requant sets dnn_accelerator's REQUANT_* parameters (REQUANT_PARAMS by
+    default); configurable_dnn_accelerator loads its requant word with the
+    parameters instead. The library lives in a sim_cache build directory
+    keyed by the RTL, the harness, those parameters and the Verilator
+    version, so rebuilding only happens when one of them changes.
+    """
+    config = VARIANTS[variant]
+    if requant is not None and variant != 'dnn':
+        raise ValueError(f"{config['toplevel']} loads its requant word with the parameters")
+    generics = []
+    if variant == 'dnn':
+        generics = [f"-G{name}={value}" for name, value in requant_generics(requant).items()]
+    here = os.path.dirname(os.path.realpath(__file__))
+    sources = [os.path.join(here, source) for source in config['sources']]
+    harness = os.path.join(here, HARNESS)
+    cflags = ' '.join(['-fPIC', '-O2'] + [f"-D{define}" for define in config['defines']])
+
+    build_dir = os.path.abspath(sim_cache.resolve_build_dir(
+        sources + [harness], f"native-{config['toplevel']}", 'verilator', ' '.join(generics + [cflags])))
+    library = os.path.join(build_dir, f"libdnn_{variant}.so")
+    if os.path.exists(library):
+        return library
+
+    command = [
+        VERILATOR, '--cc', '--exe', '--build', '-O3', '-Wno-fatal',
+        '--prefix', 'Vdnn', '--top-module', config['toplevel'],
+        '--Mdir', build_dir, '-CFLAGS', cflags, '-LDFLAGS', '-shared',
+        '-o', os.path.basename(library),
+    ] + generics + sources + [harness]
+    result = subprocess.run(command, capture_output=not verbose, text=True)
+    if result.returncode != 0 or not os.path.exists(library):
+        raise RuntimeError(f"Verilator build of {config['toplevel']} failed:\n{(result.stderr or '')[-2000:]}")
+    return library
+
+class NativeAccelerator:
+    """ctypes binding of one Verilator model instance
+
+    Inputs and outputs are NumPy arrays passed by pointer; every clock
+    edge of a batch runs in C++ with no Python in the loop.
+    """
+
+    def __init__(self, variant='configurable', requant=None):
+        if variant not in VARIANTS:
+            raise ValueError(f"Unknown accelerator variant: {variant}")
+        self.variant = variant
+        self.lib = ctypes.CDLL(build_library(variant, requant=requant))
+        self.lib.dnn_create.restype = ctypes.c_void_p
+        self.lib.dnn_destroy.argtypes = [ctypes.c_void_p]
+        self.lib.dnn_reset.argtypes = [ctypes.c_void_p]
+        self.lib.dnn_load_parameters.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int64]
+        self.lib.dnn_load_parameters.restype = ctypes.c_int64
+        self.lib.dnn_run.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int64,
+                                     ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int64]
+        self.lib.dnn_run.restype = ctypes.c_int64
+        self.handle = self.lib.dnn_create()
+        self.reset()
+
+    def close(self):
+        """Free the model"""
+        if self.handle:
+            self.lib.dnn_destroy(self.handle)
+            self.handle = None
+
+    def __del__(self):
+        self.close()
+
+    def reset(self):
+        """Apply rst_n"""
+        self.lib.dnn_reset(self.handle)
+
+    def load_parameters(self, hw_params):
+        """Burst-load accelerator register contents; returns the load cycles"""
+        if self.variant == 'dnn':
+            raise ValueError("dnn_accelerator has fixed parameters")
+        words = np.ascontiguousarray(parameter_words(hw_params), dtype=np.uint16)
+        return self.lib.dnn_load_parameters(self.handle, words.ctypes.data, len(words))
+
+    def infer(self, inputs):
+        """Run every (N, 4) input vector; returns (outputs, latency cycles, total cycles)"""
+        inputs = np.ascontiguousarray(np.atleast_2d(inputs), dtype=np.uint8)
+        outputs = np.empty((len(inputs), 2), dtype=np.uint16)
+        latency = np.empty(len(inputs), dtype=np.uint32)
+        cycles = self.lib.dnn_run(self.handle, inputs.ctypes.data, len(inputs),
+                                  outputs.ctypes.data, latency.ctypes.data, MAX_INFERENCE_CYCLES)
+        if cycles < 0:
+            raise RuntimeError(f"An inference did not complete within {MAX_INFERENCE_CYCLES} cycles")
+        return outputs, latency, cycles
+
+def run(params, inputs, variant='configurable'):
+    """Hardware outputs for (N, 4) inputs: ndarray in, (N, 2) uint16 ndarray out
+
+    params is a parameter dict (model_parameters.bin contents or register
+    contents); it is ignored for dnn_accelerator, whose values are fixed.
+    Other variants load the model's requant word with the weights.
+    """
+    model = NativeAccelerator(variant)
+    try:
+        if variant != 'dnn':
+            model.load_parameters(hardware_parameters(params))
+        outputs, _, _ = model.infer(inputs)
+    finally:
+        model.close()
+    return outputs
+
+def main():
+    """Run the stored test vectors natively and check them against the golden model"""
+    parser = argparse.ArgumentParser(description="Native Verilator batch simulation")
+    parser.add_argument('--variant', choices=list(VARIANTS), default='configurable')
+    parser.add_argument('--vectors', default='test_vectors.npy', help="input vectors (.npy)")
+    parser.add_argument('--params', default='model_parameters.bin', help="model parameters")
+    parser.add_argument('--output', default=None, help="save the hardware outputs (.npy)")
+    args = parser.parse_args()
+
+    print("=== Native Verilator Batch Simulation ===")
+    inputs = np.load(args.vectors, mmap_mode='r')
+    print(f"Loaded {len(inputs)} input vectors")
+
+    # dnn_accelerator keeps its built-in values and default requantization
+    if args.variant == 'dnn':
+        hw_params = hardware_parameters(DNN_ACCELERATOR_PARAMS)
+    else:
+        hw_params = hardware_parameters(load_model_parameters(args.params))
+
+    start = time.time()
+    model = NativeAccelerator(args.variant)
+    print(f"Library ready in {time.time() - start:.1f} s")
+
+    if args.variant != 'dnn':
+        print(f"Parameter load: {model.load_parameters(hw_params)} cycles")
+
+    start = time.time()
+    outputs, latency, cycles = model.infer(inputs)
+    elapsed = time.time() - start
+    model.close()
+
+    mismatches = int(np.any(outputs != dnn_forward(inputs, hw_params), axis=1).sum())
+    print(f"Simulated {len(inputs)} inferences ({cycles} cycles) in {elapsed:.3f} s: "
+          f"{len(inputs) / elapsed:,.0f} inferences/s, {cycles / elapsed:,.0f} cycles/s")
+    print(f"Latency: {latency.min()}-{latency.max()} cycles")
+    print(f"Mismatches against the golden model: {mismatches}")
+
+    if args.output:
+        np.save(args.output, outputs)
+        print(f"Outputs saved to {args.output}")
+    if mismatches:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()